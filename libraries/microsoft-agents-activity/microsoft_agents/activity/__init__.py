@@ -4,6 +4,7 @@
 from .agents_model import AgentsModel
 from .action_types import ActionTypes
 from .activity import Activity
+from .lazy_activity import LazyActivity
 from .activity_event_names import ActivityEventNames
 from .activity_types import ActivityTypes
 from .adaptive_card_card import AdaptiveCardCard
@@ -114,6 +115,7 @@ from .config import load_configuration_from_env
 __all__ = [
     "AgentsModel",
     "Activity",
+    "LazyActivity",
     "ActionTypes",
     "ActivityEventNames",
     "AdaptiveCardCard",
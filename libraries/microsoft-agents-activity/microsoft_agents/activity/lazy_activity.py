@@ -0,0 +1,209 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from __future__ import annotations
+
+import logging
+from functools import cache
+from typing import Any
+
+from pydantic import (
+    FieldSerializationInfo,
+    SerializerFunctionWrapHandler,
+    TypeAdapter,
+    ValidationError,
+    field_serializer,
+    field_validator,
+    model_validator,
+    ModelWrapValidatorHandler,
+)
+
+from .activity import Activity
+from .channel_id import ChannelId
+from .entity import EntityTypes
+from .entity._validate_known_entities import _validate_known_entities
+from microsoft_agents.activity.errors import activity_errors
+
+logger = logging.getLogger(__name__)
+
+# Nested fields whose validation is deferred until they are first read.
+_DEFERRED_FIELDS = (
+    "members_added",
+    "members_removed",
+    "reactions_added",
+    "reactions_removed",
+    "suggested_actions",
+    "attachments",
+    "entities",
+    "relates_to",
+    "text_highlights",
+    "semantic_action",
+)
+
+
+class _Deferred:
+    """The parsed JSON of a field that has not been validated yet.
+
+    Kept in the model's ``__dict__`` in place of the value, so copies of the
+    activity carry which of their fields are still pending.
+    """
+
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: Any):
+        self.raw = raw
+
+    def __repr__(self) -> str:
+        return repr(self.raw)
+
+
+@cache
+def _field_adapter(name: str) -> TypeAdapter:
+    return TypeAdapter(Activity.model_fields[name].annotation)
+
+
+def _validate_deferred_field(name: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if name == "entities":
+        value = _validate_known_entities(value)
+    return _field_adapter(name).validate_python(value)
+
+
+def _raw_product_info_id(entities: Any) -> str | None:
+    """Find the id of the productInfo entity without validating the entities."""
+    if not isinstance(entities, (list, tuple)):
+        return None
+
+    target = EntityTypes.PRODUCT_INFO.casefold()
+    for entity in entities:
+        if isinstance(entity, dict):
+            entity_type, entity_id = entity.get("type"), entity.get("id")
+        else:
+            entity_type, entity_id = getattr(entity, "type", None), getattr(
+                entity, "id", None
+            )
+        if isinstance(entity_type, str) and entity_type.casefold() == target:
+            return entity_id
+    return None
+
+
+class LazyActivity(Activity):
+    """An :class:`Activity` that validates its nested sub-models on first access.
+
+    Top-level scalars and the ``from``, ``recipient`` and ``conversation`` accounts are
+    validated up front. ``attachments``, ``entities``, ``members_added``,
+    ``members_removed``, ``reactions_added``, ``reactions_removed``,
+    ``suggested_actions``, ``relates_to``, ``text_highlights`` and ``semantic_action``
+    are kept as parsed JSON until they are read, and are then validated exactly as
+    :class:`Activity` validates them. ``channel_data`` and ``value`` are never validated
+    by :class:`Activity` and are kept as parsed JSON.
+
+    Fields that were never read are serialized from the data they were parsed from
+    when dumping to JSON by alias, so an activity that is received and sent back
+    serializes identically. Other dumps validate them first.
+
+    .. note::
+        Code that reads ``__dict__`` directly, or changes ``__class__``, must call
+        :meth:`resolve_deferred_fields` first.
+    """
+
+    members_added: Any = None
+    members_removed: Any = None
+    reactions_added: Any = None
+    reactions_removed: Any = None
+    suggested_actions: Any = None
+    attachments: Any = None
+    entities: Any = None
+    relates_to: Any = None
+    text_highlights: Any = None
+    semantic_action: Any = None
+
+    @field_validator("entities", mode="before")
+    @classmethod
+    def _deserialize_known_entities(cls, entities: Any) -> Any:
+        # entities are converted to their known types when first read
+        return entities
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _validate_channel_id(
+        cls, data: Any, handler: ModelWrapValidatorHandler[LazyActivity]
+    ) -> LazyActivity:
+        """Validate the LazyActivity, syncing channel_id.sub_channel with the raw productInfo entity.
+
+        :param data: The input data to validate.
+        :param handler: The validation handler provided by Pydantic.
+        :return: The validated LazyActivity instance.
+        """
+        try:
+            activity = handler(data)
+        except ValidationError as exc:
+            logger.error("Validation error for Activity: %s", exc, exc_info=True)
+            raise
+
+        for name in _DEFERRED_FIELDS:
+            value = activity.__dict__.get(name)
+            if value is not None and not isinstance(value, _Deferred):
+                activity.__dict__[name] = _Deferred(value)
+
+        entities = activity.__dict__.get("entities")
+        product_info_id = _raw_product_info_id(
+            entities.raw if isinstance(entities, _Deferred) else entities
+        )
+
+        if product_info_id and activity.channel_id:
+            if (
+                activity.channel_id.sub_channel
+                and activity.channel_id.sub_channel != product_info_id
+            ):
+                raise Exception(str(activity_errors.ChannelIdProductInfoConflict))
+            activity.channel_id = ChannelId(
+                channel=activity.channel_id.channel,
+                sub_channel=product_info_id,
+            )
+
+        return activity
+
+    @field_serializer(*_DEFERRED_FIELDS, mode="wrap")
+    def _serialize_deferred_field(
+        self,
+        value: Any,
+        handler: SerializerFunctionWrapHandler,
+        info: FieldSerializationInfo,
+    ) -> Any:
+        if isinstance(value, _Deferred):
+            if info.mode_is_json() and info.by_alias:
+                return value.raw
+            value = getattr(self, info.field_name)
+        return handler(value)
+
+    def resolve_deferred_fields(self) -> None:
+        """Validate every field that has not been read yet."""
+        for name in _DEFERRED_FIELDS:
+            if isinstance(self.__dict__.get(name), _Deferred):
+                getattr(self, name)
+
+    def __eq__(self, other: object) -> bool:
+        self.resolve_deferred_fields()
+        if isinstance(other, LazyActivity):
+            other.resolve_deferred_fields()
+        return super().__eq__(other)
+
+
+def _deferred_property(name: str) -> property:
+    def get(self: LazyActivity) -> Any:
+        value = self.__dict__[name]
+        if isinstance(value, _Deferred):
+            value = self.__dict__[name] = _validate_deferred_field(name, value.raw)
+        return value
+
+    def set(self: LazyActivity, value: Any) -> None:
+        self.__dict__[name] = value
+        self.__pydantic_fields_set__.add(name)
+
+    return property(get, set)
+
+
+for _name in _DEFERRED_FIELDS:
+    setattr(LazyActivity, _name, _deferred_property(_name))
@@ -0,0 +1,187 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+
+from microsoft_agents.hosting.core.authorization._single_flight import (
+    _SingleFlight,
+    _refresh_time,
+)
+
+
+class _CachedToken:
+    __slots__ = ("token", "expires_on", "refresh_on")
+
+    def __init__(
+        self, token: str, expires_on: datetime, refresh_on: datetime | None = None
+    ):
+        self.token = token
+        self.expires_on = expires_on
+        self.refresh_on = refresh_on if refresh_on is not None else expires_on
+
+
+class _SidecarTokenCache:
+    """A bounded token cache ordered by expiry.
+
+    Entries are indexed by key and by expiry in a heap, so inserting a token and
+    evicting the one closest to expiry are O(log n). Heap items replaced by a newer
+    token for the same key are skipped when popped and compacted away once they
+    outnumber the live entries.
+
+    :meth:`get_or_fetch` serves a cached token until ``expiry_buffer`` before it
+    expires. Once its refresh time has passed, the cached token is still served and
+    one background fetch replaces it. Concurrent misses for a key share one fetch.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        expiry_buffer: timedelta,
+        refresh_before: timedelta,
+    ):
+        """
+        :param max_entries: The maximum number of cached tokens.
+        :param expiry_buffer: How long before expiry a token stops being served.
+        :param refresh_before: How long before expiry a token is refreshed in the background.
+        """
+        self._max_entries = max_entries
+        self._expiry_buffer = expiry_buffer
+        self._refresh_before = refresh_before
+
+        self._entries: dict[str, _CachedToken] = {}
+        self._expiry_heap: list[tuple[datetime, int, str, _CachedToken]] = []
+        self._sequence = itertools.count()
+        self._fetching: _SingleFlight[str] = _SingleFlight("Sidecar token acquisition")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def keys(self) -> set[str]:
+        return set(self._entries)
+
+    def entry(
+        self, token: str, expires_on: datetime, now: datetime | None = None
+    ) -> _CachedToken:
+        """Creates a cache entry, scheduling its refresh ahead of ``expires_on``.
+
+        :param token: The access token.
+        :param expires_on: When the token expires.
+        :param now: When the token was obtained. Defaults to the current time.
+        :return: The cache entry.
+        """
+        now = now or datetime.now(timezone.utc)
+        return _CachedToken(
+            token, expires_on, _refresh_time(now, expires_on, self._refresh_before)
+        )
+
+    def is_usable(self, entry: _CachedToken, now: datetime | None = None) -> bool:
+        """Whether a token may still be served.
+
+        :param entry: The cache entry.
+        :param now: The current time. Defaults to now.
+        """
+        now = now or datetime.now(timezone.utc)
+        return entry.expires_on >= now + self._expiry_buffer
+
+    def get(self, key: str) -> _CachedToken | None:
+        """Gets the usable token for a key, dropping it if it is near expiry.
+
+        :param key: The cache key.
+        :return: The cache entry, or None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self.is_usable(entry):
+            return entry
+        del self._entries[key]
+        return None
+
+    def set(self, key: str, entry: _CachedToken) -> None:
+        """Caches a token, evicting expired tokens and then the tokens nearest
+        expiry if the cache is over its bound.
+
+        :param key: The cache key.
+        :param entry: The cache entry.
+        """
+        self._entries[key] = entry
+        heapq.heappush(
+            self._expiry_heap, (entry.expires_on, next(self._sequence), key, entry)
+        )
+
+        if len(self._entries) > self._max_entries:
+            self._prune_expired_entries()
+            while len(self._entries) > self._max_entries:
+                self._pop_nearest_expiry()
+
+        if len(self._expiry_heap) > 2 * len(self._entries) + 64:
+            self._compact()
+
+    def pop(self, key: str) -> None:
+        """Removes the token for a key.
+
+        :param key: The cache key.
+        """
+        self._entries.pop(key, None)
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[_CachedToken]],
+        force_refresh: bool = False,
+    ) -> str:
+        """Gets the token for a key, fetching it if no usable token is cached.
+
+        :param key: The cache key.
+        :param fetch: Obtains a new cache entry for the key.
+        :param force_refresh: Whether to ignore the cached token.
+        :return: The access token.
+        """
+        if force_refresh:
+            self.pop(key)
+        else:
+            entry = self.get(key)
+            if entry is not None:
+                if datetime.now(timezone.utc) >= entry.refresh_on:
+                    self._fetching.start(key, lambda: self._fetch(key, fetch))
+                return entry.token
+
+        return await self._fetching.run(key, lambda: self._fetch(key, fetch))
+
+    async def _fetch(
+        self, key: str, fetch: Callable[[], Awaitable[_CachedToken]]
+    ) -> str:
+        entry = await fetch()
+        if self.is_usable(entry):
+            self.set(key, entry)
+        else:
+            self.pop(key)
+        return entry.token
+
+    def _prune_expired_entries(self) -> None:
+        now = datetime.now(timezone.utc)
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, _, key, entry = heapq.heappop(self._expiry_heap)
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+
+    def _pop_nearest_expiry(self) -> None:
+        while self._expiry_heap:
+            _, _, key, entry = heapq.heappop(self._expiry_heap)
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+                return
+
+    def _compact(self) -> None:
+        self._expiry_heap = [
+            item for item in self._expiry_heap if self._entries.get(item[2]) is item[3]
+        ]
+        heapq.heapify(self._expiry_heap)
@@ -3,16 +3,23 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import uuid
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
+
+from pydantic import BaseModel
 
 from microsoft_agents.hosting.core import (
     AccessTokenProviderBase,
     AgentAuthConfiguration,
+    Storage,
+    StoreItem,
 )
+from microsoft_agents.hosting.core.storage._type_aliases import JSON
 
 from ._models import SidecarConnectionSettings, SidecarRequestOptions
+from ._token_cache import _CachedToken, _SidecarTokenCache
 from ._token_expiry import SidecarTokenExpiry
 from .errors.error_resources import SidecarAuthErrorResources as _Errors
 from .sidecar_http_client import SidecarHttpClient
@@ -25,15 +32,26 @@ _EXPIRY_BUFFER = timedelta(seconds=30)
 
 # Hard upper bound on cached entries; protects memory when many distinct
 # identities are served.
-_MAX_CACHE_ENTRIES = 500
+_MAX_CACHE_ENTRIES = 5000
+
+# Tokens are refreshed in the background once they are this close to expiry.
+_REFRESH_BEFORE = timedelta(minutes=5)
+
+_STORAGE_KEY_PREFIX = "entra-auth-sidecar/token/"
 
 
-class _CachedToken:
-    __slots__ = ("token", "expires_on")
+class _StoredSidecarToken(BaseModel, StoreItem):
+    """A sidecar token persisted to the shared storage."""
 
-    def __init__(self, token: str, expires_on: datetime):
-        self.token = token
-        self.expires_on = expires_on
+    token: str
+    expires_on: datetime
+
+    def store_item_to_json(self) -> JSON:
+        return self.model_dump(mode="json")
+
+    @staticmethod
+    def from_json_to_store_item(json_data: JSON) -> _StoredSidecarToken:
+        return _StoredSidecarToken.model_validate(json_data)
 
 
 class SidecarAuth(AccessTokenProviderBase):
@@ -46,6 +64,12 @@ class SidecarAuth(AccessTokenProviderBase):
     agent credential and performs the full agentic identity chain
     (Blueprint -> Instance -> agentic User) internally, so this provider never
     handles secrets, certificates, or keys.
+
+    Tokens are cached per identity and scopes, and refreshed in the background
+    shortly before they expire. When a ``storage`` is given, acquired tokens are
+    also written to it and read back on a cache miss, so replicas sharing the
+    storage warm-start from each other's tokens. The storage holds bearer tokens
+    and must be protected accordingly.
     """
 
     def __init__(
@@ -53,7 +77,14 @@ class SidecarAuth(AccessTokenProviderBase):
         configuration: AgentAuthConfiguration,
         *,
         sidecar_client: SidecarHttpClient | None = None,
+        storage: Storage | None = None,
     ):
+        """
+        :param configuration: The auth configuration of the connection.
+        :param sidecar_client: The client used to reach the sidecar. Created from
+            the configuration when omitted.
+        :param storage: An optional storage shared by replicas to persist tokens.
+        """
         self._configuration = configuration
         self._settings = SidecarConnectionSettings.from_configuration(configuration)
 
@@ -77,7 +108,10 @@ class SidecarAuth(AccessTokenProviderBase):
                 ),
             )
 
-        self._token_cache: dict[str, _CachedToken] = {}
+        self._storage = storage
+        self._token_cache = _SidecarTokenCache(
+            _MAX_CACHE_ENTRIES, _EXPIRY_BUFFER, _REFRESH_BEFORE
+        )
 
     @property
     def configuration(self) -> AgentAuthConfiguration:
@@ -190,59 +224,78 @@ class SidecarAuth(AccessTokenProviderBase):
     async def _get_cached_token(
         self, service_name: str, options: SidecarRequestOptions
     ) -> str:
-        force_refresh = options.force_refresh is True
         cache_key = self._build_cache_key(service_name, options)
+        force_refresh = options.force_refresh is True
 
-        cached = self._cache_get(cache_key, force_refresh)
-        if cached is not None:
-            return cached.token
-
+        async def fetch() -> _CachedToken:
+            if not force_refresh:
+                stored = await self._read_stored_token(cache_key)
+                cached = self._token_cache.get(cache_key)
+                # a background refresh only takes a stored token another replica
+                # already refreshed
+                if stored is not None and (
+                    cached is None or stored.expires_on > cached.expires_on
+                ):
+                    return stored
+            return await self._fetch_token(cache_key, service_name, options)
+
+        return await self._token_cache.get_or_fetch(cache_key, fetch, force_refresh)
+
+    async def _fetch_token(
+        self, cache_key: str, service_name: str, options: SidecarRequestOptions
+    ) -> _CachedToken:
         result = await self._sidecar_client.get_authorization_header_unauthenticated(
             service_name, options
         )
-        self._cache_set(
-            cache_key,
-            _CachedToken(result.token, SidecarTokenExpiry.resolve(result.token)),
+        entry = self._token_cache.entry(
+            result.token, SidecarTokenExpiry.resolve(result.token)
         )
-        return result.token
-
-    def _cache_get(self, cache_key: str, force_refresh: bool) -> _CachedToken | None:
-        cached = self._token_cache.get(cache_key)
-        if cached is not None:
-            if (
-                not force_refresh
-                and cached.expires_on >= datetime.now(timezone.utc) + _EXPIRY_BUFFER
-            ):
-                return cached
-            # Token is being force-refreshed or is at/near expiry; flush it.
-            self._token_cache.pop(cache_key, None)
-        return None
-
-    def _cache_set(self, cache_key: str, token: _CachedToken) -> None:
-        self._token_cache[cache_key] = token
-
-        if len(self._token_cache) > _MAX_CACHE_ENTRIES:
-            self._prune_expired_entries()
-            if len(self._token_cache) > _MAX_CACHE_ENTRIES:
-                self._evict_nearest_expiry()
-
-    def _prune_expired_entries(self) -> None:
-        now = datetime.now(timezone.utc)
-        expired = [
-            key for key, value in self._token_cache.items() if value.expires_on <= now
-        ]
-        for key in expired:
-            self._token_cache.pop(key, None)
-
-    def _evict_nearest_expiry(self) -> None:
-        overflow = len(self._token_cache) - _MAX_CACHE_ENTRIES
-        if overflow <= 0:
+        await self._write_stored_token(cache_key, entry)
+        return entry
+
+    async def _read_stored_token(self, cache_key: str) -> _CachedToken | None:
+        if self._storage is None:
+            return None
+        storage_key = self._storage_key(cache_key)
+        try:
+            items = await self._storage.read(
+                [storage_key], target_cls=_StoredSidecarToken
+            )
+        except Exception as error:
+            logger.warning(
+                "Failed to read a cached sidecar token from storage: %s",
+                type(error).__name__,
+            )
+            return None
+
+        stored = items.get(storage_key)
+        if stored is None:
+            return None
+        entry = self._token_cache.entry(stored.token, stored.expires_on)
+        return entry if self._token_cache.is_usable(entry) else None
+
+    async def _write_stored_token(self, cache_key: str, entry: _CachedToken) -> None:
+        if self._storage is None or not self._token_cache.is_usable(entry):
             return
-        nearest = sorted(
-            self._token_cache.items(), key=lambda item: item[1].expires_on
-        )[:overflow]
-        for key, _ in nearest:
-            self._token_cache.pop(key, None)
+        try:
+            await self._storage.write(
+                {
+                    self._storage_key(cache_key): _StoredSidecarToken(
+                        token=entry.token, expires_on=entry.expires_on
+                    )
+                }
+            )
+        except Exception as error:
+            logger.warning(
+                "Failed to write a sidecar token to storage: %s",
+                type(error).__name__,
+            )
+
+    @staticmethod
+    def _storage_key(cache_key: str) -> str:
+        # the cache key names the user and tenant, so only its digest is stored
+        digest = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
+        return f"{_STORAGE_KEY_PREFIX}{digest}"
 
     @staticmethod
     def _build_cache_key(service_name: str, options: SidecarRequestOptions) -> str:
@@ -1,7 +1,9 @@
 from .msal_auth import MsalAuth
 from .msal_connection_manager import MsalConnectionManager
+from .msal_token_manager import MsalTokenManager
 
 __all__ = [
     "MsalAuth",
     "MsalConnectionManager",
+    "MsalTokenManager",
 ]
@@ -7,6 +7,8 @@ import re
 import asyncio
 import logging
 import jwt
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Optional
 from urllib.parse import urlparse, ParseResult as URI
 from msal import (
@@ -28,8 +30,15 @@ from microsoft_agents.hosting.core import (
 from microsoft_agents.hosting.core.authorization.telemetry import spans
 from microsoft_agents.authentication.msal.errors import authentication_errors
 
+from .msal_token_manager import MsalTokenManager
+
 logger = logging.getLogger(__name__)
 
+_AGENTIC_TOKEN_EXCHANGE_SCOPES = ["api://AzureAdTokenExchange/.default"]
+
+# Maximum number of agentic instance applications kept by each MsalAuth
+_MAX_AGENTIC_INSTANCE_APPS = 256
+
 
 async def _async_acquire_token_for_client(msal_auth_client, *args, **kwargs):
     """MSAL in Python does not support async, so we use asyncio.to_thread to run it in
@@ -40,6 +49,35 @@ async def _async_acquire_token_for_client(msal_auth_client, *args, **kwargs):
     )
 
 
+class _NoStoreTokenCache(TokenCache):
+    """A TokenCache that never stores tokens.
+
+    Agentic user tokens are requested through ``acquire_token_for_client``, whose cache
+    lookup does not tell users apart, so they are cached per user by
+    :class:`MsalTokenManager` instead.
+    """
+
+    def add(self, event, **kwargs) -> None:
+        return None
+
+
+@dataclass
+class _AgenticInstanceApp:
+    """The applications for one agentic instance, reused across turns.
+
+    ``client_assertion`` holds the latest agent application token, which the
+    applications read whenever MSAL needs to contact the identity provider.
+    """
+
+    client_assertion: str
+    instance_app: ConfidentialClientApplication | None = None
+    user_app: ConfidentialClientApplication | None = None
+
+
+class _AgenticUserTokenNotAcquired(Exception):
+    pass
+
+
 class MsalAuth(AccessTokenProviderBase):
 
     def __init__(self, msal_configuration: AgentAuthConfiguration):
@@ -57,6 +95,10 @@ class MsalAuth(AccessTokenProviderBase):
 
         # TokenCache is thread-safe and async-safe per MSAL documentation
         self._token_cache = TokenCache()
+        self._token_manager = MsalTokenManager()
+        self._agentic_instance_apps: OrderedDict[
+            tuple[str, str], _AgenticInstanceApp
+        ] = OrderedDict()
         logger.debug(
             f"Initializing MsalAuth with configuration: {self._msal_configuration}"
         )
@@ -70,6 +112,15 @@ class MsalAuth(AccessTokenProviderBase):
         """
         return self._msal_configuration
 
+    @property
+    def token_manager(self) -> MsalTokenManager:
+        """Returns the manager that caches and refreshes the tokens from :meth:`get_access_token`.
+
+        :return: The token manager, which also exposes cache hit and latency metrics.
+        :rtype: :class:`microsoft_agents.authentication.msal.MsalTokenManager`
+        """
+        return self._token_manager
+
     async def get_access_token(
         self, resource_url: str, scopes: list[str], force_refresh: bool = False
     ) -> str:
@@ -89,32 +140,46 @@ class MsalAuth(AccessTokenProviderBase):
             msal_auth_client = self._get_client()
 
             if isinstance(msal_auth_client, ManagedIdentityClient):
-                logger.info("Acquiring token using Managed Identity Client.")
-                auth_result_payload = await _async_acquire_token_for_client(
-                    msal_auth_client, resource=resource_url
-                )
-            elif isinstance(msal_auth_client, ConfidentialClientApplication):
-                logger.info("Acquiring token using Confidential Client Application.")
-                auth_result_payload = await _async_acquire_token_for_client(
-                    msal_auth_client, scopes=local_scopes
-                )
+                token_key = (self._client_rep(), resource_url)
             else:
-                auth_result_payload = None
+                token_key = (self._client_rep(), tuple(local_scopes))
 
-            res = (
-                auth_result_payload.get("access_token") if auth_result_payload else None
+            return await self._token_manager.get_token(
+                token_key,
+                lambda: self._acquire_access_token(
+                    msal_auth_client, resource_url, local_scopes
+                ),
+                force_refresh=force_refresh,
             )
-            if not res:
-                logger.error(
-                    "Failed to acquire token for resource %s", auth_result_payload
-                )
-                raise ValueError(
-                    authentication_errors.FailedToAcquireToken.format(
-                        str(auth_result_payload)
-                    )
+
+    async def _acquire_access_token(
+        self,
+        msal_auth_client: ConfidentialClientApplication | ManagedIdentityClient,
+        resource_url: str,
+        scopes: list[str],
+    ) -> dict:
+        if isinstance(msal_auth_client, ManagedIdentityClient):
+            logger.info("Acquiring token using Managed Identity Client.")
+            auth_result_payload = await _async_acquire_token_for_client(
+                msal_auth_client, resource=resource_url
+            )
+        elif isinstance(msal_auth_client, ConfidentialClientApplication):
+            logger.info("Acquiring token using Confidential Client Application.")
+            auth_result_payload = await _async_acquire_token_for_client(
+                msal_auth_client, scopes=scopes
+            )
+        else:
+            auth_result_payload = None
+
+        if not auth_result_payload or not auth_result_payload.get("access_token"):
+            logger.error("Failed to acquire token for resource %s", auth_result_payload)
+            raise ValueError(
+                authentication_errors.FailedToAcquireToken.format(
+                    str(auth_result_payload)
                 )
+            )
 
-            return res
+        return auth_result_payload
 
     async def acquire_token_on_behalf_of(
         self, scopes: list[str], user_assertion: str
@@ -352,6 +417,48 @@ class MsalAuth(AccessTokenProviderBase):
         logger.debug(f"Resolved scopes: {temp_list}")
         return temp_list
 
+    def _create_agentic_instance_client(
+        self,
+        agent_app_instance_id: str,
+        authority: str,
+        agentic_app: _AgenticInstanceApp,
+        token_cache: TokenCache,
+    ) -> ConfidentialClientApplication:
+        return ConfidentialClientApplication(
+            client_id=agent_app_instance_id,
+            authority=authority,
+            client_credential={
+                "client_assertion": lambda: agentic_app.client_assertion
+            },
+            azure_region=MsalAuth._resolve_azure_region(self._msal_configuration),
+            token_cache=token_cache,
+        )
+
+    def _get_agentic_instance_app(
+        self, agent_app_instance_id: str, authority: str, agent_token: str
+    ) -> _AgenticInstanceApp:
+        """Gets the cached applications for an agentic instance, creating them if needed.
+
+        The instance application shares this MsalAuth's TokenCache, so instance tokens
+        are served from the cache until they expire. The least recently used instance
+        is evicted once more than ``_MAX_AGENTIC_INSTANCE_APPS`` are cached.
+        """
+        key = (agent_app_instance_id, authority)
+        agentic_app = self._agentic_instance_apps.get(key)
+        if agentic_app is None:
+            agentic_app = _AgenticInstanceApp(agent_token)
+            agentic_app.instance_app = self._create_agentic_instance_client(
+                agent_app_instance_id, authority, agentic_app, self._token_cache
+            )
+            self._agentic_instance_apps[key] = agentic_app
+        else:
+            agentic_app.client_assertion = agent_token
+            self._agentic_instance_apps.move_to_end(key)
+
+        while len(self._agentic_instance_apps) > _MAX_AGENTIC_INSTANCE_APPS:
+            self._agentic_instance_apps.popitem(last=False)
+        return agentic_app
+
     # the call to MSAL is blocking, but in the future we want to create an asyncio task
     # to avoid this
     async def get_agentic_application_token(
@@ -449,17 +556,12 @@ class MsalAuth(AccessTokenProviderBase):
                 )
 
             authority = MsalAuth._resolve_authority(self._msal_configuration, tenant_id)
-
-            instance_app = ConfidentialClientApplication(
-                client_id=agent_app_instance_id,
-                authority=authority,
-                client_credential={"client_assertion": agent_token_result},
-                azure_region=MsalAuth._resolve_azure_region(self._msal_configuration),
-                # token_cache=self._token_cache,
-            )
+            instance_app = self._get_agentic_instance_app(
+                agent_app_instance_id, authority, agent_token_result
+            ).instance_app
 
             agentic_instance_token = await _async_acquire_token_for_client(
-                instance_app, ["api://AzureAdTokenExchange/.default"]
+                instance_app, _AGENTIC_TOKEN_EXCHANGE_SCOPES
             )
 
             if not agentic_instance_token:
@@ -528,67 +630,85 @@ class MsalAuth(AccessTokenProviderBase):
                 agent_app_instance_id,
                 agentic_user_id,
             )
-            instance_token, agent_token = await self.get_agentic_instance_token(
-                tenant_id, agent_app_instance_id
-            )
+            authority = MsalAuth._resolve_authority(self._msal_configuration, tenant_id)
 
-            if not instance_token or not agent_token:
-                logger.error(
-                    "Failed to acquire instance token or agent token for agent_app_instance_id %s and agentic_user_id %s",
-                    agent_app_instance_id,
-                    agentic_user_id,
-                )
-                raise Exception(
-                    authentication_errors.FailedToAcquireInstanceOrAgentToken.format(
-                        agent_app_instance_id, agentic_user_id
-                    )
+            try:
+                return await self._token_manager.get_token(
+                    (
+                        "agentic_user",
+                        authority,
+                        agent_app_instance_id,
+                        agentic_user_id,
+                        tuple(scopes),
+                    ),
+                    lambda: self._acquire_agentic_user_token(
+                        tenant_id,
+                        authority,
+                        agent_app_instance_id,
+                        agentic_user_id,
+                        scopes,
+                    ),
                 )
+            except _AgenticUserTokenNotAcquired:
+                return None
 
-            authority = MsalAuth._resolve_authority(self._msal_configuration, tenant_id)
-
-            instance_app = ConfidentialClientApplication(
-                client_id=agent_app_instance_id,
-                authority=authority,
-                client_credential={"client_assertion": agent_token},
-                azure_region=MsalAuth._resolve_azure_region(self._msal_configuration),
-                # token_cache=self._token_cache,
-            )
+    async def _acquire_agentic_user_token(
+        self,
+        tenant_id: str,
+        authority: str,
+        agent_app_instance_id: str,
+        agentic_user_id: str,
+        scopes: list[str],
+    ) -> dict:
+        instance_token, agent_token = await self.get_agentic_instance_token(
+            tenant_id, agent_app_instance_id
+        )
 
-            logger.info(
-                "Acquiring agentic user token for agent_app_instance_id %s and agentic_user_id %s",
+        if not instance_token or not agent_token:
+            logger.error(
+                "Failed to acquire instance token or agent token for agent_app_instance_id %s and agentic_user_id %s",
                 agent_app_instance_id,
                 agentic_user_id,
             )
-            # MSAL in Python does not support async, so we use asyncio.to_thread to run it in
-            # a separate thread and avoid blocking the event loop
-            auth_result_payload = await _async_acquire_token_for_client(
-                instance_app,
-                scopes,
-                data={
-                    "user_id": agentic_user_id,
-                    "user_federated_identity_credential": instance_token,
-                    "grant_type": "user_fic",
-                },
+            raise Exception(
+                authentication_errors.FailedToAcquireInstanceOrAgentToken.format(
+                    agent_app_instance_id, agentic_user_id
+                )
             )
 
-            if not auth_result_payload:
-                logger.error(
-                    "Failed to acquire agentic user token for agent_app_instance_id %s and agentic_user_id %s, %s",
-                    agent_app_instance_id,
-                    agentic_user_id,
-                    auth_result_payload,
-                )
-                return None
+        agentic_app = self._get_agentic_instance_app(
+            agent_app_instance_id, authority, agent_token
+        )
+        if agentic_app.user_app is None:
+            agentic_app.user_app = self._create_agentic_instance_client(
+                agent_app_instance_id, authority, agentic_app, _NoStoreTokenCache()
+            )
 
-            access_token = auth_result_payload.get("access_token")
-            if not access_token:
-                logger.error(
-                    "Failed to acquire agentic user token for agent_app_instance_id %s and agentic_user_id %s, %s",
-                    agent_app_instance_id,
-                    agentic_user_id,
-                    auth_result_payload,
-                )
-                return None
+        logger.info(
+            "Acquiring agentic user token for agent_app_instance_id %s and agentic_user_id %s",
+            agent_app_instance_id,
+            agentic_user_id,
+        )
+        # MSAL in Python does not support async, so we use asyncio.to_thread to run it in
+        # a separate thread and avoid blocking the event loop
+        auth_result_payload = await _async_acquire_token_for_client(
+            agentic_app.user_app,
+            scopes,
+            data={
+                "user_id": agentic_user_id,
+                "user_federated_identity_credential": instance_token,
+                "grant_type": "user_fic",
+            },
+        )
+
+        if not auth_result_payload or not auth_result_payload.get("access_token"):
+            logger.error(
+                "Failed to acquire agentic user token for agent_app_instance_id %s and agentic_user_id %s, %s",
+                agent_app_instance_id,
+                agentic_user_id,
+                auth_result_payload,
+            )
+            raise _AgenticUserTokenNotAcquired()
 
-            logger.info("Acquired agentic user token response.")
-            return access_token
+        logger.info("Acquired agentic user token response.")
+        return auth_result_payload
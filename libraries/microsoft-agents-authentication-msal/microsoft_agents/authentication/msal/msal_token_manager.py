@@ -0,0 +1,167 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+
+from microsoft_agents.hosting.core.authorization._single_flight import (
+    _SingleFlight,
+    _refresh_time,
+)
+from microsoft_agents.hosting.core.authorization.telemetry import metrics
+
+
+@dataclass
+class _CachedToken:
+
+    access_token: str
+    expires_at: float
+    refresh_at: float
+
+
+class MsalTokenManager:
+    """Caches access tokens per key, coalescing concurrent acquisitions and refreshing
+    tokens in the background before they expire.
+
+    A token is served from the cache until ``expiry_buffer`` seconds before it expires.
+    Once fewer than ``refresh_before`` seconds remain, the next request starts a
+    background refresh and keeps receiving the cached token, so callers only wait for
+    an acquisition when a key has no usable token. Concurrent requests for such a key
+    share a single acquisition.
+
+    Tokens whose acquisition result has no ``expires_in`` are not cached.
+    """
+
+    def __init__(self, refresh_before: float = 240.0, expiry_buffer: float = 30.0):
+        """
+        :param refresh_before: Seconds before expiry at which a token is refreshed in the background.
+            The default is below MSAL's own five-minute refresh window, so the refresh
+            returns a new token rather than the one in MSAL's cache.
+        :param expiry_buffer: Seconds before expiry after which a token is no longer served.
+        """
+        if expiry_buffer < 0 or refresh_before < expiry_buffer:
+            raise ValueError(
+                "MsalTokenManager(): refresh_before must be at least expiry_buffer, which must not be negative"
+            )
+
+        self._refresh_before = refresh_before
+        self._expiry_buffer = expiry_buffer
+
+        self._tokens: dict[Hashable, _CachedToken] = {}
+        self._acquiring: _SingleFlight[str] = _SingleFlight("Access token acquisition")
+
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._refreshes = 0
+        self._acquisitions = 0
+        self._acquisition_time_ms = 0.0
+        self._last_acquisition_ms: float | None = None
+
+    @property
+    def hits(self) -> int:
+        """The number of requests served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of requests that waited for an acquisition."""
+        return self._misses
+
+    @property
+    def coalesced(self) -> int:
+        """The number of misses that joined an acquisition already in flight."""
+        return self._coalesced
+
+    @property
+    def refreshes(self) -> int:
+        """The number of background refreshes started."""
+        return self._refreshes
+
+    @property
+    def acquisitions(self) -> int:
+        """The number of completed or failed acquisitions."""
+        return self._acquisitions
+
+    @property
+    def last_acquisition_ms(self) -> float | None:
+        """The duration of the most recent acquisition in milliseconds."""
+        return self._last_acquisition_ms
+
+    @property
+    def average_acquisition_ms(self) -> float | None:
+        """The mean duration of acquisitions in milliseconds."""
+        if not self._acquisitions:
+            return None
+        return self._acquisition_time_ms / self._acquisitions
+
+    async def get_token(
+        self,
+        key: Hashable,
+        acquire: Callable[[], Awaitable[dict[str, Any]]],
+        force_refresh: bool = False,
+    ) -> str:
+        """Gets the access token for a key, acquiring it if no usable token is cached.
+
+        :param key: Identifies the token, e.g. the authority and scopes it is for.
+        :param acquire: Acquires a token, returning an MSAL result with ``access_token``
+            and ``expires_in``. It should raise if no token could be acquired.
+        :param force_refresh: Whether to ignore the cached token.
+        :return: The access token.
+        """
+        entry = self._tokens.get(key)
+        now = time.monotonic()
+        if (
+            not force_refresh
+            and entry is not None
+            and now < entry.expires_at - self._expiry_buffer
+        ):
+            self._hits += 1
+            metrics.auth_token_cache_hit_total.add(1)
+            if now >= entry.refresh_at and not self._acquiring.in_flight(key):
+                self._refreshes += 1
+                self._acquiring.start(key, lambda: self._acquire(key, acquire))
+            return entry.access_token
+
+        self._misses += 1
+        metrics.auth_token_cache_miss_total.add(1)
+        if self._acquiring.in_flight(key):
+            self._coalesced += 1
+
+        return await self._acquiring.run(key, lambda: self._acquire(key, acquire))
+
+    def invalidate(self, key: Hashable) -> None:
+        """Removes the cached token for a key.
+
+        :param key: Identifies the token.
+        """
+        self._tokens.pop(key, None)
+
+    async def _acquire(
+        self, key: Hashable, acquire: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> str:
+        started = time.monotonic()
+        try:
+            result = await acquire()
+        finally:
+            duration_ms = (time.monotonic() - started) * 1000
+            self._acquisitions += 1
+            self._acquisition_time_ms += duration_ms
+            self._last_acquisition_ms = duration_ms
+            metrics.auth_token_acquisition_duration.record(duration_ms)
+
+        access_token = result["access_token"]
+        expires_in = result.get("expires_in")
+        if isinstance(expires_in, (int, float)) and not isinstance(expires_in, bool):
+            expires_at = started + expires_in
+            self._tokens[key] = _CachedToken(
+                access_token,
+                expires_at,
+                _refresh_time(started, expires_at, self._refresh_before),
+            )
+        else:
+            self._tokens.pop(key, None)
+        return access_token
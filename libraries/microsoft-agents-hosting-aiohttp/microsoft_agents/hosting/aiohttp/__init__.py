@@ -5,6 +5,7 @@ from .cloud_adapter import CloudAdapter
 from .jwt_authorization_middleware import (
     jwt_authorization_middleware,
     jwt_authorization_decorator,
+    jwt_authorization_warm_up,
 )
 
 # Import streaming utilities from core for backward compatibility
@@ -20,6 +21,7 @@ __all__ = [
     "CloudAdapter",
     "jwt_authorization_middleware",
     "jwt_authorization_decorator",
+    "jwt_authorization_warm_up",
     "channel_service_route_table",
     "Citation",
     "CitationUtil",
@@ -21,6 +21,9 @@ class AiohttpRequestAdapter:
     async def json(self):
         return await self._request.json()
 
+    async def read(self) -> bytes:
+        return await self._request.read()
+
     def get_claims_identity(self):
         return self._request.get("claims_identity")
 
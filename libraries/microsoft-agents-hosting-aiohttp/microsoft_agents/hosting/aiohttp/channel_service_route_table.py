@@ -3,7 +3,7 @@
 
 from aiohttp.web import RouteTableDef, Request, Response
 
-from microsoft_agents.hosting.core import ChannelApiHandlerProtocol
+from microsoft_agents.hosting.core import ChannelApiHandlerProtocol, get_json_codec
 from microsoft_agents.hosting.core.http import ChannelServiceRoutes
 
 from ._aiohttp_request_adapter import AiohttpRequestAdapter
@@ -25,9 +25,9 @@ def channel_service_route_table(
     service_routes = ChannelServiceRoutes(handler, base_url)
 
     def json_response(data: dict | list[dict]) -> Response:
-        import json
-
-        return Response(text=json.dumps(data), content_type="application/json")
+        return Response(
+            body=get_json_codec().dumps(data), content_type="application/json"
+        )
 
     @routes.post(base_url + "/v3/conversations/{conversation_id}/activities")
     async def send_to_conversation(request: Request):
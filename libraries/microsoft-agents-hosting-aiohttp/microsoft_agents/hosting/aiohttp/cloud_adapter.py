@@ -29,6 +29,8 @@ class CloudAdapter(HttpAdapterBase, AgentHttpAdapter):
         channel_service_client_factory: ChannelServiceClientFactoryBase | None = None,
         channel_service_client_factory_options: dict | None = None,
         host_validator: OutboundHostValidator | None = None,
+        max_in_flight_sends: int = 1,
+        lazy_activity_validation: bool = False,
     ):
         """
         Initializes a new instance of the CloudAdapter class.
@@ -37,12 +39,19 @@ class CloudAdapter(HttpAdapterBase, AgentHttpAdapter):
         :param channel_service_client_factory: Factory for creating channel service clients.
         :param channel_service_client_factory_options: Optional dictionary of options to pass to the channel service client factory
             This is only used if channel_service_client_factory is not provided and connection_manager is provided.
+        :param max_in_flight_sends: The maximum number of outbound requests a single `send_activities`
+            call keeps in flight. The default of 1 sends activities one after another.
+        :param lazy_activity_validation: If true, inbound activities are parsed as
+            :class:`microsoft_agents.activity.LazyActivity`, which validates nested
+            sub-models such as entities and attachments only when they are read.
         """
         super().__init__(
             connection_manager=connection_manager,
             channel_service_client_factory=channel_service_client_factory,
             channel_service_client_factory_options=channel_service_client_factory_options,
             host_validator=host_validator,
+            max_in_flight_sends=max_in_flight_sends,
+            lazy_activity_validation=lazy_activity_validation,
         )
 
     async def process(self, request: Request, agent: Agent) -> Optional[Response]:
@@ -5,10 +5,13 @@ import functools
 import logging
 from typing import cast
 
-from aiohttp.web import Request, middleware, json_response
+from aiohttp.web import Application, Request, middleware, json_response
 
 from microsoft_agents.hosting.core.authorization import AgentAuthConfiguration
-from microsoft_agents.hosting.core.authorization.jwt import _authorize_request
+from microsoft_agents.hosting.core.authorization.jwt import (
+    JwtTokenValidator,
+    _authorize_request,
+)
 from microsoft_agents.hosting.core.http import HttpResponse
 
 logger = logging.getLogger(__name__)
@@ -77,3 +80,24 @@ def jwt_authorization_decorator(func):
         return await _jwt_authorization_middleware(request, func)
 
     return wrapper
+
+
+async def jwt_authorization_warm_up(app: Application) -> None:
+    """
+    Startup hook that fetches the JWT signing keys before the first request arrives.
+
+    Register it with ``app.on_startup.append(jwt_authorization_warm_up)``. Keys that
+    cannot be fetched at startup are fetched again when a token needs them.
+
+    :param app: The aiohttp application holding the ``agent_configuration``.
+    """
+    auth_config = cast(
+        AgentAuthConfiguration | None, app.get("agent_configuration", None)
+    )
+    if auth_config is None:
+        logger.warning(
+            "Agent Authentication configuration not found; skipping warm-up."
+        )
+        return
+
+    await JwtTokenValidator(auth_config).warm_up()
@@ -10,6 +10,14 @@ from .middleware_set import Middleware, MiddlewareSet
 from .rest_channel_service_client_factory import RestChannelServiceClientFactory
 from .turn_context import TurnContext
 from .outbound_host_validator import OutboundHostValidator
+from .json_codec import (
+    JsonCodec,
+    StdlibJsonCodec,
+    OrjsonJsonCodec,
+    MsgspecJsonCodec,
+    get_json_codec,
+    set_json_codec,
+)
 
 # HTTP abstractions
 from .http import (
@@ -25,7 +33,13 @@ from .app._type_defs import RouteHandler, RouteSelector, StateT
 from .app.agent_application import AgentApplication
 from .app.app_error import ApplicationError
 from .app.app_options import ApplicationOptions
-from .app.input_file import InputFile, InputFileDownloader
+from .app.attachment_downloader import AttachmentDownloader, FileTooLargeError
+from .app.input_file import (
+    InputFile,
+    InputFileDownloader,
+    LazyInputFile,
+    SpooledInputFile,
+)
 from .app.query import Query
 from .app._routes import _Route, _RouteList, RouteRank
 from .app.typing_indicator import TypingIndicator
@@ -83,6 +97,7 @@ from .client.http_agent_channel import HttpAgentChannel
 # Connector API
 from .connector import (
     ConnectorClient,
+    UserTokenCache,
     UserTokenClient,
     UserTokenClientBase,
     TeamsConnectorClient,
@@ -106,6 +121,8 @@ from .state.user_state import UserState
 from .storage.store_item import StoreItem
 from .storage import Storage
 from .storage.memory_storage import MemoryStorage
+from .storage.cached_storage import CachedStorage
+from .storage.object_memory_storage import ObjectMemoryStorage
 
 # Error Resources
 from .errors import error_resources, ErrorMessage, ErrorResources
@@ -124,6 +141,12 @@ __all__ = [
     "RestChannelServiceClientFactory",
     "TurnContext",
     "OutboundHostValidator",
+    "JsonCodec",
+    "StdlibJsonCodec",
+    "OrjsonJsonCodec",
+    "MsgspecJsonCodec",
+    "get_json_codec",
+    "set_json_codec",
     "HttpRequestProtocol",
     "HttpResponse",
     "HttpResponseFactory",
@@ -134,6 +157,10 @@ __all__ = [
     "ApplicationOptions",
     "InputFile",
     "InputFileDownloader",
+    "LazyInputFile",
+    "SpooledInputFile",
+    "AttachmentDownloader",
+    "FileTooLargeError",
     "Query",
     "_Route",
     "RouteHandler",
@@ -172,6 +199,7 @@ __all__ = [
     "HttpAgentChannelFactory",
     "HttpAgentChannel",
     "ConnectorClient",
+    "UserTokenCache",
     "UserTokenClient",
     "UserTokenClientBase",
     "TeamsConnectorClient",
@@ -186,6 +214,8 @@ __all__ = [
     "StoreItem",
     "Storage",
     "MemoryStorage",
+    "CachedStorage",
+    "ObjectMemoryStorage",
     "AgenticUserAuthorization",
     "Authorization",
     "MiddlewareSet",
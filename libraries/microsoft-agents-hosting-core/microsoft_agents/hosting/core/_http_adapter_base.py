@@ -9,7 +9,9 @@ from traceback import format_exc
 
 import logging
 
-from microsoft_agents.activity import Activity, DeliveryModes
+from pydantic import ValidationError
+
+from microsoft_agents.activity import Activity, DeliveryModes, LazyActivity
 from microsoft_agents.hosting.core.telemetry.adapter import spans
 
 from .agent import Agent
@@ -19,6 +21,7 @@ from .channel_service_adapter import ChannelServiceAdapter
 from .channel_service_client_factory_base import ChannelServiceClientFactoryBase
 from .http._http_request_protocol import HttpRequestProtocol
 from .http._http_response import HttpResponse, HttpResponseFactory
+from .http._request_body import _validate_body, _is_invalid_json
 from .message_factory import MessageFactory
 from .rest_channel_service_client_factory import RestChannelServiceClientFactory
 from .turn_context import TurnContext
@@ -41,6 +44,8 @@ class HttpAdapterBase(ChannelServiceAdapter, ABC):
         channel_service_client_factory: ChannelServiceClientFactoryBase | None = None,
         channel_service_client_factory_options: dict | None = None,
         host_validator: OutboundHostValidator | None = None,
+        max_in_flight_sends: int = 1,
+        lazy_activity_validation: bool = False,
     ):
         """Initialize the HTTP adapter.
 
@@ -48,6 +53,11 @@ class HttpAdapterBase(ChannelServiceAdapter, ABC):
         :param channel_service_client_factory: Factory for creating channel service clients.
         :param channel_service_client_factory_options: Optional dictionary of options to pass to the channel service client factory
             This is only used if channel_service_client_factory is not provided and connection_manager is provided.
+        :param max_in_flight_sends: The maximum number of outbound requests a single `send_activities`
+            call keeps in flight. The default of 1 sends activities one after another.
+        :param lazy_activity_validation: If true, inbound activities are parsed as
+            :class:`microsoft_agents.activity.LazyActivity`, which validates nested
+            sub-models such as entities and attachments only when they are read.
         """
 
         async def on_turn_error(context: TurnContext, error: Exception):
@@ -80,8 +90,11 @@ class HttpAdapterBase(ChannelServiceAdapter, ABC):
                 **(channel_service_client_factory_options or {}),
             )
         self._host_validator = host_validator or OutboundHostValidator()
+        self._activity_model: type[Activity] = (
+            LazyActivity if lazy_activity_validation else Activity
+        )
 
-        super().__init__(factory)
+        super().__init__(factory, max_in_flight_sends=max_in_flight_sends)
 
     async def process_request(
         self, request: HttpRequestProtocol, agent: Agent
@@ -109,13 +122,18 @@ class HttpAdapterBase(ChannelServiceAdapter, ABC):
                 return HttpResponseFactory.method_not_allowed()
 
             try:
-                body = await request.json()
+                activity: Activity = await _validate_body(request, self._activity_model)
+            except ValidationError as error:
+                if not _is_invalid_json(error):
+                    raise
+                return HttpResponseFactory.bad_request(
+                    "Invalid JSON or unsupported Content-Type"
+                )
             except Exception:
                 return HttpResponseFactory.bad_request(
                     "Invalid JSON or unsupported Content-Type"
                 )
 
-            activity: Activity = Activity.model_validate(body)
             span.share(activity=activity)
 
             # Get claims identity (default to anonymous if not set by middleware)
@@ -18,8 +18,8 @@ class _DummyCache(Storage):
 
 
 # this could be generalized. Ideas:
-# - CachedStorage class for two-tier storage
 # - Namespaced/PrefixedStorage class for namespacing keying
+# (for two-tier storage, pass a CachedStorage as the backing storage)
 # not generally thread or async safe (operations are not atomic)
 class _FlowStorageClient:
     """Wrapper around Storage that manages sign-in state specific to each user and channel.
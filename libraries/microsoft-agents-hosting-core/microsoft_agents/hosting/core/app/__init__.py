@@ -8,7 +8,13 @@ from __future__ import annotations
 from .agent_application import AgentApplication
 from .app_error import ApplicationError
 from .app_options import ApplicationOptions
-from .input_file import InputFile, InputFileDownloader
+from .attachment_downloader import AttachmentDownloader, FileTooLargeError
+from .input_file import (
+    InputFile,
+    InputFileDownloader,
+    LazyInputFile,
+    SpooledInputFile,
+)
 from .query import Query
 from ._routes import _RouteList, _Route, RouteRank
 from .typing_indicator import TypingChannelStrategy, TypingIndicator, TypingOptions
@@ -29,6 +35,7 @@ from .proactive import (
     CreateConversationOptions,
     Proactive,
     ProactiveOptions,
+    SendActivityResult,
 )
 
 # App State
@@ -43,6 +50,10 @@ __all__ = [
     "ApplicationOptions",
     "InputFile",
     "InputFileDownloader",
+    "LazyInputFile",
+    "SpooledInputFile",
+    "AttachmentDownloader",
+    "FileTooLargeError",
     "Query",
     "Route",
     "RouteHandler",
@@ -66,4 +77,5 @@ __all__ = [
     "CreateConversationOptions",
     "Proactive",
     "ProactiveOptions",
+    "SendActivityResult",
 ]
@@ -2,11 +2,15 @@
 # Licensed under the MIT License.
 
 from ._route_list import _RouteList
+from ._route_index import _RouteIndex
+from ._message_matcher import _MessageMatcher
 from ._route import _Route, _agentic_selector
 from .route_rank import RouteRank
 
 __all__ = [
     "_RouteList",
+    "_RouteIndex",
+    "_MessageMatcher",
     "_Route",
     "RouteRank",
     "_agentic_selector",
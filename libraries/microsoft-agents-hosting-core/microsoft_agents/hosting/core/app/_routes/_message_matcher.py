@@ -0,0 +1,135 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from __future__ import annotations
+
+import re
+from typing import Hashable, Optional
+
+_NO_MATCH = -1
+
+# flags that can be scoped to a single alternative with (?flags:...)
+_SCOPED_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s", re.VERBOSE: "x"}
+_MERGEABLE_FLAGS = re.UNICODE | re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE
+# inline global flags such as (?i) are only valid at the start of a whole expression
+_INLINE_GLOBAL_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+def _is_mergeable(pattern: re.Pattern) -> bool:
+    # capturing groups would be renumbered (breaking backreferences) and
+    # named groups may collide, so only group-free str patterns are merged
+    return (
+        isinstance(pattern.pattern, str)
+        and pattern.groups == 0
+        and not pattern.flags & ~_MERGEABLE_FLAGS
+        and _INLINE_GLOBAL_FLAGS.search(pattern.pattern) is None
+    )
+
+
+def _scoped(pattern: re.Pattern) -> str:
+    flags = "".join(
+        letter for flag, letter in _SCOPED_FLAGS.items() if pattern.flags & flag
+    )
+    body = pattern.pattern
+    if pattern.flags & re.VERBOSE:
+        # a trailing comment would otherwise swallow the closing parenthesis
+        body += "\n"
+    return f"(?{flags}:{body})" if flags else f"(?:{body})"
+
+
+class _MessageMatcher:
+    """Matches message text against the selectors of every ``message()`` route at once.
+
+    Literal selectors are kept in a single hash table and group-free regex
+    selectors are merged into one alternation, so a single pass over the text
+    finds the first registered entry that matches. Entries before it are known
+    not to match; entries after it are checked individually if they are ever
+    asked about, which keeps the result identical to evaluating every entry
+    on its own.
+    """
+
+    _literals: list[frozenset[Hashable]]
+    _patterns: list[tuple[re.Pattern, ...]]
+    _literal_index: Optional[dict[Hashable, int]]
+    _combined: Optional[re.Pattern]
+    _group_entries: dict[str, int]
+    _unmerged: list[tuple[int, re.Pattern]]
+    _last: tuple[Optional[str], int]
+
+    def __init__(self) -> None:
+        self._literals = []
+        self._patterns = []
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._literal_index = None
+        self._combined = None
+        self._group_entries = {}
+        self._unmerged = []
+        self._last = (None, _NO_MATCH)
+
+    def add(self, select: str | re.Pattern[str] | list[str | re.Pattern[str]]) -> int:
+        """Registers the selector of a ``message()`` route and returns its entry id."""
+        items = select if isinstance(select, list) else [select]
+        self._literals.append(
+            frozenset(item for item in items if not isinstance(item, re.Pattern))
+        )
+        self._patterns.append(
+            tuple(item for item in items if isinstance(item, re.Pattern))
+        )
+        self._invalidate()
+        return len(self._literals) - 1
+
+    def _compile(self) -> None:
+        literal_index: dict[Hashable, int] = {}
+        alternatives: list[str] = []
+        for entry in range(len(self._literals)):
+            for literal in self._literals[entry]:
+                literal_index.setdefault(literal, entry)
+            for pattern in self._patterns[entry]:
+                if _is_mergeable(pattern):
+                    group = f"_m{len(alternatives)}"
+                    self._group_entries[group] = entry
+                    alternatives.append(f"(?P<{group}>{_scoped(pattern)})")
+                else:
+                    self._unmerged.append((entry, pattern))
+
+        self._combined = re.compile("|".join(alternatives)) if alternatives else None
+        self._literal_index = literal_index
+
+    def first_match(self, text: str) -> int:
+        """Returns the id of the first registered entry matching ``text``, or -1."""
+        last_text, last_entry = self._last
+        if last_text == text:
+            return last_entry
+
+        if self._literal_index is None:
+            self._compile()
+
+        first = self._literal_index.get(text, _NO_MATCH)
+        if self._combined is not None:
+            match = self._combined.fullmatch(text)
+            if match is not None:
+                entry = self._group_entries[match.lastgroup]
+                if first == _NO_MATCH or entry < first:
+                    first = entry
+        for entry, pattern in self._unmerged:
+            if first != _NO_MATCH and entry >= first:
+                break
+            if pattern.fullmatch(text) is not None:
+                first = entry
+                break
+
+        self._last = (text, first)
+        return first
+
+    def matches(self, entry: int, text: str) -> bool:
+        """Returns whether the selector registered as ``entry`` matches ``text``."""
+        first = self.first_match(text)
+        if first == _NO_MATCH or entry < first:
+            return False
+        if entry == first:
+            return True
+        return text in self._literals[entry] or any(
+            pattern.fullmatch(text) is not None for pattern in self._patterns[entry]
+        )
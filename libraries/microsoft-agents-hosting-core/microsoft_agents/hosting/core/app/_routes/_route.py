@@ -3,7 +3,8 @@
 
 from __future__ import annotations
 
-from typing import Generic, Optional, TypeVar
+from enum import Enum
+from typing import Generic, Iterable, Optional, TypeVar
 
 from ...turn_context import TurnContext
 from .._type_defs import RouteHandler, RouteSelector
@@ -21,6 +22,10 @@ def _agentic_selector(selector: RouteSelector) -> RouteSelector:
 StateT = TypeVar("StateT", bound=TurnState)
 
 
+def _hint_value(value: str | Enum) -> str:
+    return value.value if isinstance(value, Enum) else value
+
+
 class _Route(Generic[StateT]):
     selector: RouteSelector
     handler: RouteHandler[StateT]
@@ -28,6 +33,9 @@ class _Route(Generic[StateT]):
     _rank: int
     auth_handlers: list[str]
     _is_agentic: bool
+    _activity_types: Optional[frozenset[str]]
+    _activity_name: Optional[str]
+    _priority: tuple[int, int, int]
 
     def __init__(
         self,
@@ -37,6 +45,8 @@ class _Route(Generic[StateT]):
         rank: int = RouteRank.DEFAULT,
         auth_handlers: Optional[list[str]] = None,
         is_agentic: bool = False,
+        activity_types: Optional[Iterable[str]] = None,
+        activity_name: Optional[str] = None,
         **kwargs,
     ) -> None:
 
@@ -51,6 +61,21 @@ class _Route(Generic[StateT]):
         self._rank = int(rank)  # conversion from RouteRank IntEnum if necessary
         self._is_agentic = is_agentic
         self.auth_handlers = auth_handlers or []
+        self._activity_types = (
+            frozenset(_hint_value(t) for t in activity_types)
+            if activity_types is not None
+            else None
+        )
+        self._activity_name = (
+            _hint_value(activity_name) if activity_name is not None else None
+        )
+        # rank, invoke and agentic flags never change after construction,
+        # so the sort key is computed once instead of on every comparison
+        self._priority = (
+            0 if self._is_invoke else 1,
+            0 if self._is_agentic else 1,
+            self._rank,
+        )
 
     @property
     def is_invoke(self) -> bool:
@@ -64,6 +89,34 @@ class _Route(Generic[StateT]):
     def is_agentic(self) -> bool:
         return self._is_agentic
 
+    @property
+    def activity_types(self) -> Optional[frozenset[str]]:
+        """Activity types this route can match, or None if the route may match any type."""
+        return self._activity_types
+
+    @property
+    def activity_name(self) -> Optional[str]:
+        """Activity name (e.g. an invoke name) this route requires, or None if any name is accepted."""
+        return self._activity_name
+
+    def accepts(
+        self, activity_type: Optional[str], activity_name: Optional[str], agentic: bool
+    ) -> bool:
+        """Returns whether the route's selector could possibly match an activity with these keys.
+
+        This is a pre-filter used by the dispatch index; the selector still has the final say.
+        """
+        if self._is_agentic and not agentic:
+            return False
+        if (
+            self._activity_types is not None
+            and activity_type not in self._activity_types
+        ):
+            return False
+        if self._activity_name is not None and activity_name != self._activity_name:
+            return False
+        return True
+
     @property
     def priority(self) -> list[int]:
         """Lower "values" indicate higher priority.
@@ -78,12 +131,8 @@ class _Route(Generic[StateT]):
 
         priority is represented as a list of three integers for easy lexicographic comparison.
         """
-        return [
-            0 if self._is_invoke else 1,
-            0 if self._is_agentic else 1,
-            self._rank,
-        ]
+        return list(self._priority)
 
     def __lt__(self, other: _Route) -> bool:
-        # built-in list ordering is a lexicographic comparison in Python
-        return self.priority < other.priority
+        # built-in tuple ordering is a lexicographic comparison in Python
+        return self._priority < other._priority
@@ -0,0 +1,64 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from __future__ import annotations
+
+from typing import Generic, Iterable, Optional, TypeVar
+
+from microsoft_agents.activity import Activity
+
+from ..state.turn_state import TurnState
+from ._route import _Route
+
+StateT = TypeVar("StateT", bound=TurnState)
+
+_BucketKey = tuple[Optional[str], Optional[str], bool]
+
+
+class _RouteIndex(Generic[StateT]):
+    """An immutable dispatch index over a priority-ordered snapshot of routes.
+
+    Routes are bucketed by (activity type, activity name, agentic flag). Only
+    types and names that some route declared are used as bucket keys; anything
+    else collapses into the ``None`` key, so the number of buckets is bounded by
+    the registered routes rather than by incoming traffic. Buckets are filtered
+    subsequences of the sorted snapshot, so priority order (including the order
+    of routes with equal priority) is preserved.
+    """
+
+    _routes: tuple[_Route[StateT], ...]
+    _activity_types: frozenset[str]
+    _activity_names: frozenset[str]
+    _buckets: dict[_BucketKey, tuple[_Route[StateT], ...]]
+
+    def __init__(self, routes: Iterable[_Route[StateT]]) -> None:
+        self._routes = tuple(routes)
+        self._activity_types = frozenset(
+            activity_type
+            for route in self._routes
+            if route.activity_types
+            for activity_type in route.activity_types
+        )
+        self._activity_names = frozenset(
+            route.activity_name
+            for route in self._routes
+            if route.activity_name is not None
+        )
+        self._buckets = {}
+
+    @property
+    def routes(self) -> tuple[_Route[StateT], ...]:
+        """All routes in priority order."""
+        return self._routes
+
+    def candidates(self, activity: Activity) -> tuple[_Route[StateT], ...]:
+        """Returns, in priority order, the routes whose selectors could match the activity."""
+        activity_type = activity.type if activity.type in self._activity_types else None
+        activity_name = activity.name if activity.name in self._activity_names else None
+        key = (activity_type, activity_name, bool(activity.is_agentic_request()))
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = tuple(route for route in self._routes if route.accepts(*key))
+            self._buckets[key] = bucket
+        return bucket
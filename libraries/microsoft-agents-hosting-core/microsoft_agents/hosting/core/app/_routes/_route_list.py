@@ -4,29 +4,47 @@
 from __future__ import annotations
 
 import heapq
-from typing import Generic, TypeVar
+from typing import Generic, Optional, TypeVar
+
+from microsoft_agents.activity import Activity
 
 from ..state.turn_state import TurnState
 from ._route import _Route
+from ._route_index import _RouteIndex
 
 StateT = TypeVar("StateT", bound=TurnState)
 
 
 class _RouteList(Generic[StateT]):
     _routes: list[_Route[StateT]]
+    _index: Optional[_RouteIndex[StateT]]
 
     def __init__(
         self,
     ) -> None:
         # a min-heap where lower "values" indicate higher priority
         self._routes = []
+        self._index = None
 
     def add_route(self, route: _Route[StateT]) -> None:
         """Adds a route to the list."""
         heapq.heappush(self._routes, route)
+        # registration changed, the index is recompiled on next use
+        self._index = None
+
+    @property
+    def index(self) -> _RouteIndex[StateT]:
+        """The dispatch index, compiled on first use after the last registration."""
+        if self._index is None:
+            # sorted will return a new list, leaving the heap intact
+            self._index = _RouteIndex[StateT](sorted(self._routes))
+        return self._index
+
+    def candidates(self, activity: Activity) -> tuple[_Route[StateT], ...]:
+        """Returns, in priority order, the routes that could match the given activity."""
+        return self.index.candidates(activity)
 
     def __iter__(self):
-        # sorted will return a new list, leaving the heap intact
-        # returning an iterator over the previous list would expose
-        # internal details
-        return iter(sorted(self._routes))
+        # the index holds an immutable snapshot, so iterating it
+        # does not expose the internal heap
+        return iter(self.index.routes)
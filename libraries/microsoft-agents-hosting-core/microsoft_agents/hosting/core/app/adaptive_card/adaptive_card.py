@@ -93,6 +93,8 @@ class AdaptiveCard:
                 handler,
                 is_invoke=True,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name=_ACTION_INVOKE_NAME,
                 **kwargs,
             )
             return func
@@ -132,6 +134,7 @@ class AdaptiveCard:
                 handler,
                 is_invoke=False,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.message],
                 **kwargs,
             )
             return func
@@ -192,6 +195,8 @@ class AdaptiveCard:
                 handler,
                 is_invoke=True,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name=_SEARCH_INVOKE_NAME,
                 **kwargs,
             )
             return func
@@ -40,6 +40,7 @@ from ..authorization import Connections
 from ..header_propagation import AgenticHeaderProvider, HeaderPropagationContext
 from .app_error import ApplicationError
 from .app_options import ApplicationOptions
+from .input_file import SpooledInputFile
 
 from .state import TurnState
 from ..channel_service_adapter import ChannelServiceAdapter
@@ -52,7 +53,13 @@ from ._type_defs import (
     HandoffHandler,
     RouteSelector,
 )
-from ._routes import _RouteList, _Route, RouteRank, _agentic_selector
+from ._routes import (
+    _RouteList,
+    _Route,
+    RouteRank,
+    _agentic_selector,
+    _MessageMatcher,
+)
 from .proactive import Proactive
 from .adaptive_card import AdaptiveCard
 
@@ -84,6 +91,7 @@ class AgentApplication(Agent, Generic[StateT]):
     _internal_before_turn: list[Callable[[TurnContext, StateT], Awaitable[bool]]]
     _internal_after_turn: list[Callable[[TurnContext, StateT], Awaitable[bool]]]
     _route_list: _RouteList[StateT]
+    _message_matcher: _MessageMatcher
     _error: Callable[[TurnContext, Exception], Awaitable[None]] | None = None
     _turn_state_factory: Callable[[], StateT] | None = None
     _connection_manager: Connections
@@ -110,6 +118,7 @@ class AgentApplication(Agent, Generic[StateT]):
         """
         self._adaptive_card = AdaptiveCard(self)
         self._route_list = _RouteList[StateT]()
+        self._message_matcher = _MessageMatcher()
         self._internal_before_turn = []
         self._internal_after_turn = []
 
@@ -164,7 +173,12 @@ class AgentApplication(Agent, Generic[StateT]):
         self._turn_state_factory = (
             options.turn_state_factory
             or kwargs.get("turn_state_factory", None)
-            or partial(TurnState.with_storage, self._storage)
+            or partial(
+                TurnState.with_storage,
+                self._storage,
+                track_changes=options.track_state_changes,
+                optimistic_concurrency=options.optimistic_state_concurrency,
+            )
         )
 
         if options.proactive:
@@ -337,6 +351,8 @@ class AgentApplication(Agent, Generic[StateT]):
         is_agentic: bool = False,
         rank: RouteRank = RouteRank.DEFAULT,
         auth_handlers: Optional[list[str]] = None,
+        activity_types: Optional[list[str | ActivityTypes]] = None,
+        activity_name: Optional[str] = None,
     ) -> None:
         """Adds a new route to the application.
 
@@ -355,6 +371,12 @@ class AgentApplication(Agent, Generic[StateT]):
         :type rank: :class:`microsoft_agents.hosting.core.app._routes.route_rank.RouteRank`, Optional
         :param auth_handlers: A list of authentication handler IDs to use for this route, defaults to None
         :type auth_handlers: Optional[list[str]], Optional
+        :param activity_types: The activity types the selector can match, defaults to None (any type).
+            Used to index the route so its selector only runs for activities of these types.
+        :type activity_types: Optional[list[str | :class:`microsoft_agents.activity.ActivityTypes`]], Optional
+        :param activity_name: The activity name (e.g. invoke name) the selector requires, defaults to None (any name).
+            Used to index the route so its selector only runs for activities with this name.
+        :type activity_name: Optional[str], Optional
         :raises ApplicationError: If the selector or handler are not valid.
         """
         if not selector or not handler:
@@ -367,7 +389,14 @@ class AgentApplication(Agent, Generic[StateT]):
             selector = _agentic_selector(selector)
 
         route = _Route[StateT](
-            selector, handler, is_invoke, rank, auth_handlers, is_agentic
+            selector,
+            handler,
+            is_invoke,
+            rank,
+            auth_handlers,
+            is_agentic,
+            activity_types=activity_types,
+            activity_name=activity_name,
         )
         self._route_list.add_route(route)
 
@@ -405,7 +434,17 @@ class AgentApplication(Agent, Generic[StateT]):
             logger.debug(
                 f"Registering activity handler for route handler {func.__name__} with type: {activity_type} with auth handlers: {auth_handlers}"
             )
-            self.add_route(__selector, func, auth_handlers=auth_handlers, **kwargs)
+            self.add_route(
+                __selector,
+                func,
+                auth_handlers=auth_handlers,
+                activity_types=(
+                    activity_type
+                    if isinstance(activity_type, list)
+                    else [activity_type]
+                ),
+                **kwargs,
+            )
             return func
 
         return __call
@@ -435,31 +474,28 @@ class AgentApplication(Agent, Generic[StateT]):
         :param kwargs: Additional route configuration passed to :meth:`microsoft_agents.hosting.core.AgentApplication.add_route`.
         """
 
+        # all message selectors share one matcher, so the text is scanned
+        # once per turn no matter how many message routes are registered
+        entry = self._message_matcher.add(select)
+
         def __selector(context: TurnContext):
             if context.activity.type != ActivityTypes.message:
                 return False
 
             text = context.activity.text if context.activity.text else ""
-
-            if isinstance(select, list):
-                for item in select:
-                    if isinstance(item, re.Pattern):
-                        if re.fullmatch(item, text) is not None:
-                            return True
-                    elif text == item:
-                        return True
-                return False
-
-            if isinstance(select, re.Pattern):
-                return re.fullmatch(select, text) is not None
-
-            return text == select
+            return self._message_matcher.matches(entry, text)
 
         def __call(func: RouteHandler[StateT]) -> RouteHandler[StateT]:
             logger.debug(
                 f"Registering message handler for route handler {func.__name__} with select: {select} with auth handlers: {auth_handlers}"
             )
-            self.add_route(__selector, func, auth_handlers=auth_handlers, **kwargs)
+            self.add_route(
+                __selector,
+                func,
+                auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.message],
+                **kwargs,
+            )
             return func
 
         return __call
@@ -515,7 +551,13 @@ class AgentApplication(Agent, Generic[StateT]):
             logger.debug(
                 f"Registering conversation update handler for route handler {func.__name__} with type: {update_type} with auth handlers: {auth_handlers}"
             )
-            self.add_route(__selector, func, auth_handlers=auth_handlers, **kwargs)
+            self.add_route(
+                __selector,
+                func,
+                auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.conversation_update],
+                **kwargs,
+            )
             return func
 
         return __call
@@ -567,7 +609,13 @@ class AgentApplication(Agent, Generic[StateT]):
             logger.debug(
                 f"Registering message reaction handler for route handler {func.__name__} with type: {reaction_type} with auth handlers: {auth_handlers}"
             )
-            self.add_route(__selector, func, auth_handlers=auth_handlers, **kwargs)
+            self.add_route(
+                __selector,
+                func,
+                auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.message_reaction],
+                **kwargs,
+            )
             return func
 
         return __call
@@ -632,7 +680,16 @@ class AgentApplication(Agent, Generic[StateT]):
             logger.debug(
                 f"Registering message update handler for route handler {func.__name__} with type: {update_type} with auth handlers: {auth_handlers}"
             )
-            self.add_route(__selector, func, auth_handlers=auth_handlers, **kwargs)
+            self.add_route(
+                __selector,
+                func,
+                auth_handlers=auth_handlers,
+                activity_types=[
+                    ActivityTypes.message_update,
+                    ActivityTypes.message_delete,
+                ],
+                **kwargs,
+            )
             return func
 
         return __call
@@ -715,7 +772,14 @@ class AgentApplication(Agent, Generic[StateT]):
                 f"Registering handoff handler for route handler {func.__name__} with auth handlers: {auth_handlers}"
             )
 
-            self.add_route(__selector, __handler, auth_handlers=auth_handlers, **kwargs)
+            self.add_route(
+                __selector,
+                __handler,
+                auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="handoff/action",
+                **kwargs,
+            )
             return func
 
         if func is not None:
@@ -843,6 +907,9 @@ class AgentApplication(Agent, Generic[StateT]):
                     AgenticHeaderProvider(context.activity, self._agent_name)
                 )
 
+            if self._options.buffer_responses:
+                context.enable_buffering()
+
             with spans.AppOnTurn(context) as on_turn_span:
                 use_typing = (
                     self._options.start_typing_timer
@@ -882,15 +949,18 @@ class AgentApplication(Agent, Generic[StateT]):
                     if not await self._run_before_turn_middleware(context, turn_state):
                         return
 
-                    logger.debug("Running file downloads")
-                    await self._handle_file_downloads(context, turn_state)
+                    try:
+                        logger.debug("Running file downloads")
+                        await self._handle_file_downloads(context, turn_state)
 
-                    logger.debug("Running activity handlers")
-                    await self._on_activity(context, turn_state, on_turn_span)
+                        logger.debug("Running activity handlers")
+                        await self._on_activity(context, turn_state, on_turn_span)
 
-                    logger.debug("Running after turn middleware")
-                    if await self._run_after_turn_middleware(context, turn_state):
-                        await turn_state.save(context)
+                        logger.debug("Running after turn middleware")
+                        if await self._run_after_turn_middleware(context, turn_state):
+                            await turn_state.save(context)
+                    finally:
+                        self._close_input_files(turn_state)
                     return
         except ApplicationError as err:
             logger.error(
@@ -946,7 +1016,11 @@ class AgentApplication(Agent, Generic[StateT]):
             turn_state = self._turn_state_factory()
         else:
             logger.debug("Using default turn state factory")
-            turn_state = TurnState.with_storage(self._storage)
+            turn_state = TurnState.with_storage(
+                self._storage,
+                track_changes=self._options.track_state_changes,
+                optimistic_concurrency=self._options.optimistic_state_concurrency,
+            )
 
         turn_state = cast(StateT, turn_state)
 
@@ -964,6 +1038,13 @@ class AgentApplication(Agent, Generic[StateT]):
                     return False
             return True
 
+    @staticmethod
+    def _close_input_files(state: StateT) -> None:
+        """Release the temporary files backing the downloaded input files of a turn."""
+        for file in state.temp.input_files or []:
+            if isinstance(file, SpooledInputFile):
+                file.close()
+
     async def _handle_file_downloads(self, context: TurnContext, state: StateT):
         with spans.AppDownloadFiles(context):
             if (
@@ -971,11 +1052,21 @@ class AgentApplication(Agent, Generic[StateT]):
                 and len(self._options.file_downloaders) > 0
             ):
                 input_files = state.temp.input_files if state.temp.input_files else []
-                for file_downloader in self._options.file_downloaders:
-                    logger.info(
-                        f"Using file downloader: {file_downloader.__class__.__name__}"
+                logger.info(
+                    "Using file downloaders: %s",
+                    ", ".join(
+                        file_downloader.__class__.__name__
+                        for file_downloader in self._options.file_downloaders
+                    ),
+                )
+                # downloaders run concurrently; files keep the order of the downloaders
+                results = await asyncio.gather(
+                    *(
+                        file_downloader.download_files(context)
+                        for file_downloader in self._options.file_downloaders
                     )
-                    files = await file_downloader.download_files(context)
+                )
+                for files in results:
                     input_files.extend(files)
                 state.temp.input_files = input_files
 
@@ -1005,7 +1096,9 @@ class AgentApplication(Agent, Generic[StateT]):
         route_matched: bool = False
         route_authorized: bool = False
 
-        for route in self._route_list:
+        # only routes indexed under this activity's type, name and agentic
+        # flag are candidates; their selectors are evaluated in priority order
+        for route in self._route_list.candidates(context.activity):
             if route.selector(context):
                 route_matched = True
                 if not route.auth_handlers:
@@ -81,6 +81,28 @@ class ApplicationOptions:
     If not provided, the default `TurnState` will be used.
     """
 
+    track_state_changes: bool = False
+    """
+    Optional. If true, the default turn state records which conversation and user state
+    properties are written during a turn instead of hashing the serialized state on load
+    and save to detect changes. Values mutated in place must be set again to be saved.
+    Defaults to false.
+    """
+
+    optimistic_state_concurrency: bool = False
+    """
+    Optional. If true, the default turn state saves conversation and user state only if no
+    other turn changed it since it was loaded, and raises `ETagConflictError` otherwise.
+    Defaults to false, where the last turn to save wins.
+    """
+
+    buffer_responses: bool = False
+    """
+    Optional. If true, message activities sent during a turn are buffered on the `TurnContext`
+    and sent as one batch when another kind of activity is sent or the turn ends, instead of
+    one request per `send_activity` call. Defaults to false.
+    """
+
     authorization_handlers: Optional[dict[str, AuthHandler]] = None
     """
     Optional. Authorization handler for OAuth flows.
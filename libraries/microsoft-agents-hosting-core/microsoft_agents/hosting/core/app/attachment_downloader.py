@@ -0,0 +1,234 @@
+"""
+Copyright (c) Microsoft Corporation. All rights reserved.
+Licensed under the MIT License.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from fnmatch import fnmatch
+from typing import AsyncIterator, Iterable, Optional
+from urllib.parse import urlparse
+
+from aiohttp import ClientSession, TCPConnector
+
+from microsoft_agents.activity import Attachment
+from microsoft_agents.hosting.core.authorization import Connections
+from microsoft_agents.hosting.core.turn_context import TurnContext
+
+from .input_file import (
+    InputFile,
+    InputFileDownloader,
+    LazyInputFile,
+    SpooledInputFile,
+)
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 65536
+
+
+class FileTooLargeError(ValueError):
+    """Raised when a downloaded file exceeds the configured maximum size."""
+
+    def __init__(self, url: str, max_file_size: int):
+        super().__init__(f"File at '{url}' is larger than {max_file_size} bytes")
+        self.url = url
+        self.max_file_size = max_file_size
+
+
+class AttachmentDownloader(InputFileDownloader):
+    """
+    Downloads the files attached to the incoming activity.
+
+    Attachments are downloaded concurrently, with at most ``max_concurrency``
+    downloads in flight across all turns, over one HTTP session shared by all
+    turns. Attachments without a content URL (such as cards), ``text/html``
+    message bodies and attachments whose content type does not match
+    ``content_types`` are skipped.
+
+    Files larger than ``max_file_size`` are skipped with a warning, as are files
+    that fail to download. Downloaded files are returned as
+    :class:`~microsoft_agents.hosting.core.app.input_file.SpooledInputFile`, kept
+    on disk once larger than ``max_memory_size``. With ``lazy`` set the files are
+    returned as :class:`~microsoft_agents.hosting.core.app.input_file.LazyInputFile`
+    and only fetched when a handler uses them.
+
+    When a ``connection_manager`` is given, requests to the host of the
+    activity's service URL carry a token for the agent, as channels such as
+    Teams require for inline images. Other hosts never receive the token.
+
+    Example::
+
+        downloader = AttachmentDownloader(content_types=["image/*"], max_file_size=10_000_000)
+        app = AgentApplication[TurnState](
+            ApplicationOptions(file_downloaders=[downloader], ...)
+        )
+
+        @app.activity("message")
+        async def on_message(context, state):
+            for file in state.temp.input_files:
+                ...
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 4,
+        max_file_size: Optional[int] = None,
+        max_memory_size: int = 1024 * 1024,
+        content_types: Optional[Iterable[str]] = None,
+        lazy: bool = False,
+        connection_manager: Optional[Connections] = None,
+        session: Optional[ClientSession] = None,
+    ):
+        """
+        :param max_concurrency: The maximum number of downloads in flight.
+        :type max_concurrency: int
+        :param max_file_size: Optional. The maximum size of a file in bytes.
+        :type max_file_size: Optional[int]
+        :param max_memory_size: The size in bytes above which a downloaded file is
+            kept in a temporary file on disk.
+        :type max_memory_size: int
+        :param content_types: Optional. Content types to download; patterns such as
+            ``image/*`` are supported. All content types are downloaded by default.
+        :type content_types: Optional[Iterable[str]]
+        :param lazy: Whether to defer downloads until a handler uses the file.
+        :type lazy: bool
+        :param connection_manager: Optional. Connections used to get a token for
+            attachments hosted by the channel service.
+        :type connection_manager: Optional[:class:`microsoft_agents.hosting.core.authorization.Connections`]
+        :param session: Optional. The HTTP session to download with. By default the
+            downloader creates its own session, closed by :meth:`close`.
+        :type session: Optional[:class:`aiohttp.ClientSession`]
+        :raises ValueError: If max_concurrency is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("AttachmentDownloader: max_concurrency must be at least 1")
+
+        self._max_concurrency = max_concurrency
+        self._max_file_size = max_file_size
+        self._max_memory_size = max_memory_size
+        self._content_types = list(content_types) if content_types else None
+        self._lazy = lazy
+        self._connection_manager = connection_manager
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    def _get_session(self) -> ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(
+                connector=TCPConnector(limit=self._max_concurrency)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the HTTP session, if the downloader created it."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _should_download(self, attachment: Attachment) -> bool:
+        if not attachment.content_url or not attachment.content_url.startswith(
+            ("https://", "http://")
+        ):
+            return False
+        content_type = attachment.content_type or ""
+        if content_type.startswith("text/html"):
+            return False
+        if self._content_types is None:
+            return True
+        return any(fnmatch(content_type, pattern) for pattern in self._content_types)
+
+    async def _get_headers(self, context: TurnContext, url: str) -> dict[str, str]:
+        """Get the headers for a download, with a token for the channel service host."""
+        service_url = context.activity.service_url
+        identity = context.identity
+        if (
+            self._connection_manager is None
+            or not service_url
+            or identity is None
+            or identity.allow_anonymous
+            or urlparse(url).hostname != urlparse(service_url).hostname
+        ):
+            return {}
+
+        token_provider = self._connection_manager.get_token_provider(
+            identity, service_url
+        )
+        token = await token_provider.get_access_token(
+            identity.get_token_audience(), identity.get_token_scope()
+        )
+        return {"Authorization": f"Bearer {token}"} if token else {}
+
+    async def _fetch(
+        self, context: TurnContext, url: str, chunk_size: int = _CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Stream a file, enforcing the maximum file size."""
+        headers = await self._get_headers(context, url)
+        async with self._semaphore:
+            async with self._get_session().get(url, headers=headers) as response:
+                response.raise_for_status()
+                max_size = self._max_file_size
+                if (
+                    max_size is not None
+                    and response.content_length is not None
+                    and response.content_length > max_size
+                ):
+                    raise FileTooLargeError(url, max_size)
+
+                size = 0
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    size += len(chunk)
+                    if max_size is not None and size > max_size:
+                        raise FileTooLargeError(url, max_size)
+                    yield chunk
+
+    async def _download(
+        self, context: TurnContext, attachment: Attachment
+    ) -> Optional[InputFile]:
+        url = attachment.content_url
+        try:
+            return await SpooledInputFile.from_chunks(
+                self._fetch(context, url),
+                attachment.content_type,
+                url,
+                max_memory_size=self._max_memory_size,
+            )
+        except Exception as error:  # noqa: BLE001
+            logger.warning("Failed to download attachment from '%s': %s", url, error)
+            return None
+
+    async def download_files(self, context: TurnContext) -> list[InputFile]:
+        """
+        Download the files attached to the incoming activity.
+
+        :param context: The turn context for the current request.
+        :type context: :class:`microsoft_agents.hosting.core.turn_context.TurnContext`
+        :return: The downloaded files, in the order of the attachments.
+        :rtype: list[:class:`microsoft_agents.hosting.core.app.input_file.InputFile`]
+        """
+        attachments = [
+            attachment
+            for attachment in context.activity.attachments or []
+            if self._should_download(attachment)
+        ]
+
+        if self._lazy:
+            return [
+                LazyInputFile(
+                    lambda chunk_size, url=attachment.content_url: self._fetch(
+                        context, url, chunk_size
+                    ),
+                    attachment.content_type,
+                    attachment.content_url,
+                )
+                for attachment in attachments
+            ]
+
+        files = await asyncio.gather(
+            *(self._download(context, attachment) for attachment in attachments)
+        )
+        return [file for file in files if file is not None]
@@ -5,12 +5,18 @@ Licensed under the MIT License.
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from tempfile import SpooledTemporaryFile
+from typing import AsyncIterable, AsyncIterator, BinaryIO, Callable, Optional
 
 from microsoft_agents.hosting.core import TurnContext
 
+_CHUNK_SIZE = 65536
+# spooled files are written and read in blocks of this size, off the event loop
+_SPOOL_BLOCK_SIZE = 16 * _CHUNK_SIZE
+
 
 @dataclass
 class InputFile:
@@ -28,6 +34,258 @@ class InputFile:
     content_type: str
     content_url: Optional[str]
 
+    async def iter_content(self, chunk_size: int = _CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """
+        Iterate over the content of the file in chunks.
+
+        :param chunk_size: The maximum size of each chunk in bytes.
+        :type chunk_size: int
+        :return: An async iterator of the file's content.
+        :rtype: AsyncIterator[bytes]
+        """
+        content = self.content
+        for start in range(0, len(content), chunk_size):
+            yield content[start : start + chunk_size]
+
+
+class SpooledInputFile(InputFile):
+    """A file sent by the user to the bot, kept in a spooled temporary file.
+
+    Content up to ``max_memory_size`` bytes stays in memory; larger files roll over
+    to a temporary file on disk, so large uploads can be processed at constant memory
+    with :meth:`iter_content` or :meth:`open`. :meth:`from_chunks`, :meth:`read` and
+    :meth:`iter_content` do their file I/O in a worker thread. Reading :attr:`content`
+    loads the whole file into memory on the calling thread; prefer :meth:`read` in
+    async code. Call :meth:`close` once the file is no longer needed to remove the
+    temporary file.
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        content_type: str,
+        content_url: Optional[str] = None,
+    ):
+        """
+        :param file: The file holding the content, positioned anywhere.
+        :type file: BinaryIO
+        :param content_type: The content type of the file.
+        :type content_type: str
+        :param content_url: Optional. URL to the content of the file.
+        :type content_url: Optional[str]
+        """
+        self._file = file
+        self.content_type = content_type
+        self.content_url = content_url
+
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(content_type={self.content_type!r}, "
+            f"content_url={self.content_url!r}, size={self.size})"
+        )
+
+    @classmethod
+    async def from_chunks(
+        cls,
+        chunks: AsyncIterable[bytes],
+        content_type: str,
+        content_url: Optional[str] = None,
+        *,
+        max_memory_size: int = 1024 * 1024,
+    ) -> SpooledInputFile:
+        """
+        Create a :class:`SpooledInputFile` from streamed content, such as the chunks of
+        :meth:`microsoft_agents.hosting.core.connector.client.connector_client.AttachmentsOperations.stream_attachment`.
+
+        :param chunks: The content of the file.
+        :type chunks: AsyncIterable[bytes]
+        :param content_type: The content type of the file.
+        :type content_type: str
+        :param content_url: Optional. URL to the content of the file.
+        :type content_url: Optional[str]
+        :param max_memory_size: The size in bytes above which the content is written to disk.
+        :type max_memory_size: int
+        :return: The spooled input file.
+        :rtype: :class:`SpooledInputFile`
+        """
+        file = SpooledTemporaryFile(max_size=max_memory_size)
+        block: list[bytes] = []
+        block_size = written = 0
+        try:
+            async for chunk in chunks:
+                block.append(chunk)
+                block_size += len(chunk)
+                if block_size >= _SPOOL_BLOCK_SIZE:
+                    written = await _spool(file, block, written, max_memory_size)
+                    block, block_size = [], 0
+            if block:
+                await _spool(file, block, written, max_memory_size)
+        except BaseException:
+            file.close()
+            raise
+        return cls(file, content_type, content_url)
+
+    @property
+    def content(self) -> bytes:
+        """The whole content of the file, read into memory."""
+        self._file.seek(0)
+        return self._file.read()
+
+    async def read(self) -> bytes:
+        """
+        Read the whole content of the file into memory, in a worker thread.
+
+        :return: The content of the file.
+        :rtype: bytes
+        """
+        return await asyncio.to_thread(self._read_at, 0, -1)
+
+    def _read_at(self, offset: int, size: int) -> bytes:
+        self._file.seek(offset)
+        return self._file.read(size)
+
+    @property
+    def size(self) -> int:
+        """The size of the file in bytes."""
+        self._file.seek(0, 2)
+        return self._file.tell()
+
+    def open(self) -> BinaryIO:
+        """
+        Get the underlying file, positioned at the start of the content.
+
+        :return: The file holding the content.
+        :rtype: BinaryIO
+        """
+        self._file.seek(0)
+        return self._file
+
+    async def iter_content(self, chunk_size: int = _CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """
+        Iterate over the content of the file in chunks read from the spooled file.
+
+        :param chunk_size: The maximum size of each chunk in bytes.
+        :type chunk_size: int
+        :return: An async iterator of the file's content.
+        :rtype: AsyncIterator[bytes]
+        """
+        offset = 0
+        read_size = max(chunk_size, _SPOOL_BLOCK_SIZE // chunk_size * chunk_size)
+        while block := await asyncio.to_thread(self._read_at, offset, read_size):
+            offset += len(block)
+            for start in range(0, len(block), chunk_size):
+                yield block[start : start + chunk_size]
+
+    def close(self) -> None:
+        """Close the file and remove any temporary file backing it."""
+        self._file.close()
+
+
+async def _spool(
+    file: SpooledTemporaryFile, chunks: list[bytes], written: int, max_memory_size: int
+) -> int:
+    """Append chunks to a spooled file, writing in a worker thread once it is on disk.
+
+    :return: The number of bytes written to the file so far.
+    """
+    data = b"".join(chunks)
+    if written + len(data) <= max_memory_size:
+        # the file stays in memory
+        file.write(data)
+    else:
+        await asyncio.to_thread(file.write, data)
+    return written + len(data)
+
+
+class LazyInputFile(InputFile):
+    """A file sent by the user to the bot, downloaded only when it is used.
+
+    Await :meth:`download` to fetch and keep the content, or use :meth:`iter_content`
+    to stream it without keeping it. :attr:`content` is available once the file has
+    been downloaded.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int], AsyncIterator[bytes]],
+        content_type: str,
+        content_url: Optional[str] = None,
+    ):
+        """
+        :param fetch: Callable returning the content of the file in chunks of at most
+            the given size. It is called again for each download or iteration.
+        :type fetch: Callable[[int], AsyncIterator[bytes]]
+        :param content_type: The content type of the file.
+        :type content_type: str
+        :param content_url: Optional. URL to the content of the file.
+        :type content_url: Optional[str]
+        """
+        self._fetch = fetch
+        self._content: Optional[bytes] = None
+        self._lock = asyncio.Lock()
+        self.content_type = content_type
+        self.content_url = content_url
+
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(content_type={self.content_type!r}, "
+            f"content_url={self.content_url!r}, downloaded={self.is_downloaded})"
+        )
+
+    @property
+    def is_downloaded(self) -> bool:
+        """Whether the content has been downloaded."""
+        return self._content is not None
+
+    @property
+    def content(self) -> bytes:
+        """
+        The downloaded content of the file.
+
+        :raises RuntimeError: If the file has not been downloaded yet.
+        """
+        if self._content is None:
+            raise RuntimeError(
+                "LazyInputFile: content is not downloaded yet, await download() first"
+            )
+        return self._content
+
+    async def download(self) -> bytes:
+        """
+        Download the content of the file, once.
+
+        :return: The content of the file.
+        :rtype: bytes
+        """
+        async with self._lock:
+            if self._content is None:
+                chunks = [chunk async for chunk in self._fetch(_CHUNK_SIZE)]
+                self._content = b"".join(chunks)
+        return self._content
+
+    async def iter_content(self, chunk_size: int = _CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """
+        Iterate over the content of the file in chunks, streaming it from its source
+        unless it has already been downloaded.
+
+        :param chunk_size: The maximum size of each chunk in bytes.
+        :type chunk_size: int
+        :return: An async iterator of the file's content.
+        :rtype: AsyncIterator[bytes]
+        """
+        if self._content is not None:
+            async for chunk in super().iter_content(chunk_size):
+                yield chunk
+            return
+        async for chunk in self._fetch(chunk_size):
+            yield chunk
+
 
 class InputFileDownloader(ABC):
     """
@@ -9,6 +9,7 @@ from .conversation_reference_builder import ConversationReferenceBuilder
 from .create_conversation_options import CreateConversationOptions
 from .proactive import Proactive
 from .proactive_options import ProactiveOptions
+from .send_activity_result import SendActivityResult
 
 __all__ = [
     "Conversation",
@@ -17,4 +18,5 @@ __all__ = [
     "CreateConversationOptions",
     "Proactive",
     "ProactiveOptions",
+    "SendActivityResult",
 ]
@@ -0,0 +1,84 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from aiohttp import ClientResponseError
+
+_TOO_MANY_REQUESTS = 429
+
+
+def _get_retry_after(error: Exception, attempt: int) -> float | None:
+    """
+    Returns the seconds to wait before retrying a request the channel throttled,
+    or None if the error is not a throttling response.
+
+    Uses the ``Retry-After`` header when present, otherwise backs off exponentially.
+    """
+    if not isinstance(error, ClientResponseError) or error.status != _TOO_MANY_REQUESTS:
+        return None
+
+    value = (error.headers or {}).get("Retry-After")
+    if value:
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            retry_at = None
+        if retry_at is not None:
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    return float(2 ** (attempt - 1))
+
+
+class _ServiceUrlThrottle:
+    """
+    Limits the requests sent to one service URL: at most ``max_concurrency`` at a
+    time, optionally spaced to ``requests_per_second``, and none while the service
+    has asked to back off.
+    """
+
+    def __init__(self, max_concurrency: int, requests_per_second: float | None = None):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._next_slot = 0.0
+        self._resume_at = 0.0
+
+    async def __aenter__(self) -> _ServiceUrlThrottle:
+        await self._semaphore.acquire()
+        try:
+            await self._wait_for_slot()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._semaphore.release()
+
+    async def _wait_for_slot(self) -> None:
+        while True:
+            now = time.monotonic()
+            if self._resume_at > now:
+                await asyncio.sleep(self._resume_at - now)
+                continue
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+            if slot > now:
+                await asyncio.sleep(slot - now)
+            # a throttling response may have arrived while waiting for the slot
+            if self._resume_at <= time.monotonic():
+                return
+
+    def pause(self, seconds: float) -> None:
+        """Holds back all requests to the service URL for the given number of seconds."""
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
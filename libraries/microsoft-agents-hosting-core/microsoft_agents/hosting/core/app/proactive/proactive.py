@@ -3,17 +3,28 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Awaitable, Callable, Generic, TypeVar, TYPE_CHECKING
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    TypeVar,
+    TYPE_CHECKING,
+)
 
 from microsoft_agents.activity import Activity, ResourceResponse
 
 from microsoft_agents.hosting.core.app.state.turn_state import TurnState
 from microsoft_agents.hosting.core.storage import Storage
 
+from ._service_url_throttle import _ServiceUrlThrottle, _get_retry_after
 from .conversation import Conversation
 from .create_conversation_options import CreateConversationOptions
 from .proactive_options import ProactiveOptions
+from .send_activity_result import SendActivityResult
 from .telemetry import spans
 
 if TYPE_CHECKING:
@@ -29,6 +40,9 @@ StateT = TypeVar("StateT", bound=TurnState)
 
 _STORAGE_KEY_PREFIX = "proactive/conversations/"
 
+# conversations read from storage per request when sending to many conversations
+_READ_BATCH_SIZE = 100
+
 RouteHandler = Callable[["TurnContext", StateT], Awaitable[None]]
 
 
@@ -46,7 +60,9 @@ class Proactive(Generic[StateT]):
     * **Continue** an existing conversation proactively
       (:meth:`microsoft_agents.hosting.core.app.proactive.Proactive.continue_conversation`).
     * **Send** a single activity into an existing conversation
-      (:meth:`microsoft_agents.hosting.core.app.proactive.Proactive.send_activity`).
+      (:meth:`microsoft_agents.hosting.core.app.proactive.Proactive.send_activity`),
+      or into many conversations at once
+      (:meth:`microsoft_agents.hosting.core.app.proactive.Proactive.send_activity_to_conversations`).
     * **Create** a brand-new conversation with a user
       (:meth:`microsoft_agents.hosting.core.app.proactive.Proactive.create_conversation`).
 
@@ -221,6 +237,178 @@ class Proactive(Generic[StateT]):
             raise captured_exc
         return result
 
+    # ------------------------------------------------------------------
+    # Send an activity to many conversations
+    # ------------------------------------------------------------------
+
+    async def send_activity_to_conversations(
+        self,
+        adapter: ChannelServiceAdapter,
+        conversations: Iterable[str | Conversation],
+        activity: Activity,
+        *,
+        max_concurrency: int = 32,
+        max_concurrency_per_service_url: int = 8,
+        requests_per_second_per_service_url: float | None = None,
+        max_retries: int = 3,
+    ) -> AsyncIterator[SendActivityResult]:
+        """
+        Send the same activity into many existing conversations, yielding the
+        result for each conversation as soon as it is known.
+
+        Sends run on a pool of *max_concurrency* workers. Requests to each service
+        URL are limited separately; when the channel responds with ``429 Too Many
+        Requests`` all requests to that service URL wait for its ``Retry-After``
+        period and the send is retried. Failures are reported in the results
+        instead of being raised. To reuse connections across the sends, create the
+        adapter with a channel service client factory that has a
+        :class:`~microsoft_agents.hosting.core.connector.client.ClientSessionPool`.
+
+        Example::
+
+            async for result in app.proactive.send_activity_to_conversations(
+                adapter, conversation_ids, MessageFactory.text("Maintenance at 6pm")
+            ):
+                if not result.succeeded:
+                    logger.warning("Not delivered to %s", result.conversation_id)
+
+        :param adapter: The channel service adapter.
+        :type adapter: :class:`~microsoft_agents.hosting.core.channel_service_adapter.ChannelServiceAdapter`
+        :param conversations: Conversation IDs (loaded from storage in batches) or
+            :class:`~microsoft_agents.hosting.core.app.proactive.conversation.Conversation`
+            objects.
+        :type conversations: Iterable[str or
+            :class:`~microsoft_agents.hosting.core.app.proactive.conversation.Conversation`]
+        :param activity: The activity to send.
+        :type activity: :class:`~microsoft_agents.activity.Activity`
+        :param max_concurrency: The maximum number of sends in flight.
+        :type max_concurrency: int
+        :param max_concurrency_per_service_url: The maximum number of sends in flight
+            to one service URL.
+        :type max_concurrency_per_service_url: int
+        :param requests_per_second_per_service_url: Optional limit on the rate of
+            sends to one service URL.
+        :type requests_per_second_per_service_url: Optional[float]
+        :param max_retries: The number of times a throttled send is retried.
+        :type max_retries: int
+        :return: An async iterator of
+            :class:`~microsoft_agents.hosting.core.app.proactive.SendActivityResult`,
+            in completion order. Conversation IDs not found in storage are reported
+            with a :exc:`KeyError`.
+        :raises ValueError: If a concurrency limit is less than 1.
+        """
+        if max_concurrency < 1 or max_concurrency_per_service_url < 1:
+            raise ValueError("Proactive: concurrency limits must be at least 1")
+
+        work: asyncio.Queue[tuple[str, Conversation | None]] = asyncio.Queue(
+            max_concurrency * 2
+        )
+        results: asyncio.Queue[SendActivityResult | None] = asyncio.Queue()
+        throttles: dict[str, _ServiceUrlThrottle] = {}
+
+        async def send(conversation_id: str, conversation: Conversation | None):
+            if conversation is None:
+                return SendActivityResult(
+                    conversation_id,
+                    error=KeyError(
+                        f"Proactive conversation not found in storage: "
+                        f"'{conversation_id}'"
+                    ),
+                )
+            service_url = conversation.conversation_reference.service_url or ""
+            throttle = throttles.get(service_url)
+            if throttle is None:
+                throttle = throttles[service_url] = _ServiceUrlThrottle(
+                    max_concurrency_per_service_url,
+                    requests_per_second_per_service_url,
+                )
+            return await self._send_activity_with_retries(
+                adapter, conversation, activity, throttle, max_retries
+            )
+
+        async def worker() -> None:
+            while True:
+                conversation_id, conversation = await work.get()
+                try:
+                    result = await send(conversation_id, conversation)
+                except Exception as exc:  # noqa: BLE001
+                    result = SendActivityResult(conversation_id, error=exc)
+                finally:
+                    work.task_done()
+                results.put_nowait(result)
+
+        async def run() -> None:
+            workers = [asyncio.create_task(worker()) for _ in range(max_concurrency)]
+            try:
+                batch: list[str | Conversation] = []
+                for item in conversations:
+                    batch.append(item)
+                    if len(batch) == _READ_BATCH_SIZE:
+                        for entry in await self._resolve_conversations(batch):
+                            await work.put(entry)
+                        batch = []
+                if batch:
+                    for entry in await self._resolve_conversations(batch):
+                        await work.put(entry)
+                await work.join()
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                results.put_nowait(None)
+
+        runner = asyncio.create_task(run())
+        try:
+            while (result := await results.get()) is not None:
+                yield result
+            await runner
+        finally:
+            if not runner.done():
+                runner.cancel()
+                await asyncio.gather(runner, return_exceptions=True)
+
+    async def _send_activity_with_retries(
+        self,
+        adapter: ChannelServiceAdapter,
+        conversation: Conversation,
+        activity: Activity,
+        throttle: _ServiceUrlThrottle,
+        max_retries: int,
+    ) -> SendActivityResult:
+        """Send an activity into a conversation, retrying while the channel throttles it."""
+        conversation_id = conversation.conversation_reference.conversation.id
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                async with throttle:
+                    with spans.ProactiveSendActivity(
+                        conversation_id, activity, link=conversation._get_span_context()
+                    ):
+                        response = await Proactive._send_activity_impl(
+                            adapter, conversation, activity
+                        )
+                return SendActivityResult(
+                    conversation_id, response=response, attempts=attempts
+                )
+            except Exception as exc:  # noqa: BLE001
+                retry_after = _get_retry_after(exc, attempts)
+                if retry_after is None or attempts > max_retries:
+                    logger.warning(
+                        "Proactive send to conversation '%s' failed: %s",
+                        conversation_id,
+                        exc,
+                    )
+                    return SendActivityResult(
+                        conversation_id, error=exc, attempts=attempts
+                    )
+                logger.debug(
+                    "Proactive send to conversation '%s' throttled, retrying in %.1fs",
+                    conversation_id,
+                    retry_after,
+                )
+                throttle.pause(retry_after)
+
     # ------------------------------------------------------------------
     # Continue a conversation
     # ------------------------------------------------------------------
@@ -401,6 +589,30 @@ class Proactive(Generic[StateT]):
         await state.load(context, self._storage)
         return state
 
+    async def _resolve_conversations(
+        self,
+        conversation_ids_or_conversations: list[str | Conversation],
+    ) -> list[tuple[str, Conversation | None]]:
+        """Resolve conversations, reading all of the given conversation IDs from storage at once."""
+        keys = [
+            self._storage_key(item)
+            for item in conversation_ids_or_conversations
+            if isinstance(item, str)
+        ]
+        stored = (
+            await self._storage.read(list(dict.fromkeys(keys)), target_cls=Conversation)
+            if keys
+            else {}
+        )
+        return [
+            (
+                (item, stored.get(self._storage_key(item)))
+                if isinstance(item, str)
+                else (item.conversation_reference.conversation.id, item)
+            )
+            for item in conversation_ids_or_conversations
+        ]
+
     async def _resolve_conversation(
         self,
         conversation_id_or_conversation: str | Conversation,
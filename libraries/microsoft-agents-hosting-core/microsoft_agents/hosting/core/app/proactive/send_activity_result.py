@@ -0,0 +1,38 @@
+"""
+Copyright (c) Microsoft Corporation. All rights reserved.
+Licensed under the MIT License.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from microsoft_agents.activity import ResourceResponse
+
+
+@dataclass
+class SendActivityResult:
+    """
+    The outcome of sending an activity to one conversation with
+    :meth:`microsoft_agents.hosting.core.app.proactive.Proactive.send_activity_to_conversations`.
+
+    :param conversation_id: The ID of the conversation the activity was sent to.
+    :type conversation_id: str
+    :param response: The :class:`~microsoft_agents.activity.ResourceResponse` from the
+        channel, or ``None`` if sending failed.
+    :type response: :class:`~microsoft_agents.activity.ResourceResponse` | None
+    :param error: The exception that made sending fail, or ``None`` on success.
+    :type error: Exception | None
+    :param attempts: The number of send attempts, including retries after throttling.
+    :type attempts: int
+    """
+
+    conversation_id: str
+    response: ResourceResponse | None = None
+    error: Exception | None = None
+    attempts: int = 0
+
+    @property
+    def succeeded(self) -> bool:
+        """``True`` if the activity was sent."""
+        return self.error is None
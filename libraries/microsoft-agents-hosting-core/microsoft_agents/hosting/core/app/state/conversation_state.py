@@ -23,14 +23,29 @@ class ConversationState(AgentState):
 
     CONTEXT_SERVICE_KEY = "ConversationState"
 
-    def __init__(self, storage: Storage) -> None:
+    def __init__(
+        self,
+        storage: Storage,
+        *,
+        track_changes: bool = False,
+        optimistic_concurrency: bool = False,
+    ) -> None:
         """
         Initialize ConversationState with a key and optional properties.
 
         param storage: Storage instance to use for state management.
         type storage: Storage
+        param track_changes: Whether to record changed properties instead of hashing the state.
+        type track_changes: bool
+        param optimistic_concurrency: Whether saves fail if another writer changed the state since it was loaded.
+        type optimistic_concurrency: bool
         """
-        super().__init__(storage=storage, context_service_key=self.CONTEXT_SERVICE_KEY)
+        super().__init__(
+            storage=storage,
+            context_service_key=self.CONTEXT_SERVICE_KEY,
+            track_changes=track_changes,
+            optimistic_concurrency=optimistic_concurrency,
+        )
 
     def get_storage_key(
         self, turn_context: TurnContext, *, target_cls: Type[StoreItem] | None = None
@@ -42,6 +42,8 @@ class TurnState:
             agent_states: Initial list of AgentState objects to manage.
         """
         self._scopes: dict[str, AgentState] = {}
+        self._track_changes = False
+        self._optimistic_concurrency = False
 
         # Add all provided agent states
         for agent_state in agent_states:
@@ -52,23 +54,43 @@ class TurnState:
             self._scopes[TempState.SCOPE_NAME] = TempState()
 
     @classmethod
-    def with_storage(cls, storage: Storage, *agent_states: AgentState) -> "TurnState":
+    def with_storage(
+        cls,
+        storage: Storage,
+        *agent_states: AgentState,
+        track_changes: bool = False,
+        optimistic_concurrency: bool = False,
+    ) -> "TurnState":
         """
         Creates TurnState with default ConversationState and UserState.
 
         Args:
             storage: Storage to use for the states.
             agent_states: Additional list of AgentState objects to manage.
+            track_changes: Whether the default states record changed properties
+                instead of hashing their serialized contents to detect changes.
+            optimistic_concurrency: Whether the default states fail to save if another
+                writer changed them since they were loaded.
 
         Returns:
             A new TurnState instance with the default states.
         """
         logger.debug("Creating TurnState with storage: %s", storage)
         turn_state = cls()
+        turn_state._track_changes = track_changes
+        turn_state._optimistic_concurrency = optimistic_concurrency
 
         # Add default states
-        turn_state._scopes[ConversationState.__name__] = ConversationState(storage)
-        turn_state._scopes[UserState.__name__] = UserState(storage)
+        turn_state._scopes[ConversationState.__name__] = ConversationState(
+            storage,
+            track_changes=track_changes,
+            optimistic_concurrency=optimistic_concurrency,
+        )
+        turn_state._scopes[UserState.__name__] = UserState(
+            storage,
+            track_changes=track_changes,
+            optimistic_concurrency=optimistic_concurrency,
+        )
         turn_state._scopes[TempState.SCOPE_NAME] = TempState()
 
         # Add any additional agent states
@@ -289,19 +311,62 @@ class TurnState:
             A new TurnState instance with loaded states.
         """
         conversation, user, temp = (
-            ConversationState(storage),
-            UserState(storage),
+            ConversationState(
+                storage,
+                track_changes=self._track_changes,
+                optimistic_concurrency=self._optimistic_concurrency,
+            ),
+            UserState(
+                storage,
+                track_changes=self._track_changes,
+                optimistic_concurrency=self._optimistic_concurrency,
+            ),
             TempState(),
         )
 
-        await conversation.load(context)
-        await user.load(context)
-        await temp.load(context)
+        await self._load_states(context, [conversation, user, temp])
 
         self._scopes[ConversationState.__name__] = conversation
         self._scopes[UserState.__name__] = user
         self._scopes[TempState.SCOPE_NAME] = temp
 
+    @staticmethod
+    async def _load_states(
+        context: TurnContext, states: list[AgentState], force: bool = False
+    ) -> None:
+        """
+        Loads agent states, reading the ones that share a storage in a single request.
+
+        Args:
+            context: The turn context.
+            states: The states to load.
+            force: Whether data should be forced into cache.
+        """
+        tasks = []
+        reads: dict[tuple[Storage, type], list[tuple[AgentState, str]]] = {}
+        for state in states:
+            if type(state).load is not AgentState.load:
+                tasks.append(state.load(context, force))
+                continue
+            storage_key = state.get_storage_key(context)
+            if state._should_load(context, force):
+                reads.setdefault((state._storage, state._read_target_cls), []).append(
+                    (state, storage_key)
+                )
+
+        async def read(storage: Storage, target_cls: type, pending) -> None:
+            items = await storage.read(
+                [storage_key for _, storage_key in pending], target_cls=target_cls
+            )
+            for state, storage_key in pending:
+                state._set_loaded(context, items.get(storage_key))
+
+        tasks.extend(
+            read(storage, target_cls, pending)
+            for (storage, target_cls), pending in reads.items()
+        )
+        await asyncio.gather(*tasks)
+
     @staticmethod
     def _get_scope_and_path(name: str) -> tuple[str, str]:
         """
@@ -0,0 +1,105 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Generic, Hashable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _SingleFlight(Generic[T]):
+    """Runs at most one fetch per key at a time.
+
+    Callers asking for a key while its fetch is running share that fetch instead of
+    starting another one. Used by the token and signing key caches, which refresh
+    entries in the background while the cached value keeps being served.
+    """
+
+    def __init__(self, description: str):
+        """
+        :param description: Names the fetch in the warning logged when it fails,
+            e.g. "JWKS refresh".
+        """
+        self._description = description
+        self._tasks: dict[Hashable, asyncio.Task[T]] = {}
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Whether a fetch for a key is running on the current event loop.
+
+        :param key: Identifies the fetch.
+        """
+        task = self._tasks.get(key)
+        return (
+            task is not None
+            and not task.done()
+            and task.get_loop() is asyncio.get_running_loop()
+        )
+
+    def task(self, key: Hashable) -> asyncio.Task[T] | None:
+        """Gets the most recently started fetch for a key, if it has not finished.
+
+        :param key: Identifies the fetch.
+        """
+        return self._tasks.get(key)
+
+    def start(
+        self, key: Hashable, fetch: Callable[[], Awaitable[T]]
+    ) -> asyncio.Task[T]:
+        """Starts a fetch for a key unless one is already running.
+
+        Failures are logged, so a background fetch nobody awaits does not fail silently.
+
+        :param key: Identifies the fetch.
+        :param fetch: Performs the fetch.
+        :return: The running fetch.
+        """
+        if self.in_flight(key):
+            return self._tasks[key]
+
+        task = asyncio.get_running_loop().create_task(fetch())
+        self._tasks[key] = task
+
+        def _on_done(done: asyncio.Task[T]) -> None:
+            if self._tasks.get(key) is done:
+                del self._tasks[key]
+            if not done.cancelled() and done.exception() is not None:
+                logger.warning(
+                    "%s failed: %s",
+                    self._description,
+                    type(done.exception()).__name__,
+                )
+
+        task.add_done_callback(_on_done)
+        return task
+
+    async def run(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Waits for the fetch for a key, starting it unless one is already running.
+
+        :param key: Identifies the fetch.
+        :param fetch: Performs the fetch.
+        :return: The result of the fetch.
+        """
+        # shielded so a cancelled caller does not cancel a fetch other callers share
+        return await asyncio.shield(self.start(key, fetch))
+
+
+def _refresh_time(obtained_at: Any, expires_at: Any, refresh_before: Any) -> Any:
+    """Computes when a cached value should be refreshed in the background.
+
+    The value is refreshed ``refresh_before`` ahead of ``expires_at``, but never
+    before half its lifetime has passed, so a refresh that returns a short-lived value
+    does not refresh again at once. Works with both monotonic seconds and datetimes.
+
+    :param obtained_at: When the value was obtained.
+    :param expires_at: When the value expires.
+    :param refresh_before: How long before expiry the value is refreshed.
+    :return: When the value should be refreshed.
+    """
+    return max(
+        expires_at - refresh_before, obtained_at + (expires_at - obtained_at) / 2
+    )
@@ -2,15 +2,27 @@
 # Licensed under the MIT License.
 
 import asyncio
+import hashlib
 import logging
-import threading
-from typing import Any
-from dataclasses import dataclass
-
-from jwt import PyJWKClient, PyJWK, decode, get_unverified_header
+import time
+from collections import OrderedDict
+from typing import Any, Iterable
+from dataclasses import dataclass, field
+
+from aiohttp import ClientError, ClientSession, ClientTimeout
+from jwt import (
+    PyJWK,
+    PyJWKClientConnectionError,
+    PyJWKClientError,
+    PyJWKSet,
+    decode,
+    get_unverified_header,
+)
 
+from ...json_codec import get_json_codec
 from ..agent_auth_configuration import AgentAuthConfiguration
 from ..authentication_constants import AuthenticationConstants
+from .._single_flight import _SingleFlight
 from ..claims_identity import ClaimsIdentity
 from .._entra_issuers import (
     BOTFRAMEWORK_JWKS_URIS,
@@ -25,55 +37,197 @@ logger = logging.getLogger(__name__)
 
 
 @dataclass
-class _JwkClientCacheEntry:
+class _JwksCacheEntry:
 
-    jwk_client: PyJWKClient
-    lock: threading.Lock
+    keys: dict[str, PyJWK] = field(default_factory=dict)
+    fetched_at: float | None = None
 
 
 class _JwkClientManager:
-    """Helper class to manage PyJWKClient instances for different JWKS URIs, with caching and async-safety"""
+    """Async cache of the JSON Web Key Sets served by different JWKS URIs.
+
+    Key sets are fetched with aiohttp. A key set older than ``refresh_after`` seconds is
+    refreshed in the background while the cached keys keep being served, so the request
+    path only waits on the network when a key set is missing, older than ``lifespan``
+    seconds, or does not contain the requested ``kid``. Concurrent fetches of the same
+    URI share one request.
+    """
 
-    _cache: dict[str, _JwkClientCacheEntry]
+    _cache: dict[str, _JwksCacheEntry]
 
-    def __init__(self):
+    def __init__(
+        self,
+        lifespan: float = 300.0,
+        refresh_after: float = 240.0,
+        min_refresh_interval: float = 10.0,
+        timeout: float = 10.0,
+    ):
+        """
+        :param lifespan: Seconds after which a key set is no longer served without refetching it.
+        :param refresh_after: Seconds after which a key set is refreshed in the background.
+        :param min_refresh_interval: Minimum seconds between refetches caused by an unknown ``kid``.
+        :param timeout: Timeout in seconds for fetching a key set.
+        """
         self._cache = {}
+        self._refreshing: _SingleFlight[None] = _SingleFlight("JWKS refresh")
+        self._lifespan = lifespan
+        self._refresh_after = refresh_after
+        self._min_refresh_interval = min_refresh_interval
+        self._timeout = timeout
 
-    def _get_jwk_client(self, jwks_uri: str) -> _JwkClientCacheEntry:
-        """Retrieves a PyJWKClient for the given JWKS URI, using a cache to
-        avoid creating multiple clients for the same URI."""
+    def _get_entry(self, jwks_uri: str) -> _JwksCacheEntry:
         if jwks_uri not in self._cache:
-            self._cache[jwks_uri] = _JwkClientCacheEntry(
-                PyJWKClient(jwks_uri), threading.Lock()
-            )
+            self._cache[jwks_uri] = _JwksCacheEntry()
         return self._cache[jwks_uri]
 
     async def get_signing_key(self, jwks_uri: str, header: dict[str, Any]) -> PyJWK:
-        """Retrieves the signing key from the JWK client for the given token header."""
+        """Retrieves the signing key matching the ``kid`` of the given token header.
 
-        jwk_cache_entry = self._get_jwk_client(jwks_uri)
+        :param jwks_uri: The JWKS URI serving the key set.
+        :param header: The unverified token header.
+        :return: The matching signing key.
+        :raises KeyError: If the header has no ``kid``.
+        :raises PyJWKClientError: If the key set has no matching key or cannot be fetched.
+        """
+        kid = header[AuthenticationConstants.KEY_ID_HEADER]
+        entry = self._get_entry(jwks_uri)
+
+        age = None if entry.fetched_at is None else time.monotonic() - entry.fetched_at
+        if age is None or age >= self._lifespan:
+            await self._refresh(jwks_uri, entry)
+        elif kid not in entry.keys:
+            if age >= self._min_refresh_interval:
+                await self._refresh(jwks_uri, entry)
+        elif age >= self._refresh_after:
+            self._refreshing.start(jwks_uri, lambda: self._load(jwks_uri, entry))
+
+        key = entry.keys.get(kid)
+        if key is None:
+            raise PyJWKClientError(
+                f'Unable to find a signing key that matches: "{kid}"'
+            )
+        return key
 
-        # locking and creating a new thread seems strange,
-        # but PyJWKClient.get_signing_key is synchronous, so we spawn another thread
-        # to make the call non-blocking, allowing other queued coroutines to run in the meantime.
-        # Meanwhile, the lock ensures safety for the PyJWKClient's underlying cache and
-        # prevents duplicate calls to the JWKS endpoint for the same URI when multiple
-        # coroutines are trying to get signing keys concurrently.
+    async def prefetch(self, jwks_uris: Iterable[str]) -> None:
+        """Fetches the key sets of the given JWKS URIs concurrently.
 
-        def _helper():
-            with jwk_cache_entry.lock:
-                return jwk_cache_entry.jwk_client.get_signing_key(
-                    header[AuthenticationConstants.KEY_ID_HEADER]
+        Failures are logged and left for the request path to retry.
+
+        :param jwks_uris: The JWKS URIs to fetch.
+        """
+        jwks_uris = list(dict.fromkeys(jwks_uris))
+        results = await asyncio.gather(
+            *(self._refresh(uri, self._get_entry(uri)) for uri in jwks_uris),
+            return_exceptions=True,
+        )
+        for jwks_uri, result in zip(jwks_uris, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "Failed to prefetch JWKS from %s: %s",
+                    jwks_uri,
+                    type(result).__name__,
                 )
 
-        key = await asyncio.to_thread(_helper)
-        return key
+    async def _refresh(self, jwks_uri: str, entry: _JwksCacheEntry) -> None:
+        await self._refreshing.run(jwks_uri, lambda: self._load(jwks_uri, entry))
+
+    async def _load(self, jwks_uri: str, entry: _JwksCacheEntry) -> None:
+        jwk_set = PyJWKSet.from_dict(await self._fetch_jwk_set(jwks_uri))
+        entry.keys = {
+            key.key_id: key
+            for key in jwk_set.keys
+            if key.key_id and key.public_key_use in ("sig", None)
+        }
+        entry.fetched_at = time.monotonic()
+
+    async def _fetch_jwk_set(self, jwks_uri: str) -> dict[str, Any]:
+        try:
+            async with ClientSession(
+                timeout=ClientTimeout(total=self._timeout)
+            ) as session:
+                async with session.get(jwks_uri) as response:
+                    response.raise_for_status()
+                    return await response.json(
+                        loads=get_json_codec().loads, content_type=None
+                    )
+        except (ClientError, asyncio.TimeoutError, ValueError) as error:
+            raise PyJWKClientConnectionError(
+                f'Fail to fetch data from the url, err: "{error}"'
+            ) from error
+
+
+class _ValidatedTokenCache:
+    """Bounded LRU cache of the claims of tokens that passed validation.
+
+    Entries are keyed by the configuration the token was validated against and a
+    SHA-256 digest of the token, and expire at the token's ``exp`` claim. Tokens
+    without a numeric ``exp`` are not cached.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        :param max_size: Maximum number of tokens kept; the least recently used is evicted first.
+        """
+        self._max_size = max_size
+        self._entries: OrderedDict[
+            tuple[AgentAuthConfiguration, bytes], tuple[dict[str, Any], float]
+        ] = OrderedDict()
+
+    @staticmethod
+    def _key(
+        configuration: AgentAuthConfiguration, token: str
+    ) -> tuple[AgentAuthConfiguration, bytes]:
+        return configuration, hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(
+        self, configuration: AgentAuthConfiguration, token: str
+    ) -> dict[str, Any] | None:
+        """Returns the claims of a cached, unexpired token, or None."""
+        key = self._key(configuration, token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        claims, expires_at = entry
+        if time.time() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return claims
+
+    def set(
+        self,
+        configuration: AgentAuthConfiguration,
+        token: str,
+        claims: dict[str, Any],
+    ) -> None:
+        """Caches the claims of a validated token until its ``exp`` claim."""
+        expires_at = claims.get("exp")
+        if (
+            self._max_size <= 0
+            or not isinstance(expires_at, (int, float))
+            or isinstance(expires_at, bool)
+            or time.time() >= expires_at
+        ):
+            return
+        key = self._key(configuration, token)
+        self._entries[key] = (claims, float(expires_at))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
 
 
 class JwtTokenValidator:
-    """Utility class for validating JWT tokens using the PyJWT library and JWKs from a specified URI."""
+    """Utility class for validating JWT tokens using the PyJWT library and JWKs from a specified URI.
+
+    Tokens that pass validation are cached until their ``exp`` claim, so a bearer token
+    reused across requests is verified once.
+    """
 
     _jwk_client_manager = _JwkClientManager()
+    _validated_tokens = _ValidatedTokenCache()
 
     def __init__(self, configuration: AgentAuthConfiguration):
         """Initializes the JwtTokenValidator with the given configuration.
@@ -97,6 +251,11 @@ class JwtTokenValidator:
         :raises ValueError: If the token, audience, tenant binding, or (when opted in) issuer is not valid.
         """
 
+        cached_claims = self._validated_tokens.get(self.configuration, token)
+        if cached_claims is not None:
+            logger.debug("JWT token found in the validated token cache.")
+            return ClaimsIdentity(dict(cached_claims), security_token=token)
+
         logger.debug("Validating JWT token.")
         header = get_unverified_header(token)
         unverified_payload: dict = decode(token, options={"verify_signature": False})
@@ -154,8 +313,20 @@ class JwtTokenValidator:
         )
 
         logger.debug("JWT token validated successfully.")
+        self._validated_tokens.set(self.configuration, token, dict(decoded_token))
         return ClaimsIdentity(decoded_token, security_token=token)
 
+    async def warm_up(self) -> None:
+        """Fetches the signing keys of every configured connection ahead of the first request.
+
+        Call this once at startup; the aiohttp and FastAPI hosting packages do so from
+        ``jwt_authorization_warm_up``. Keys that cannot be fetched are fetched again
+        when a token needs them.
+        """
+        await self._jwk_client_manager.prefetch(
+            _configured_jwks_uris(self.configuration)
+        )
+
     def get_anonymous_claims(self) -> ClaimsIdentity:
         """Returns a ClaimsIdentity for an anonymous user."""
         logger.debug("Returning anonymous claims identity.")
@@ -200,6 +371,20 @@ def _build_jwks_uri(
     )
 
 
+def _configured_jwks_uris(config: AgentAuthConfiguration) -> list[str]:
+    """Lists the JWKS URIs that :func:`_build_jwks_uri` can route tokens for the
+    configured connections to: the Bot Framework key set of each connection's
+    cloud and its Entra key set."""
+    uris = []
+    for connection in config._connections.values():
+        if is_gov_authority(connection.AUTHORITY):
+            uris.append(AuthenticationConstants.GOV_ABS_JWKS_URL)
+        else:
+            uris.append(AuthenticationConstants.PUBLIC_ABS_JWKS_URL)
+        uris.append(_build_jwks_uri(None, config, connection))
+    return list(dict.fromkeys(uris))
+
+
 def _get_valid_issuers(config: AgentAuthConfiguration) -> set[str]:
     """Case-insensitive union of the connection's configured/default issuers
     (``AgentAuthConfiguration.ISSUERS``) and the always-trusted Microsoft
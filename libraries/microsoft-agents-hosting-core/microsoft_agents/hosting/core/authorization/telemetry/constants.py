@@ -12,6 +12,9 @@ SPAN_GET_AGENTIC_USER_TOKEN = "agents.authentication.get_agentic_user_token"
 
 METRIC_AUTH_TOKEN_REQUEST_DURATION = "agents.auth.token.request.duration"
 METRIC_AUTH_TOKEN_REQUEST_COUNT = "agents.auth.token.request.count"
+METRIC_AUTH_TOKEN_CACHE_HIT_TOTAL = "agents.auth.token.cache.hit.total"
+METRIC_AUTH_TOKEN_CACHE_MISS_TOTAL = "agents.auth.token.cache.miss.total"
+METRIC_AUTH_TOKEN_ACQUISITION_DURATION = "agents.auth.token.acquisition.duration"
 
 AUTH_METHOD_OBO = "obo"
 AUTH_METHOD_AGENTIC_INSTANCE = "agentic_instance"
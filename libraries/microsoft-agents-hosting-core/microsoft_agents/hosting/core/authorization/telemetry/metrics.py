@@ -15,3 +15,21 @@ auth_token_request_duration = agents_telemetry.meter.create_histogram(
     "ms",
     description="Duration of auth token requests in milliseconds",
 )
+
+auth_token_cache_hit_total = agents_telemetry.meter.create_counter(
+    constants.METRIC_AUTH_TOKEN_CACHE_HIT_TOTAL,
+    "request",
+    description="Number of access token requests served from the token cache",
+)
+
+auth_token_cache_miss_total = agents_telemetry.meter.create_counter(
+    constants.METRIC_AUTH_TOKEN_CACHE_MISS_TOTAL,
+    "request",
+    description="Number of access token requests that waited for a token acquisition",
+)
+
+auth_token_acquisition_duration = agents_telemetry.meter.create_histogram(
+    constants.METRIC_AUTH_TOKEN_ACQUISITION_DURATION,
+    "ms",
+    description="Duration of access token acquisitions from the identity provider in milliseconds",
+)
@@ -242,12 +242,16 @@ class ChannelAdapter(ABC, ChannelAdapterProtocol):
                 await self.middleware_set.receive_activity_with_status(
                     context, callback
                 )
+                # send whatever the turn left in the outbound buffer
+                await context.flush_buffered_activities()
             except Exception as error:
                 if self.on_turn_error is not None:
                     await self.on_turn_error(context, error)
+                    await context.flush_buffered_activities()
                 else:
                     raise error
         else:
             # callback to caller on proactive case
             if callback is not None:
                 await callback(context)
+            await context.flush_buffered_activities()
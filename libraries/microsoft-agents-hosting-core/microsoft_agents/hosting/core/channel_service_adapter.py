@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC
 from http import HTTPStatus
 from typing import Awaitable, Callable, Optional, cast
@@ -41,15 +42,32 @@ from .turn_context import TurnContext
 class ChannelServiceAdapter(ChannelAdapter, ABC):
     _AGENT_CONNECTOR_CLIENT_KEY = "ConnectorClient"
 
-    def __init__(self, channel_service_client_factory: ChannelServiceClientFactoryBase):
+    def __init__(
+        self,
+        channel_service_client_factory: ChannelServiceClientFactoryBase,
+        *,
+        max_in_flight_sends: int = 1,
+    ):
         """
         Initialize the ChannelServiceAdapter.
 
         :param channel_service_client_factory: The factory for creating channel service clients.
         :type channel_service_client_factory: :class:`microsoft_agents.hosting.core.channel_service_client_factory_base.ChannelServiceClientFactoryBase`
+        :param max_in_flight_sends: The maximum number of outbound requests a single
+            `send_activities` call keeps in flight. The default of 1 sends activities
+            one after another. Higher values let requests for different conversations
+            overlap; requests for the same conversation are still sent in order, each
+            after the previous response.
+        :type max_in_flight_sends: int
+        :raises ValueError: If max_in_flight_sends is less than 1.
         """
         super().__init__()
+        if max_in_flight_sends < 1:
+            raise ValueError(
+                "ChannelServiceAdapter.__init__: max_in_flight_sends must be at least 1"
+            )
         self._channel_service_client_factory = channel_service_client_factory
+        self._max_in_flight_sends = max_in_flight_sends
 
     async def send_activities(
         self, context: TurnContext, activities: list[Activity]
@@ -68,6 +86,9 @@ class ChannelServiceAdapter(ChannelAdapter, ABC):
         if len(activities) == 0:
             raise ValueError("send_activities: activities list cannot be empty")
 
+        if self._max_in_flight_sends > 1 and len(activities) > 1:
+            return await self._send_activities_pipelined(context, activities)
+
         responses = []
 
         for activity in activities:
@@ -84,34 +105,110 @@ class ChannelServiceAdapter(ChannelAdapter, ABC):
                 # no-op
                 pass
             else:
-                connector_client = context.services.get(ConnectorClientBase)
-                if not connector_client:
-                    raise RuntimeError(
-                        "Unable to extract ConnectorClient from turn context."
-                    )
-
-                with spans.AdapterSendActivities([activity]):
-                    if activity.reply_to_id:
-                        response = (
-                            await connector_client.conversations.reply_to_activity(
-                                activity.conversation.id,
-                                activity.reply_to_id,
-                                activity,
-                            )
-                        )
-                    else:
-                        response = (
-                            await connector_client.conversations.send_to_conversation(
-                                activity.conversation.id,
-                                activity,
-                            )
-                        )
+                response = await self._send_activity(
+                    self._get_connector_client(context), activity
+                )
             response = response or ResourceResponse(id=activity.id or "")
 
             responses.append(response)
 
         return responses
 
+    async def _send_activities_pipelined(
+        self, context: TurnContext, activities: list[Activity]
+    ) -> list[ResourceResponse]:
+        """
+        Send a list of activities with up to `max_in_flight_sends` requests in flight.
+
+        Requests for the same conversation are sent one after another, each waiting
+        for the response to the previous one, so the channel receives them in order.
+        Only requests for different conversations overlap. Responses are returned in
+        the order of the activities. If a request fails, no further requests are
+        started and the first failure is raised once the in-flight requests have
+        completed.
+        """
+        responses = [ResourceResponse() for _ in activities]
+        window = asyncio.Semaphore(self._max_in_flight_sends)
+        failed = False
+        sends: list[asyncio.Task] = []
+        last_sends: dict[Optional[str], asyncio.Task] = {}
+        connector_client: ConnectorClientBase | None = None
+
+        async def send(
+            index: int, activity: Activity, previous: Optional[asyncio.Task]
+        ) -> None:
+            nonlocal failed
+            if previous is not None:
+                await asyncio.wait([previous])
+            async with window:
+                if failed:
+                    return
+                try:
+                    response = await self._send_activity(connector_client, activity)
+                except BaseException:
+                    failed = True
+                    raise
+                responses[index] = response or ResourceResponse(id=activity.id or "")
+
+        try:
+            for index, activity in enumerate(activities):
+                activity.id = None
+
+                if activity.type == ActivityTypes.invoke_response:
+                    context.turn_state[self.INVOKE_RESPONSE_KEY] = activity
+                elif (
+                    activity.type == ActivityTypes.trace
+                    and activity.channel_id != Channels.emulator
+                ):
+                    # no-op
+                    pass
+                else:
+                    if connector_client is None:
+                        connector_client = self._get_connector_client(context)
+
+                    conversation_id = (
+                        activity.conversation.id if activity.conversation else None
+                    )
+                    task = asyncio.create_task(
+                        send(index, activity, last_sends.get(conversation_id))
+                    )
+                    last_sends[conversation_id] = task
+                    sends.append(task)
+
+            results = await asyncio.gather(*sends, return_exceptions=True)
+        except BaseException:
+            for task in sends:
+                task.cancel()
+            await asyncio.gather(*sends, return_exceptions=True)
+            raise
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return responses
+
+    def _get_connector_client(self, context: TurnContext) -> ConnectorClientBase:
+        connector_client = context.services.get(ConnectorClientBase)
+        if not connector_client:
+            raise RuntimeError("Unable to extract ConnectorClient from turn context.")
+        return connector_client
+
+    async def _send_activity(
+        self, connector_client: ConnectorClientBase, activity: Activity
+    ) -> ResourceResponse:
+        with spans.AdapterSendActivities([activity]):
+            if activity.reply_to_id:
+                return await connector_client.conversations.reply_to_activity(
+                    activity.conversation.id,
+                    activity.reply_to_id,
+                    activity,
+                )
+            return await connector_client.conversations.send_to_conversation(
+                activity.conversation.id,
+                activity,
+            )
+
     async def update_activity(self, context: TurnContext, activity: Activity):
         """
         Update an existing activity in the conversation.
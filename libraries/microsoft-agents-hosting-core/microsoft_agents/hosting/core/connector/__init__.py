@@ -3,7 +3,9 @@ from .connector_client_base import ConnectorClientBase
 from .get_product_info import get_product_info
 
 # Client API
+from .client.client_session_pool import ClientSessionPool
 from .client.connector_client import ConnectorClient
+from .client.user_token_cache import UserTokenCache
 from .client.user_token_client import UserTokenClient
 
 from .user_token_client_base import UserTokenClientBase
@@ -15,7 +17,9 @@ from .teams.teams_connector_client import TeamsConnectorClient
 from .mcs.mcs_connector_client import MCSConnectorClient
 
 __all__ = [
+    "ClientSessionPool",
     "ConnectorClient",
+    "UserTokenCache",
     "UserTokenClient",
     "UserTokenClientBase",
     "TeamsConnectorClient",
@@ -2,8 +2,30 @@
 # Licensed under the MIT License.
 
 from logging import Logger
+from typing import Any
 
 import aiohttp
+from pydantic import BaseModel
+
+from ..json_codec import get_json_codec
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _serialize_model(model: BaseModel, *, exclude_none: bool = False) -> bytes:
+    """Serialize a model straight to JSON bytes for use as a request body.
+
+    This is equivalent to ``json.dumps(model.model_dump(mode="json", ...))`` without
+    building the intermediate dict or encoding twice.
+    """
+    return model.__pydantic_serializer__.to_json(
+        model, by_alias=True, exclude_unset=True, exclude_none=exclude_none
+    )
+
+
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a JSON response body with the SDK's JSON codec."""
+    return await response.json(loads=get_json_codec().loads)
 
 
 def _handle_request_error(
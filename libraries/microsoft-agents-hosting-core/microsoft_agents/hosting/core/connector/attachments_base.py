@@ -15,3 +15,22 @@ class AttachmentsBase(Protocol):
     @abstractmethod
     async def get_attachment(self) -> Optional[AsyncIterator[bytes]]:
         pass
+
+    async def stream_attachment(
+        self, attachment_id: str, view_id: str, chunk_size: int = 65536
+    ) -> AsyncIterator[bytes]:
+        """Streams an attachment in chunks of at most ``chunk_size`` bytes.
+
+        The default implementation gets the whole attachment with
+        ``get_attachment`` and yields it in chunks.
+        """
+        attachment = await self.get_attachment(attachment_id, view_id)
+        if attachment is None:
+            return
+        if hasattr(attachment, "__aiter__"):
+            async for chunk in attachment:
+                yield chunk
+            return
+        data = attachment.read() if hasattr(attachment, "read") else attachment
+        for start in range(0, len(data), chunk_size):
+            yield data[start : start + chunk_size]
@@ -1,7 +1,9 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+from .client_session_pool import ClientSessionPool
 from .connector_client import ConnectorClient
+from .user_token_cache import UserTokenCache
 from .user_token_client import UserTokenClient
 
-__all__ = ["ConnectorClient", "UserTokenClient"]
+__all__ = ["ClientSessionPool", "ConnectorClient", "UserTokenCache", "UserTokenClient"]
@@ -12,10 +12,24 @@ logger = logging.getLogger(__name__)
 
 
 class _ClientSessionWrapper:
-    """ClientSession wrapper that merges propagated headers per request."""
-
-    def __init__(self, session: ClientSession):
+    """ClientSession wrapper that merges propagated headers per request.
+
+    Headers given to the wrapper, such as the Authorization header of a client,
+    are also merged into each request, so sessions shared between clients never
+    carry per-client headers. Closing the wrapper closes the session only if the
+    wrapper owns it.
+    """
+
+    def __init__(
+        self,
+        session: ClientSession,
+        headers: dict[str, str] | None = None,
+        *,
+        owns_session: bool = True,
+    ):
         self._session = session
+        self._headers = headers or {}
+        self._owns_session = owns_session
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._session, name)
@@ -33,13 +47,15 @@ class _ClientSessionWrapper:
 
     def _apply_headers(self, headers: dict) -> None:
         """
-        Merge propagated headers into the request headers.
+        Merge the wrapper's headers and propagated headers into the request headers.
 
-        Explicit request headers take precedence over propagated values with the
-        same name.
+        Explicit request headers take precedence, followed by the wrapper's headers
+        and then propagated values with the same name.
 
         :param headers: Mutable request headers to augment.
         """
+        for key, value in self._headers.items():
+            headers.setdefault(key, value)
         propagated_headers = HeaderPropagationContext.collect_headers()
         if propagated_headers:
             for key, value in propagated_headers.items():
@@ -79,6 +95,10 @@ class _ClientSessionWrapper:
     def patch(self, *args, **kwargs):
         return self._call_with_headers(self._session.patch, *args, **kwargs)
 
+    async def close(self) -> None:
+        if self._owns_session:
+            await self._session.close()
+
 
 class _BaseClient:
 
@@ -91,4 +111,6 @@ class _BaseClient:
 
         :return: The wrapped ClientSession.
         """
+        if isinstance(self._client, _ClientSessionWrapper):
+            return self._client
         return _ClientSessionWrapper(self._client)
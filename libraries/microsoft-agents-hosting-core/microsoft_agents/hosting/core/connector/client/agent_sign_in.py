@@ -7,7 +7,7 @@ from aiohttp import ClientSession
 from microsoft_agents.activity import SignInResource
 from ..telemetry import user_token_client_spans as spans
 from ..agent_sign_in_base import AgentSignInBase
-from .._utils import _handle_request_error
+from .._utils import _handle_request_error, _read_json
 from ._base_client import _BaseClient
 
 logger = logging.getLogger(__name__)
@@ -107,5 +107,5 @@ class AgentSignIn(AgentSignInBase, _BaseClient):
                         logger, response, resource="api/botsignin/getSignInResource"
                     )
 
-                data = await response.json()
+                data = await _read_json(response)
                 return SignInResource.model_validate(data)
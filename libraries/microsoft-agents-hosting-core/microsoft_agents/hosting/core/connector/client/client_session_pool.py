@@ -0,0 +1,84 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import logging
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+from ..get_product_info import get_product_info
+
+logger = logging.getLogger(__name__)
+
+
+class ClientSessionPool:
+    """
+    Long-lived aiohttp sessions shared by connector and user token clients.
+
+    One session is kept per service URL, so connections to the channel service
+    and token service stay open across turns instead of being set up again for
+    every client. The sessions carry no Authorization header; clients add their
+    token to each request. Clients created from the pool do not close its
+    sessions, call :meth:`close` when the application shuts down.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        timeout: ClientTimeout | None = None,
+    ):
+        """
+        Initialize a new instance of ClientSessionPool.
+
+        :param limit: The maximum number of open connections per session.
+        :param limit_per_host: The maximum number of open connections per host, or 0 for no limit.
+        :param keepalive_timeout: Seconds an idle connection is kept open for reuse.
+        :param timeout: The request timeout of the sessions, or None for the aiohttp default.
+        """
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._timeout = timeout
+        self._sessions: dict[str, ClientSession] = {}
+
+    def get_session(self, endpoint: str) -> ClientSession:
+        """
+        Gets the session for a service URL, creating it on first use.
+
+        Must be called from a running event loop.
+
+        :param endpoint: The base URL of the service.
+        :return: The shared ClientSession.
+        """
+        if not endpoint.endswith("/"):
+            endpoint += "/"
+
+        session = self._sessions.get(endpoint)
+        if session is None or session.closed:
+            logger.debug("Creating pooled ClientSession for endpoint: %s", endpoint)
+            kwargs = {"timeout": self._timeout} if self._timeout else {}
+            session = ClientSession(
+                base_url=endpoint,
+                headers={
+                    "Accept": "application/json",
+                    "Content-Type": "application/json",
+                    "User-Agent": get_product_info(),
+                },
+                connector=TCPConnector(
+                    limit=self._limit,
+                    limit_per_host=self._limit_per_host,
+                    keepalive_timeout=self._keepalive_timeout,
+                ),
+                **kwargs,
+            )
+            self._sessions[endpoint] = session
+        return session
+
+    async def close(self) -> None:
+        """Close all pooled sessions."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            await session.close()
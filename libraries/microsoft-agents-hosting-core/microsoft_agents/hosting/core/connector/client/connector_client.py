@@ -5,7 +5,7 @@
 
 import logging
 import re
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 from aiohttp import ClientSession
 from io import BytesIO
 
@@ -28,8 +28,14 @@ from ..attachments_base import AttachmentsBase
 from ..conversations_base import ConversationsBase
 from ..get_product_info import get_product_info
 from ..telemetry import connector_spans as spans
-from .._utils import _handle_request_error
-from ._base_client import _BaseClient
+from .._utils import (
+    _JSON_HEADERS,
+    _handle_request_error,
+    _read_json,
+    _serialize_model,
+)
+from ._base_client import _BaseClient, _ClientSessionWrapper
+from .client_session_pool import ClientSessionPool
 
 logger = logging.getLogger(__name__)
 
@@ -43,15 +49,20 @@ class AttachmentInfo:
         self.views = kwargs.get("views")
 
 
-def normalize_outgoing_activity(data: Any) -> Any:
+def normalize_outgoing_activity(data: Any, *, exclude_none: bool = False) -> Any:
     """
     Normalizes an outgoing activity object for wire transmission.
 
+    Activities are serialized straight to JSON bytes, using their aliases and
+    leaving out unset fields. Other values are returned unchanged.
+
     :param data: The activity object to normalize.
-    :return: The normalized activity object.
+    :param exclude_none: Whether to leave out fields that are set to None.
+    :return: The JSON request body for an activity, otherwise the unchanged value.
     """
-    # This is a placeholder for any transformations needed
     # Similar to the normalizeOutgoingActivity function in TypeScript
+    if isinstance(data, Activity):
+        return _serialize_model(data, exclude_none=exclude_none)
     return data
 
 
@@ -94,7 +105,7 @@ class AttachmentsOperations(AttachmentsBase, _BaseClient):
                         logger, response, resource=f"v3/attachments/<attachment_id>"
                     )
 
-                data = await response.json()
+                data = await _read_json(response)
                 return AttachmentInfo(**data)
 
     async def get_attachment(self, attachment_id: str, view_id: str) -> BytesIO:
@@ -146,6 +157,59 @@ class AttachmentsOperations(AttachmentsBase, _BaseClient):
                 data = await response.read()
                 return BytesIO(data)
 
+    async def stream_attachment(
+        self, attachment_id: str, view_id: str, chunk_size: int = 65536
+    ) -> AsyncIterator[bytes]:
+        """
+        Streams an attachment by attachment ID and view ID in chunks, without
+        holding the whole attachment in memory.
+
+        :param attachment_id: The ID of the attachment.
+        :param view_id: The ID of the view.
+        :param chunk_size: The maximum size of each chunk in bytes.
+        :return: An async iterator of the attachment's content.
+        """
+        if attachment_id is None:
+            logger.error(
+                "AttachmentsOperations.stream_attachment(): attachmentId is required",
+                stack_info=True,
+            )
+            raise ValueError("attachmentId is required")
+        if view_id is None:
+            logger.error(
+                "AttachmentsOperations.stream_attachment(): viewId is required",
+                stack_info=True,
+            )
+            raise ValueError("viewId is required")
+
+        with spans.ConnectorGetAttachment(attachment_id, view_id) as span:
+
+            url = f"v3/attachments/{attachment_id}/views/{view_id}"
+
+            logger.info(
+                "Streaming attachment for ID: %s, View ID: %s", attachment_id, view_id
+            )
+
+            async with self._wrapped_client().get(url) as response:
+                span.share(http_method="GET", status_code=response.status)
+
+                if response.status in (301, 302):
+                    logger.warning(
+                        "Redirect when streaming attachment: %s",
+                        response.status,
+                        stack_info=True,
+                    )
+                    return
+                elif response.status >= 300:
+                    _handle_request_error(
+                        logger,
+                        response,
+                        resource=f"v3/attachments/<attachment_id>/views/<view_id>",
+                    )
+
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    yield chunk
+
 
 class ConversationsOperations(ConversationsBase, _BaseClient):
 
@@ -219,7 +283,7 @@ class ConversationsOperations(ConversationsBase, _BaseClient):
                 if response.status != 200:
                     _handle_request_error(logger, response, resource="v3/conversations")
 
-                data = await response.json()
+                data = await _read_json(response)
                 return ConversationsResult.model_validate(data)
 
     async def create_conversation(
@@ -236,14 +300,15 @@ class ConversationsOperations(ConversationsBase, _BaseClient):
 
             async with self._wrapped_client().post(
                 "v3/conversations",
-                json=body.model_dump(by_alias=True, exclude_unset=True, mode="json"),
+                data=_serialize_model(body),
+                headers=_JSON_HEADERS,
             ) as response:
                 span.share(http_method="POST", status_code=response.status)
 
                 if response.status not in (200, 201, 202):
                     _handle_request_error(logger, response, resource="v3/conversations")
 
-                data = await response.json()
+                data = await _read_json(response)
                 return ConversationResourceResponse.model_validate(data)
 
     async def reply_to_activity(
@@ -278,9 +343,8 @@ class ConversationsOperations(ConversationsBase, _BaseClient):
 
             async with self._wrapped_client().post(
                 url,
-                json=body.model_dump(
-                    by_alias=True, exclude_unset=True, exclude_none=True, mode="json"
-                ),
+                data=normalize_outgoing_activity(body, exclude_none=True),
+                headers=_JSON_HEADERS,
             ) as response:
                 span.share(http_method="POST", status_code=response.status)
 
@@ -338,7 +402,8 @@ class ConversationsOperations(ConversationsBase, _BaseClient):
 
             async with self._wrapped_client().post(
                 url,
-                json=body.model_dump(by_alias=True, exclude_unset=True, mode="json"),
+                data=normalize_outgoing_activity(body),
+                headers=_JSON_HEADERS,
             ) as response:
                 span.share(http_method="POST", status_code=response.status)
 
@@ -386,7 +451,8 @@ class ConversationsOperations(ConversationsBase, _BaseClient):
 
             async with self._wrapped_client().put(
                 url,
-                json=body.model_dump(by_alias=True, exclude_unset=True),
+                data=normalize_outgoing_activity(body),
+                headers=_JSON_HEADERS,
             ) as response:
                 if response.status not in (200, 201, 202):
                     _handle_request_error(
@@ -395,7 +461,7 @@ class ConversationsOperations(ConversationsBase, _BaseClient):
                         resource=f"v3/conversations/{conversation_id}/activities/{activity_id}",
                     )
 
-                data = await response.json()
+                data = await _read_json(response)
                 return ResourceResponse.model_validate(data)
 
     async def delete_activity(self, conversation_id: str, activity_id: str) -> None:
@@ -463,7 +529,8 @@ class ConversationsOperations(ConversationsBase, _BaseClient):
 
             async with self._wrapped_client().post(
                 url,
-                json=body.model_dump(by_alias=True, exclude_unset=True, mode="json"),
+                data=_serialize_model(body),
+                headers=_JSON_HEADERS,
             ) as response:
                 span.share(http_method="POST", status_code=response.status)
 
@@ -474,7 +541,7 @@ class ConversationsOperations(ConversationsBase, _BaseClient):
                         resource=f"v3/conversations/{conversation_id}/attachments",
                     )
 
-                data = await response.json()
+                data = await _read_json(response)
                 return ResourceResponse.model_validate(data)
 
     async def get_conversation_members(
@@ -512,7 +579,7 @@ class ConversationsOperations(ConversationsBase, _BaseClient):
                         resource=f"v3/conversations/{conversation_id}/members",
                     )
 
-                data = await response.json()
+                data = await _read_json(response)
                 return [ChannelAccount.model_validate(member) for member in data]
 
     async def get_conversation_member(
@@ -553,7 +620,7 @@ class ConversationsOperations(ConversationsBase, _BaseClient):
                         resource=f"v3/conversations/{conversation_id}/members/{member_id}",
                     )
 
-                data = await response.json()
+                data = await _read_json(response)
                 return ChannelAccount.model_validate(data)
 
     async def delete_conversation_member(
@@ -623,7 +690,7 @@ class ConversationsOperations(ConversationsBase, _BaseClient):
                     resource=f"v3/conversations/{conversation_id}/activities/{activity_id}/members",
                 )
 
-            data = await response.json()
+            data = await _read_json(response)
             return [ChannelAccount.model_validate(member) for member in data]
 
     async def get_conversation_paged_members(
@@ -671,7 +738,7 @@ class ConversationsOperations(ConversationsBase, _BaseClient):
                     resource=f"v3/conversations/{conversation_id}/pagedmembers",
                 )
 
-            data = await response.json()
+            data = await _read_json(response)
             return PagedMembersResult.model_validate(data)
 
     async def send_conversation_history(
@@ -697,9 +764,8 @@ class ConversationsOperations(ConversationsBase, _BaseClient):
         logger.info("Sending conversation history to conversation: %s", conversation_id)
         async with self._wrapped_client().post(
             url,
-            json=body.model_dump(
-                by_alias=True, exclude_unset=True, exclude_none=True, mode="json"
-            ),
+            data=_serialize_model(body, exclude_none=True),
+            headers=_JSON_HEADERS,
         ) as response:
             if response.status not in (200, 201, 202):
                 _handle_request_error(
@@ -708,7 +774,7 @@ class ConversationsOperations(ConversationsBase, _BaseClient):
                     resource=f"v3/conversations/{conversation_id}/activities/history",
                 )
 
-            data = await response.json()
+            data = await _read_json(response)
             return ResourceResponse.model_validate(data)
 
 
@@ -718,15 +784,26 @@ class ConnectorClient(ConnectorClientBase):
     """
 
     def __init__(
-        self, endpoint: str, token: str, *, session: ClientSession | None = None
+        self,
+        endpoint: str,
+        token: str,
+        *,
+        session: ClientSession | None = None,
+        session_pool: ClientSessionPool | None = None,
     ):
         """
         Initialize a new instance of ConnectorClient.
 
+        The token is added to each request rather than to the session headers.
+
         :param session: The aiohttp ClientSession to use for HTTP requests.
+        :param session_pool: Optional pool providing a shared session for the endpoint,
+            which is left open when the client is closed.
         """
         if not endpoint.endswith("/"):
             endpoint += "/"
+        if session_pool is not None:
+            session = session_pool.get_session(endpoint)
 
         # Configure headers with JSON acceptance
         headers = {
@@ -746,10 +823,11 @@ class ConnectorClient(ConnectorClientBase):
             headers,
         )
 
-        if len(token) > 1:
-            session.headers.update({"Authorization": f"Bearer {token}"})
-
-        self.client = session
+        self.client = _ClientSessionWrapper(
+            session,
+            {"Authorization": f"Bearer {token}"} if len(token) > 1 else None,
+            owns_session=session_pool is None,
+        )
         self._attachments = AttachmentsOperations(
             self.client
         )  # Will implement if needed
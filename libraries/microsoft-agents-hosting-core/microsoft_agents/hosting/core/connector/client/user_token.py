@@ -13,7 +13,7 @@ from microsoft_agents.activity import (
 )
 from ..telemetry import user_token_client_spans as spans
 from ..user_token_base import UserTokenBase
-from .._utils import _handle_request_error
+from .._utils import _handle_request_error, _read_json
 from ._base_client import _BaseClient
 
 logger = logging.getLogger(__name__)
@@ -78,7 +78,7 @@ class UserToken(UserTokenBase, _BaseClient):
                         logger, response, resource="api/usertoken/GetToken"
                     )
 
-                data = await response.json()
+                data = await _read_json(response)
                 return TokenResponse.model_validate(data)
 
     async def _get_token_or_sign_in_resource(
@@ -121,7 +121,7 @@ class UserToken(UserTokenBase, _BaseClient):
                         resource="/api/usertoken/GetTokenOrSignInResource",
                     )
 
-                data = await response.json()
+                data = await _read_json(response)
                 return TokenOrSignInResourceResponse.model_validate(data)
 
     async def get_aad_tokens(
@@ -154,7 +154,7 @@ class UserToken(UserTokenBase, _BaseClient):
                         logger, response, resource="api/usertoken/GetAadTokens"
                     )
 
-                data = await response.json()
+                data = await _read_json(response)
                 return {k: TokenResponse.model_validate(v) for k, v in data.items()}
 
     async def sign_out(
@@ -219,7 +219,7 @@ class UserToken(UserTokenBase, _BaseClient):
                         logger, response, resource="api/usertoken/GetTokenStatus"
                     )
 
-                data = await response.json()
+                data = await _read_json(response)
                 return [TokenStatus.model_validate(status) for status in data]
 
     async def exchange_token(
@@ -267,5 +267,5 @@ class UserToken(UserTokenBase, _BaseClient):
                         headers=response.headers,
                     )
 
-                data = await response.json()
+                data = await _read_json(response)
                 return TokenResponse.model_validate(data)
@@ -0,0 +1,209 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime, timezone
+
+import jwt
+
+from microsoft_agents.activity import ChannelId, TokenResponse
+
+from ...storage import Storage, StoreItem
+from ...storage._type_aliases import JSON
+from ...storage.object_memory_storage import ObjectMemoryStorage
+
+logger = logging.getLogger(__name__)
+
+
+class _CachedUserTokens(StoreItem):
+    """The cached token responses of one user, by connection name."""
+
+    def __init__(self, tokens: dict[str, JSON] | None = None):
+        self.tokens = tokens or {}
+
+    def store_item_to_json(self) -> JSON:
+        return {"tokens": self.tokens}
+
+    @staticmethod
+    def from_json_to_store_item(json_data: JSON) -> _CachedUserTokens:
+        return _CachedUserTokens(dict(json_data.get("tokens") or {}))
+
+
+def _token_expiry(token_response: TokenResponse) -> float | None:
+    """Returns when a token expires as a POSIX timestamp, or None if it is unknown.
+
+    The ``expiration`` of the response is used when present, otherwise the ``exp``
+    claim of the token if it is a JWT.
+    """
+    if token_response.expiration:
+        try:
+            expiration = datetime.fromisoformat(
+                token_response.expiration.replace("Z", "+00:00")
+            )
+        except ValueError:
+            expiration = None
+        if expiration is not None:
+            if expiration.tzinfo is None:
+                expiration = expiration.replace(tzinfo=timezone.utc)
+            return expiration.timestamp()
+
+    try:
+        exp = jwt.decode(token_response.token, options={"verify_signature": False}).get(
+            "exp"
+        )
+    except jwt.PyJWTError:
+        return None
+    if isinstance(exp, (int, float)) and not isinstance(exp, bool):
+        return float(exp)
+    return None
+
+
+class UserTokenCache:
+    """Caches user tokens from the token service until they expire.
+
+    Tokens are cached per user, connection and channel, and per agent app when
+    the app ID is given. Tokens with no known expiry are not cached, and a token
+    is no longer served ``expiry_buffer`` seconds before it expires.
+
+    By default the cache is kept in process memory and holds the tokens of up to
+    ``max_users`` users. Pass a :class:`Storage` to share it between processes; the
+    storage then holds bearer tokens and must be protected accordingly.
+    Errors reading or writing the storage are logged and treated as cache misses,
+    while errors removing tokens are raised so a sign-out never leaves a token
+    behind.
+    """
+
+    def __init__(
+        self,
+        storage: Storage | None = None,
+        *,
+        max_users: int = 10000,
+        expiry_buffer: float = 300.0,
+    ):
+        """
+        :param storage: The storage holding the tokens. Defaults to an in-memory storage.
+        :param max_users: The maximum number of users kept by the default in-memory storage.
+        :param expiry_buffer: Seconds before expiry after which a token is no longer served.
+        :raises ValueError: If expiry_buffer is negative.
+        """
+        if expiry_buffer < 0:
+            raise ValueError("UserTokenCache(): expiry_buffer must not be negative")
+
+        self._storage = (
+            storage if storage is not None else ObjectMemoryStorage(max_items=max_users)
+        )
+        self._expiry_buffer = expiry_buffer
+
+    @staticmethod
+    def _storage_key(user_id: str, channel_id: str, app_id: str | None) -> str:
+        return (
+            f"auth:_UserTokenCache:{app_id or ''}:"
+            f"{ChannelId.get_channel(channel_id)}:{user_id}"
+        )
+
+    async def _read(self, key: str) -> _CachedUserTokens | None:
+        try:
+            items = await self._storage.read([key], target_cls=_CachedUserTokens)
+        except Exception as error:
+            logger.warning(
+                "Failed to read cached user tokens: %s", type(error).__name__
+            )
+            return None
+        return items.get(key)
+
+    async def get(
+        self,
+        user_id: str,
+        connection_name: str,
+        channel_id: str,
+        app_id: str | None = None,
+    ) -> TokenResponse | None:
+        """Gets a cached token that is not about to expire.
+
+        :param user_id: The ID of the user.
+        :param connection_name: The name of the OAuth connection.
+        :param channel_id: The channel ID associated with the user.
+        :param app_id: The ID of the agent app, if known.
+        :return: The cached token response, or None.
+        """
+        cached = await self._read(self._storage_key(user_id, channel_id, app_id))
+        if cached is None:
+            return None
+
+        data = cached.tokens.get(connection_name)
+        if data is None:
+            return None
+        token_response = TokenResponse.model_validate(data)
+        expires_at = _token_expiry(token_response)
+        if expires_at is None or time.time() >= expires_at - self._expiry_buffer:
+            return None
+        return token_response
+
+    async def set(
+        self,
+        user_id: str,
+        connection_name: str,
+        channel_id: str,
+        token_response: TokenResponse,
+        app_id: str | None = None,
+    ) -> None:
+        """Caches a token, unless its expiry is unknown or too close.
+
+        :param user_id: The ID of the user.
+        :param connection_name: The name of the OAuth connection.
+        :param channel_id: The channel ID associated with the user.
+        :param token_response: The token response from the token service.
+        :param app_id: The ID of the agent app, if known.
+        """
+        if not token_response:
+            return
+        expires_at = _token_expiry(token_response)
+        if expires_at is None or time.time() >= expires_at - self._expiry_buffer:
+            return
+
+        key = self._storage_key(user_id, channel_id, app_id)
+        cached = await self._read(key) or _CachedUserTokens()
+        now = time.time()
+        # drop the user's other expired tokens while the item is rewritten
+        tokens: dict[str, JSON] = {}
+        for name, data in cached.tokens.items():
+            expiry = _token_expiry(TokenResponse.model_validate(data))
+            if expiry is not None and expiry > now:
+                tokens[name] = data
+        tokens[connection_name] = token_response.model_dump(
+            mode="json", by_alias=True, exclude_none=True
+        )
+        try:
+            await self._storage.write({key: _CachedUserTokens(tokens)})
+        except Exception as error:
+            logger.warning("Failed to cache a user token: %s", type(error).__name__)
+
+    async def delete(
+        self,
+        user_id: str,
+        connection_name: str | None,
+        channel_id: str,
+        app_id: str | None = None,
+    ) -> None:
+        """Removes a user's cached token for a connection, or all of them.
+
+        :param user_id: The ID of the user.
+        :param connection_name: The name of the OAuth connection, or None for every connection.
+        :param channel_id: The channel ID associated with the user.
+        :param app_id: The ID of the agent app, if known.
+        """
+        key = self._storage_key(user_id, channel_id, app_id)
+        if connection_name:
+            cached = (
+                await self._storage.read([key], target_cls=_CachedUserTokens)
+            ).get(key)
+            if cached is None or connection_name not in cached.tokens:
+                return
+            del cached.tokens[connection_name]
+            if cached.tokens:
+                await self._storage.write({key: _CachedUserTokens(cached.tokens)})
+                return
+        await self._storage.delete([key])
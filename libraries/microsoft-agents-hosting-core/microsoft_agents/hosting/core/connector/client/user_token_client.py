@@ -20,8 +20,11 @@ from ..get_product_info import get_product_info
 from ..user_token_base import UserTokenBase
 from ..agent_sign_in_base import AgentSignInBase
 
+from ._base_client import _ClientSessionWrapper
 from .agent_sign_in import AgentSignIn
 from .user_token import UserToken
+from .client_session_pool import ClientSessionPool
+from .user_token_cache import UserTokenCache
 
 logger = logging.getLogger(__name__)
 
@@ -38,14 +41,22 @@ class UserTokenClient(UserTokenClientBase):
         *,
         app_id: str | None = None,
         session: ClientSession | None = None,
+        session_pool: ClientSessionPool | None = None,
+        token_cache: UserTokenCache | None = None,
     ):
         """
         Initialize a new instance of UserTokenClient.
 
+        The token is added to each request rather than to the session headers.
+
         :param endpoint: The endpoint URL for the token service.
         :param token: The authentication token to use.
         :param app_id: The application ID.
         :param session: The aiohttp ClientSession to use for HTTP requests.
+        :param session_pool: Optional pool providing a shared session for the endpoint,
+            which is left open when the client is closed.
+        :param token_cache: Optional cache of user tokens. User tokens are then served
+            from it until they expire, and removed from it when the user signs out.
         """
         self._app_id = app_id
         if not self._app_id:
@@ -56,6 +67,8 @@ class UserTokenClient(UserTokenClientBase):
 
         if not endpoint.endswith("/"):
             endpoint += "/"
+        if session_pool is not None:
+            session = session_pool.get_session(endpoint)
 
         # Configure headers with JSON acceptance
         headers = {
@@ -75,12 +88,14 @@ class UserTokenClient(UserTokenClientBase):
             headers,
         )
 
-        if len(token) > 1:
-            session.headers.update({"Authorization": f"Bearer {token}"})
-
-        self.client = session
+        self.client = _ClientSessionWrapper(
+            session,
+            {"Authorization": f"Bearer {token}"} if len(token) > 1 else None,
+            owns_session=session_pool is None,
+        )
         self._agent_sign_in = AgentSignIn(self.client)
         self._user_token = UserToken(self.client)
+        self._token_cache = token_cache
 
     @property
     def agent_sign_in(self) -> AgentSignInBase:
@@ -137,12 +152,33 @@ class UserTokenClient(UserTokenClientBase):
         :param magic_code: The magic code for the token exchange, if any.
         :return: The token response.
         """
-        return await self._user_token.get_token(
+        if self._token_cache and not magic_code:
+            cached = await self._token_cache.get(
+                user_id, connection_name, channel_id, self._app_id
+            )
+            if cached:
+                return cached
+
+        token_response = await self._user_token.get_token(
             user_id,
             connection_name,
             channel_id,
             code=magic_code,
         )
+        await self._cache_token(user_id, connection_name, channel_id, token_response)
+        return token_response
+
+    async def _cache_token(
+        self,
+        user_id: str,
+        connection_name: str,
+        channel_id: str,
+        token_response: TokenResponse | None,
+    ) -> None:
+        if self._token_cache and token_response:
+            await self._token_cache.set(
+                user_id, connection_name, channel_id, token_response, self._app_id
+            )
 
     async def get_sign_in_resource(
         self,
@@ -183,6 +219,10 @@ class UserTokenClient(UserTokenClientBase):
         :param connection_name: The name of the connection to sign out from.
         :param channel_id: The channel ID associated with the user.
         """
+        if self._token_cache:
+            await self._token_cache.delete(
+                user_id, connection_name, channel_id, self._app_id
+            )
         await self._user_token.sign_out(
             user_id,
             connection_name,
@@ -246,12 +286,14 @@ class UserTokenClient(UserTokenClientBase):
         :param exchange_request: The token exchange request.
         :return: The token response.
         """
-        return await self._user_token.exchange_token(
+        token_response = await self._user_token.exchange_token(
             user_id,
             connection_name,
             channel_id,
             exchange_request.model_dump(exclude_none=True),
         )
+        await self._cache_token(user_id, connection_name, channel_id, token_response)
+        return token_response
 
     async def get_token_or_sign_in_resource(
         self,
@@ -280,11 +322,19 @@ class UserTokenClient(UserTokenClientBase):
                 "App ID must be provided in the creation of UserTokenClient to get the token or sign-in resource."
             )
 
+        user_id = activity.from_property.id
+        if self._token_cache and not code:
+            cached = await self._token_cache.get(
+                user_id, connection_name, activity.channel_id, self._app_id
+            )
+            if cached:
+                return TokenOrSignInResourceResponse(token_response=cached)
+
         state = UserTokenClient._create_token_exchange_state(
             self._app_id, connection_name, activity
         )
-        return await self._user_token._get_token_or_sign_in_resource(
-            user_id=activity.from_property.id,
+        response = await self._user_token._get_token_or_sign_in_resource(
+            user_id=user_id,
             connection_name=connection_name,
             channel_id=activity.channel_id,
             state=state,
@@ -292,6 +342,10 @@ class UserTokenClient(UserTokenClientBase):
             final_redirect=final_redirect or "",
             fwd_url=fwd_url or "",
         )
+        await self._cache_token(
+            user_id, connection_name, activity.channel_id, response.token_response
+        )
+        return response
 
     async def close(self) -> None:
         """Close the HTTP session."""
@@ -13,7 +13,7 @@ from ..connector_client_base import ConnectorClientBase
 from ..attachments_base import AttachmentsBase
 from ..conversations_base import ConversationsBase
 from ..client._base_client import _BaseClient
-from .._utils import _handle_request_error
+from .._utils import _handle_request_error, _read_json, _serialize_model
 
 logger = logging.getLogger(__name__)
 
@@ -53,14 +53,14 @@ class MCSConversations(ConversationsBase, _BaseClient):
 
         async with self._wrapped_client().post(
             self._endpoint,
-            json=activity.model_dump(by_alias=True, exclude_unset=True, mode="json"),
+            data=_serialize_model(activity),
             headers={"Accept": "application/json", "Content-Type": "application/json"},
         ) as response:
 
             if response.status not in (200, 201, 202):
                 _handle_request_error(logger, response, resource=self._endpoint)
 
-            data = await response.json()
+            data = await _read_json(response)
             return ResourceResponse.model_validate(data)
 
     async def reply_to_activity(
@@ -194,6 +194,14 @@ class MCSAttachments(AttachmentsBase):
             "GetAttachment is not supported for Microsoft Copilot Studio Connector"
         )
 
+    def stream_attachment(
+        self, attachment_id: str, view_id: str, chunk_size: int = 65536
+    ):
+        """Not supported for MCS Connector."""
+        raise NotImplementedError(
+            "StreamAttachment is not supported for Microsoft Copilot Studio Connector"
+        )
+
 
 class MCSConnectorClient(ConnectorClientBase):
     """
@@ -12,6 +12,7 @@ from microsoft_agents.hosting.core.authorization import (
     AgentAuthConfiguration,
 )
 from microsoft_agents.hosting.core.connector.client import ConnectorClient
+from microsoft_agents.hosting.core.connector._utils import _read_json
 
 from microsoft_agents.activity import ConversationParameters
 from microsoft_agents.activity.teams import (
@@ -81,7 +82,7 @@ class TeamsConnectorClient(ConnectorClient):
         ) as response:
             response.raise_for_status()
 
-            json_response = await response.json()
+            json_response = await _read_json(response)
             return TeamsChannelAccount.model_validate(json_response)
 
     async def get_conversation_paged_member(
@@ -103,7 +104,7 @@ class TeamsConnectorClient(ConnectorClient):
             },
         ) as response:
             response.raise_for_status()
-            return TeamsPagedMembersResult.model_validate(await response.json())
+            return TeamsPagedMembersResult.model_validate(await _read_json(response))
 
     async def fetch_channel_list(self, team_id: str) -> list[ChannelInfo]:
         """
@@ -114,7 +115,7 @@ class TeamsConnectorClient(ConnectorClient):
         """
         async with self.client.get(f"v3/teams/{team_id}/conversations") as response:
             response.raise_for_status()
-            json_response = await response.json()
+            json_response = await _read_json(response)
             channels_data = json_response.get("conversations", [])
             return [ChannelInfo.model_validate(channel) for channel in channels_data]
 
@@ -127,7 +128,7 @@ class TeamsConnectorClient(ConnectorClient):
         """
         async with self.client.get(f"v3/teams/{team_id}") as response:
             response.raise_for_status()
-            return TeamDetails.model_validate(await response.json())
+            return TeamDetails.model_validate(await _read_json(response))
 
     async def fetch_meeting_participant(
         self, meeting_id: str, participant_id: str, tenant_id: str
@@ -145,7 +146,7 @@ class TeamsConnectorClient(ConnectorClient):
             params={"tenantId": tenant_id},
         ) as response:
             response.raise_for_status()
-            return await response.json()
+            return await _read_json(response)
 
     async def fetch_meeting_info(self, meeting_id: str) -> MeetingInfo:
         """
@@ -156,7 +157,7 @@ class TeamsConnectorClient(ConnectorClient):
         """
         async with self.client.get(f"v1/meetings/{meeting_id}") as response:
             response.raise_for_status()
-            return MeetingInfo.model_validate(await response.json())
+            return MeetingInfo.model_validate(await _read_json(response))
 
     async def create_conversation(
         self, conversation_parameters: ConversationParameters
@@ -175,7 +176,7 @@ class TeamsConnectorClient(ConnectorClient):
             headers={"Content-Type": "application/json"},
         ) as response:
             response.raise_for_status()
-            return ResourceResponse.model_validate(await response.json())
+            return ResourceResponse.model_validate(await _read_json(response))
 
     async def send_meeting_notification(
         self, meeting_id: str, notification: MeetingNotification
@@ -194,7 +195,9 @@ class TeamsConnectorClient(ConnectorClient):
             ),
         ) as response:
             response.raise_for_status()
-            return MeetingNotificationResponse.model_validate(await response.json())
+            return MeetingNotificationResponse.model_validate(
+                await _read_json(response)
+            )
 
     async def send_message_to_list_of_users(
         self, activity: Activity, tenant_id: str, members: list[TeamsMember]
@@ -222,7 +225,9 @@ class TeamsConnectorClient(ConnectorClient):
             "v3/batch/conversation/users", json=content
         ) as response:
             response.raise_for_status()
-            return TeamsBatchOperationResponse.model_validate(await response.json())
+            return TeamsBatchOperationResponse.model_validate(
+                await _read_json(response)
+            )
 
     async def send_message_to_all_users_in_tenant(
         self, activity: Activity, tenant_id: str
@@ -245,7 +250,9 @@ class TeamsConnectorClient(ConnectorClient):
             "v3/batch/conversation/tenant", json=content
         ) as response:
             response.raise_for_status()
-            return TeamsBatchOperationResponse.model_validate(await response.json())
+            return TeamsBatchOperationResponse.model_validate(
+                await _read_json(response)
+            )
 
     async def send_message_to_all_users_in_team(
         self, activity: Activity, tenant_id: str, team_id: str
@@ -270,7 +277,9 @@ class TeamsConnectorClient(ConnectorClient):
             "v3/batch/conversation/team", json=content
         ) as response:
             response.raise_for_status()
-            return TeamsBatchOperationResponse.model_validate(await response.json())
+            return TeamsBatchOperationResponse.model_validate(
+                await _read_json(response)
+            )
 
     async def send_message_to_list_of_channels(
         self, activity: Activity, tenant_id: str, members: list[TeamsMember]
@@ -298,7 +307,9 @@ class TeamsConnectorClient(ConnectorClient):
             "v3/batch/conversation/channels", json=content
         ) as response:
             response.raise_for_status()
-            return TeamsBatchOperationResponse.model_validate(await response.json())
+            return TeamsBatchOperationResponse.model_validate(
+                await _read_json(response)
+            )
 
     async def get_operation_state(
         self, operation_id: str
@@ -311,7 +322,9 @@ class TeamsConnectorClient(ConnectorClient):
         """
         async with self.client.get(f"v3/batch/conversation/{operation_id}") as response:
             response.raise_for_status()
-            return BatchOperationStateResponse.model_validate(await response.json())
+            return BatchOperationStateResponse.model_validate(
+                await _read_json(response)
+            )
 
     async def get_failed_entries(self, operation_id: str) -> BatchFailedEntriesResponse:
         """
@@ -324,7 +337,7 @@ class TeamsConnectorClient(ConnectorClient):
             f"v3/batch/conversation/failedentries/{operation_id}"
         ) as response:
             response.raise_for_status()
-            return BatchFailedEntriesResponse.model_validate(await response.json())
+            return BatchFailedEntriesResponse.model_validate(await _read_json(response))
 
     async def cancel_operation(self, operation_id: str) -> CancelOperationResponse:
         """
@@ -337,7 +350,7 @@ class TeamsConnectorClient(ConnectorClient):
             f"v3/batch/conversation/{operation_id}"
         ) as response:
             response.raise_for_status()
-            return CancelOperationResponse.model_validate(await response.json())
+            return CancelOperationResponse.model_validate(await _read_json(response))
 
     async def close(self) -> None:
         """Close the HTTP session."""
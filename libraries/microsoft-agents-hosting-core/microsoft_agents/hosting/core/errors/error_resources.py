@@ -127,6 +127,11 @@ class ErrorResources:
         -63020,
     )
 
+    StorageETagConflict = ErrorMessage(
+        "Storage: the item with key '{0}' was changed by another writer (ETag mismatch).",
+        -63021,
+    )
+
     # General/Validation Errors (-66000 to -66999)
     InvalidConfiguration = ErrorMessage(
         "Invalid configuration: {0}",
@@ -17,6 +17,7 @@ from microsoft_agents.hosting.core.channel_api_handler_protocol import (
 )
 
 from ._http_request_protocol import HttpRequestProtocol
+from ._request_body import _validate_body
 
 AgentsModelT = TypeVar("AgentsModelT", bound=AgentsModel)
 
@@ -47,8 +48,7 @@ class ChannelServiceRoutes:
         if "application/json" not in content_type:
             raise ValueError("Content-Type must be application/json")
 
-        body = await request.json()
-        return target_model.model_validate(body)
+        return await _validate_body(request, target_model)
 
     @staticmethod
     @overload
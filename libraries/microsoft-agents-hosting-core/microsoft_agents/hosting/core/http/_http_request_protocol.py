@@ -27,6 +27,14 @@ class HttpRequestProtocol(Protocol):
         """Parse request body as JSON."""
         ...
 
+    async def read(self) -> bytes:
+        """Raw request body.
+
+        Used to validate the body without parsing it into a dict first. Requests
+        that do not implement it fall back to ``json()``.
+        """
+        ...
+
     def get_claims_identity(self) -> Optional[Any]:
         """Get claims identity attached by auth middleware."""
         ...
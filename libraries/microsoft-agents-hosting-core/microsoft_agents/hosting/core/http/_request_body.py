@@ -0,0 +1,36 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""Validation of request bodies into models."""
+
+from typing import Type, TypeVar
+
+from pydantic import ValidationError
+
+from microsoft_agents.activity import AgentsModel
+
+from ._http_request_protocol import HttpRequestProtocol
+
+AgentsModelT = TypeVar("AgentsModelT", bound=AgentsModel)
+
+
+async def _validate_body(
+    request: HttpRequestProtocol, target_model: Type[AgentsModelT]
+) -> AgentsModelT:
+    """Validate the request body as target_model.
+
+    When the request exposes its raw body through ``read()``, the bytes are validated
+    directly with ``model_validate_json``, which skips building an intermediate dict.
+    Requests that only implement ``json()`` are parsed and then validated.
+    """
+    read = getattr(request, "read", None)
+    raw = await read() if read else None
+    if isinstance(raw, (bytes, bytearray)):
+        return target_model.model_validate_json(raw)
+
+    return target_model.model_validate(await request.json())
+
+
+def _is_invalid_json(error: ValidationError) -> bool:
+    """Whether a validation error was raised because the body is not valid JSON."""
+    return any(detail["type"] == "json_invalid" for detail in error.errors())
@@ -0,0 +1,146 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""The JSON codec shared by storage, transport and connector code.
+
+The default codec uses ``orjson`` when it is installed, then ``msgspec``, and
+falls back to the standard library ``json`` module otherwise. Call
+:func:`set_json_codec` once at startup to choose a codec explicitly.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Protocol, Union, runtime_checkable
+
+JsonInput = Union[bytes, bytearray, memoryview, str]
+
+
+@runtime_checkable
+class JsonCodec(Protocol):
+    """Encodes Python values to JSON bytes and decodes JSON documents."""
+
+    name: str
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a value as UTF-8 JSON.
+
+        :param obj: The JSON-compatible value to encode.
+        :return: The encoded JSON document.
+        :raises TypeError: If the value cannot be encoded.
+        """
+        ...
+
+    def loads(self, data: JsonInput) -> Any:
+        """Decode a JSON document.
+
+        :param data: The JSON document, as bytes or text.
+        :return: The decoded value.
+        :raises ValueError: If the document is not valid JSON.
+        """
+        ...
+
+
+class StdlibJsonCodec:
+    """A :class:`JsonCodec` backed by the standard library ``json`` module."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: JsonInput) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonJsonCodec:
+    """A :class:`JsonCodec` backed by ``orjson``."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        # the json module writes int, float, bool and None keys as strings too
+        return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: JsonInput) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecJsonCodec:
+    """A :class:`JsonCodec` backed by ``msgspec``."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except self._msgspec.EncodeError as error:
+            raise TypeError(str(error)) from error
+
+    def loads(self, data: JsonInput) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as error:
+            raise ValueError(str(error)) from error
+
+
+_CODECS: dict[str, type] = {
+    OrjsonJsonCodec.name: OrjsonJsonCodec,
+    MsgspecJsonCodec.name: MsgspecJsonCodec,
+    StdlibJsonCodec.name: StdlibJsonCodec,
+}
+
+_codec: JsonCodec | None = None
+
+
+def _default_json_codec() -> JsonCodec:
+    for codec_type in (OrjsonJsonCodec, MsgspecJsonCodec):
+        try:
+            return codec_type()
+        except ImportError:
+            continue
+    return StdlibJsonCodec()
+
+
+def get_json_codec() -> JsonCodec:
+    """Return the JSON codec used across the SDK.
+
+    :return: The codec set with :func:`set_json_codec`, or the fastest installed codec.
+    """
+    global _codec
+    if _codec is None:
+        _codec = _default_json_codec()
+    return _codec
+
+
+def set_json_codec(codec: JsonCodec | str | None) -> None:
+    """Set the JSON codec used across the SDK.
+
+    :param codec: A :class:`JsonCodec` instance, the name of a built-in codec
+        (``"orjson"``, ``"msgspec"`` or ``"json"``), or None to restore the default.
+    :raises ValueError: If the codec name is not known.
+    :raises ImportError: If the named codec's package is not installed.
+    """
+    global _codec
+    if isinstance(codec, str):
+        codec_type = _CODECS.get(codec)
+        if codec_type is None:
+            raise ValueError(
+                f"Unknown JSON codec '{codec}'. Expected one of: {', '.join(_CODECS)}"
+            )
+        codec = codec_type()
+    _codec = codec
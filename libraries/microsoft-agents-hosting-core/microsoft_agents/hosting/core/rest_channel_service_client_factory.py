@@ -12,7 +12,11 @@ from microsoft_agents.hosting.core.authorization import (
 )
 from microsoft_agents.hosting.core.authorization import AccessTokenProviderBase
 from microsoft_agents.hosting.core.connector import ConnectorClientBase
-from microsoft_agents.hosting.core.connector.client import UserTokenClient
+from microsoft_agents.hosting.core.connector.client import (
+    ClientSessionPool,
+    UserTokenCache,
+    UserTokenClient,
+)
 from microsoft_agents.hosting.core.connector.teams import TeamsConnectorClient
 from microsoft_agents.hosting.core.connector.mcs import MCSConnectorClient
 from microsoft_agents.hosting.core.telemetry.adapter import spans
@@ -31,10 +35,26 @@ class RestChannelServiceClientFactory(ChannelServiceClientFactoryBase):
         connection_manager: Connections,
         token_service_endpoint=AuthenticationConstants.AGENTS_SDK_OAUTH_URL,
         token_service_audience=AuthenticationConstants.AGENTS_SDK_SCOPE,
+        *,
+        session_pool: ClientSessionPool | None = None,
+        user_token_cache: UserTokenCache | None = None,
     ) -> None:
+        """
+        Initialize a new instance of RestChannelServiceClientFactory.
+
+        :param session_pool: Optional pool of shared sessions for the created clients.
+            Without it each client opens and closes its own session.
+        :param user_token_cache: Optional cache of user tokens shared by the created
+            user token clients, so OAuth flows do not call the token service on every turn.
+        """
         self._connection_manager = connection_manager
         self._token_service_endpoint = token_service_endpoint
         self._token_service_audience = token_service_audience
+        self._session_pool = session_pool
+        self._user_token_cache = user_token_cache
+
+    def _session_kwargs(self) -> dict:
+        return {"session_pool": self._session_pool} if self._session_pool else {}
 
     async def _get_agentic_token(self, context: TurnContext, service_url: str) -> str:
         logger.info(
@@ -140,6 +160,7 @@ class RestChannelServiceClientFactory(ChannelServiceClientFactoryBase):
             return TeamsConnectorClient(
                 endpoint=service_url,
                 token=token,
+                **self._session_kwargs(),
             )
 
     async def create_user_token_client(
@@ -167,6 +188,8 @@ class RestChannelServiceClientFactory(ChannelServiceClientFactoryBase):
                     app_id=claims_identity.get_app_id(),
                     endpoint=self._token_service_endpoint,
                     token="",
+                    token_cache=self._user_token_cache,
+                    **self._session_kwargs(),
                 )
 
             if context.activity.is_agentic_request():
@@ -190,4 +213,6 @@ class RestChannelServiceClientFactory(ChannelServiceClientFactoryBase):
                 app_id=claims_identity.get_app_id(),
                 endpoint=self._token_service_endpoint,
                 token=token,
+                token_cache=self._user_token_cache,
+                **self._session_kwargs(),
             )
@@ -16,13 +16,76 @@ from ..turn_context import TurnContext
 logger = logging.getLogger(__name__)
 
 
+class _ChangeTrackingDict(dict):
+    """
+    A dict that records the keys written or deleted through it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.changed: set[str] = set()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.changed.add(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.changed.add(key)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, key, *default):
+        if key in self:
+            self.changed.add(key)
+        return super().pop(key, *default)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self.changed.add(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self.changed.add(key)
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        updates = dict(*args, **kwargs)
+        super().update(updates)
+        self.changed.update(updates)
+
+    def clear(self):
+        self.changed.update(self)
+        super().clear()
+
+
 class CachedAgentState(StoreItem):
     """
     Internal cached Agent state.
+
+    By default changes are detected by comparing a hash of the serialized state
+    taken when it was loaded or last saved. With ``track_changes`` the state dict
+    records the properties written or deleted through it instead, so no
+    serialization happens until the state is actually written. In that mode values
+    mutated in place must be assigned back (e.g. with ``AgentState.set_value``)
+    to be detected.
     """
 
-    def __init__(self, state: dict[str, StoreItem | dict] | None = None):
-        if state:
+    def __init__(
+        self,
+        state: dict[str, StoreItem | dict] | None = None,
+        *,
+        track_changes: bool = False,
+    ):
+        self._track_changes = track_changes
+        self._cleared = False
+        if track_changes:
+            self.state = _ChangeTrackingDict(state or {})
+            self.hash = ""
+        elif state:
             self.state = state
             self.hash = self.compute_hash()
         else:
@@ -33,13 +96,39 @@ class CachedAgentState(StoreItem):
     def has_state(self) -> bool:
         return bool(self.state)
 
+    @property
+    def tracks_changes(self) -> bool:
+        return self._track_changes
+
     @property
     def is_changed(self) -> bool:
+        if self._track_changes:
+            return self._cleared or bool(self.state.changed)
         return self.hash != self.compute_hash()
 
+    @property
+    def changed_properties(self) -> frozenset[str] | None:
+        """
+        The properties written or deleted since the state was loaded or last saved,
+        or None when changes are not tracked or the whole state was cleared.
+        """
+        if not self._track_changes or self._cleared:
+            return None
+        return frozenset(self.state.changed)
+
     def compute_hash(self) -> str:
         return hash(str(self.store_item_to_json()))
 
+    def mark_saved(self) -> None:
+        """
+        Resets change detection after the state has been written to storage.
+        """
+        if self._track_changes:
+            self.state.changed.clear()
+            self._cleared = False
+        else:
+            self.hash = self.compute_hash()
+
     def store_item_to_json(self) -> dict:
         if not self.state:
             return {}
@@ -50,7 +139,47 @@ class CachedAgentState(StoreItem):
         }
         return serialized
 
+    def delta_to_json(self) -> tuple[dict, list[str]]:
+        """
+        Serializes only the changed properties, as the values to set and the names
+        of the properties that were removed.
+        """
+        updates = {}
+        removals = []
+        for key in self.changed_properties or ():
+            if key in self.state:
+                value = self.state[key]
+                updates[key] = (
+                    value.store_item_to_json()
+                    if isinstance(value, StoreItem)
+                    else value
+                )
+            else:
+                removals.append(key)
+        return updates, removals
+
+    def __deepcopy__(self, memo: dict) -> CachedAgentState:
+        """
+        Copies the state as it would be loaded from storage: the copy starts
+        unchanged, whatever was pending on this instance.
+        """
+        copied = type(self).__new__(type(self))
+        copied._track_changes = self._track_changes
+        copied._cleared = False
+        state = deepcopy(dict(self.state), memo)
+        if self._track_changes:
+            copied.state = _ChangeTrackingDict(state)
+            copied.hash = ""
+        else:
+            copied.state = state
+            copied.hash = copied.compute_hash()
+        return copied
+
     def clear(self) -> None:
+        if self._track_changes:
+            self.state = _ChangeTrackingDict()
+            self._cleared = True
+            return
         self.state = {}
         self.hash = ""
 
@@ -59,6 +188,19 @@ class CachedAgentState(StoreItem):
         return CachedAgentState(json_data)
 
 
+class _ChangeTrackedCachedAgentState(CachedAgentState):
+    """
+    Change-tracking CachedAgentState, also used as the storage read target for it.
+    """
+
+    def __init__(self, state: dict[str, StoreItem | dict] | None = None):
+        super().__init__(state, track_changes=True)
+
+    @staticmethod
+    def from_json_to_store_item(json_data: dict) -> CachedAgentState:
+        return _ChangeTrackedCachedAgentState(json_data)
+
+
 class AgentState:
     """
     Defines a state management object and automates the reading and writing of
@@ -73,7 +215,14 @@ class AgentState:
         You can define additional scopes for your agent.
     """
 
-    def __init__(self, storage: Storage, context_service_key: str):
+    def __init__(
+        self,
+        storage: Storage,
+        context_service_key: str,
+        *,
+        track_changes: bool = False,
+        optimistic_concurrency: bool = False,
+    ):
         """
         Initializes a new instance of the :class:`microsoft_agents.hosting.core.state.agent_state.AgentState` class.
 
@@ -81,6 +230,13 @@ class AgentState:
         :type storage:  :class:`microsoft_agents.hosting.core.storage.Storage`
         :param context_service_key: The key for the state cache for this :class:`microsoft_agents.hosting.core.state.agent_state.AgentState`
         :type context_service_key: str
+        :param track_changes: Optional, true to record changed properties as they are written instead of
+            hashing the serialized state on load and save. Values mutated in place must be set again to be saved.
+        :type track_changes: bool
+        :param optimistic_concurrency: Optional, true to save state read from storage only if no other
+            writer changed it since it was loaded, raising :class:`microsoft_agents.hosting.core.storage.ETagConflictError`
+            otherwise. By default the last save wins.
+        :type optimistic_concurrency: bool
 
         .. remarks::
             This constructor creates a state management object and associated scope. The object uses
@@ -93,6 +249,8 @@ class AgentState:
         self._storage = storage
         self._context_service_key = context_service_key
         self._cached_state: CachedAgentState | None = None
+        self._track_changes = track_changes
+        self._optimistic_concurrency = optimistic_concurrency
 
     def get_cached_state(
         self, turn_context: TurnContext | None = None
@@ -154,10 +312,30 @@ class AgentState:
         storage_key = self.get_storage_key(turn_context)
 
         if self._should_load(turn_context, force):
-            items = await self._storage.read([storage_key], target_cls=CachedAgentState)
-            val = items.get(storage_key, CachedAgentState())
-            self._cached_state = val
-            turn_context.turn_state[self._context_service_key] = val
+            items = await self._storage.read(
+                [storage_key], target_cls=self._read_target_cls
+            )
+            self._set_loaded(turn_context, items.get(storage_key))
+
+    @property
+    def _read_target_cls(self) -> type:
+        """
+        The class the stored state is deserialized into when it is read.
+        """
+        return (
+            _ChangeTrackedCachedAgentState if self._track_changes else CachedAgentState
+        )
+
+    def _set_loaded(
+        self, turn_context: TurnContext, cached_state: CachedAgentState | None
+    ) -> None:
+        """
+        Caches state read from storage, or empty state if nothing was stored.
+        """
+        if cached_state is None:
+            cached_state = self._read_target_cls()
+        self._cached_state = cached_state
+        turn_context.turn_state[self._context_service_key] = cached_state
 
     def _should_load(self, turn_context: TurnContext, force: bool = False) -> bool:
         """
@@ -190,9 +368,30 @@ class AgentState:
 
         if force or (cached_state is not None and cached_state.is_changed):
             storage_key = self.get_storage_key(turn_context)
-            changes: dict[str, StoreItem] = {storage_key: cached_state}
-            await self._storage.write(changes)
-            cached_state.hash = cached_state.compute_hash()
+            if not self._optimistic_concurrency:
+                # the ETag set by the storage would make the write conditional
+                cached_state.e_tag = None
+            if force or not await self._save_delta(storage_key, cached_state):
+                changes: dict[str, StoreItem] = {storage_key: cached_state}
+                await self._storage.write(changes)
+            cached_state.mark_saved()
+
+    async def _save_delta(
+        self, storage_key: str, cached_state: CachedAgentState
+    ) -> bool:
+        """
+        Writes only the changed properties when fewer than all of them changed and
+        the storage supports partial writes.
+
+        :return: True if the delta was written, False if a full write is needed.
+        """
+        changed = cached_state.changed_properties
+        if not changed or changed.issuperset(cached_state.state):
+            return False
+        updates, removals = cached_state.delta_to_json()
+        return await self._storage.write_delta(
+            storage_key, updates, removals, source=cached_state
+        )
 
     def clear(self, turn_context: TurnContext | None = None) -> None:
         """
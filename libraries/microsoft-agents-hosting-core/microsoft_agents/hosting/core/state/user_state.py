@@ -16,15 +16,29 @@ class UserState(AgentState):
         "UserState: channel_id and/or conversation missing from context.activity."
     )
 
-    def __init__(self, storage: Storage, namespace=""):
+    def __init__(
+        self,
+        storage: Storage,
+        namespace="",
+        *,
+        track_changes: bool = False,
+        optimistic_concurrency: bool = False,
+    ):
         """
         Creates a new UserState instance.
         :param storage:
         :param namespace:
+        :param track_changes: Whether to record changed properties instead of hashing the state.
+        :param optimistic_concurrency: Whether saves fail if another writer changed the state since it was loaded.
         """
         self.namespace = namespace
 
-        super().__init__(storage, namespace or "Internal.UserState")
+        super().__init__(
+            storage,
+            namespace or "Internal.UserState",
+            track_changes=track_changes,
+            optimistic_concurrency=optimistic_concurrency,
+        )
 
     def get_storage_key(self, turn_context: TurnContext) -> str:
         """
@@ -4,12 +4,17 @@
 from .store_item import StoreItem
 from .storage import Storage, AsyncStorageBase
 from .memory_storage import MemoryStorage
+from .object_memory_storage import ObjectMemoryStorage
+from .cached_storage import CachedStorage
+from .error_handling import ETagConflictError
 
 from .transcript import (
     TranscriptInfo,
     TranscriptLogger,
     ConsoleTranscriptLogger,
     TranscriptLoggerMiddleware,
+    BackgroundTranscriptLogger,
+    TranscriptOverflowPolicy,
     TranscriptStore,
     FileTranscriptLogger,
     FileTranscriptStore,
@@ -21,10 +26,15 @@ __all__ = [
     "Storage",
     "AsyncStorageBase",
     "MemoryStorage",
+    "ObjectMemoryStorage",
+    "CachedStorage",
+    "ETagConflictError",
     "TranscriptInfo",
     "TranscriptLogger",
     "ConsoleTranscriptLogger",
     "TranscriptLoggerMiddleware",
+    "BackgroundTranscriptLogger",
+    "TranscriptOverflowPolicy",
     "TranscriptStore",
     "FileTranscriptLogger",
     "FileTranscriptStore",
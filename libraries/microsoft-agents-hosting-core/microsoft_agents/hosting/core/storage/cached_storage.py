@@ -0,0 +1,445 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Any, Iterable, TypeVar
+
+from ._type_aliases import JSON
+from .error_handling import ETagConflictError
+from .storage import Storage
+from .store_item import StoreItem, is_conditional_write, set_e_tag
+from .telemetry import metrics
+
+logger = logging.getLogger(__name__)
+
+StoreItemT = TypeVar("StoreItemT", bound=StoreItem)
+
+
+@dataclass
+class _CacheEntry:
+    """A cached item, or a cached absence when ``data`` is None."""
+
+    data: JSON | None
+    e_tag: str | None
+    expires_at: float | None
+
+
+class _JsonStoreItem(StoreItem):
+    """StoreItem wrapping already serialized data, used to flush write-behind changes.
+
+    ``source`` is the item the change was written from, which is given the new
+    ETag once a conditional change is flushed.
+    """
+
+    def __init__(
+        self, data: JSON, e_tag: str | None = None, source: StoreItem | None = None
+    ):
+        self.data = data
+        self.e_tag = e_tag
+        self.source = source
+
+    def store_item_to_json(self) -> JSON:
+        return self.data
+
+    @staticmethod
+    def from_json_to_store_item(json_data: JSON) -> _JsonStoreItem:
+        return _JsonStoreItem(json_data)
+
+
+class CachedStorage(Storage):
+    """Storage that keeps a bounded in-process cache in front of another storage.
+
+    Reads are served from a least-recently-used cache whose entries expire after
+    ``ttl`` seconds; concurrent misses for the same key share one read from the
+    backing storage. Keys that do not exist are cached as well.
+
+    By default writes go to the backing storage before the cache is updated
+    (write-through). Storages only report the new ETag of conditional writes, so
+    unconditional writes evict the key and the next read fetches its ETag. With ``write_behind`` the cache is updated immediately and
+    changes are flushed to the backing storage in batches every ``flush_interval``
+    seconds, or on :meth:`flush`. A change written while an earlier change to the
+    same key is being flushed is conditioned on the ETag that flush produces.
+    Changes that fail to flush are kept and retried by the next flush, except
+    changes rejected for an ETag conflict: those are dropped, their key is
+    evicted, and the conflict is raised by :meth:`flush` or by the next write of
+    the key that still carries the rejected ETag.
+
+    The cache is local to the process, so changes made by other processes become
+    visible only once the cached entries expire.
+    """
+
+    def __init__(
+        self,
+        storage: Storage,
+        *,
+        max_items: int = 1000,
+        ttl: float | None = 300,
+        write_behind: bool = False,
+        flush_interval: float = 1.0,
+    ):
+        """Initializes the CachedStorage.
+
+        :param storage: The backing storage.
+        :param max_items: The maximum number of cached keys.
+        :param ttl: Seconds a cached entry stays valid, or None to keep entries until evicted.
+        :param write_behind: True to acknowledge writes once cached and flush them in the background.
+        :param flush_interval: Seconds between background flushes in write-behind mode.
+        :raises ValueError: If max_items is not positive.
+        """
+        if max_items < 1:
+            raise ValueError("CachedStorage(): max_items must be at least 1")
+
+        self._storage = storage
+        self._max_items = max_items
+        self._ttl = ttl
+        self._write_behind = write_behind
+        self._flush_interval = flush_interval
+
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._pending_reads: dict[str, asyncio.Future] = {}
+        self._pending_writes: dict[str, _JsonStoreItem] = {}
+        # the ETags of write-behind changes rejected for a conflict, by key
+        self._conflicts: dict[str, str] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._flush_lock = asyncio.Lock()
+
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def storage(self) -> Storage:
+        """The backing storage."""
+        return self._storage
+
+    @property
+    def hits(self) -> int:
+        """The number of keys read from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of keys read from the backing storage."""
+        return self._misses
+
+    def _get_entry(self, key: str) -> _CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _set_entry(self, key: str, data: JSON | None, e_tag: str | None) -> None:
+        expires_at = None if self._ttl is None else time.monotonic() + self._ttl
+        self._entries[key] = _CacheEntry(data, e_tag, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_items:
+            self._entries.popitem(last=False)
+
+    def _invalidate(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def read(
+        self, keys: list[str], *, target_cls: type[StoreItemT], **kwargs
+    ) -> dict[str, StoreItemT]:
+        """Reads items from the cache, falling back to the backing storage for misses.
+
+        :param keys: A list of keys to read.
+        :param target_cls: The class of the StoreItem to deserialize the data into.
+        :return: A dictionary of key to StoreItem.
+        :raises ValueError: If keys is empty.
+        """
+        if not keys:
+            raise ValueError("Storage.read(): Keys are required when reading.")
+
+        entries: dict[str, _CacheEntry] = {}
+        waiting: dict[str, asyncio.Future] = {}
+        missing: list[str] = []
+        for key in dict.fromkeys(keys):
+            pending = self._pending_writes.get(key)
+            entry = self._get_entry(key)
+            if entry is None and pending is not None:
+                entry = _CacheEntry(pending.data, pending.e_tag, None)
+            if entry is not None:
+                entries[key] = entry
+            elif key in self._pending_reads:
+                waiting[key] = self._pending_reads[key]
+            else:
+                missing.append(key)
+
+        self._hits += len(entries)
+        self._misses += len(waiting) + len(missing)
+        if entries:
+            metrics.storage_cache_hit_total.add(len(entries))
+        if waiting or missing:
+            metrics.storage_cache_miss_total.add(len(waiting) + len(missing))
+
+        if missing:
+            entries.update(await self._read_missing(missing, target_cls, **kwargs))
+        for key, future in waiting.items():
+            entries[key] = await asyncio.shield(future)
+
+        result: dict[str, StoreItemT] = {}
+        for key, entry in entries.items():
+            if entry.data is not None:
+                item = target_cls.from_json_to_store_item(deepcopy(entry.data))
+                set_e_tag(item, entry.e_tag)
+                result[key] = item
+        return result
+
+    async def _read_missing(
+        self, keys: list[str], target_cls: type[StoreItemT], **kwargs
+    ) -> dict[str, _CacheEntry]:
+        """Reads keys from the backing storage on behalf of every caller waiting on them."""
+        loop = asyncio.get_running_loop()
+        futures = {key: loop.create_future() for key in keys}
+        self._pending_reads.update(futures)
+        try:
+            items = await self._storage.read(keys, target_cls=target_cls, **kwargs)
+        except BaseException as error:
+            for key, future in futures.items():
+                if self._pending_reads.get(key) is future:
+                    del self._pending_reads[key]
+                if isinstance(error, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(error)
+                    # mark as retrieved; waiting readers re-raise it themselves
+                    future.exception()
+            raise
+
+        entries: dict[str, _CacheEntry] = {}
+        for key, future in futures.items():
+            item = items.get(key)
+            if item is None:
+                entry = _CacheEntry(None, None, None)
+            else:
+                entry = _CacheEntry(
+                    deepcopy(item.store_item_to_json()),
+                    getattr(item, "e_tag", None),
+                    None,
+                )
+            # skip caching if a write or delete landed while the read was in flight
+            if self._pending_reads.get(key) is future:
+                del self._pending_reads[key]
+                self._set_entry(key, entry.data, entry.e_tag)
+            future.set_result(entry)
+            entries[key] = entry
+        return entries
+
+    async def write(self, changes: dict[str, StoreItem]) -> None:
+        """Writes items to the backing storage and the cache.
+
+        In write-behind mode the items are cached immediately and written to the
+        backing storage by the next flush.
+
+        :param changes: A dictionary of key to StoreItem to write.
+        :raises ValueError: If changes is empty.
+        :raises ETagConflictError: If the backing storage rejects a conditional write,
+            or rejected a flushed change written with the same ETag.
+        """
+        if not changes:
+            raise ValueError("Storage.write(): Changes are required when writing.")
+
+        serialized = {
+            key: deepcopy(item.store_item_to_json()) for key, item in changes.items()
+        }
+        for key in changes:
+            self._pending_reads.pop(key, None)
+
+        if self._write_behind:
+            for key, item in changes.items():
+                e_tag = getattr(item, "e_tag", None)
+                if is_conditional_write(e_tag) and self._conflicts.get(key) == e_tag:
+                    del self._conflicts[key]
+                    raise ETagConflictError(key)
+            for key, item in changes.items():
+                e_tag = getattr(item, "e_tag", None)
+                self._pending_writes[key] = _JsonStoreItem(serialized[key], e_tag, item)
+                self._set_entry(key, serialized[key], e_tag)
+            self._schedule_flush()
+            return
+
+        try:
+            await self._storage.write(changes)
+        except ETagConflictError:
+            self._invalidate(changes)
+            raise
+        for key, item in changes.items():
+            e_tag = getattr(item, "e_tag", None)
+            if is_conditional_write(e_tag):
+                self._set_entry(key, serialized[key], e_tag)
+            else:
+                self._invalidate([key])
+
+    async def write_delta(
+        self,
+        key: str,
+        updates: dict[str, Any],
+        removals: Iterable[str] = (),
+        *,
+        source: StoreItem | None = None,
+    ) -> bool:
+        """Applies a partial update through the backing storage and to the cached item.
+
+        :param key: The key of the item to update.
+        :param updates: Serialized property values to set on the stored item.
+        :param removals: Names of properties to remove from the stored item.
+        :param source: The item the delta was taken from, whose ETag is checked and refreshed.
+        :return: True if the delta was applied, False if a full write is required.
+        :raises ETagConflictError: If the backing storage rejects the delta.
+        """
+        if self._write_behind:
+            # the full item is flushed later, so deltas are not worth tracking
+            return False
+
+        self._pending_reads.pop(key, None)
+        try:
+            applied = await self._storage.write_delta(
+                key, updates, removals, source=source
+            )
+        except ETagConflictError:
+            self._invalidate([key])
+            raise
+        entry = self._get_entry(key)
+        e_tag = getattr(source, "e_tag", None)
+        if (
+            not applied
+            or entry is None
+            or entry.data is None
+            or not is_conditional_write(e_tag)
+        ):
+            self._invalidate([key])
+            return applied
+
+        entry.data.update(deepcopy(updates))
+        for name in removals:
+            entry.data.pop(name, None)
+        entry.e_tag = e_tag
+        return True
+
+    async def delete(self, keys: list[str]) -> None:
+        """Deletes items from the backing storage and the cache.
+
+        :param keys: A list of keys to delete.
+        :raises ValueError: If keys is empty.
+        """
+        if not keys:
+            raise ValueError("Storage.delete(): Keys are required when deleting.")
+
+        for key in keys:
+            self._pending_reads.pop(key, None)
+            self._pending_writes.pop(key, None)
+            self._conflicts.pop(key, None)
+            self._set_entry(key, None, None)
+        await self._storage.delete(keys)
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        while self._pending_writes:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self._flush_pending()
+            except ETagConflictError as error:
+                logger.warning("CachedStorage: background flush rejected: %s", error)
+            except Exception as error:
+                logger.error("CachedStorage: background flush failed: %s", error)
+
+    async def _flush_pending(self) -> None:
+        async with self._flush_lock:
+            if not self._pending_writes:
+                return
+            changes, self._pending_writes = self._pending_writes, {}
+            sent = {key: item.e_tag for key, item in changes.items()}
+            try:
+                await self._storage.write(changes)
+                errors: list[BaseException | None] = [None] * len(changes)
+            except ETagConflictError:
+                # write the changes one by one to find the ones that conflict
+                errors = await asyncio.gather(
+                    *(
+                        self._storage.write({key: item})
+                        for key, item in changes.items()
+                    ),
+                    return_exceptions=True,
+                )
+            except BaseException:
+                for key, item in changes.items():
+                    self._requeue(key, item, sent[key])
+                raise
+
+            failure: BaseException | None = None
+            for (key, item), error in zip(changes.items(), errors):
+                if error is None:
+                    self._flushed(key, item, sent[key])
+                elif isinstance(error, ETagConflictError):
+                    self._invalidate([key])
+                    self._conflicts[key] = sent[key]
+                    if not isinstance(failure, ETagConflictError):
+                        failure = error
+                else:
+                    self._requeue(key, item, sent[key])
+                    failure = failure or error
+            while len(self._conflicts) > self._max_items:
+                del self._conflicts[next(iter(self._conflicts))]
+            if failure is not None:
+                raise failure
+
+    def _flushed(self, key: str, item: _JsonStoreItem, sent_e_tag: str | None) -> None:
+        """Records the ETag a flushed change was given on the cache and newer changes."""
+        self._conflicts.pop(key, None)
+        conditional = is_conditional_write(sent_e_tag)
+        if conditional and item.source is not None:
+            set_e_tag(item.source, item.e_tag)
+
+        newer = self._pending_writes.get(key)
+        if newer is not None and conditional and newer.e_tag == sent_e_tag:
+            # written while this change was in flight, from the same version
+            newer.e_tag = item.e_tag
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        if entry.data is item.data:
+            if conditional:
+                entry.e_tag = item.e_tag
+            else:
+                # the storage does not report the ETag of unconditional writes
+                del self._entries[key]
+        elif newer is not None and entry.data is newer.data:
+            entry.e_tag = newer.e_tag
+
+    def _requeue(self, key: str, item: _JsonStoreItem, sent_e_tag: str | None) -> None:
+        """Keeps a change that failed to flush unless a newer change replaced it."""
+        if item.e_tag != sent_e_tag:
+            # written before the rest of the batch failed
+            self._flushed(key, item, sent_e_tag)
+        elif key not in self._pending_writes:
+            self._pending_writes[key] = item
+            self._schedule_flush()
+
+    async def flush(self) -> None:
+        """Writes pending write-behind changes to the backing storage.
+
+        Changes that fail for a reason other than an ETag conflict stay pending.
+
+        :raises ETagConflictError: If the backing storage rejects a conditional write.
+        """
+        await self._flush_pending()
+
+    def clear(self) -> None:
+        """Drops every cached entry. Pending write-behind changes are kept."""
+        self._entries.clear()
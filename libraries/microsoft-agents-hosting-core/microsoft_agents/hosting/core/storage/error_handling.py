@@ -4,6 +4,8 @@
 from typing import TypeVar
 from collections.abc import Callable, Awaitable
 
+from microsoft_agents.hosting.core.errors import error_resources
+
 ErrorFilter = Callable[[Exception], bool]
 
 T = TypeVar("T")
@@ -43,3 +45,14 @@ def is_status_code_error(*ignored_codes: int) -> ErrorFilter:
         return False
 
     return func
+
+
+class ETagConflictError(Exception):
+    """
+    Raised when a conditional write finds that the stored item was changed or
+    deleted since it was read.
+    """
+
+    def __init__(self, key: str) -> None:
+        super().__init__(error_resources.StorageETagConflict.format(key))
+        self.key = key
@@ -2,11 +2,13 @@
 # Licensed under the MIT License.
 
 from asyncio import Lock
-from typing import TypeVar
+from itertools import count
+from typing import Any, Iterable, TypeVar
 
 from ._type_aliases import JSON
+from .error_handling import ETagConflictError
 from .storage import Storage
-from .store_item import StoreItem
+from .store_item import StoreItem, is_conditional_write, set_e_tag
 
 StoreItemT = TypeVar("StoreItemT", bound=StoreItem)
 
@@ -21,8 +23,24 @@ class MemoryStorage(Storage):
         :raises ValueError: If state is not a dictionary or None.
         """
         self._memory: dict[str, JSON] = state or {}
+        self._e_tags: dict[str, str] = {}
+        self._e_tag_counter = count(1)
         self._lock = Lock()
 
+    def _get_e_tag(self, key: str) -> str:
+        """Returns the ETag of a stored item, assigning one to items from the initial state."""
+        e_tag = self._e_tags.get(key)
+        if e_tag is None:
+            e_tag = self._e_tags[key] = str(next(self._e_tag_counter))
+        return e_tag
+
+    def _check_e_tag(self, key: str, e_tag: str | None) -> None:
+        """Raises ETagConflictError if a conditional write no longer matches the stored item."""
+        if is_conditional_write(e_tag) and (
+            key not in self._memory or self._get_e_tag(key) != e_tag
+        ):
+            raise ETagConflictError(key)
+
     async def read(
         self, keys: list[str], *, target_cls: type[StoreItemT], **kwargs
     ) -> dict[str, StoreItemT]:
@@ -43,24 +61,37 @@ class MemoryStorage(Storage):
                 if key == "":
                     raise ValueError("MemoryStorage.read(): key cannot be empty")
                 if key in self._memory:
-                    result[key] = target_cls.from_json_to_store_item(self._memory[key])
+                    item = target_cls.from_json_to_store_item(self._memory[key])
+                    set_e_tag(item, self._get_e_tag(key))
+                    result[key] = item
 
             return result
 
     async def write(self, changes: dict[str, StoreItem]):
         """Writes items to the in-memory storage.
 
+        Items carrying an ``e_tag`` are only written if the stored item still has
+        that ETag, and are given the new ETag afterwards. Either all changes are
+        written or none are.
+
         :param changes: A dictionary mapping keys to StoreItem instances to be written to the storage.
         :raises ValueError: If changes is None or any key is empty.
+        :raises ETagConflictError: If a stored item was changed or deleted since it was read.
         """
         if not changes:
             raise ValueError("MemoryStorage.write(): changes cannot be None")
 
         async with self._lock:
-            for key in changes:
+            for key, item in changes.items():
                 if key == "":
                     raise ValueError("MemoryStorage.write(): key cannot be empty")
-                self._memory[key] = changes[key].store_item_to_json()
+                self._check_e_tag(key, getattr(item, "e_tag", None))
+
+            for key, item in changes.items():
+                self._memory[key] = item.store_item_to_json()
+                e_tag = self._e_tags[key] = str(next(self._e_tag_counter))
+                if is_conditional_write(getattr(item, "e_tag", None)):
+                    set_e_tag(item, e_tag)
 
     async def delete(self, keys: list[str]):
         """Deletes items from the in-memory storage.
@@ -78,3 +109,39 @@ class MemoryStorage(Storage):
                     raise ValueError("MemoryStorage.delete(): key cannot be empty")
                 if key in self._memory:
                     del self._memory[key]
+                self._e_tags.pop(key, None)
+
+    async def write_delta(
+        self,
+        key: str,
+        updates: dict[str, Any],
+        removals: Iterable[str] = (),
+        *,
+        source: StoreItem | None = None,
+    ) -> bool:
+        """Merges property updates into an item already in the in-memory storage.
+
+        :param key: The key of the item to update.
+        :param updates: Serialized property values to set on the stored item.
+        :param removals: Names of properties to remove from the stored item.
+        :param source: The item the delta was taken from, whose ETag is checked and refreshed.
+        :return: True if the item was updated, False if it does not exist.
+        :raises ValueError: If key is empty.
+        :raises ETagConflictError: If the stored item was changed since it was read.
+        """
+        if key == "":
+            raise ValueError("MemoryStorage.write_delta(): key cannot be empty")
+
+        async with self._lock:
+            item = self._memory.get(key)
+            if not isinstance(item, dict):
+                return False
+            if source is not None:
+                self._check_e_tag(key, source.e_tag)
+            item.update(updates)
+            for name in removals:
+                item.pop(name, None)
+            e_tag = self._e_tags[key] = str(next(self._e_tag_counter))
+            if is_conditional_write(getattr(source, "e_tag", None)):
+                set_e_tag(source, e_tag)
+            return True
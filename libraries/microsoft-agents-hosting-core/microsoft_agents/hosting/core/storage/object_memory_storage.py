@@ -0,0 +1,143 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from copy import deepcopy
+from itertools import count
+from typing import TypeVar
+
+from .error_handling import ETagConflictError
+from .storage import Storage
+from .store_item import StoreItem, is_conditional_write, set_e_tag
+
+StoreItemT = TypeVar("StoreItemT", bound=StoreItem)
+
+
+class ObjectMemoryStorage(Storage):
+    """In-memory storage that keeps copies of the written items instead of their JSON.
+
+    Reads return a deep copy of the stored item when it is read back as the class
+    it was written as, skipping ``from_json_to_store_item``; otherwise the item is
+    serialized and deserialized into ``target_cls``. Items that keep transient
+    bookkeeping should implement ``__deepcopy__`` to leave it out of the copies.
+
+    No lock is taken: none of the operations awaits, so each one runs to completion
+    on the event loop before another starts. With ``max_items`` the least recently
+    used items are evicted once the limit is exceeded, which makes the storage
+    suitable as a bounded cache but not as a durable store.
+    """
+
+    def __init__(
+        self,
+        state: dict[str, StoreItem] | None = None,
+        *,
+        max_items: int | None = None,
+    ):
+        """Initializes the ObjectMemoryStorage.
+
+        :param state: An optional dictionary of initial items, which are copied.
+        :param max_items: The maximum number of stored items, or None for no limit.
+        :raises ValueError: If max_items is not positive.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError("ObjectMemoryStorage(): max_items must be at least 1")
+
+        self._max_items = max_items
+        self._items: OrderedDict[str, StoreItem] = OrderedDict()
+        self._e_tags: dict[str, str] = {}
+        self._e_tag_counter = count(1)
+        for key, item in (state or {}).items():
+            self._store(key, item)
+
+    @property
+    def count(self) -> int:
+        """The number of stored items."""
+        return len(self._items)
+
+    def _store(self, key: str, item: StoreItem) -> str:
+        """Stores a copy of an item under a new ETag, evicting items over the limit."""
+        self._items[key] = deepcopy(item)
+        self._items.move_to_end(key)
+        e_tag = self._e_tags[key] = str(next(self._e_tag_counter))
+        if self._max_items is not None:
+            while len(self._items) > self._max_items:
+                evicted, _ = self._items.popitem(last=False)
+                del self._e_tags[evicted]
+        return e_tag
+
+    def _check_e_tag(self, key: str, e_tag: str | None) -> None:
+        """Raises ETagConflictError if a conditional write no longer matches the stored item."""
+        if is_conditional_write(e_tag) and self._e_tags.get(key) != e_tag:
+            raise ETagConflictError(key)
+
+    async def read(
+        self, keys: list[str], *, target_cls: type[StoreItemT], **kwargs
+    ) -> dict[str, StoreItemT]:
+        """Reads copies of items from the in-memory storage.
+
+        :param keys: A list of keys to read from the storage.
+        :param target_cls: The class type of the items to be read. Must be a subclass of StoreItem.
+        :return: A dictionary mapping keys to their corresponding StoreItem instances.
+        :raises ValueError: If keys are empty.
+        """
+        if not keys:
+            raise ValueError("Storage.read(): Keys are required when reading.")
+
+        result: dict[str, StoreItemT] = {}
+        for key in keys:
+            if key == "":
+                raise ValueError("ObjectMemoryStorage.read(): key cannot be empty")
+            stored = self._items.get(key)
+            if stored is None:
+                continue
+            self._items.move_to_end(key)
+            if type(stored) is target_cls:
+                item = deepcopy(stored)
+            else:
+                item = target_cls.from_json_to_store_item(
+                    deepcopy(stored.store_item_to_json())
+                )
+            set_e_tag(item, self._e_tags[key])
+            result[key] = item
+        return result
+
+    async def write(self, changes: dict[str, StoreItem]) -> None:
+        """Writes copies of items to the in-memory storage.
+
+        Items carrying an ``e_tag`` are only written if the stored item still has
+        that ETag, and are given the new ETag afterwards. Either all changes are
+        written or none are.
+
+        :param changes: A dictionary mapping keys to StoreItem instances to be written to the storage.
+        :raises ValueError: If changes is None or any key is empty.
+        :raises ETagConflictError: If a stored item was changed or deleted since it was read.
+        """
+        if not changes:
+            raise ValueError("ObjectMemoryStorage.write(): changes cannot be None")
+
+        for key, item in changes.items():
+            if key == "":
+                raise ValueError("ObjectMemoryStorage.write(): key cannot be empty")
+            self._check_e_tag(key, getattr(item, "e_tag", None))
+
+        for key, item in changes.items():
+            e_tag = self._store(key, item)
+            if is_conditional_write(getattr(item, "e_tag", None)):
+                set_e_tag(item, e_tag)
+
+    async def delete(self, keys: list[str]) -> None:
+        """Deletes items from the in-memory storage.
+
+        :param keys: A list of keys to delete from the storage.
+        :raises ValueError: If keys is empty or any key is empty.
+        """
+        if not keys:
+            raise ValueError("Storage.delete(): Keys are required when deleting.")
+
+        for key in keys:
+            if key == "":
+                raise ValueError("ObjectMemoryStorage.delete(): key cannot be empty")
+            self._items.pop(key, None)
+            self._e_tags.pop(key, None)
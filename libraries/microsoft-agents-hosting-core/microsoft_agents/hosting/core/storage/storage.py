@@ -1,7 +1,7 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from typing import TypeVar
+from typing import Any, Iterable, TypeVar
 from abc import ABC, abstractmethod
 from asyncio import gather
 
@@ -30,6 +30,10 @@ class Storage(ABC):
     async def write(self, changes: dict[str, StoreItem]) -> None:
         """Writes multiple items to storage.
 
+        Implementations that support optimistic concurrency only write an item
+        carrying an ``e_tag`` if the stored item still has that ETag, and raise
+        :class:`ETagConflictError` otherwise.
+
         :param changes: A dictionary of key to StoreItem to write.
         """
         pass
@@ -44,6 +48,29 @@ class Storage(ABC):
         """
         pass
 
+    async def write_delta(
+        self,
+        key: str,
+        updates: dict[str, Any],
+        removals: Iterable[str] = (),
+        *,
+        source: StoreItem | None = None,
+    ) -> bool:
+        """Applies a partial update to the top-level properties of a stored item.
+
+        Storage implementations that can patch a document in place override this.
+        The default does nothing and returns False, in which case the caller is
+        expected to fall back to a full :meth:`write`.
+
+        :param key: The key of the item to update.
+        :param updates: Serialized property values to set on the stored item.
+        :param removals: Names of properties to remove from the stored item.
+        :param source: Optional, the item the delta was taken from. Its ``e_tag`` is
+            checked like a conditional write and refreshed once the delta is applied.
+        :return: True if the delta was applied, False if a full write is required.
+        """
+        return False
+
 
 class AsyncStorageBase(Storage):
     """Base class for asynchronous storage implementations with operations
@@ -9,7 +9,16 @@ from ._type_aliases import JSON
 
 
 class StoreItem(ABC):
-    """Abstract base class for items stored in the storage system."""
+    """Abstract base class for items stored in the storage system.
+
+    Storage implementations that support optimistic concurrency set ``e_tag`` on
+    the items they read. When an item with an ``e_tag`` is written, the write only
+    succeeds if the stored item still has that ETag, and the item then carries the
+    new ETag. ``None`` or ``"*"`` writes unconditionally. Pydantic based items
+    that want ETags must declare an ``e_tag`` field excluded from serialization.
+    """
+
+    e_tag = None
 
     @abstractmethod
     def store_item_to_json(self) -> JSON:
@@ -28,3 +37,25 @@ class StoreItem(ABC):
         :return: A StoreItem instance.
         """
         pass
+
+
+def is_conditional_write(e_tag: str | None) -> bool:
+    """Determines whether a write with the given ETag must match the stored item.
+
+    :param e_tag: The ETag of the item being written.
+    :return: True unless the ETag is None or the wildcard "*".
+    """
+    return e_tag is not None and e_tag != "*"
+
+
+def set_e_tag(item: StoreItem, e_tag: str | None) -> None:
+    """Records an ETag on an item, skipping items that cannot hold one.
+
+    :param item: The item read or written.
+    :param e_tag: The ETag of the stored item.
+    """
+    try:
+        item.e_tag = e_tag
+    except (AttributeError, ValueError):
+        # e.g. pydantic models without an e_tag field
+        pass
@@ -7,3 +7,5 @@ SPAN_STORAGE_DELETE = "agents.storage.delete"
 
 METRIC_STORAGE_OPERATION_TOTAL = "agents.storage.operation.total"
 METRIC_STORAGE_OPERATION_DURATION = "agents.storage.operation.duration"
+METRIC_STORAGE_CACHE_HIT_TOTAL = "agents.storage.cache.hit.total"
+METRIC_STORAGE_CACHE_MISS_TOTAL = "agents.storage.cache.miss.total"
@@ -14,3 +14,13 @@ storage_operation_duration = agents_telemetry.meter.create_histogram(
     "ms",
     description="Duration of storage operations in milliseconds",
 )
+storage_cache_hit_total = agents_telemetry.meter.create_counter(
+    constants.METRIC_STORAGE_CACHE_HIT_TOTAL,
+    "key",
+    description="Number of keys read from the CachedStorage cache",
+)
+storage_cache_miss_total = agents_telemetry.meter.create_counter(
+    constants.METRIC_STORAGE_CACHE_MISS_TOTAL,
+    "key",
+    description="Number of keys CachedStorage read from its backing storage",
+)
@@ -10,6 +10,10 @@ from .transcript_logger import (
     PagedResult,
 )
 from .transcript_store import TranscriptStore
+from .background_transcript_logger import (
+    BackgroundTranscriptLogger,
+    TranscriptOverflowPolicy,
+)
 from .transcript_file_store import FileTranscriptStore
 
 __all__ = [
@@ -17,6 +21,8 @@ __all__ = [
     "TranscriptLogger",
     "ConsoleTranscriptLogger",
     "TranscriptLoggerMiddleware",
+    "BackgroundTranscriptLogger",
+    "TranscriptOverflowPolicy",
     "TranscriptStore",
     "FileTranscriptLogger",
     "FileTranscriptStore",
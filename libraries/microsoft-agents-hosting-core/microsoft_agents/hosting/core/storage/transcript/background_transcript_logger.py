@@ -0,0 +1,224 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from enum import Enum
+
+from microsoft_agents.activity import Activity
+
+from .transcript_logger import TranscriptLogger
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptOverflowPolicy(str, Enum):
+    """What :class:`BackgroundTranscriptLogger` does when its queue is full."""
+
+    BLOCK = "block"
+    """Wait for room in the queue, slowing down the turns that log activities."""
+
+    DROP_NEWEST = "drop_newest"
+    """Drop the activities being logged."""
+
+    DROP_OLDEST = "drop_oldest"
+    """Drop the oldest queued activities to make room."""
+
+
+class BackgroundTranscriptLogger(TranscriptLogger):
+    """A :class:`TranscriptLogger` that queues activities and writes them to another
+    logger in batches on a background task.
+
+    Logging an activity only adds it to a bounded queue, so turns do not wait for the
+    transcript to be persisted. A worker task takes up to ``batch_size`` activities
+    from the queue, waiting at most ``flush_interval`` seconds for a batch to fill,
+    and passes them to the inner logger's :meth:`TranscriptLogger.log_activities`.
+    Activities are written in the order they were logged. When the queue holds
+    ``max_queue_size`` activities, ``overflow_policy`` decides whether logging waits
+    or activities are dropped.
+
+    Failed writes are logged and their activities are not retried. Call
+    :meth:`flush` to wait for the queued activities to be written, and :meth:`close`
+    on shutdown.
+    """
+
+    def __init__(
+        self,
+        logger: TranscriptLogger,
+        *,
+        batch_size: int = 50,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 1000,
+        overflow_policy: TranscriptOverflowPolicy = TranscriptOverflowPolicy.BLOCK,
+    ):
+        """
+        :param logger: The logger the activities are written to.
+        :param batch_size: The maximum number of activities written at once.
+        :param flush_interval: The longest time in seconds to wait for a batch to fill.
+        :param max_queue_size: The maximum number of activities waiting to be written.
+        :param overflow_policy: What to do when the queue is full.
+        :raises ValueError: If a size is not positive or flush_interval is negative.
+        """
+        if not logger:
+            raise TypeError("BackgroundTranscriptLogger requires a TranscriptLogger.")
+        if batch_size < 1 or max_queue_size < 1:
+            raise ValueError(
+                "BackgroundTranscriptLogger(): batch_size and max_queue_size must be at least 1"
+            )
+        if flush_interval < 0:
+            raise ValueError(
+                "BackgroundTranscriptLogger(): flush_interval must not be negative"
+            )
+
+        self._logger = logger
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_queue_size = max_queue_size
+        self._overflow_policy = TranscriptOverflowPolicy(overflow_policy)
+
+        self._queue: asyncio.Queue[Activity] | None = None
+        self._worker: asyncio.Task | None = None
+        self._flush_requested: asyncio.Event | None = None
+
+        self._dropped = 0
+        self._failed = 0
+
+    @property
+    def dropped(self) -> int:
+        """The number of activities dropped because the queue was full."""
+        return self._dropped
+
+    @property
+    def failed(self) -> int:
+        """The number of activities whose write failed."""
+        return self._failed
+
+    async def log_activity(self, activity: Activity) -> None:
+        """Queues an activity to be written.
+
+        :param activity: The activity to log.
+        """
+        if not activity:
+            raise TypeError("Activity is required")
+        await self._enqueue(self._ensure_worker(), activity)
+
+    async def log_activities(self, activities: list[Activity]) -> None:
+        """Queues activities to be written, in order.
+
+        :param activities: The activities to log.
+        """
+        queue = self._ensure_worker()
+        for activity in activities:
+            await self._enqueue(queue, activity)
+
+    async def flush(self) -> None:
+        """Waits until every queued activity has been written."""
+        if not self._running():
+            return
+        self._flush_requested.set()
+        try:
+            await self._queue.join()
+        finally:
+            self._flush_requested.clear()
+
+    async def close(self) -> None:
+        """Writes the queued activities and stops the background task."""
+        if not self._running():
+            return
+        await self.flush()
+        worker = self._worker
+        self._worker = None
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+
+    def _running(self) -> bool:
+        return (
+            self._worker is not None
+            and not self._worker.done()
+            and self._worker.get_loop() is asyncio.get_running_loop()
+        )
+
+    def _ensure_worker(self) -> asyncio.Queue[Activity]:
+        if not self._running():
+            # the queue and the event are bound to the loop the worker runs on
+            self._queue = asyncio.Queue(self._max_queue_size)
+            self._flush_requested = asyncio.Event()
+            self._worker = asyncio.get_running_loop().create_task(
+                self._run(self._queue, self._flush_requested)
+            )
+        return self._queue
+
+    async def _enqueue(self, queue: asyncio.Queue[Activity], activity: Activity):
+        if not queue.full():
+            queue.put_nowait(activity)
+        elif self._overflow_policy == TranscriptOverflowPolicy.BLOCK:
+            await queue.put(activity)
+        elif self._overflow_policy == TranscriptOverflowPolicy.DROP_NEWEST:
+            self._drop()
+        else:
+            queue.get_nowait()
+            queue.task_done()
+            self._drop()
+            queue.put_nowait(activity)
+
+    def _drop(self) -> None:
+        self._dropped += 1
+        logger.debug(
+            "Transcript queue is full, dropped an activity (%d in total)",
+            self._dropped,
+        )
+
+    async def _run(
+        self, queue: asyncio.Queue[Activity], flush_requested: asyncio.Event
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0 or flush_requested.is_set():
+                    break
+                activity = await self._wait_for_activity(
+                    queue, flush_requested, timeout
+                )
+                if activity is None:
+                    break
+                batch.append(activity)
+
+            try:
+                await self._logger.log_activities(batch)
+            except Exception as error:
+                self._failed += len(batch)
+                logger.warning(
+                    "Failed to write %d transcript activities: %s",
+                    len(batch),
+                    type(error).__name__,
+                )
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    @staticmethod
+    async def _wait_for_activity(
+        queue: asyncio.Queue[Activity], flush_requested: asyncio.Event, timeout: float
+    ) -> Activity | None:
+        """Waits for the next activity, returning None on timeout or when a flush is requested."""
+        getter = asyncio.ensure_future(queue.get())
+        waiter = asyncio.ensure_future(flush_requested.wait())
+        try:
+            await asyncio.wait(
+                {getter, waiter}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            waiter.cancel()
+            if not getter.done():
+                getter.cancel()
+        if getter.done() and not getter.cancelled():
+            return getter.result()
+        return None
@@ -79,6 +79,41 @@ class FileTranscriptStore(TranscriptLogger):
 
         await asyncio.to_thread(_write)
 
+    async def log_activities(self, activities: list[Activity]) -> None:
+        """
+        Asynchronously persist a batch of transcript activities to the file system.
+
+        Activities are grouped by transcript file, and every file is opened once in a
+        single background thread.
+
+        :param activities: The activities to log.
+        """
+        if not all(activities):
+            raise ValueError("Activity is required")
+
+        by_file: dict[Path, list[Activity]] = {}
+        for activity in activities:
+            channel_id, conversation_id = _get_ids(activity)
+            by_file.setdefault(self._file_path(channel_id, conversation_id), []).append(
+                activity
+            )
+
+        def _write() -> None:
+            for file_path, file_activities in by_file.items():
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(file_path, "a", encoding="utf-8", newline="\n") as f:
+                    for activity in file_activities:
+                        if not activity.timestamp:
+                            activity.timestamp = datetime.now(timezone.utc)
+                        f.write(
+                            activity.model_dump_json(
+                                exclude_none=True, exclude_unset=True
+                            )
+                        )
+                        f.write("\n")
+
+        await asyncio.to_thread(_write)
+
     # -------- Store surface --------
 
     async def list_transcripts(self, channel_id: str) -> PagedResult[TranscriptInfo]:
@@ -3,11 +3,9 @@
 import copy
 import random
 import string
-import json
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from queue import Queue
 from typing import Awaitable, Callable, Optional
 from dataclasses import dataclass
 
@@ -37,6 +35,18 @@ class TranscriptLogger(ABC):
         """
         pass
 
+    async def log_activities(self, activities: list[Activity]) -> None:
+        """
+        Asynchronously logs a batch of activities, in order.
+
+        The default implementation calls :meth:`log_activity` for each activity.
+        Loggers that can persist several activities at once override it.
+
+        :param activities: The activities to log.
+        """
+        for activity in activities:
+            await self.log_activity(activity)
+
 
 class ConsoleTranscriptLogger(TranscriptLogger):
     """
@@ -51,9 +61,7 @@ class ConsoleTranscriptLogger(TranscriptLogger):
         if not activity:
             raise TypeError("Activity is required")
 
-        json_data = activity.model_dump_json()
-        parsed = json.loads(json_data)
-        print(json.dumps(parsed, indent=4))
+        print(activity.model_dump_json(indent=4))
 
 
 class FileTranscriptLogger(TranscriptLogger):
@@ -86,22 +94,37 @@ class FileTranscriptLogger(TranscriptLogger):
         if not activity:
             raise TypeError("Activity is required")
 
-        json_data = activity.model_dump_json()
-        parsed = json.loads(json_data)
-
-        self._file.write(json.dumps(parsed, indent=4))
+        self._file.write(activity.model_dump_json(indent=4))
 
         # As this is a logging / debugging class, we want to ensure the data is written out immediately. This is another
         # consideration that makes this class non-performant for production scenarios.
         self._file.flush()
 
+    async def log_activities(self, activities: list[Activity]) -> None:
+        """
+        Appends the given activities as JSON to the file, flushing it once.
+
+        :param activities: The Activity objects to log.
+        """
+        if not all(activities):
+            raise TypeError("Activity is required")
+
+        for activity in activities:
+            self._file.write(activity.model_dump_json(indent=4))
+        self._file.flush()
+
     def __del__(self):
         if hasattr(self, "_file"):
             self._file.close()
 
 
 class TranscriptLoggerMiddleware(Middleware):
-    """Logs incoming and outgoing activities to a TranscriptLogger."""
+    """Logs incoming and outgoing activities to a TranscriptLogger.
+
+    The activities of a turn are passed to :meth:`TranscriptLogger.log_activities`
+    once at the end of the turn. Wrap the logger in a
+    :class:`BackgroundTranscriptLogger` to persist them off the turn's critical path.
+    """
 
     def __init__(self, logger: TranscriptLogger):
         if not logger:
@@ -118,7 +141,7 @@ class TranscriptLoggerMiddleware(Middleware):
         :param context: Context for the current turn of conversation with the user.
         :param logic: Function to call at the end of the middleware chain.
         """
-        transcript = Queue()
+        transcript: list[Activity] = []
         activity = context.activity
         # Log incoming activity at beginning of turn
         if activity:
@@ -204,16 +227,14 @@ class TranscriptLoggerMiddleware(Middleware):
             await logic(context)
 
         # Flush transcript at end of turn
-        while not transcript.empty():
-            activity = transcript.get()
-            if activity is None:
-                break
-            await self.logger.log_activity(activity)
-            transcript.task_done()
-
-    async def _queue_activity(self, transcript: Queue, activity: Activity) -> None:
+        if transcript:
+            await self.logger.log_activities(transcript)
+
+    async def _queue_activity(
+        self, transcript: list[Activity], activity: Activity
+    ) -> None:
         """Logs the activity.
         :param transcript: transcript.
         :param activity: Activity to log.
         """
-        transcript.put(activity)
+        transcript.append(activity)
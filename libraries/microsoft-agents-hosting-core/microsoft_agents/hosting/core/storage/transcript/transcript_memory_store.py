@@ -45,6 +45,24 @@ class TranscriptMemoryStore(TranscriptLogger):
         async with self.lock:
             self._transcript.append(activity)
 
+    async def log_activities(self, activities: list[Activity]) -> None:
+        """
+        Asynchronously logs a batch of activities to the in-memory transcript.
+
+        :param activities: The Activity objects to log. Each must have a valid conversation and conversation id.
+        :raises ValueError: If an activity, its conversation, or its conversation id is None.
+        """
+        for activity in activities:
+            if not activity:
+                raise ValueError("Activity cannot be None")
+            if not activity.conversation:
+                raise ValueError("Activity.Conversation cannot be None")
+            if not activity.conversation.id:
+                raise ValueError("Activity.Conversation.id cannot be None")
+
+        async with self.lock:
+            self._transcript.extend(activities)
+
     async def get_transcript_activities(
         self,
         channel_id: str,
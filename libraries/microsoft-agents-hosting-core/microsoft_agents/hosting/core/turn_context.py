@@ -7,6 +7,7 @@ from typing import Optional, Awaitable, TypeVar, Protocol
 
 from copy import deepcopy
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from microsoft_agents.activity import (
     Activity,
@@ -46,6 +47,15 @@ class _AsyncFunc(Protocol[T]):
     def __call__(self) -> Awaitable[T]: ...
 
 
+@dataclass
+class _OutboundBuffer:
+    """Message activities held back by `TurnContext.enable_buffering`."""
+
+    enabled: bool = False
+    coalesce_text: bool = False
+    activities: list[Activity] = field(default_factory=list)
+
+
 class TurnContext(TurnContextProtocol):
     # Same constant as in the BF Adapter, duplicating here to avoid circular dependency
     _INVOKE_RESPONSE_KEY = "TurnContext.InvokeResponse"
@@ -81,6 +91,7 @@ class TurnContext(TurnContextProtocol):
             self._on_delete_activity = []
             self._responded: bool = False
             self._identity = identity
+            self._outbound_buffer = _OutboundBuffer()
 
         if self.adapter is None:
             raise TypeError("TurnContext must be instantiated with an adapter.")
@@ -113,6 +124,7 @@ class TurnContext(TurnContextProtocol):
             "_on_send_activities",
             "_on_update_activity",
             "_on_delete_activity",
+            "_outbound_buffer",
         ]:
             setattr(context, attribute, getattr(self, attribute))
 
@@ -176,6 +188,69 @@ class TurnContext(TurnContextProtocol):
     def identity(self) -> Optional[ClaimsIdentity]:
         return self._identity
 
+    @property
+    def buffering(self) -> bool:
+        """
+        If `true` outgoing message activities are held back until they are flushed.
+        :return:
+        """
+        return self._outbound_buffer.enabled
+
+    def enable_buffering(self, coalesce_text: bool = False) -> None:
+        """
+        Holds back message activities sent with `send_activity` for the rest of the turn.
+
+        Buffered messages are sent as one `send_activities` batch, through a single pass of
+        the `on_send_activities` handlers, when `flush_buffered_activities` is called, when
+        any other activity is sent, updated or deleted, or when the adapter finishes the turn.
+        `send_activity` returns an empty `ResourceResponse` for buffered messages; call
+        `flush_buffered_activities` to get the responses from the channel.
+
+        :param coalesce_text: If true, consecutive text-only messages that differ only in
+            their text are merged into one message, separated by a blank line.
+        :type coalesce_text: bool
+        """
+        self._outbound_buffer.enabled = True
+        self._outbound_buffer.coalesce_text = coalesce_text
+
+    async def flush_buffered_activities(self) -> list[ResourceResponse]:
+        """
+        Sends the message activities held back by `enable_buffering`.
+        :return: The responses for the sent activities, or an empty list if nothing was buffered.
+        """
+        if not self._outbound_buffer.activities:
+            return []
+
+        buffered = self._outbound_buffer.activities
+        self._outbound_buffer.activities = []
+        return await self.send_activities(buffered)
+
+    def _buffer_activity(self, activity: Activity) -> None:
+        buffered = self._outbound_buffer.activities
+        if (
+            self._outbound_buffer.coalesce_text
+            and buffered
+            and self._can_coalesce(buffered[-1], activity)
+        ):
+            previous = buffered[-1]
+            previous.text = f"{previous.text}\n\n{activity.text}"
+            if activity.input_hint:
+                previous.input_hint = activity.input_hint
+        else:
+            buffered.append(deepcopy(activity))
+
+        self.responded = True
+
+    @staticmethod
+    def _can_coalesce(previous: Activity, activity: Activity) -> bool:
+        if not previous.text or not activity.text:
+            return False
+
+        excluded = {"text", "input_hint"}
+        return previous.model_dump(
+            exclude=excluded, exclude_unset=True
+        ) == activity.model_dump(exclude=excluded, exclude_unset=True)
+
     async def send_activity(
         self,
         activity_or_text: Activity | str,
@@ -196,12 +271,21 @@ class TurnContext(TurnContextProtocol):
             if speak:
                 activity_or_text.speak = speak
 
+        activity_type = activity_or_text.type or ActivityTypes.message
+        if self._outbound_buffer.enabled and activity_type == ActivityTypes.message:
+            self._buffer_activity(activity_or_text)
+            return ResourceResponse()
+
         result = await self.send_activities([activity_or_text])
         return result[0] if result else ResourceResponse()
 
     async def send_activities(
         self, activities: list[Activity]
     ) -> list[ResourceResponse]:
+        if self._outbound_buffer.activities:
+            # keep buffered messages ahead of the activities sent now
+            await self.flush_buffered_activities()
+
         sent_non_trace_activity = False
         # TODO: Check activity serialization
         ref = self.activity.get_conversation_reference()
@@ -259,6 +343,9 @@ class TurnContext(TurnContextProtocol):
         :param activity:
         :return:
         """
+        if self._outbound_buffer.activities:
+            await self.flush_buffered_activities()
+
         reference = self.activity.get_conversation_reference()
 
         return await self._emit(
@@ -273,6 +360,9 @@ class TurnContext(TurnContextProtocol):
         :param id_or_reference:
         :return:
         """
+        if self._outbound_buffer.activities:
+            await self.flush_buffered_activities()
+
         if isinstance(id_or_reference, str):
             reference = self.activity.get_conversation_reference()
             reference.activity_id = id_or_reference
@@ -8,6 +8,7 @@ from .cloud_adapter import CloudAdapter
 from .jwt_authorization_middleware import (
     JwtAuthorizationMiddleware,
     jwt_authorization_decorator,
+    jwt_authorization_warm_up,
 )
 
 # Import streaming utilities from core for backward compatibility
@@ -23,6 +24,7 @@ __all__ = [
     "CloudAdapter",
     "JwtAuthorizationMiddleware",
     "jwt_authorization_decorator",
+    "jwt_authorization_warm_up",
     "channel_service_route_table",
     "Citation",
     "CitationUtil",
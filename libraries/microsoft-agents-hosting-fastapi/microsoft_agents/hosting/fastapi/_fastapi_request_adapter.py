@@ -21,6 +21,9 @@ class FastApiRequestAdapter:
     async def json(self):
         return await self._request.json()
 
+    async def read(self) -> bytes:
+        return await self._request.body()
+
     def get_claims_identity(self):
         return getattr(self._request.state, "claims_identity", None)
 
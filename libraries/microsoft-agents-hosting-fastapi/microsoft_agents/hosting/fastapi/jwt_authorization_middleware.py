@@ -3,15 +3,21 @@
 
 import functools
 import inspect
+import logging
 
-from fastapi import Request
+from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from starlette.types import ASGIApp, Receive, Scope, Send
 
 from microsoft_agents.hosting.core import AgentAuthConfiguration
-from microsoft_agents.hosting.core.authorization.jwt import _authorize_request
+from microsoft_agents.hosting.core.authorization.jwt import (
+    JwtTokenValidator,
+    _authorize_request,
+)
 from microsoft_agents.hosting.core.http import HttpResponse
 
+logger = logging.getLogger(__name__)
+
 
 class JwtAuthorizationMiddleware:
     """Starlette-compatible ASGI middleware for JWT authorization.
@@ -78,3 +84,34 @@ def jwt_authorization_decorator(func):
     wrapper.__signature__ = inspect.signature(func)  # type: ignore[attr-defined]
 
     return wrapper
+
+
+async def jwt_authorization_warm_up(app: FastAPI) -> None:
+    """
+    Fetches the JWT signing keys before the first request arrives.
+
+    Await it from the application's lifespan handler. Keys that cannot be fetched
+    at startup are fetched again when a token needs them.
+
+    Usage:
+        from contextlib import asynccontextmanager
+
+        @asynccontextmanager
+        async def lifespan(app: FastAPI):
+            await jwt_authorization_warm_up(app)
+            yield
+
+        app = FastAPI(lifespan=lifespan)
+
+    :param app: The FastAPI application whose state holds the ``agent_configuration``.
+    """
+    auth_config: AgentAuthConfiguration | None = getattr(
+        app.state, "agent_configuration", None
+    )
+    if auth_config is None:
+        logger.warning(
+            "Agent Authentication configuration not found; skipping warm-up."
+        )
+        return
+
+    await JwtTokenValidator(auth_config).warm_up()
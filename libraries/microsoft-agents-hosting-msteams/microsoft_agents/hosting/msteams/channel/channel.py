@@ -72,7 +72,11 @@ class Channel(Generic[StateT]):
                 await func(teams_context, state, channel_info)
 
             self._app.add_route(
-                __selector, __handler, rank=rank, auth_handlers=auth_handlers
+                __selector,
+                __handler,
+                rank=rank,
+                auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.conversation_update],
             )
             return func
 
@@ -335,7 +339,11 @@ class Channel(Generic[StateT]):
                 await func(teams_context, state, channel_info)
 
             self._app.add_route(
-                __selector, __func, rank=rank, auth_handlers=auth_handlers
+                __selector,
+                __func,
+                rank=rank,
+                auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.conversation_update],
             )
             return func
 
@@ -383,7 +391,11 @@ class Channel(Generic[StateT]):
                 await func(teams_context, state, channel_info)
 
             self._app.add_route(
-                __selector, __func, rank=rank, auth_handlers=auth_handlers
+                __selector,
+                __func,
+                rank=rank,
+                auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.conversation_update],
             )
             return func
 
@@ -69,6 +69,8 @@ class Config(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name=name,
             )
             return func
 
@@ -79,6 +79,8 @@ class FileConsent(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="fileConsent/invoke",
             )
             return func
 
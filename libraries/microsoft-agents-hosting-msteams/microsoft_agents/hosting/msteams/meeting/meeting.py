@@ -87,6 +87,8 @@ class Meeting(Generic[StateT]):
                 __handler,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.event],
+                activity_name="application/vnd.microsoft.meetingStart",
             )
             return func
 
@@ -138,6 +140,8 @@ class Meeting(Generic[StateT]):
                 __handler,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.event],
+                activity_name="application/vnd.microsoft.meetingEnd",
             )
             return func
 
@@ -199,6 +203,8 @@ class Meeting(Generic[StateT]):
                 __handler,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.event],
+                activity_name="application/vnd.microsoft.meetingParticipantJoin",
             )
             return func
 
@@ -260,6 +266,8 @@ class Meeting(Generic[StateT]):
                 __handler,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.event],
+                activity_name="application/vnd.microsoft.meetingParticipantLeave",
             )
             return func
 
@@ -76,6 +76,7 @@ class Message(Generic[StateT]):
                 wrap_teams_route_handler(func, self._app),
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[message_type],
             )
             return func
 
@@ -228,7 +229,12 @@ class Message(Generic[StateT]):
                 await func(teams_context, state, value)
 
             self._app.add_route(
-                __selector, __handler, rank=rank, auth_handlers=auth_handlers
+                __selector,
+                __handler,
+                rank=rank,
+                auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.event],
+                activity_name="application/vnd.microsoft.readReceipt",
             )
             return func
 
@@ -286,6 +292,8 @@ class Message(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="actionableMessage/executeAction",
             )
             return func
 
@@ -120,6 +120,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/query",
             )
             return func
 
@@ -169,6 +171,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/selectItem",
             )
             return func
 
@@ -226,6 +230,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/submitAction",
             )
             return func
 
@@ -275,6 +281,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/submitAction",
             )
             return func
 
@@ -324,6 +332,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/submitAction",
             )
             return func
 
@@ -369,6 +379,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/fetchTask",
             )
             return func
 
@@ -419,6 +431,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/queryLink",
             )
             return func
 
@@ -471,6 +485,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/anonymousQueryLink",
             )
             return func
 
@@ -529,6 +545,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/querySettingUrl",
             )
             return func
 
@@ -580,6 +598,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/setting",
             )
             return func
 
@@ -635,6 +655,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/onCardButtonClicked",
             )
             return func
 
@@ -90,6 +90,8 @@ class TaskModule(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="task/fetch",
             )
             return func
 
@@ -133,6 +135,8 @@ class TaskModule(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="task/submit",
             )
             return func
 
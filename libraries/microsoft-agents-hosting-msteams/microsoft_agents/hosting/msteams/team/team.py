@@ -79,7 +79,11 @@ class Team(Generic[StateT]):
                 await func(teams_context, state, team_info)
 
             self._app.add_route(
-                __selector, __handler, rank=rank, auth_handlers=auth_handlers
+                __selector,
+                __handler,
+                rank=rank,
+                auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.conversation_update],
             )
             return func
 
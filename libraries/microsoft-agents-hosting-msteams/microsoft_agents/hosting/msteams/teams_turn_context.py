@@ -15,6 +15,7 @@ from microsoft_agents.activity import (
     Activity,
     ActivityTreatment,
     ActivityTreatmentTypes,
+    LazyActivity,
     ResourceResponse,
 )
 from microsoft_agents.hosting.core import (
@@ -70,6 +71,8 @@ class TeamsTurnContext(TurnContext):
         The main pitfall beyond the obvious ones is if a user defines a custom Activity
         and brings in their own Adapter that creates it. This is a tradeoff.
         """
+        if isinstance(self._activity, LazyActivity):
+            self._activity.resolve_deferred_fields()
         self._activity.__class__ = TeamsActivity
         self._teams_activity = cast(TeamsActivity, self._activity)
 
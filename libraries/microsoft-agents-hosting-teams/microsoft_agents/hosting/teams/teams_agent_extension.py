@@ -120,6 +120,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/query",
             )
             return func
 
@@ -152,6 +154,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/selectItem",
             )
             return func
 
@@ -204,6 +208,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/submitAction",
             )
             return func
 
@@ -244,6 +250,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/submitAction",
             )
             return func
 
@@ -284,6 +292,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/submitAction",
             )
             return func
 
@@ -323,6 +333,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/fetchTask",
             )
             return func
 
@@ -356,6 +368,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/queryLink",
             )
             return func
 
@@ -391,6 +405,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/anonymousQueryLink",
             )
             return func
 
@@ -428,6 +444,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/querySettingUrl",
             )
             return func
 
@@ -461,6 +479,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/setting",
             )
             return func
 
@@ -494,6 +514,8 @@ class MessageExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="composeExtension/onCardButtonClicked",
             )
             return func
 
@@ -554,6 +576,8 @@ class TaskModule(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="task/fetch",
             )
             return func
 
@@ -593,6 +617,8 @@ class TaskModule(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="task/submit",
             )
             return func
 
@@ -633,6 +659,8 @@ class Meeting(Generic[StateT]):
                 __handler,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.event],
+                activity_name="application/vnd.microsoft.meetingStart",
             )
             return func
 
@@ -665,6 +693,8 @@ class Meeting(Generic[StateT]):
                 __handler,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.event],
+                activity_name="application/vnd.microsoft.meetingEnd",
             )
             return func
 
@@ -700,6 +730,8 @@ class Meeting(Generic[StateT]):
                 __handler,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.event],
+                activity_name="application/vnd.microsoft.meetingParticipantJoin",
             )
             return func
 
@@ -735,6 +767,8 @@ class Meeting(Generic[StateT]):
                 __handler,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.event],
+                activity_name="application/vnd.microsoft.meetingParticipantLeave",
             )
             return func
 
@@ -806,7 +840,11 @@ class TeamsAgentExtension(Generic[StateT]):
 
         def __register(func: Callable) -> Callable:
             self._app.add_route(
-                __selector, func, rank=rank, auth_handlers=auth_handlers
+                __selector,
+                func,
+                rank=rank,
+                auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.message_update],
             )
             return func
 
@@ -832,7 +870,11 @@ class TeamsAgentExtension(Generic[StateT]):
 
         def __register(func: Callable) -> Callable:
             self._app.add_route(
-                __selector, func, rank=rank, auth_handlers=auth_handlers
+                __selector,
+                func,
+                rank=rank,
+                auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.message_update],
             )
             return func
 
@@ -858,7 +900,11 @@ class TeamsAgentExtension(Generic[StateT]):
 
         def __register(func: Callable) -> Callable:
             self._app.add_route(
-                __selector, func, rank=rank, auth_handlers=auth_handlers
+                __selector,
+                func,
+                rank=rank,
+                auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.message_delete],
             )
             return func
 
@@ -889,7 +935,12 @@ class TeamsAgentExtension(Generic[StateT]):
                 await func(context, state, receipt)
 
             self._app.add_route(
-                __selector, __handler, rank=rank, auth_handlers=auth_handlers
+                __selector,
+                __handler,
+                rank=rank,
+                auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.event],
+                activity_name="application/vnd.microsoft.readReceipt",
             )
             return func
 
@@ -926,6 +977,8 @@ class TeamsAgentExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="config/fetch",
             )
             return func
 
@@ -960,6 +1013,8 @@ class TeamsAgentExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="config/submit",
             )
             return func
 
@@ -1000,6 +1055,8 @@ class TeamsAgentExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="fileConsent/invoke",
             )
             return func
 
@@ -1038,6 +1095,8 @@ class TeamsAgentExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="fileConsent/invoke",
             )
             return func
 
@@ -1076,6 +1135,8 @@ class TeamsAgentExtension(Generic[StateT]):
                 is_invoke=True,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.invoke],
+                activity_name="actionableMessage/executeAction",
             )
             return func
 
@@ -1104,7 +1165,11 @@ class TeamsAgentExtension(Generic[StateT]):
 
         def __register(func: Callable) -> Callable:
             self._app.add_route(
-                __selector, func, rank=rank, auth_handlers=auth_handlers
+                __selector,
+                func,
+                rank=rank,
+                auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.conversation_update],
             )
             return func
 
@@ -1131,7 +1196,11 @@ class TeamsAgentExtension(Generic[StateT]):
 
         def __register(func: Callable) -> Callable:
             self._app.add_route(
-                __selector, func, rank=rank, auth_handlers=auth_handlers
+                __selector,
+                func,
+                rank=rank,
+                auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.conversation_update],
             )
             return func
 
@@ -1276,7 +1345,11 @@ class TeamsAgentExtension(Generic[StateT]):
 
         def __register(func: Callable) -> Callable:
             self._app.add_route(
-                __selector, func, rank=rank, auth_handlers=auth_handlers
+                __selector,
+                func,
+                rank=rank,
+                auth_handlers=auth_handlers,
+                activity_types=[ActivityTypes.conversation_update],
             )
             return func
 
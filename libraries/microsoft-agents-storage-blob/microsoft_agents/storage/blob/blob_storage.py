@@ -1,19 +1,26 @@
-import json
 from typing import TypeVar
 from io import BytesIO
 
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceModifiedError, ResourceNotFoundError
 from azure.storage.blob.aio import (
     ContainerClient,
     BlobServiceClient,
 )
 
+from microsoft_agents.hosting.core.json_codec import get_json_codec
 from microsoft_agents.hosting.core.storage import StoreItem
 from microsoft_agents.hosting.core.storage.storage import AsyncStorageBase
 from microsoft_agents.hosting.core.storage._type_aliases import JSON
 from microsoft_agents.hosting.core.storage.error_handling import (
+    ETagConflictError,
     ignore_error,
     is_status_code_error,
 )
+from microsoft_agents.hosting.core.storage.store_item import (
+    is_conditional_write,
+    set_e_tag,
+)
 from microsoft_agents.storage.blob.errors import blob_storage_errors
 
 from .blob_storage_config import BlobStorageConfig
@@ -89,13 +96,15 @@ class BlobStorage(AsyncStorageBase):
             return None, None
 
         item_rep: bytes = await item.readall()
-        item_JSON: JSON = json.loads(item_rep)
+        item_JSON: JSON = get_json_codec().loads(item_rep)
         try:
-            return key, target_cls.from_json_to_store_item(item_JSON)
+            store_item = target_cls.from_json_to_store_item(item_JSON)
         except AttributeError as error:
             raise TypeError(
                 f"BlobStorage.read_item(): could not deserialize blob item into {target_cls} class. Error: {error}"
             )
+        set_e_tag(store_item, item.properties.etag)
+        return key, store_item
 
     async def _write_item(self, key: str, item: StoreItem) -> None:
         """Writes an item to blob storage.
@@ -103,21 +112,35 @@ class BlobStorage(AsyncStorageBase):
         :param key: The key under which to store the item.
         :param item: The StoreItem to serialize and store.
         :raises ValueError: If the StoreItem serialization returns None.
+        :raises ETagConflictError: If the item carries an ETag the stored blob no longer has.
         """
         item_JSON: JSON = item.store_item_to_json()
         if item_JSON is None:
             raise ValueError(
                 "BlobStorage.write(): StoreItem serialization cannot return None"
             )
-        item_rep_bytes = json.dumps(item_JSON).encode("utf-8")
+        item_rep_bytes = get_json_codec().dumps(item_JSON)
+
+        kwargs = {}
+        e_tag = getattr(item, "e_tag", None)
+        if is_conditional_write(e_tag):
+            kwargs["etag"] = e_tag
+            kwargs["match_condition"] = MatchConditions.IfNotModified
 
         # getting the length is important for performance with large blobs
-        await self._container_client.upload_blob(
-            name=key,
-            data=BytesIO(item_rep_bytes),
-            overwrite=True,
-            length=len(item_rep_bytes),
-        )
+        try:
+            response = await self._container_client.get_blob_client(key).upload_blob(
+                data=BytesIO(item_rep_bytes),
+                overwrite=True,
+                length=len(item_rep_bytes),
+                **kwargs,
+            )
+        except (ResourceModifiedError, ResourceNotFoundError) as error:
+            if kwargs:
+                raise ETagConflictError(key) from error
+            raise
+        if kwargs:
+            set_e_tag(item, response.get("etag"))
 
     async def _delete_item(self, key: str) -> None:
         """Deletes an item from blob storage.
@@ -1,9 +1,10 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from typing import TypeVar
+from typing import Any, Iterable, TypeVar
 import asyncio
 
+from azure.core import MatchConditions
 from azure.cosmos import (
     documents,
     CosmosDict,
@@ -18,7 +19,15 @@ from azure.cosmos.partition_key import NonePartitionKeyValue
 
 from microsoft_agents.hosting.core.storage import AsyncStorageBase, StoreItem
 from microsoft_agents.hosting.core.storage._type_aliases import JSON
-from microsoft_agents.hosting.core.storage.error_handling import ignore_error
+from microsoft_agents.hosting.core.storage.error_handling import (
+    ETagConflictError,
+    ignore_error,
+)
+from microsoft_agents.hosting.core.storage.store_item import (
+    is_conditional_write,
+    set_e_tag,
+)
+from microsoft_agents.hosting.core.storage.telemetry import spans
 from microsoft_agents.storage.cosmos.errors import storage_errors
 
 from .cosmos_db_storage_config import CosmosDBStorageConfig
@@ -30,6 +39,25 @@ cosmos_resource_not_found = lambda err: isinstance(
     err, cosmos_exceptions.CosmosResourceNotFoundError
 )
 
+# a conditional write fails with 412 if the document changed and 404 if it was deleted
+cosmos_condition_failed = lambda err: isinstance(
+    err,
+    (
+        cosmos_exceptions.CosmosAccessConditionFailedError,
+        cosmos_exceptions.CosmosResourceNotFoundError,
+    ),
+)
+
+# Cosmos DB accepts at most this many operations in a single patch request.
+MAX_PATCH_OPERATIONS = 10
+# ... and at most this many operations in a single transactional batch.
+MAX_BATCH_OPERATIONS = 100
+
+
+def _patch_path(name: str) -> str:
+    """JSON pointer to a top-level property of the stored document."""
+    return "/document/" + name.replace("~", "~0").replace("/", "~1")
+
 
 class CosmosDBStorage(AsyncStorageBase):
     """A CosmosDB based storage provider using partitioning"""
@@ -50,6 +78,8 @@ class CosmosDBStorage(AsyncStorageBase):
         self._compatability_mode_partition_key: bool = False
         # Lock used for synchronizing container creation
         self._lock: asyncio.Lock = asyncio.Lock()
+        # Caps the requests a single read or write keeps in flight
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(config.max_concurrency)
 
     def _create_client(self) -> CosmosClient:
         """Create a CosmosClient based on the configuration.
@@ -116,10 +146,90 @@ class CosmosDBStorage(AsyncStorageBase):
         if read_item_response is None:
             return None, None
 
-        doc: JSON | None = read_item_response.get("document")
+        return read_item_response["realId"], self._to_store_item(
+            read_item_response, target_cls
+        )
+
+    @staticmethod
+    def _to_store_item(
+        response: JSON, target_cls: type[StoreItemT]
+    ) -> StoreItemT | None:
+        """Deserialize a stored document, carrying over its ETag.
+
+        :param response: The Cosmos DB document.
+        :param target_cls: The type of the item to read.
+        :return: The item, or None if the document has no content.
+        """
+        doc: JSON | None = response.get("document")
         if doc is None:
-            return read_item_response["realId"], None
-        return read_item_response["realId"], target_cls.from_json_to_store_item(doc)
+            return None
+        item = target_cls.from_json_to_store_item(doc)
+        set_e_tag(item, response.get("_etag"))
+        return item
+
+    async def read(
+        self, keys: list[str], *, target_cls: type[StoreItemT], **kwargs
+    ) -> dict[str, StoreItemT]:
+        """Read multiple items with a single batched point-read request.
+
+        :param keys: A list of keys to read.
+        :param target_cls: The type of the items to read.
+        :return: A dictionary of key to item for the keys that exist.
+        :raises ValueError: If keys is empty or any key is empty.
+        """
+        if not keys:
+            raise ValueError("Storage.read(): Keys are required when reading.")
+        if "" in keys:
+            raise ValueError(str(storage_errors.CosmosDbKeyCannotBeEmpty))
+
+        with spans.StorageRead(len(keys)):
+            await self.initialize()
+
+            if not hasattr(self._container, "read_items"):
+                # azure-cosmos releases without read_items fall back to point reads
+                items = await asyncio.gather(
+                    *[
+                        self._bounded(self._read_item, key, target_cls=target_cls)
+                        for key in dict.fromkeys(keys)
+                    ]
+                )
+                return {
+                    key: value
+                    for key, value in items
+                    if key is not None and value is not None
+                }
+
+            escaped_keys = dict.fromkeys(self._sanitize(key) for key in keys)
+            docs = await self._container.read_items(
+                items=[
+                    (escaped_key, self._get_partition_key(escaped_key))
+                    for escaped_key in escaped_keys
+                ],
+                max_concurrency=self._config.max_concurrency,
+            )
+            result: dict[str, StoreItemT] = {}
+            for doc in docs:
+                item = self._to_store_item(doc, target_cls)
+                if item is not None:
+                    result[doc["realId"]] = item
+            return result
+
+    def _create_document(self, key: str, item: StoreItem) -> JSON:
+        """Create the Cosmos DB document that stores an item.
+
+        :param key: The key of the item.
+        :param item: The item to store.
+        :return: The document to upsert.
+        :raises ValueError: If the key is empty.
+        """
+        if key == "":
+            raise ValueError(str(storage_errors.CosmosDbKeyCannotBeEmpty))
+
+        return {
+            "id": self._sanitize(key),
+            "realId": key,  # to retrieve the raw key later
+            "document": item.store_item_to_json(),
+        }
 
     async def _write_item(self, key: str, item: StoreItem) -> None:
         """Write an item to the storage.
@@ -127,18 +237,162 @@ class CosmosDBStorage(AsyncStorageBase):
         :param key: The key of the item to write.
         :param item: The item to write.
         :raises ValueError: If the key is empty.
+        :raises ETagConflictError: If the item carries an ETag the stored document no longer has.
+        """
+        await self._upsert(key, item, self._create_document(key, item))
+
+    async def _upsert(self, key: str, item: StoreItem, doc: JSON) -> None:
+        """Upsert a single document, conditionally if the item carries an ETag.
+
+        :param key: The key of the item.
+        :param item: The item being written; a conditional write updates its ETag.
+        :param doc: The document to upsert.
+        :raises ETagConflictError: If the stored document no longer has the item's ETag.
+        """
+        e_tag = getattr(item, "e_tag", None)
+        if not is_conditional_write(e_tag):
+            await self._container.upsert_item(body=doc)
+            return
+
+        try:
+            response = await self._container.upsert_item(
+                body=doc, etag=e_tag, match_condition=MatchConditions.IfNotModified
+            )
+        except cosmos_exceptions.CosmosHttpResponseError as err:
+            if cosmos_condition_failed(err):
+                raise ETagConflictError(key) from err
+            raise
+        set_e_tag(item, response.get("_etag"))
+
+    async def write(self, changes: dict[str, StoreItem]) -> None:
+        """Write multiple items, batching the ones that share a partition.
+
+        Items that share a partition key (all items in compatibility mode) are
+        upserted in transactional batches; the rest, and items carrying an ETag,
+        are upserted individually.
+
+        :param changes: A dictionary of key to item to write.
+        :raises ValueError: If changes is empty or any key is empty.
+        :raises ETagConflictError: If an item carries an ETag the stored document no longer has.
+        """
+        if not changes:
+            raise ValueError("Storage.write(): Changes are required when writing.")
+
+        docs = {key: self._create_document(key, item) for key, item in changes.items()}
+
+        with spans.StorageWrite(len(changes)):
+            await self.initialize()
+
+            tasks = []
+            partitions: dict = {}
+            for key, doc in docs.items():
+                item = changes[key]
+                if is_conditional_write(getattr(item, "e_tag", None)):
+                    tasks.append(self._bounded(self._upsert, key, item, doc))
+                else:
+                    partition_key = self._get_partition_key(doc["id"])
+                    partitions.setdefault(partition_key, []).append((key, item, doc))
+
+            tasks.extend(
+                self._write_partition(partition_key, entries)
+                for partition_key, entries in partitions.items()
+            )
+            await asyncio.gather(*tasks)
+
+    async def _write_partition(
+        self, partition_key, entries: list[tuple[str, StoreItem, JSON]]
+    ) -> None:
+        """Upsert documents that share a partition key.
+
+        :param partition_key: The partition key shared by the documents.
+        :param entries: The keys, items and documents to upsert.
+        """
+        if len(entries) == 1:
+            await self._bounded(self._upsert, *entries[0])
+            return
+
+        docs = [doc for _, _, doc in entries]
+
+        await asyncio.gather(
+            *[
+                self._bounded(
+                    self._container.execute_item_batch,
+                    batch_operations=[
+                        ("upsert", (doc,))
+                        for doc in docs[start : start + MAX_BATCH_OPERATIONS]
+                    ],
+                    partition_key=partition_key,
+                )
+                for start in range(0, len(docs), MAX_BATCH_OPERATIONS)
+            ]
+        )
+
+    async def _bounded(self, request, *args, **kwargs):
+        """Issue a request while holding one of the in-flight request slots."""
+        async with self._semaphore:
+            return await request(*args, **kwargs)
+
+    async def write_delta(
+        self,
+        key: str,
+        updates: dict[str, Any],
+        removals: Iterable[str] = (),
+        *,
+        source: StoreItem | None = None,
+    ) -> bool:
+        """Patch the stored document in place instead of replacing it.
+
+        :param key: The key of the item to update.
+        :param updates: Serialized property values to set on the stored item.
+        :param removals: Names of properties to remove from the stored item.
+        :param source: The item the delta was taken from, whose ETag is checked and refreshed.
+        :return: True if the patch was applied, False if a full write is required
+            (the item does not exist, the delta exceeds the patch operation limit,
+            or the patch was rejected).
+        :raises ValueError: If the key is empty.
+        :raises ETagConflictError: If the stored document no longer has the source's ETag.
         """
         if key == "":
             raise ValueError(str(storage_errors.CosmosDbKeyCannotBeEmpty))
 
-        escaped_key: str = self._sanitize(key)
+        operations = [
+            {"op": "set", "path": _patch_path(name), "value": value}
+            for name, value in updates.items()
+        ]
+        operations.extend(
+            {"op": "remove", "path": _patch_path(name)} for name in removals
+        )
+        if not operations:
+            return True
+        if len(operations) > MAX_PATCH_OPERATIONS:
+            return False
 
-        doc = {
-            "id": escaped_key,
-            "realId": key,  # to retrieve the raw key later
-            "document": item.store_item_to_json(),
-        }
-        await self._container.upsert_item(body=doc)
+        with spans.StorageWrite(1):
+            await self.initialize()
+
+            escaped_key: str = self._sanitize(key)
+            e_tag = getattr(source, "e_tag", None)
+            kwargs = {}
+            if is_conditional_write(e_tag):
+                kwargs["etag"] = e_tag
+                kwargs["match_condition"] = MatchConditions.IfNotModified
+            try:
+                response = await self._container.patch_item(
+                    item=escaped_key,
+                    partition_key=self._get_partition_key(escaped_key),
+                    patch_operations=operations,
+                    **kwargs,
+                )
+            except cosmos_exceptions.CosmosAccessConditionFailedError as err:
+                raise ETagConflictError(key) from err
+            except cosmos_exceptions.CosmosHttpResponseError as err:
+                # not found, or a path that does not exist in the stored document
+                if err.status_code in (400, 404):
+                    return False
+                raise
+            if kwargs:
+                set_e_tag(source, response.get("_etag"))
+            return True
 
     async def _delete_item(self, key: str) -> None:
         """Delete an item from the storage.
@@ -21,6 +21,7 @@ class CosmosDBStorageConfig:
         compatibility_mode: bool = False,
         url: str = "",
         credential: AsyncTokenCredential | None = None,
+        max_concurrency: int | None = None,
         **kwargs,
     ):
         """Create the Config object.
@@ -38,6 +39,8 @@ class CosmosDBStorageConfig:
             max key length of 255.
         :param url: The URL to the CosmosDB resource.
         :param credential: The TokenCredential to use for authentication.
+        :param max_concurrency: The maximum number of requests a single read or write keeps in
+            flight. Defaults to 10.
         :return CosmosDBConfig:
         """
         config_file: str = kwargs.get("filename", "")
@@ -62,6 +65,7 @@ class CosmosDBStorageConfig:
         )
         self.url = url or kwargs.get("url", "")
         self.credential: AsyncTokenCredential | None = credential
+        self.max_concurrency: int = max_concurrency or kwargs.get("max_concurrency", 10)
 
     @staticmethod
     def validate_cosmos_db_config(config: "CosmosDBStorageConfig") -> None:
@@ -74,6 +78,12 @@ class CosmosDBStorageConfig:
             raise ValueError(str(storage_errors.CosmosDbDatabaseIdRequired))
         if not config.container_id:
             raise ValueError(str(storage_errors.CosmosDbContainerIdRequired))
+        if config.max_concurrency < 1:
+            raise ValueError(
+                storage_errors.InvalidConfiguration.format(
+                    "max_concurrency must be at least 1"
+                )
+            )
 
         CosmosDBStorageConfig._validate_suffix(config)
 
@@ -3,6 +3,7 @@ from microsoft_agents.hosting.core import AgentApplication, AgentAuthConfigurati
 from microsoft_agents.hosting.aiohttp import (
     start_agent_process,
     jwt_authorization_middleware,
+    jwt_authorization_warm_up,
     CloudAdapter,
 )
 from aiohttp.web import Request, Response, Application, run_app
@@ -24,6 +25,7 @@ def start_server(
     APP.router.add_post("/api/messages", entry_point)
     APP.router.add_get("/api/messages", lambda _: Response(status=200))
     APP["agent_configuration"] = auth_configuration
+    APP.on_startup.append(jwt_authorization_warm_up)
     APP["agent_app"] = agent_application
     APP["adapter"] = agent_application.adapter
 
@@ -1,6 +1,8 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI, Request
 from dotenv import load_dotenv
@@ -19,6 +21,7 @@ from microsoft_agents.hosting.fastapi import (
     CloudAdapter,
     start_agent_process,
     jwt_authorization_decorator,
+    jwt_authorization_warm_up,
 )
 from microsoft_agents.authentication.msal import MsalConnectionManager
 
@@ -38,7 +41,13 @@ AGENT_APP = AgentApplication[TurnState](
 )
 
 # Create FastAPI app
-app = FastAPI(title="Empty Agent Sample", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await jwt_authorization_warm_up(app)
+    yield
+
+
+app = FastAPI(title="Empty Agent Sample", version="1.0.0", lifespan=lifespan)
 app.state.agent_configuration = (
     CONNECTION_MANAGER.get_default_connection_configuration()
 )
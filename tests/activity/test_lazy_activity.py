@@ -0,0 +1,123 @@
+import copy
+import json
+
+import pytest
+
+from microsoft_agents.activity import (
+    Activity,
+    Attachment,
+    ChannelAccount,
+    LazyActivity,
+    Mention,
+)
+
+ACTIVITY_BODY = {
+    "type": "message",
+    "id": "activity-1",
+    "channelId": "msteams",
+    "serviceUrl": "https://service.url",
+    "text": "<at>Bot</at> hello",
+    "from": {"id": "user-1", "name": "User"},
+    "recipient": {"id": "bot-1", "name": "Bot"},
+    "conversation": {"id": "conversation-1"},
+    "membersAdded": [{"id": "user-2"}],
+    "attachments": [{"contentType": "text/html", "content": "<p>hello</p>"}],
+    "entities": [
+        {"type": "clientInfo", "locale": "en-US"},
+        {"type": "mention", "text": "<at>Bot</at>", "mentioned": {"id": "bot-1"}},
+    ],
+    "channelData": {"tenant": {"id": "tenant-1"}},
+    "value": {"key": "value"},
+}
+
+
+def _dump(activity: Activity) -> dict:
+    return activity.model_dump(mode="json", by_alias=True, exclude_unset=True)
+
+
+class TestLazyActivity:
+    @pytest.fixture
+    def activity(self):
+        return LazyActivity.model_validate_json(json.dumps(ACTIVITY_BODY))
+
+    def test_top_level_fields_are_validated(self, activity):
+        assert isinstance(activity, Activity)
+        assert activity.type == "message"
+        assert activity.text == "<at>Bot</at> hello"
+        assert isinstance(activity.from_property, ChannelAccount)
+        assert activity.conversation.id == "conversation-1"
+        assert activity.channel_data == {"tenant": {"id": "tenant-1"}}
+
+    def test_nested_fields_are_validated_on_first_access(self, activity):
+        assert activity.__dict__["attachments"].raw == ACTIVITY_BODY["attachments"]
+
+        attachments = activity.attachments
+
+        assert isinstance(attachments[0], Attachment)
+        assert activity.attachments is attachments
+        assert isinstance(activity.entities[1], Mention)
+        assert isinstance(activity.members_added[0], ChannelAccount)
+
+    def test_serializes_identically_without_access(self, activity):
+        assert _dump(activity) == ACTIVITY_BODY
+
+    def test_serializes_like_activity_after_access(self, activity):
+        activity.resolve_deferred_fields()
+
+        assert _dump(activity) == _dump(
+            Activity.model_validate_json(json.dumps(ACTIVITY_BODY))
+        )
+
+    def test_python_dump_matches_activity_without_access(self, activity):
+        expected = Activity.model_validate_json(json.dumps(ACTIVITY_BODY))
+
+        assert activity.model_dump() == expected.model_dump()
+        assert activity.model_dump(mode="json") == expected.model_dump(mode="json")
+        assert _dump(activity) == ACTIVITY_BODY
+
+    @pytest.mark.parametrize(
+        "make_copy", [lambda a: a.model_copy(), copy.copy, copy.deepcopy]
+    )
+    def test_copies_validate_fields_independently(self, activity, make_copy):
+        copied = make_copy(activity)
+
+        assert isinstance(copied.entities[1], Mention)
+        assert isinstance(activity.entities[1], Mention)
+        assert isinstance(copied.attachments[0], Attachment)
+        assert isinstance(activity.attachments[0], Attachment)
+
+    def test_mention_helpers(self, activity):
+        assert activity.get_mentions()[0].mentioned.id == "bot-1"
+        assert activity.remove_recipient_mention() == "hello"
+
+    def test_assignment_replaces_deferred_value(self, activity):
+        activity.attachments = [Attachment(content_type="image/png")]
+
+        assert _dump(activity)["attachments"] == [{"contentType": "image/png"}]
+
+    def test_product_info_sets_sub_channel_without_validating_entities(self):
+        body = {
+            **ACTIVITY_BODY,
+            "entities": [{"type": "ProductInfo", "id": "COPILOT"}],
+        }
+
+        activity = LazyActivity.model_validate(body)
+
+        assert activity.channel_id.channel == "msteams"
+        assert activity.channel_id.sub_channel == "COPILOT"
+        assert activity.__dict__["entities"].raw == body["entities"]
+        assert _dump(activity)["entities"] == [{"type": "ProductInfo", "id": "COPILOT"}]
+
+    def test_equality_resolves_deferred_fields(self, activity):
+        other = LazyActivity.model_validate_json(json.dumps(ACTIVITY_BODY))
+        other.attachments
+
+        assert activity == other
+
+    def test_invalid_nested_value_raises_on_access(self):
+        activity = LazyActivity.model_validate(
+            {**ACTIVITY_BODY, "attachments": "not a list"}
+        )
+
+        with pytest.raises(ValueError):
+            activity.attachments
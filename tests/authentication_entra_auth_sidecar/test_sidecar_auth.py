@@ -1,19 +1,26 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import asyncio
+
 import jwt
 import pytest
 
 from datetime import datetime, timedelta, timezone
 
-from microsoft_agents.hosting.core import AgentAuthConfiguration
+from microsoft_agents.hosting.core import AgentAuthConfiguration, MemoryStorage
 from microsoft_agents.authentication.entra_auth_sidecar import SidecarAuth
 from microsoft_agents.authentication.entra_auth_sidecar._models import (
+    SidecarRequestOptions,
     SidecarTokenResult,
 )
 import microsoft_agents.authentication.entra_auth_sidecar.sidecar_auth as sidecar_auth_module
 from microsoft_agents.authentication.entra_auth_sidecar.sidecar_auth import (
+    _StoredSidecarToken,
+)
+from microsoft_agents.authentication.entra_auth_sidecar._token_cache import (
     _CachedToken,
+    _SidecarTokenCache,
 )
 
 
@@ -215,29 +222,206 @@ class TestSidecarAuthCache:
 class TestSidecarAuthCacheEviction:
     """Validate the bounded-cache eviction policy used to cap memory growth."""
 
-    def test_overflow_prunes_expired_entries_first(self, monkeypatch):
-        monkeypatch.setattr(sidecar_auth_module, "_MAX_CACHE_ENTRIES", 2)
-        auth, _ = _make_auth()
+    def _cache(self, max_entries=2):
+        return _SidecarTokenCache(
+            max_entries, timedelta(seconds=30), timedelta(minutes=5)
+        )
+
+    def test_overflow_prunes_expired_entries_first(self):
+        cache = self._cache()
         now = datetime.now(timezone.utc)
-        auth._token_cache["expired-1"] = _CachedToken("t", now - timedelta(seconds=1))
-        auth._token_cache["expired-2"] = _CachedToken("t", now - timedelta(seconds=1))
+        cache.set("expired-1", _CachedToken("t", now - timedelta(seconds=1)))
+        cache.set("expired-2", _CachedToken("t", now - timedelta(seconds=1)))
 
         # Inserting a fresh entry exceeds the bound; expired entries are pruned,
         # so the still-valid entry survives without resorting to eviction.
-        auth._cache_set("fresh", _CachedToken("t", now + timedelta(hours=1)))
+        cache.set("fresh", _CachedToken("t", now + timedelta(hours=1)))
 
-        assert set(auth._token_cache) == {"fresh"}
+        assert cache.keys() == {"fresh"}
 
-    def test_overflow_evicts_nearest_expiry_when_none_expired(self, monkeypatch):
-        monkeypatch.setattr(sidecar_auth_module, "_MAX_CACHE_ENTRIES", 2)
-        auth, _ = _make_auth()
+    def test_overflow_evicts_nearest_expiry_when_none_expired(self):
+        cache = self._cache()
         now = datetime.now(timezone.utc)
-        auth._token_cache["soon"] = _CachedToken("t", now + timedelta(minutes=1))
-        auth._token_cache["later"] = _CachedToken("t", now + timedelta(hours=1))
+        cache.set("soon", _CachedToken("t", now + timedelta(minutes=1)))
+        cache.set("later", _CachedToken("t", now + timedelta(hours=1)))
 
         # Nothing is expired, so the entry closest to expiry is evicted to make
         # room, keeping the longest-lived tokens cached.
-        auth._cache_set("newest", _CachedToken("t", now + timedelta(hours=2)))
+        cache.set("newest", _CachedToken("t", now + timedelta(hours=2)))
+
+        assert cache.keys() == {"later", "newest"}
+
+    def test_replaced_entry_is_evicted_by_its_new_expiry(self):
+        cache = self._cache()
+        now = datetime.now(timezone.utc)
+        cache.set("a", _CachedToken("t", now + timedelta(minutes=1)))
+        cache.set("b", _CachedToken("t", now + timedelta(minutes=30)))
+        cache.set("a", _CachedToken("t2", now + timedelta(hours=1)))
+
+        cache.set("c", _CachedToken("t", now + timedelta(hours=2)))
+
+        assert cache.keys() == {"a", "c"}
+        assert cache.get("a").token == "t2"
+
+    def test_heap_is_compacted_when_entries_are_replaced(self):
+        cache = self._cache(max_entries=10)
+        now = datetime.now(timezone.utc)
+        for i in range(1000):
+            cache.set("key", _CachedToken(f"t{i}", now + timedelta(minutes=i + 1)))
+
+        assert len(cache) == 1
+        assert len(cache._expiry_heap) <= 2 * len(cache) + 64
+
+    def test_many_identities_stay_cached(self):
+        auth, _ = _make_auth()
+        now = datetime.now(timezone.utc)
+        for i in range(sidecar_auth_module._MAX_CACHE_ENTRIES):
+            auth._token_cache.set(
+                f"user-{i}", _CachedToken("t", now + timedelta(minutes=30 + i))
+            )
+
+        assert len(auth._token_cache) == sidecar_auth_module._MAX_CACHE_ENTRIES
+
 
-        assert "soon" not in auth._token_cache
-        assert set(auth._token_cache) == {"later", "newest"}
+class TestSidecarAuthConcurrency:
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_request(self):
+        auth, client = _make_auth()
+        release = asyncio.Event()
+        fetch = client.get_authorization_header_unauthenticated
+
+        async def slow_fetch(service_name, options=None):
+            await release.wait()
+            return await fetch(service_name, options)
+
+        client.get_authorization_header_unauthenticated = slow_fetch
+
+        tasks = [
+            asyncio.create_task(auth.get_agentic_user_token("t", "a", "u", ["s"]))
+            for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        tokens = await asyncio.gather(*tasks)
+
+        assert tokens == ["token"] * 10
+        assert len(client.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_request_is_shared_and_not_cached(self):
+        auth, client = _make_auth()
+        fetch = client.get_authorization_header_unauthenticated
+
+        async def failing_fetch(service_name, options=None):
+            raise RuntimeError("sidecar unavailable")
+
+        client.get_authorization_header_unauthenticated = failing_fetch
+        with pytest.raises(RuntimeError):
+            await auth.get_access_token("https://res", ["s"])
+
+        client.get_authorization_header_unauthenticated = fetch
+        assert await auth.get_access_token("https://res", ["s"]) == "token"
+
+    @pytest.mark.asyncio
+    async def test_token_near_expiry_is_refreshed_in_background(self):
+        counter = {"n": 0}
+
+        def token():
+            counter["n"] += 1
+            exp = datetime.now(timezone.utc) + timedelta(minutes=3)
+            return jwt.encode(
+                {"exp": int(exp.timestamp()), "n": counter["n"]},
+                "x" * 32,
+                algorithm="HS256",
+            )
+
+        auth, client = _make_auth(token=token)
+        first = await auth.get_access_token("https://res", ["s"])
+        key = next(iter(auth._token_cache.keys()))
+        auth._token_cache.get(key).refresh_on = datetime.now(timezone.utc)
+
+        # the cached token is served while it is refreshed
+        assert await auth.get_access_token("https://res", ["s"]) == first
+        await auth._token_cache._fetching.task(key)
+
+        assert len(client.calls) == 2
+        assert await auth.get_access_token("https://res", ["s"]) != first
+        assert len(client.calls) == 2
+
+
+class TestSidecarAuthStorage:
+    def _make_auth(self, storage, token="token"):
+        config = AgentAuthConfiguration(
+            auth_type="EntraAuthSideCar", client_id="blueprint-id"
+        )
+        client = FakeSidecarClient(token=token)
+        return SidecarAuth(config, sidecar_client=client, storage=storage), client
+
+    @pytest.mark.asyncio
+    async def test_replica_warm_starts_from_storage(self):
+        storage = MemoryStorage()
+        first, first_client = self._make_auth(storage)
+        second, second_client = self._make_auth(storage)
+
+        await first.get_agentic_user_token("t", "a", "u", ["s"])
+        token = await second.get_agentic_user_token("t", "a", "u", ["s"])
+
+        assert token == "token"
+        assert len(first_client.calls) == 1
+        assert second_client.calls == []
+
+    @pytest.mark.asyncio
+    async def test_storage_key_does_not_expose_identity(self):
+        storage = MemoryStorage()
+        auth, _ = self._make_auth(storage)
+
+        await auth.get_agentic_user_token("tenant-1", "a", "user@contoso.com", ["s"])
+
+        (key,) = storage._memory.keys()
+        assert "user@contoso.com" not in key
+        assert "tenant-1" not in key
+
+    @pytest.mark.asyncio
+    async def test_expired_stored_token_is_ignored(self):
+        storage = MemoryStorage()
+        auth, client = self._make_auth(storage)
+        cache_key = SidecarAuth._build_cache_key(
+            "default", SidecarRequestOptions(request_app_token=True, scopes=["s"])
+        )
+        await storage.write(
+            {
+                SidecarAuth._storage_key(cache_key): _StoredSidecarToken(
+                    token="stale",
+                    expires_on=datetime.now(timezone.utc) + timedelta(seconds=5),
+                )
+            }
+        )
+
+        assert await auth.get_access_token("https://res", ["s"]) == "token"
+        assert len(client.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_skips_storage(self):
+        storage = MemoryStorage()
+        first, _ = self._make_auth(storage)
+        second, second_client = self._make_auth(storage, token="new")
+
+        await first.get_access_token("https://res", ["s"])
+        token = await second.get_access_token("https://res", ["s"], force_refresh=True)
+
+        assert token == "new"
+        assert len(second_client.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_storage_failures_fall_back_to_sidecar(self):
+        class FailingStorage(MemoryStorage):
+            async def read(self, keys, *, target_cls, **kwargs):
+                raise ConnectionError("storage unavailable")
+
+            async def write(self, changes):
+                raise ConnectionError("storage unavailable")
+
+        auth, client = self._make_auth(FailingStorage())
+
+        assert await auth.get_access_token("https://res", ["s"]) == "token"
+        assert len(client.calls) == 1
@@ -390,6 +390,164 @@ class TestMsalAuthIdentityProxyManager:
             )
 
 
+class TestMsalAuthAgenticTokenCaching:
+    @pytest.fixture
+    def auth(self, mocker):
+        config = AgentAuthConfiguration(
+            client_id="test-client-id",
+            tenant_id="test-tenant-id",
+            client_secret="test-secret",
+        )
+        auth = MsalAuth(config)
+        self.agent_token = "agent-token-1"
+
+        async def fake_get_agentic_application_token(tenant_id, instance_id):
+            return self.agent_token
+
+        mocker.patch.object(
+            auth,
+            "get_agentic_application_token",
+            side_effect=fake_get_agentic_application_token,
+        )
+        return auth
+
+    @pytest.fixture
+    def created_apps(self, mocker):
+        created = []
+
+        def create_app(**kwargs):
+            app = mocker.Mock(spec=ConfidentialClientApplication)
+            app.kwargs = kwargs
+
+            def acquire_token_for_client(scopes, data=None):
+                if data and data.get("grant_type") == "user_fic":
+                    return {
+                        "access_token": f"user-token-{data['user_id']}",
+                        "expires_in": 3600,
+                    }
+                return {"access_token": "instance-token", "expires_in": 3600}
+
+            app.acquire_token_for_client.side_effect = acquire_token_for_client
+            created.append(app)
+            return app
+
+        mocker.patch(
+            "microsoft_agents.authentication.msal.msal_auth.ConfidentialClientApplication",
+            side_effect=create_app,
+        )
+        return created
+
+    @staticmethod
+    def _user_fic_calls(created_apps):
+        return [
+            call
+            for app in created_apps
+            for call in app.acquire_token_for_client.call_args_list
+            if call.kwargs.get("data")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_instance_app_is_reused_with_shared_token_cache(
+        self, auth, created_apps
+    ):
+        await auth.get_agentic_instance_token("test-tenant-id", "instance-1")
+        self.agent_token = "agent-token-2"
+        await auth.get_agentic_instance_token("test-tenant-id", "instance-1")
+
+        assert len(created_apps) == 1
+        instance_app = created_apps[0]
+        assert instance_app.kwargs["client_id"] == "instance-1"
+        assert instance_app.kwargs["token_cache"] is auth._token_cache
+        assert instance_app.acquire_token_for_client.call_count == 2
+        # the client assertion is read when MSAL needs it, so it follows the latest agent token
+        assert instance_app.kwargs["client_credential"]["client_assertion"]() == (
+            "agent-token-2"
+        )
+
+    @pytest.mark.asyncio
+    async def test_instance_apps_are_keyed_by_instance(self, auth, created_apps):
+        await auth.get_agentic_instance_token("test-tenant-id", "instance-1")
+        await auth.get_agentic_instance_token("test-tenant-id", "instance-2")
+
+        assert [app.kwargs["client_id"] for app in created_apps] == [
+            "instance-1",
+            "instance-2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_instance_apps_are_bounded(self, auth, created_apps, mocker):
+        mocker.patch(
+            "microsoft_agents.authentication.msal.msal_auth._MAX_AGENTIC_INSTANCE_APPS",
+            1,
+        )
+
+        await auth.get_agentic_instance_token("test-tenant-id", "instance-1")
+        await auth.get_agentic_instance_token("test-tenant-id", "instance-2")
+        await auth.get_agentic_instance_token("test-tenant-id", "instance-1")
+
+        assert len(created_apps) == 3
+        assert len(auth._agentic_instance_apps) == 1
+
+    @pytest.mark.asyncio
+    async def test_user_token_is_cached_per_user(self, auth, created_apps):
+        first = await auth.get_agentic_user_token(
+            "test-tenant-id", "instance-1", "user-a", ["scope"]
+        )
+        second = await auth.get_agentic_user_token(
+            "test-tenant-id", "instance-1", "user-a", ["scope"]
+        )
+        other_user = await auth.get_agentic_user_token(
+            "test-tenant-id", "instance-1", "user-b", ["scope"]
+        )
+
+        assert first == second == "user-token-user-a"
+        assert other_user == "user-token-user-b"
+        assert len(self._user_fic_calls(created_apps)) == 2
+
+    @pytest.mark.asyncio
+    async def test_user_tokens_are_not_stored_in_msal_cache(self, auth, created_apps):
+        await auth.get_agentic_user_token(
+            "test-tenant-id", "instance-1", "user-a", ["scope"]
+        )
+
+        instance_app, user_app = created_apps
+        assert instance_app.kwargs["token_cache"] is auth._token_cache
+        assert user_app.kwargs["token_cache"] is not auth._token_cache
+        user_app.kwargs["token_cache"].add(
+            {
+                "response": {"access_token": "user-token", "expires_in": 3600},
+                "client_id": "instance-1",
+                "scope": ["scope"],
+                "token_endpoint": "https://login.microsoftonline.com/t/oauth2/v2.0/token",
+            }
+        )
+        assert list(user_app.kwargs["token_cache"].search("AccessToken")) == []
+
+    @pytest.mark.asyncio
+    async def test_user_token_failure_returns_none_and_is_not_cached(
+        self, auth, created_apps, mocker
+    ):
+        mocker.patch.object(
+            auth,
+            "get_agentic_instance_token",
+            return_value=("instance-token", "agent-token"),
+        )
+        mocker.patch(
+            "microsoft_agents.authentication.msal.msal_auth._async_acquire_token_for_client",
+            return_value={"error": "invalid_grant"},
+        )
+
+        for _ in range(2):
+            assert (
+                await auth.get_agentic_user_token(
+                    "test-tenant-id", "instance-1", "user-a", ["scope"]
+                )
+                is None
+            )
+
+        assert auth.token_manager.misses == 2
+
+
 # class TestMsalAuthAgentic:
 
 #     @pytest.mark.asyncio
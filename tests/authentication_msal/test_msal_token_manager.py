@@ -0,0 +1,237 @@
+import asyncio
+
+import pytest
+from msal import ConfidentialClientApplication
+
+from microsoft_agents.authentication.msal import MsalTokenManager
+
+from tests._common.testing_objects import MockMsalAuth
+
+KEY = ("tenant:test.instance:None", ("scope",))
+
+
+class FakeTokenSource:
+    """Issues numbered tokens, optionally waiting to be released."""
+
+    def __init__(self, expires_in: float | None = 3600):
+        self.expires_in = expires_in
+        self.calls = 0
+        self.release: asyncio.Event | None = None
+        self.error: Exception | None = None
+
+    async def acquire(self) -> dict:
+        self.calls += 1
+        if self.release is not None:
+            await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        result = {"access_token": f"token-{self.calls}"}
+        if self.expires_in is not None:
+            result["expires_in"] = self.expires_in
+        return result
+
+
+def _age_token(manager: MsalTokenManager, seconds: float) -> None:
+    entry = manager._tokens[KEY]
+    entry.expires_at -= seconds
+    entry.refresh_at -= seconds
+
+
+class TestMsalTokenManager:
+    @pytest.mark.asyncio
+    async def test_serves_cached_token(self):
+        manager = MsalTokenManager()
+        source = FakeTokenSource()
+
+        first = await manager.get_token(KEY, source.acquire)
+        second = await manager.get_token(KEY, source.acquire)
+
+        assert first == second == "token-1"
+        assert source.calls == 1
+        assert manager.misses == 1
+        assert manager.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_acquisitions(self):
+        manager = MsalTokenManager()
+        source = FakeTokenSource()
+        source.release = asyncio.Event()
+
+        tasks = [
+            asyncio.create_task(manager.get_token(KEY, source.acquire))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        source.release.set()
+        tokens = await asyncio.gather(*tasks)
+
+        assert tokens == ["token-1"] * 5
+        assert source.calls == 1
+        assert manager.coalesced == 4
+
+    @pytest.mark.asyncio
+    async def test_keys_are_cached_separately(self):
+        manager = MsalTokenManager()
+        source = FakeTokenSource()
+
+        await manager.get_token(KEY, source.acquire)
+        other = await manager.get_token(("other",), source.acquire)
+
+        assert other == "token-2"
+
+    @pytest.mark.asyncio
+    async def test_refreshes_in_background_before_expiry(self):
+        manager = MsalTokenManager(refresh_before=240, expiry_buffer=30)
+        source = FakeTokenSource()
+        await manager.get_token(KEY, source.acquire)
+        _age_token(manager, 3400)
+        source.release = asyncio.Event()
+
+        # the cached token is returned without waiting for the refresh
+        assert await manager.get_token(KEY, source.acquire) == "token-1"
+        assert await manager.get_token(KEY, source.acquire) == "token-1"
+        assert manager.refreshes == 1
+
+        source.release.set()
+        await manager._acquiring.task(KEY)
+
+        assert await manager.get_token(KEY, source.acquire) == "token-2"
+        assert source.calls == 2
+        assert manager.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_background_refresh_keeps_cached_token(self):
+        manager = MsalTokenManager()
+        source = FakeTokenSource()
+        await manager.get_token(KEY, source.acquire)
+        _age_token(manager, 3400)
+        source.error = ValueError("failed")
+
+        assert await manager.get_token(KEY, source.acquire) == "token-1"
+        await asyncio.gather(manager._acquiring.task(KEY), return_exceptions=True)
+
+        assert await manager.get_token(KEY, source.acquire) == "token-1"
+
+    @pytest.mark.asyncio
+    async def test_waits_for_acquisition_once_token_is_within_expiry_buffer(self):
+        manager = MsalTokenManager(refresh_before=240, expiry_buffer=30)
+        source = FakeTokenSource()
+        await manager.get_token(KEY, source.acquire)
+        _age_token(manager, 3575)
+
+        assert await manager.get_token(KEY, source.acquire) == "token-2"
+        assert manager.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_bypasses_cache(self):
+        manager = MsalTokenManager()
+        source = FakeTokenSource()
+        await manager.get_token(KEY, source.acquire)
+
+        token = await manager.get_token(KEY, source.acquire, force_refresh=True)
+
+        assert token == "token-2"
+        assert await manager.get_token(KEY, source.acquire) == "token-2"
+
+    @pytest.mark.asyncio
+    async def test_token_without_expiry_is_not_cached(self):
+        manager = MsalTokenManager()
+        source = FakeTokenSource(expires_in=None)
+
+        await manager.get_token(KEY, source.acquire)
+        await manager.get_token(KEY, source.acquire)
+
+        assert source.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_acquisition_error_propagates_to_waiters(self):
+        manager = MsalTokenManager()
+        source = FakeTokenSource()
+        source.error = ValueError("failed")
+
+        with pytest.raises(ValueError):
+            await manager.get_token(KEY, source.acquire)
+
+        assert KEY not in manager._tokens
+        assert manager.acquisitions == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_removes_cached_token(self):
+        manager = MsalTokenManager()
+        source = FakeTokenSource()
+        await manager.get_token(KEY, source.acquire)
+
+        manager.invalidate(KEY)
+
+        assert await manager.get_token(KEY, source.acquire) == "token-2"
+
+    @pytest.mark.asyncio
+    async def test_records_acquisition_latency(self):
+        manager = MsalTokenManager()
+        source = FakeTokenSource()
+
+        assert manager.average_acquisition_ms is None
+        await manager.get_token(KEY, source.acquire)
+
+        assert manager.acquisitions == 1
+        assert manager.last_acquisition_ms >= 0
+        assert manager.average_acquisition_ms == manager.last_acquisition_ms
+
+    def test_refresh_before_must_cover_expiry_buffer(self):
+        with pytest.raises(ValueError):
+            MsalTokenManager(refresh_before=10, expiry_buffer=30)
+
+
+class TestMsalAuthTokenCaching:
+    @pytest.mark.asyncio
+    async def test_get_access_token_reuses_cached_token(self, mocker):
+        mock_auth = MockMsalAuth(
+            mocker,
+            ConfidentialClientApplication,
+            acquire_token_for_client_return={
+                "access_token": "token",
+                "expires_in": 3600,
+            },
+        )
+
+        for _ in range(3):
+            token = await mock_auth.get_access_token(
+                "https://test.api.botframework.com", scopes=["test-scope"]
+            )
+
+        assert token == "token"
+        assert mock_auth.mock_client.acquire_token_for_client.call_count == 1
+        assert mock_auth.token_manager.hits == 2
+
+    @pytest.mark.asyncio
+    async def test_get_access_token_caches_per_scopes(self, mocker):
+        mock_auth = MockMsalAuth(
+            mocker,
+            ConfidentialClientApplication,
+            acquire_token_for_client_return={
+                "access_token": "token",
+                "expires_in": 3600,
+            },
+        )
+
+        await mock_auth.get_access_token(
+            "https://test.api.botframework.com", scopes=["scope-a"]
+        )
+        await mock_auth.get_access_token(
+            "https://test.api.botframework.com", scopes=["scope-b"]
+        )
+
+        assert mock_auth.mock_client.acquire_token_for_client.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_access_token_failure_raises(self, mocker):
+        mock_auth = MockMsalAuth(
+            mocker,
+            ConfidentialClientApplication,
+            acquire_token_for_client_return={"error": "invalid_client"},
+        )
+
+        with pytest.raises(ValueError):
+            await mock_auth.get_access_token(
+                "https://test.api.botframework.com", scopes=["test-scope"]
+            )
@@ -136,3 +136,31 @@ async def test_aiohttp_decorator_converts_http_response():
     assert response.status == 401
     assert _response_json(response) == {"error": "Authorization header not found"}
     authorize.assert_awaited_once_with(None, auth_config)
+
+
+@pytest.mark.asyncio
+@pytest.mark.filterwarnings("ignore::aiohttp.web_exceptions.NotAppKeyWarning")
+async def test_aiohttp_warm_up_prefetches_configured_keys():
+    auth_config = AgentAuthConfiguration()
+    app = web.Application()
+    app["agent_configuration"] = auth_config
+    app.on_startup.append(_jwt_middleware_module.jwt_authorization_warm_up)
+
+    with patch.object(
+        _jwt_middleware_module.JwtTokenValidator, "warm_up", autospec=True
+    ) as warm_up:
+        app.freeze()
+        await app.startup()
+
+    warm_up.assert_awaited_once()
+    assert warm_up.await_args.args[0].configuration is auth_config
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_warm_up_skips_without_configuration():
+    with patch.object(
+        _jwt_middleware_module.JwtTokenValidator, "warm_up", autospec=True
+    ) as warm_up:
+        await _jwt_middleware_module.jwt_authorization_warm_up(web.Application())
+
+    warm_up.assert_not_awaited()
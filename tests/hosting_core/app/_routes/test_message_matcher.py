@@ -0,0 +1,102 @@
+import re
+
+import pytest
+
+from microsoft_agents.hosting.core.app._routes import _MessageMatcher
+
+
+def reference_match(select, text: str) -> bool:
+    items = select if isinstance(select, list) else [select]
+    for item in items:
+        if isinstance(item, re.Pattern):
+            if re.fullmatch(item, text) is not None:
+                return True
+        elif text == item:
+            return True
+    return False
+
+
+SELECTORS = [
+    "hello",
+    re.compile(r"hel+o"),
+    ["bye", re.compile(r"see you.*")],
+    re.compile(r"HELP", re.IGNORECASE),
+    re.compile(r"(\w)\1+"),  # backreference, evaluated on its own
+    re.compile(r"a.b", re.DOTALL),
+    re.compile(r"x  # comment", re.VERBOSE),
+    re.compile(r"hello world|hello"),
+    re.compile(r"(?i)bonjour"),  # inline global flag, evaluated on its own
+    [],
+]
+
+TEXTS = [
+    "hello",
+    "helllo",
+    "bye",
+    "see you later",
+    "help",
+    "HeLp",
+    "aaaa",
+    "a\nb",
+    "x",
+    "hello world",
+    "BONJOUR",
+    "",
+    "nothing",
+]
+
+
+class Test_MessageMatcher:
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_matches_like_individual_selectors(self, text):
+        matcher = _MessageMatcher()
+        entries = [matcher.add(select) for select in SELECTORS]
+
+        for entry, select in zip(entries, SELECTORS):
+            assert matcher.matches(entry, text) == reference_match(select, text)
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_matches_in_reverse_query_order(self, text):
+        matcher = _MessageMatcher()
+        entries = [matcher.add(select) for select in SELECTORS]
+
+        for entry, select in reversed(list(zip(entries, SELECTORS))):
+            assert matcher.matches(entry, text) == reference_match(select, text)
+
+    def test_first_match(self):
+        matcher = _MessageMatcher()
+        matcher.add("bye")
+        matcher.add(re.compile(r"hel+o"))
+        matcher.add("hello")
+
+        assert matcher.first_match("hello") == 1
+        assert matcher.first_match("bye") == 0
+        assert matcher.first_match("other") == -1
+
+    def test_prefix_match_falls_through_to_later_alternative(self):
+        matcher = _MessageMatcher()
+        matcher.add(re.compile(r"hello"))
+        matcher.add(re.compile(r"hello.*"))
+
+        assert matcher.first_match("hello there") == 1
+
+    def test_inline_global_flags_next_to_literal(self):
+        matcher = _MessageMatcher()
+        matcher.add("hi")
+        matcher.add(re.compile(r"(?i)hello"))
+        matcher.add(re.compile(r"(?s)a.b"))
+
+        assert matcher.first_match("HELLO") == 1
+        assert matcher.first_match("a\nb") == 2
+        assert matcher.first_match("hi") == 0
+        assert matcher.first_match("HI") == -1
+
+    def test_add_after_match_recompiles(self):
+        matcher = _MessageMatcher()
+        first = matcher.add("a")
+        assert not matcher.matches(first, "b")
+
+        second = matcher.add("b")
+        assert matcher.matches(second, "b")
+        assert not matcher.matches(first, "b")
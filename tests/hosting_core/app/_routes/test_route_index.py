@@ -0,0 +1,143 @@
+from microsoft_agents.activity import Activity, ActivityTypes, ChannelAccount, RoleTypes
+
+from microsoft_agents.hosting.core import (
+    TurnContext,
+    TurnState,
+    _RouteList,
+    _Route,
+    RouteRank,
+)
+
+
+def selector(context: TurnContext) -> bool:
+    return True
+
+
+async def handler(context: TurnContext, state: TurnState) -> None:
+    pass
+
+
+def make_activity(type: str, name: str = None, agentic: bool = False) -> Activity:
+    role = RoleTypes.agentic_user if agentic else RoleTypes.user
+    activity = Activity(type=type, recipient=ChannelAccount(id="bot", role=role))
+    activity.name = name
+    return activity
+
+
+class Test_RouteIndex:
+
+    def test_untyped_route_is_always_a_candidate(self):
+        route_list = _RouteList()
+        route = _Route(selector, handler)
+        route_list.add_route(route)
+
+        assert route_list.candidates(make_activity("message")) == (route,)
+        assert route_list.candidates(make_activity("event", "custom")) == (route,)
+
+    def test_filters_by_activity_type(self):
+        route_list = _RouteList()
+        message_route = _Route(selector, handler, activity_types=["message"])
+        event_route = _Route(selector, handler, activity_types=[ActivityTypes.event])
+        route_list.add_route(message_route)
+        route_list.add_route(event_route)
+
+        assert route_list.candidates(make_activity("message")) == (message_route,)
+        assert route_list.candidates(make_activity("event")) == (event_route,)
+        assert route_list.candidates(make_activity("typing")) == ()
+
+    def test_filters_by_activity_name(self):
+        route_list = _RouteList()
+        fetch_route = _Route(
+            selector,
+            handler,
+            is_invoke=True,
+            activity_types=["invoke"],
+            activity_name="task/fetch",
+        )
+        submit_route = _Route(
+            selector,
+            handler,
+            is_invoke=True,
+            activity_types=["invoke"],
+            activity_name="task/submit",
+        )
+        any_invoke_route = _Route(selector, handler, activity_types=["invoke"])
+        route_list.add_route(fetch_route)
+        route_list.add_route(submit_route)
+        route_list.add_route(any_invoke_route)
+
+        assert route_list.candidates(make_activity("invoke", "task/fetch")) == (
+            fetch_route,
+            any_invoke_route,
+        )
+        assert route_list.candidates(make_activity("invoke", "other")) == (
+            any_invoke_route,
+        )
+
+    def test_agentic_routes_only_for_agentic_requests(self):
+        route_list = _RouteList()
+        agentic_route = _Route(selector, handler, is_agentic=True)
+        route = _Route(selector, handler)
+        route_list.add_route(agentic_route)
+        route_list.add_route(route)
+
+        assert route_list.candidates(make_activity("message")) == (route,)
+        assert route_list.candidates(make_activity("message", agentic=True)) == (
+            agentic_route,
+            route,
+        )
+
+    def test_candidates_preserve_priority_order(self):
+        route_list = _RouteList()
+        routes = [
+            _Route(selector, handler, rank=RouteRank.LAST, activity_types=["message"]),
+            _Route(selector, handler, rank=RouteRank.FIRST),
+            _Route(selector, handler, is_invoke=True, activity_types=["invoke"]),
+            _Route(selector, handler, activity_types=["message", "event"]),
+        ]
+        for route in routes:
+            route_list.add_route(route)
+
+        expected = tuple(
+            route
+            for route in route_list
+            if route.activity_types is None or "message" in route.activity_types
+        )
+        assert route_list.candidates(make_activity("message")) == expected
+
+    def test_index_is_recompiled_after_registration(self):
+        route_list = _RouteList()
+        first = _Route(selector, handler, activity_types=["message"])
+        route_list.add_route(first)
+        index = route_list.index
+        assert route_list.candidates(make_activity("message")) == (first,)
+
+        second = _Route(selector, handler, rank=RouteRank.FIRST)
+        route_list.add_route(second)
+
+        assert route_list.index is not index
+        assert route_list.candidates(make_activity("message")) == (second, first)
+
+    def test_index_is_reused_between_turns(self):
+        route_list = _RouteList()
+        route_list.add_route(_Route(selector, handler, activity_types=["message"]))
+
+        index = route_list.index
+        route_list.candidates(make_activity("message"))
+        assert route_list.index is index
+
+    def test_unknown_keys_share_a_bucket(self):
+        route_list = _RouteList()
+        route_list.add_route(
+            _Route(
+                selector,
+                handler,
+                activity_types=["invoke"],
+                activity_name="task/fetch",
+            )
+        )
+
+        for i in range(100):
+            route_list.candidates(make_activity(f"type{i}", f"name{i}"))
+
+        assert len(route_list.index._buckets) == 1
@@ -3,7 +3,10 @@ Copyright (c) Microsoft Corporation. All rights reserved.
 Licensed under the MIT License.
 """
 
+import asyncio
+
 import pytest
+from aiohttp import ClientResponseError
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from microsoft_agents.activity import (
@@ -305,6 +308,168 @@ class TestProactiveSendActivity:
             )
 
 
+class TestProactiveSendActivityToConversations:
+    @pytest.fixture
+    def storage(self):
+        return MemoryStorage()
+
+    @pytest.fixture
+    def proactive(self, storage):
+        return Proactive(_make_app(storage=storage), ProactiveOptions())
+
+    def _make_adapter(self, send):
+        adapter = MagicMock()
+
+        async def fake_continue(claims, continuation, callback):
+            ctx = MagicMock()
+            ctx.send_activity = AsyncMock(
+                side_effect=lambda act: send(continuation.conversation.id)
+            )
+            await callback(ctx)
+
+        adapter.continue_conversation_with_claims = AsyncMock(side_effect=fake_continue)
+        return adapter
+
+    @staticmethod
+    def _throttled(retry_after="0"):
+        return ClientResponseError(
+            MagicMock(), (), status=429, headers={"Retry-After": retry_after}
+        )
+
+    async def _collect(self, proactive, adapter, conversations, **kwargs):
+        return [
+            result
+            async for result in proactive.send_activity_to_conversations(
+                adapter,
+                conversations,
+                Activity(type=ActivityTypes.message, text="Hello"),
+                **kwargs,
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sends_to_each_conversation(self, proactive):
+        await proactive.store_conversation(_make_conversation("stored"))
+        adapter = self._make_adapter(lambda conv_id: ResourceResponse(id=conv_id))
+
+        results = await self._collect(
+            proactive, adapter, ["stored", _make_conversation("direct")]
+        )
+
+        assert sorted(r.conversation_id for r in results) == ["direct", "stored"]
+        assert all(r.succeeded and r.response.id == r.conversation_id for r in results)
+
+    @pytest.mark.asyncio
+    async def test_reports_missing_and_failed_conversations(self, proactive):
+        def send(conv_id):
+            raise RuntimeError("channel error")
+
+        results = await self._collect(
+            proactive,
+            self._make_adapter(send),
+            ["no-such-conv", _make_conversation("fails")],
+        )
+
+        by_id = {r.conversation_id: r for r in results}
+        assert isinstance(by_id["no-such-conv"].error, KeyError)
+        assert isinstance(by_id["fails"].error, RuntimeError)
+        assert by_id["fails"].attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_reads_conversation_ids_in_one_request(self, proactive, storage):
+        for conv_id in ("a", "b", "c"):
+            await proactive.store_conversation(_make_conversation(conv_id))
+        adapter = self._make_adapter(lambda conv_id: ResourceResponse(id=conv_id))
+
+        with patch.object(storage, "read", wraps=storage.read) as read:
+            results = await self._collect(proactive, adapter, ["a", "b", "c"])
+
+        assert len(results) == 3
+        read.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_retries_throttled_sends(self, proactive):
+        calls = []
+
+        def send(conv_id):
+            calls.append(conv_id)
+            if len(calls) == 1:
+                raise self._throttled()
+            return ResourceResponse(id=conv_id)
+
+        results = await self._collect(
+            proactive, self._make_adapter(send), [_make_conversation("throttled")]
+        )
+
+        assert results[0].succeeded
+        assert results[0].attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, proactive):
+        def send(conv_id):
+            raise self._throttled()
+
+        results = await self._collect(
+            proactive,
+            self._make_adapter(send),
+            [_make_conversation("throttled")],
+            max_retries=2,
+        )
+
+        assert isinstance(results[0].error, ClientResponseError)
+        assert results[0].attempts == 3
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency_per_service_url(self, proactive):
+        in_flight = 0
+        peak = 0
+
+        async def fake_continue(claims, continuation, callback):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            ctx = MagicMock()
+            ctx.send_activity = AsyncMock(return_value=ResourceResponse(id="r"))
+            await callback(ctx)
+
+        adapter = MagicMock()
+        adapter.continue_conversation_with_claims = AsyncMock(side_effect=fake_continue)
+
+        results = await self._collect(
+            proactive,
+            adapter,
+            [_make_conversation(f"conv-{i}") for i in range(10)],
+            max_concurrency=8,
+            max_concurrency_per_service_url=2,
+        )
+
+        assert len(results) == 10
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_stopping_early_cancels_remaining_sends(self, proactive):
+        adapter = self._make_adapter(lambda conv_id: ResourceResponse(id=conv_id))
+        results = proactive.send_activity_to_conversations(
+            adapter,
+            [_make_conversation(f"conv-{i}") for i in range(100)],
+            Activity(type=ActivityTypes.message, text="Hello"),
+            max_concurrency=2,
+        )
+
+        async for _ in results:
+            break
+        await results.aclose()
+
+        assert adapter.continue_conversation_with_claims.await_count < 100
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self, proactive):
+        with pytest.raises(ValueError):
+            await self._collect(proactive, MagicMock(), [], max_concurrency=0)
+
+
 # ---------------------------------------------------------------------------
 # Continue conversation
 # ---------------------------------------------------------------------------
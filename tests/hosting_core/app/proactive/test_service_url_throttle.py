@@ -0,0 +1,82 @@
+"""
+Copyright (c) Microsoft Corporation. All rights reserved.
+Licensed under the MIT License.
+"""
+
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from aiohttp import ClientResponseError
+
+from microsoft_agents.hosting.core.app.proactive._service_url_throttle import (
+    _ServiceUrlThrottle,
+    _get_retry_after,
+)
+
+
+def _error(status=429, headers=None):
+    return ClientResponseError(MagicMock(), (), status=status, headers=headers)
+
+
+class TestGetRetryAfter:
+    def test_seconds_header(self):
+        assert _get_retry_after(_error(headers={"Retry-After": "5"}), 1) == 5.0
+
+    def test_http_date_header(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        headers = {"Retry-After": format_datetime(retry_at, usegmt=True)}
+
+        assert 25 < _get_retry_after(_error(headers=headers), 1) <= 30
+
+    def test_backs_off_without_header(self):
+        assert _get_retry_after(_error(), 1) == 1.0
+        assert _get_retry_after(_error(), 3) == 4.0
+
+    def test_other_errors_are_not_retried(self):
+        assert _get_retry_after(_error(status=500), 1) is None
+        assert _get_retry_after(RuntimeError(), 1) is None
+
+
+class TestServiceUrlThrottle:
+    @pytest.mark.asyncio
+    async def test_spaces_requests(self, mocker):
+        sleep = mocker.patch(
+            "microsoft_agents.hosting.core.app.proactive._service_url_throttle.asyncio.sleep",
+            new=mocker.AsyncMock(),
+        )
+        mocker.patch(
+            "microsoft_agents.hosting.core.app.proactive._service_url_throttle.time.monotonic",
+            return_value=100.0,
+        )
+        throttle = _ServiceUrlThrottle(2, requests_per_second=4)
+
+        async with throttle:
+            pass
+        async with throttle:
+            pass
+
+        sleep.assert_awaited_once_with(0.25)
+
+    @pytest.mark.asyncio
+    async def test_waits_while_paused(self, mocker):
+        now = mocker.patch(
+            "microsoft_agents.hosting.core.app.proactive._service_url_throttle.time.monotonic",
+            return_value=100.0,
+        )
+
+        async def advance(seconds):
+            now.return_value += seconds
+
+        sleep = mocker.patch(
+            "microsoft_agents.hosting.core.app.proactive._service_url_throttle.asyncio.sleep",
+            side_effect=advance,
+        )
+        throttle = _ServiceUrlThrottle(1)
+        throttle.pause(3)
+
+        async with throttle:
+            pass
+
+        sleep.assert_awaited_once_with(3.0)
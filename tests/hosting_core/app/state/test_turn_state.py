@@ -155,6 +155,22 @@ async def test_turn_state_save_persists_loaded_default_scopes():
     assert conversation_cache.state["topic"] == {"value": "state"}
 
 
+@pytest.mark.asyncio
+async def test_turn_state_load_reads_default_scopes_in_one_request(mocker):
+    storage = MemoryStorage()
+    context = _create_context()
+    conversation_key = ConversationState(storage).get_storage_key(context)
+    await storage.write({conversation_key: CachedAgentState({"topic": "state"})})
+    read = mocker.spy(storage, "read")
+    turn_state = TurnState()
+
+    await turn_state.load(context, storage)
+
+    read.assert_awaited_once()
+    assert turn_state.conversation.get_value("topic") == "state"
+    assert turn_state.user.get_cached_state() is not None
+
+
 def test_turn_state_scope_path_parser():
     assert TurnState._get_scope_and_path("name") == ("temp", "name")
     assert TurnState._get_scope_and_path("scope.name") == ("scope", "name")
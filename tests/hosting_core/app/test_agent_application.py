@@ -16,6 +16,7 @@ from microsoft_agents.hosting.core.app import (
     TurnState,
 )
 from microsoft_agents.hosting.core.app.app_error import ApplicationError
+from microsoft_agents.hosting.core.app.input_file import SpooledInputFile
 from microsoft_agents.hosting.core.app.oauth import Authorization
 from microsoft_agents.hosting.core.header_propagation import HeaderPropagationContext
 from tests._common.testing_objects import TestingConnectionManager as _ConnectionManager
@@ -545,6 +546,29 @@ async def test_on_turn_after_turn_false_still_runs_after_activity_handler():
     assert calls == ["event", "after"]
 
 
+@pytest.mark.asyncio
+async def test_on_turn_closes_spooled_input_files():
+    app = _make_integration_app()
+    file = await SpooledInputFile.from_chunks(
+        _chunks(b"data"), "text/plain", "https://test/file"
+    )
+
+    @app.activity(ActivityTypes.event)
+    async def on_event(ctx, state):
+        state.temp.input_files = [file]
+        raise RuntimeError("handler failed")
+
+    with pytest.raises(RuntimeError):
+        await app.on_turn(StubTurnContext(_make_event_activity()))
+
+    assert file._file.closed
+
+
+async def _chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
 # ---------------------------------------------------------------------------
 # connection_manager property and constructor guard
 # ---------------------------------------------------------------------------
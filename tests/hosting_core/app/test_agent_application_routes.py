@@ -416,3 +416,27 @@ class TestRouteOrdering:
             TurnState(),
         )
         assert self.call_order == ["event", "message"]
+
+    @pytest.mark.asyncio
+    async def test_selectors_for_other_activity_types_are_not_evaluated(self):
+        evaluated: list[str] = []
+
+        def message_selector(context: TurnContext) -> bool:
+            evaluated.append("message")
+            return True
+
+        def event_selector(context: TurnContext) -> bool:
+            evaluated.append("event")
+            return True
+
+        async def handler(context: TurnContext, state: TurnState):
+            self.call_order.append(context.activity.type)
+
+        self.app.add_route(message_selector, handler, activity_types=["message"])
+        self.app.add_route(event_selector, handler, activity_types=["event"])
+
+        await self.app._on_activity(
+            _make_context(_make_activity(type="event")), TurnState()
+        )
+        assert evaluated == ["event"]
+        assert self.call_order == ["event"]
@@ -0,0 +1,205 @@
+"""
+Copyright (c) Microsoft Corporation. All rights reserved.
+Licensed under the MIT License.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from microsoft_agents.activity import Activity, Attachment
+from microsoft_agents.hosting.core.app import (
+    AttachmentDownloader,
+    FileTooLargeError,
+    LazyInputFile,
+    SpooledInputFile,
+)
+from microsoft_agents.hosting.core.authorization import ClaimsIdentity
+
+
+class _Server:
+    def __init__(self):
+        self.requests = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def handler(self, request):
+        self.requests.append(request)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        name = request.match_info["name"]
+        return web.Response(body=name.encode() * 10)
+
+
+@pytest_asyncio.fixture
+async def server():
+    files = _Server()
+    app = web.Application()
+    app.router.add_get("/files/{name}", files.handler)
+    test_server = TestServer(app)
+    await test_server.start_server()
+    files.url = lambda name: str(test_server.make_url(f"/files/{name}"))
+    files.service_url = str(test_server.make_url("/"))
+    yield files
+    await test_server.close()
+
+
+def _context(attachments, service_url="https://service.test/", identity=None):
+    context = MagicMock()
+    context.activity = Activity(
+        type="message", attachments=attachments, service_url=service_url
+    )
+    context.identity = identity
+    return context
+
+
+def _close(files):
+    for file in files:
+        file.close()
+
+
+class TestAttachmentDownloader:
+    @pytest.mark.asyncio
+    async def test_downloads_attachments_in_order(self, server):
+        downloader = AttachmentDownloader()
+        context = _context(
+            [
+                Attachment(content_type="image/png", content_url=server.url("a")),
+                Attachment(content_type="text/html", content_url=server.url("html")),
+                Attachment(content_type="application/vnd.card", content={}),
+                Attachment(content_type="image/jpeg", content_url=server.url("b")),
+            ]
+        )
+        try:
+            files = await downloader.download_files(context)
+        finally:
+            await downloader.close()
+
+        assert [(f.content, f.content_type) for f in files] == [
+            (b"a" * 10, "image/png"),
+            (b"b" * 10, "image/jpeg"),
+        ]
+        assert all(isinstance(f, SpooledInputFile) for f in files)
+        _close(files)
+
+    @pytest.mark.asyncio
+    async def test_large_files_are_kept_on_disk(self, server):
+        downloader = AttachmentDownloader(max_memory_size=5)
+        context = _context(
+            [Attachment(content_type="image/png", content_url=server.url("a"))]
+        )
+        try:
+            [file] = await downloader.download_files(context)
+        finally:
+            await downloader.close()
+
+        assert file._file._rolled
+        assert await file.read() == b"a" * 10
+        file.close()
+
+    @pytest.mark.asyncio
+    async def test_downloads_concurrently_with_bound(self, server):
+        downloader = AttachmentDownloader(max_concurrency=2)
+        context = _context(
+            [
+                Attachment(content_type="image/png", content_url=server.url(str(i)))
+                for i in range(6)
+            ]
+        )
+        try:
+            files = await downloader.download_files(context)
+        finally:
+            await downloader.close()
+
+        assert len(files) == 6
+        assert server.peak == 2
+        _close(files)
+
+    @pytest.mark.asyncio
+    async def test_filters_content_types(self, server):
+        downloader = AttachmentDownloader(content_types=["image/*"])
+        context = _context(
+            [
+                Attachment(content_type="image/png", content_url=server.url("a")),
+                Attachment(content_type="application/pdf", content_url=server.url("b")),
+            ]
+        )
+        try:
+            files = await downloader.download_files(context)
+        finally:
+            await downloader.close()
+
+        assert [f.content_type for f in files] == ["image/png"]
+        assert len(server.requests) == 1
+        _close(files)
+
+    @pytest.mark.asyncio
+    async def test_skips_files_over_size_limit(self, server):
+        downloader = AttachmentDownloader(max_file_size=5)
+        context = _context(
+            [Attachment(content_type="image/png", content_url=server.url("a"))]
+        )
+        try:
+            files = await downloader.download_files(context)
+        finally:
+            await downloader.close()
+
+        assert files == []
+
+    @pytest.mark.asyncio
+    async def test_lazy_files_download_when_used(self, server):
+        downloader = AttachmentDownloader(lazy=True, max_file_size=5)
+        context = _context(
+            [
+                Attachment(content_type="image/png", content_url=server.url("a")),
+                Attachment(content_type="image/png", content_url=server.url("b")),
+            ]
+        )
+        try:
+            files = await downloader.download_files(context)
+            assert all(isinstance(f, LazyInputFile) for f in files)
+            assert server.requests == []
+
+            with pytest.raises(FileTooLargeError):
+                await files[0].download()
+            assert len(server.requests) == 1
+        finally:
+            await downloader.close()
+
+    @pytest.mark.asyncio
+    async def test_token_only_sent_to_service_host(self, server):
+        token_provider = MagicMock()
+        token_provider.get_access_token = AsyncMock(return_value="agent-token")
+        connection_manager = MagicMock()
+        connection_manager.get_token_provider = MagicMock(return_value=token_provider)
+        identity = ClaimsIdentity({"aud": "app-id"}, True)
+        downloader = AttachmentDownloader(connection_manager=connection_manager)
+        attachments = [
+            Attachment(content_type="image/png", content_url=server.url("a"))
+        ]
+        try:
+            _close(
+                await downloader.download_files(
+                    _context(attachments, server.service_url, identity)
+                )
+            )
+            _close(
+                await downloader.download_files(
+                    _context(attachments, "https://other.test/", identity)
+                )
+            )
+        finally:
+            await downloader.close()
+
+        assert server.requests[0].headers["Authorization"] == "Bearer agent-token"
+        assert "Authorization" not in server.requests[1].headers
+
+    def test_invalid_max_concurrency(self):
+        with pytest.raises(ValueError):
+            AttachmentDownloader(max_concurrency=0)
@@ -0,0 +1,119 @@
+"""
+Copyright (c) Microsoft Corporation. All rights reserved.
+Licensed under the MIT License.
+"""
+
+import asyncio
+from tempfile import SpooledTemporaryFile
+
+import pytest
+
+from microsoft_agents.hosting.core.app.input_file import (
+    InputFile,
+    LazyInputFile,
+    SpooledInputFile,
+)
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+class TestInputFile:
+    @pytest.mark.asyncio
+    async def test_iter_content(self):
+        file = InputFile(b"abcdefg", "text/plain", None)
+
+        chunks = [chunk async for chunk in file.iter_content(3)]
+
+        assert chunks == [b"abc", b"def", b"g"]
+
+
+class TestSpooledInputFile:
+    @pytest.mark.asyncio
+    async def test_from_chunks(self):
+        file = await SpooledInputFile.from_chunks(
+            _chunks(b"abc", b"def"), "text/plain", "https://example.test/file"
+        )
+
+        assert file.content == b"abcdef"
+        assert file.size == 6
+        assert file.content_type == "text/plain"
+        assert file.content_url == "https://example.test/file"
+        assert [chunk async for chunk in file.iter_content(4)] == [b"abcd", b"ef"]
+        assert file.open().read() == b"abcdef"
+        file.close()
+
+    @pytest.mark.asyncio
+    async def test_large_content_rolls_over_to_disk(self):
+        file = await SpooledInputFile.from_chunks(
+            _chunks(b"x" * 100, b"y" * 100),
+            "application/octet-stream",
+            max_memory_size=150,
+        )
+
+        assert file._file._rolled
+        assert file.size == 200
+        file.close()
+
+    @pytest.mark.asyncio
+    async def test_disk_io_runs_in_worker_thread(self, mocker):
+        to_thread = mocker.spy(asyncio, "to_thread")
+
+        small = await SpooledInputFile.from_chunks(_chunks(b"abc"), "text/plain")
+        to_thread.assert_not_called()
+
+        file = await SpooledInputFile.from_chunks(
+            _chunks(b"x" * 100, b"y" * 100),
+            "application/octet-stream",
+            max_memory_size=150,
+        )
+        assert to_thread.call_count == 1
+
+        assert await file.read() == b"x" * 100 + b"y" * 100
+        chunks = [chunk async for chunk in file.iter_content(64)]
+        assert b"".join(chunks) == b"x" * 100 + b"y" * 100
+        assert [len(chunk) for chunk in chunks] == [64, 64, 64, 8]
+        assert to_thread.call_count == 4
+        small.close()
+        file.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_closes_file(self, mocker):
+        close = mocker.spy(SpooledTemporaryFile, "close")
+
+        async def failing():
+            yield b"abc"
+            raise RuntimeError("download failed")
+
+        with pytest.raises(RuntimeError):
+            await SpooledInputFile.from_chunks(failing(), "text/plain")
+
+        close.assert_called_once()
+
+    def test_is_an_input_file(self):
+        assert issubclass(SpooledInputFile, InputFile)
+
+
+class TestLazyInputFile:
+    @pytest.mark.asyncio
+    async def test_download_fetches_once(self, mocker):
+        fetch = mocker.Mock(side_effect=lambda chunk_size: _chunks(b"abc", b"def"))
+        file = LazyInputFile(fetch, "text/plain")
+
+        assert not file.is_downloaded
+        with pytest.raises(RuntimeError):
+            file.content
+
+        assert await file.download() == b"abcdef"
+        assert await file.download() == b"abcdef"
+        assert file.content == b"abcdef"
+        fetch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_iter_content_streams_without_keeping_content(self):
+        file = LazyInputFile(lambda chunk_size: _chunks(b"abc", b"def"), "text/plain")
+
+        assert [chunk async for chunk in file.iter_content()] == [b"abc", b"def"]
+        assert not file.is_downloaded
@@ -1,128 +1,214 @@
 import asyncio
-import threading
-import time
+import json
 
 import pytest
-from jwt import PyJWKClient
+from jwt import PyJWKClientConnectionError, PyJWKClientError
+from jwt.algorithms import RSAAlgorithm
 
 from microsoft_agents.hosting.core.authorization.jwt.jwt_token_validator import (
     _JwkClientManager,
 )
 
+from tests._common.jwt_test_utils import generate_rsa_keypair
 
-async def _wait_until_set(event: threading.Event, timeout: float = 1.0) -> None:
-    start = time.monotonic()
-    while not event.is_set():
-        if time.monotonic() - start > timeout:
-            raise AssertionError("Timed out waiting for threading event.")
-        await asyncio.sleep(0.01)
+JWKS_URI = "https://issuer.example.com/keys"
 
 
-class TestJwkClientManager:
-    def test_get_jwk_client_reuses_cache_for_same_uri(self):
-        manager = _JwkClientManager()
-        jwks_uri = "https://issuer.example.com/keys"
+def _jwk(kid: str, use: str | None = "sig") -> dict:
+    _, public_key = generate_rsa_keypair()
+    jwk = json.loads(RSAAlgorithm.to_jwk(public_key))
+    jwk["kid"] = kid
+    if use:
+        jwk["use"] = use
+    return jwk
+
+
+class FakeJwksEndpoint:
+    """Stands in for the network call, serving a key set per URI."""
+
+    def __init__(self, monkeypatch, manager: _JwkClientManager):
+        self.key_sets: dict[str, list[dict]] = {}
+        self.calls: list[str] = []
+        self.error: Exception | None = None
+        self.release: asyncio.Event | None = None
+
+        async def fake_fetch_jwk_set(jwks_uri):
+            self.calls.append(jwks_uri)
+            if self.release is not None:
+                await self.release.wait()
+            if self.error is not None:
+                raise self.error
+            return {"keys": self.key_sets.get(jwks_uri, [])}
+
+        # Only mocked member: the manager's network call.
+        monkeypatch.setattr(manager, "_fetch_jwk_set", fake_fetch_jwk_set)
+
+
+@pytest.fixture
+def manager():
+    return _JwkClientManager(lifespan=300.0, refresh_after=240.0)
+
+
+@pytest.fixture
+def endpoint(monkeypatch, manager):
+    endpoint = FakeJwksEndpoint(monkeypatch, manager)
+    endpoint.key_sets[JWKS_URI] = [_jwk("kid-1"), _jwk("kid-2")]
+    return endpoint
+
 
-        first = manager._get_jwk_client(jwks_uri)
-        second = manager._get_jwk_client(jwks_uri)
+def _age_entry(manager: _JwkClientManager, seconds: float) -> None:
+    manager._cache[JWKS_URI].fetched_at -= seconds
+
+
+class TestJwkClientManager:
+    def test_get_entry_reuses_cache_for_same_uri(self, manager):
+        first = manager._get_entry(JWKS_URI)
+        second = manager._get_entry(JWKS_URI)
 
         assert first is second
         assert len(manager._cache) == 1
 
-    def test_get_jwk_client_creates_distinct_entries_for_distinct_uris(self):
-        manager = _JwkClientManager()
-
-        first = manager._get_jwk_client("https://issuer-a.example.com/keys")
-        second = manager._get_jwk_client("https://issuer-b.example.com/keys")
+    def test_get_entry_creates_distinct_entries_for_distinct_uris(self, manager):
+        first = manager._get_entry("https://issuer-a.example.com/keys")
+        second = manager._get_entry("https://issuer-b.example.com/keys")
 
         assert first is not second
-        assert first.lock is not second.lock
         assert len(manager._cache) == 2
 
     @pytest.mark.asyncio
-    async def test_get_signing_key_calls_pyjwkclient_with_header_kid(self, monkeypatch):
-        manager = _JwkClientManager()
-        jwks_uri = "https://issuer.example.com/keys"
-        seen_kids = []
-        expected_key = object()
+    async def test_get_signing_key_returns_key_matching_header_kid(
+        self, manager, endpoint
+    ):
+        key = await manager.get_signing_key(JWKS_URI, {"kid": "kid-2"})
+
+        assert key.key_id == "kid-2"
+        assert endpoint.calls == [JWKS_URI]
+
+    @pytest.mark.asyncio
+    async def test_get_signing_key_serves_cached_keys(self, manager, endpoint):
+        await manager.get_signing_key(JWKS_URI, {"kid": "kid-1"})
+        await manager.get_signing_key(JWKS_URI, {"kid": "kid-2"})
+
+        assert endpoint.calls == [JWKS_URI]
+
+    @pytest.mark.asyncio
+    async def test_get_signing_key_single_flights_concurrent_fetches(
+        self, manager, endpoint
+    ):
+        endpoint.release = asyncio.Event()
+
+        tasks = [
+            asyncio.create_task(manager.get_signing_key(JWKS_URI, {"kid": kid}))
+            for kid in ("kid-1", "kid-2", "kid-1")
+        ]
+        await asyncio.sleep(0)
+        endpoint.release.set()
+        keys = await asyncio.gather(*tasks)
 
-        def fake_get_signing_key(self, kid):
-            seen_kids.append(kid)
-            return expected_key
+        assert [key.key_id for key in keys] == ["kid-1", "kid-2", "kid-1"]
+        assert endpoint.calls == [JWKS_URI]
 
-        # Only mocked member: PyJWKClient.get_signing_key
-        monkeypatch.setattr(PyJWKClient, "get_signing_key", fake_get_signing_key)
+    @pytest.mark.asyncio
+    async def test_get_signing_key_refetches_for_unknown_kid(self, manager, endpoint):
+        await manager.get_signing_key(JWKS_URI, {"kid": "kid-1"})
+        _age_entry(manager, 60)
+        endpoint.key_sets[JWKS_URI].append(_jwk("kid-3"))
 
-        key = await manager.get_signing_key(jwks_uri, {"kid": "kid-123"})
+        key = await manager.get_signing_key(JWKS_URI, {"kid": "kid-3"})
 
-        assert key is expected_key
-        assert seen_kids == ["kid-123"]
+        assert key.key_id == "kid-3"
+        assert endpoint.calls == [JWKS_URI, JWKS_URI]
 
     @pytest.mark.asyncio
-    async def test_get_signing_key_reuses_same_client_for_same_uri(self, monkeypatch):
-        manager = _JwkClientManager()
-        jwks_uri = "https://issuer.example.com/keys"
-        client_ids = []
+    async def test_get_signing_key_rate_limits_unknown_kid_refetches(
+        self, manager, endpoint
+    ):
+        await manager.get_signing_key(JWKS_URI, {"kid": "kid-1"})
 
-        def fake_get_signing_key(self, kid):
-            client_ids.append(id(self))
-            return {"kid": kid}
+        with pytest.raises(PyJWKClientError):
+            await manager.get_signing_key(JWKS_URI, {"kid": "kid-unknown"})
 
-        # Only mocked member: PyJWKClient.get_signing_key
-        monkeypatch.setattr(PyJWKClient, "get_signing_key", fake_get_signing_key)
+        assert endpoint.calls == [JWKS_URI]
 
-        await manager.get_signing_key(jwks_uri, {"kid": "kid-a"})
-        await manager.get_signing_key(jwks_uri, {"kid": "kid-b"})
+    @pytest.mark.asyncio
+    async def test_get_signing_key_raises_for_kid_missing_after_refetch(
+        self, manager, endpoint
+    ):
+        with pytest.raises(PyJWKClientError):
+            await manager.get_signing_key(JWKS_URI, {"kid": "kid-unknown"})
 
-        assert client_ids[0] == client_ids[1]
-        assert len(manager._cache) == 1
+    @pytest.mark.asyncio
+    async def test_get_signing_key_refreshes_in_background_before_expiry(
+        self, manager, endpoint
+    ):
+        original = await manager.get_signing_key(JWKS_URI, {"kid": "kid-1"})
+        _age_entry(manager, 250)
+        endpoint.release = asyncio.Event()
+
+        # the cached key is served without waiting for the refresh
+        key = await manager.get_signing_key(JWKS_URI, {"kid": "kid-1"})
+        assert key is original
+        await asyncio.sleep(0)
+        assert endpoint.calls == [JWKS_URI, JWKS_URI]
+
+        endpoint.release.set()
+        await manager._refreshing.task(JWKS_URI)
+
+        refreshed = await manager.get_signing_key(JWKS_URI, {"kid": "kid-1"})
+        assert refreshed is not original
+        assert len(endpoint.calls) == 2
 
     @pytest.mark.asyncio
-    async def test_get_signing_key_serializes_concurrent_calls_per_uri(
-        self, monkeypatch
+    async def test_background_refresh_failure_keeps_cached_keys(
+        self, manager, endpoint
     ):
-        manager = _JwkClientManager()
-        jwks_uri = "https://issuer.example.com/keys"
+        original = await manager.get_signing_key(JWKS_URI, {"kid": "kid-1"})
+        _age_entry(manager, 250)
+        endpoint.error = PyJWKClientConnectionError("unreachable")
 
-        first_entered = threading.Event()
-        second_entered = threading.Event()
-        release_first = threading.Event()
+        await manager.get_signing_key(JWKS_URI, {"kid": "kid-1"})
+        await asyncio.gather(manager._refreshing.task(JWKS_URI), return_exceptions=True)
 
-        def fake_get_signing_key(self, kid):
-            if kid == "kid-1":
-                first_entered.set()
-                if not release_first.wait(timeout=2):
-                    raise TimeoutError("First call was not released in time.")
-            elif kid == "kid-2":
-                second_entered.set()
-            return {"kid": kid}
+        assert await manager.get_signing_key(JWKS_URI, {"kid": "kid-1"}) is original
 
-        # Only mocked member: PyJWKClient.get_signing_key
-        monkeypatch.setattr(PyJWKClient, "get_signing_key", fake_get_signing_key)
+    @pytest.mark.asyncio
+    async def test_get_signing_key_refetches_expired_keys(self, manager, endpoint):
+        await manager.get_signing_key(JWKS_URI, {"kid": "kid-1"})
+        _age_entry(manager, 300)
+        endpoint.error = PyJWKClientConnectionError("unreachable")
 
-        first_task = asyncio.create_task(
-            manager.get_signing_key(jwks_uri, {"kid": "kid-1"})
-        )
-        await _wait_until_set(first_entered)
+        with pytest.raises(PyJWKClientConnectionError):
+            await manager.get_signing_key(JWKS_URI, {"kid": "kid-1"})
+
+    @pytest.mark.asyncio
+    async def test_get_signing_key_ignores_encryption_keys(self, manager, endpoint):
+        endpoint.key_sets[JWKS_URI] = [_jwk("kid-1"), _jwk("kid-enc", use="enc")]
 
-        second_task = asyncio.create_task(
-            manager.get_signing_key(jwks_uri, {"kid": "kid-2"})
-        )
+        with pytest.raises(PyJWKClientError):
+            await manager.get_signing_key(JWKS_URI, {"kid": "kid-enc"})
 
-        # If per-URI lock works, second call must not enter get_signing_key yet.
-        await asyncio.sleep(0.05)
-        assert not second_entered.is_set()
+    @pytest.mark.asyncio
+    async def test_prefetch_fetches_every_uri(self, manager, endpoint):
+        other_uri = "https://other.example.com/keys"
+        endpoint.key_sets[other_uri] = [_jwk("kid-other")]
 
-        release_first.set()
-        results = await asyncio.gather(first_task, second_task)
+        await manager.prefetch([JWKS_URI, other_uri, JWKS_URI])
+        key = await manager.get_signing_key(other_uri, {"kid": "kid-other"})
 
-        assert results[0]["kid"] == "kid-1"
-        assert results[1]["kid"] == "kid-2"
-        assert second_entered.is_set()
+        assert key.key_id == "kid-other"
+        assert sorted(endpoint.calls) == sorted([JWKS_URI, other_uri])
 
     @pytest.mark.asyncio
-    async def test_get_signing_key_raises_key_error_when_header_has_no_kid(self):
-        manager = _JwkClientManager()
+    async def test_prefetch_does_not_raise_on_failure(self, manager, endpoint):
+        endpoint.error = PyJWKClientConnectionError("unreachable")
+
+        await manager.prefetch([JWKS_URI])
+
+        assert manager._cache[JWKS_URI].fetched_at is None
 
+    @pytest.mark.asyncio
+    async def test_get_signing_key_raises_key_error_when_header_has_no_kid(
+        self, manager
+    ):
         with pytest.raises(KeyError):
-            await manager.get_signing_key("https://issuer.example.com/keys", {})
+            await manager.get_signing_key(JWKS_URI, {})
@@ -9,6 +9,7 @@ import pytest
 from microsoft_agents.hosting.core import AgentAuthConfiguration
 from microsoft_agents.hosting.core.authorization.jwt.jwt_token_validator import (
     JwtTokenValidator,
+    _ValidatedTokenCache,
 )
 
 from tests._common.jwt_test_utils import (
@@ -885,3 +886,147 @@ class TestJwtTokenValidatorEffectiveTenant:
 
         with pytest.raises(ValueError, match="Invalid issuer"):
             await validator.validate_token(token)
+
+
+class TestJwtTokenValidatorWarmUp:
+    @pytest.mark.asyncio
+    async def test_warm_up_prefetches_configured_jwks_uris(self, monkeypatch):
+        public_tenant = str(uuid.uuid4())
+        gov_tenant = str(uuid.uuid4())
+        config_a = AgentAuthConfiguration(
+            client_id="client-a",
+            tenant_id=public_tenant,
+            connection_name="SERVICE_CONNECTION",
+        )
+        config_b = AgentAuthConfiguration(
+            client_id="client-b",
+            tenant_id=gov_tenant,
+            authority="https://login.microsoftonline.us",
+            connection_name="MCS",
+        )
+        shared_connections = {"SERVICE_CONNECTION": config_a, "MCS": config_b}
+        config_a._connections = shared_connections
+        config_b._connections = shared_connections
+
+        validator = JwtTokenValidator(config_a)
+        prefetched = []
+
+        async def fake_prefetch(jwks_uris):
+            prefetched.extend(jwks_uris)
+
+        monkeypatch.setattr(validator._jwk_client_manager, "prefetch", fake_prefetch)
+
+        await validator.warm_up()
+
+        assert prefetched == [
+            "https://login.botframework.com/v1/.well-known/keys",
+            f"https://login.microsoftonline.com/{public_tenant}/discovery/v2.0/keys",
+            "https://login.botframework.azure.us/v1/.well-known/keys",
+            f"https://login.microsoftonline.us/{gov_tenant}/discovery/v2.0/keys",
+        ]
+
+
+class TestJwtTokenValidatorValidatedTokenCache:
+    @pytest.fixture(autouse=True)
+    def token_cache(self, monkeypatch):
+        cache = _ValidatedTokenCache(max_size=2)
+        monkeypatch.setattr(JwtTokenValidator, "_validated_tokens", cache)
+        return cache
+
+    @staticmethod
+    def _count_signing_key_lookups(monkeypatch, validator, public_key):
+        captured_uris = []
+        _patch_signing_key(monkeypatch, validator, public_key, captured_uris)
+        return captured_uris
+
+    @pytest.mark.asyncio
+    async def test_repeated_token_is_validated_once(self, monkeypatch):
+        private_key, public_key = generate_rsa_keypair()
+        config = AgentAuthConfiguration(client_id="client-1", tenant_id="tenant-1")
+        validator = JwtTokenValidator(config)
+        lookups = self._count_signing_key_lookups(monkeypatch, validator, public_key)
+        token = make_signed_jwt(private_key, {"aud": "client-1"})
+
+        first = await validator.validate_token(token)
+        second = await JwtTokenValidator(config).validate_token(token)
+
+        assert len(lookups) == 1
+        assert second.claims == first.claims
+        assert second.claims is not first.claims
+        assert second.security_token == token
+
+    @pytest.mark.asyncio
+    async def test_cache_is_scoped_to_configuration(self, monkeypatch):
+        private_key, public_key = generate_rsa_keypair()
+        config = AgentAuthConfiguration(client_id="client-1", tenant_id="tenant-1")
+        other_config = AgentAuthConfiguration(
+            client_id="client-2", tenant_id="tenant-1"
+        )
+        token = make_signed_jwt(private_key, {"aud": "client-1"})
+        validator = JwtTokenValidator(config)
+        _patch_signing_key(monkeypatch, validator, public_key)
+        await validator.validate_token(token)
+
+        with pytest.raises(ValueError):
+            await JwtTokenValidator(other_config).validate_token(token)
+
+    @pytest.mark.asyncio
+    async def test_rejected_token_is_not_cached(self, monkeypatch):
+        private_key, public_key = generate_rsa_keypair()
+        config = AgentAuthConfiguration(client_id="client-1", tenant_id="tenant-1")
+        validator = JwtTokenValidator(config)
+        lookups = self._count_signing_key_lookups(monkeypatch, validator, public_key)
+        token = make_signed_jwt(private_key, {"aud": "client-other"})
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await validator.validate_token(token)
+
+        assert len(lookups) == 2
+
+    @pytest.mark.asyncio
+    async def test_token_expiring_within_leeway_is_not_cached(self, monkeypatch):
+        private_key, public_key = generate_rsa_keypair()
+        config = AgentAuthConfiguration(client_id="client-1", tenant_id="tenant-1")
+        validator = JwtTokenValidator(config)
+        lookups = self._count_signing_key_lookups(monkeypatch, validator, public_key)
+        token = make_signed_jwt(private_key, {"aud": "client-1"}, expires_in=-60.0)
+
+        await validator.validate_token(token)
+        await validator.validate_token(token)
+
+        assert len(lookups) == 2
+
+    def test_cached_entry_expires_at_exp(self, monkeypatch, token_cache):
+        config = AgentAuthConfiguration(client_id="client-1", tenant_id="tenant-1")
+        now = 1_000_000.0
+        monkeypatch.setattr(
+            "microsoft_agents.hosting.core.authorization.jwt.jwt_token_validator.time.time",
+            lambda: now,
+        )
+        token_cache.set(config, "token", {"exp": now + 10})
+
+        assert token_cache.get(config, "token") == {"exp": now + 10}
+
+        now += 10
+        assert token_cache.get(config, "token") is None
+
+    def test_token_without_exp_is_not_cached(self, token_cache):
+        config = AgentAuthConfiguration(client_id="client-1", tenant_id="tenant-1")
+
+        token_cache.set(config, "token", {"aud": "client-1"})
+
+        assert token_cache.get(config, "token") is None
+
+    def test_least_recently_used_token_is_evicted(self, token_cache):
+        config = AgentAuthConfiguration(client_id="client-1", tenant_id="tenant-1")
+        claims = {"exp": 4_102_444_800}
+
+        token_cache.set(config, "token-a", claims)
+        token_cache.set(config, "token-b", claims)
+        token_cache.get(config, "token-a")
+        token_cache.set(config, "token-c", claims)
+
+        assert token_cache.get(config, "token-a") == claims
+        assert token_cache.get(config, "token-b") is None
+        assert token_cache.get(config, "token-c") == claims
@@ -0,0 +1,79 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from microsoft_agents.hosting.core.authorization._single_flight import (
+    _SingleFlight,
+    _refresh_time,
+)
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_share_one_fetch(self):
+        flight = _SingleFlight("Test fetch")
+        release = asyncio.Event()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await release.wait()
+            return len(calls)
+
+        waiters = [asyncio.create_task(flight.run("key", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert flight.in_flight("key")
+
+        release.set()
+        assert await asyncio.gather(*waiters) == [1, 1, 1]
+        assert calls == [1]
+        assert not flight.in_flight("key")
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_fetch(self):
+        flight = _SingleFlight("Test fetch")
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "value"
+
+        cancelled = asyncio.create_task(flight.run("key", fetch))
+        waiting = asyncio.create_task(flight.run("key", fetch))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+
+        release.set()
+        assert await waiting == "value"
+        assert cancelled.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_failed_background_fetch_is_logged(self, caplog):
+        flight = _SingleFlight("Test fetch")
+
+        async def fetch():
+            raise ValueError("failed")
+
+        with caplog.at_level(logging.WARNING):
+            task = flight.start("key", fetch)
+            await asyncio.gather(task, return_exceptions=True)
+            await asyncio.sleep(0)
+
+        assert "Test fetch failed: ValueError" in caplog.text
+        assert flight.task("key") is None
+
+
+def test_refresh_time_is_refresh_before_expiry():
+    assert _refresh_time(0.0, 3600.0, 240.0) == 3360.0
+
+
+def test_refresh_time_waits_for_half_the_lifetime():
+    now = datetime.now(timezone.utc)
+    expires_on = now + timedelta(minutes=4)
+
+    assert _refresh_time(now, expires_on, timedelta(minutes=5)) == now + timedelta(
+        minutes=2
+    )
@@ -93,6 +93,33 @@ class TestClientSessionWrapper:
         assert fake_session.calls[0][2]["headers"]["X-Turn"] == "first"
         assert fake_session.calls[1][2]["headers"]["X-Turn"] == "second"
 
+    def test_merges_wrapper_headers_below_request_headers(self):
+        fake_session = _FakeSession()
+        wrapper = _ClientSessionWrapper(
+            cast(ClientSession, fake_session),
+            {"Authorization": "Bearer token", "X-Default": "wrapper-value"},
+        )
+
+        wrapper.get("path", headers={"X-Default": "request-value"})
+
+        assert fake_session.calls[0][2]["headers"] == {
+            "Authorization": "Bearer token",
+            "X-Default": "request-value",
+        }
+
+    @pytest.mark.asyncio
+    async def test_close_leaves_session_it_does_not_own_open(self, mocker):
+        fake_session = _FakeSession()
+        fake_session.close = mocker.AsyncMock()
+
+        await _ClientSessionWrapper(
+            cast(ClientSession, fake_session), owns_session=False
+        ).close()
+        fake_session.close.assert_not_awaited()
+
+        await _ClientSessionWrapper(cast(ClientSession, fake_session)).close()
+        fake_session.close.assert_awaited_once()
+
     def test_delegates_unknown_attributes_to_wrapped_session(self):
         wrapper = _ClientSessionWrapper(cast(ClientSession, _FakeSession()))
 
@@ -0,0 +1,88 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""Tests for ClientSessionPool using aiohttp TestServer."""
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from microsoft_agents.activity import Activity
+from microsoft_agents.hosting.core.connector.client import (
+    ClientSessionPool,
+    ConnectorClient,
+    UserTokenClient,
+)
+
+
+class TestClientSessionPool:
+
+    @pytest.mark.asyncio
+    async def test_reuses_session_per_endpoint(self):
+        pool = ClientSessionPool()
+        try:
+            session = pool.get_session("https://service.test")
+
+            assert pool.get_session("https://service.test/") is session
+            assert pool.get_session("https://other.test/") is not session
+            assert "Authorization" not in session.headers
+        finally:
+            await pool.close()
+
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_replaces_closed_session(self):
+        pool = ClientSessionPool()
+        try:
+            session = pool.get_session("https://service.test/")
+            await session.close()
+
+            assert pool.get_session("https://service.test/") is not session
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_clients_share_session_with_their_own_tokens(self):
+        authorization = []
+
+        async def handler(request):
+            authorization.append(request.headers.get("Authorization"))
+            return web.json_response({"id": "activity-id"})
+
+        app = web.Application()
+        app.router.add_post("/v3/conversations/{conversation_id}/activities", handler)
+        server = TestServer(app)
+        await server.start_server()
+        pool = ClientSessionPool()
+        try:
+            endpoint = str(server.make_url("/"))
+            first = ConnectorClient(endpoint, "first-token", session_pool=pool)
+            second = ConnectorClient(endpoint, "second-token", session_pool=pool)
+
+            for client in (first, second):
+                await client.conversations.send_to_conversation(
+                    "conv-1", Activity(type="message", text="hello")
+                )
+                await client.close()
+
+            assert authorization == ["Bearer first-token", "Bearer second-token"]
+            assert not pool.get_session(endpoint).closed
+        finally:
+            await pool.close()
+            await server.close()
+
+    @pytest.mark.asyncio
+    async def test_user_token_client_uses_pooled_session(self):
+        pool = ClientSessionPool()
+        try:
+            client = UserTokenClient(
+                "https://token.test", "token", app_id="app-id", session_pool=pool
+            )
+            await client.close()
+
+            session = pool.get_session("https://token.test/")
+            assert client.client._session is session
+            assert not session.closed
+        finally:
+            await pool.close()
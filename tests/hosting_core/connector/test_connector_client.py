@@ -3,6 +3,10 @@
 
 """Tests for ConversationsOperations using aiohttp TestServer."""
 
+import json
+from datetime import datetime, timezone
+from io import BytesIO
+
 import pytest
 from aiohttp import ClientResponseError, web, ClientSession
 from aiohttp.test_utils import TestServer
@@ -17,9 +21,11 @@ from microsoft_agents.activity import (
     RoleTypes,
     Transcript,
 )
+from microsoft_agents.hosting.core.connector.attachments_base import AttachmentsBase
 from microsoft_agents.hosting.core.connector.client.connector_client import (
     ConnectorClient,
     ConversationsOperations,
+    normalize_outgoing_activity,
 )
 from microsoft_agents.hosting.core.header_propagation import HeaderPropagationContext
 
@@ -98,6 +104,68 @@ class TestSendToConversation:
             await server.close()
 
 
+class TestOutgoingActivitySerialization:
+    """Tests for the JSON bytes sent as activity request bodies."""
+
+    def test_normalize_outgoing_activity_serializes_to_json_bytes(self):
+        activity = Activity(
+            type="message",
+            text="Hello",
+            from_property=ChannelAccount(id="bot"),
+            channel_data=None,
+        )
+
+        body = normalize_outgoing_activity(activity)
+
+        assert isinstance(body, bytes)
+        assert json.loads(body) == activity.model_dump(
+            by_alias=True, exclude_unset=True, mode="json"
+        )
+        assert json.loads(normalize_outgoing_activity(activity, exclude_none=True)) == {
+            "type": "message",
+            "text": "Hello",
+            "from": {"id": "bot"},
+        }
+
+    def test_normalize_outgoing_activity_passes_through_other_values(self):
+        data = {"type": "message"}
+        assert normalize_outgoing_activity(data) is data
+
+    @pytest.mark.asyncio
+    async def test_update_activity_sends_json_body(self):
+        captured = {}
+
+        async def handler(request):
+            captured["content_type"] = request.content_type
+            captured["body"] = await request.json()
+            return web.json_response({"id": "activity-1"})
+
+        routes = [
+            web.put("/v3/conversations/{conversation_id}/activities/{id}", handler)
+        ]
+        server = TestServer(_create_app(routes))
+        await server.start_server()
+        try:
+            async with ClientSession(base_url=server.make_url("/")) as session:
+                ops = ConversationsOperations(session)
+                activity = Activity(
+                    type="message",
+                    text="edited",
+                    timestamp=datetime(2026, 1, 2, tzinfo=timezone.utc),
+                )
+                result = await ops.update_activity("conv-1", "activity-1", activity)
+
+            assert result.id == "activity-1"
+            assert captured["content_type"] == "application/json"
+            assert captured["body"] == {
+                "type": "message",
+                "text": "edited",
+                "timestamp": "2026-01-02T00:00:00Z",
+            }
+        finally:
+            await server.close()
+
+
 class TestConnectorClientHeaderPropagation:
     """Tests propagated headers through a full ConnectorClient operation."""
 
@@ -370,6 +438,64 @@ class TestConnectorClientContract:
         assert info.views == [{"viewId": "original"}]
         assert content.read() == b"attachment bytes"
 
+    @pytest.mark.asyncio
+    async def test_stream_attachment_yields_chunks(self):
+        body = bytes(range(256)) * 1000
+
+        async def content_handler(request):
+            return web.Response(body=body)
+
+        app = _create_app(
+            [
+                web.get(
+                    "/v3/attachments/{attachment_id}/views/{view_id}",
+                    content_handler,
+                )
+            ]
+        )
+        server = TestServer(app)
+        await server.start_server()
+        client = ConnectorClient(str(server.make_url("/")), token="")
+        try:
+            chunks = [
+                chunk
+                async for chunk in client.attachments.stream_attachment(
+                    "attachment-1", "original", chunk_size=1024
+                )
+            ]
+        finally:
+            await client.close()
+            await server.close()
+
+        assert b"".join(chunks) == body
+        assert max(len(chunk) for chunk in chunks) <= 1024
+
+    @pytest.mark.asyncio
+    async def test_stream_attachment_error_status_raises(self):
+        async def content_handler(request):
+            return web.Response(status=404)
+
+        app = _create_app(
+            [
+                web.get(
+                    "/v3/attachments/{attachment_id}/views/{view_id}",
+                    content_handler,
+                )
+            ]
+        )
+        server = TestServer(app)
+        await server.start_server()
+        client = ConnectorClient(str(server.make_url("/")), token="")
+        try:
+            with pytest.raises(ClientResponseError):
+                async for _ in client.attachments.stream_attachment(
+                    "attachment-1", "original"
+                ):
+                    pass
+        finally:
+            await client.close()
+            await server.close()
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize("status", [302, 400, 500])
     async def test_unexpected_response_status_raises_client_response_error(
@@ -701,3 +827,25 @@ class TestReplyToActivityUrlEncoding:
             assert "conv_sub_id" in captured["raw_path"]
         finally:
             await server.close()
+
+
+class _BufferedAttachments(AttachmentsBase):
+    """An AttachmentsBase implementation predating stream_attachment."""
+
+    async def get_attachment_info(self, attachment_id):
+        raise NotImplementedError()
+
+    async def get_attachment(self, attachment_id, view_id):
+        return BytesIO(b"abcdefg")
+
+
+class TestAttachmentsBase:
+    @pytest.mark.asyncio
+    async def test_stream_attachment_defaults_to_get_attachment(self):
+        attachments = _BufferedAttachments()
+
+        chunks = [
+            chunk async for chunk in attachments.stream_attachment("id", "original", 3)
+        ]
+
+        assert chunks == [b"abc", b"def", b"g"]
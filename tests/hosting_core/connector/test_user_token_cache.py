@@ -0,0 +1,284 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from microsoft_agents.activity import (
+    Activity,
+    ChannelAccount,
+    ConversationAccount,
+    TokenExchangeRequest,
+    TokenResponse,
+)
+from microsoft_agents.hosting.core import MemoryStorage
+from microsoft_agents.hosting.core.connector.client import (
+    UserTokenCache,
+    UserTokenClient,
+)
+
+
+def _expiration(seconds: float) -> str:
+    return (datetime.now(timezone.utc) + timedelta(seconds=seconds)).isoformat()
+
+
+def _token(token="user-token", seconds=3600.0) -> TokenResponse:
+    return TokenResponse(
+        token=token, connection_name="connection", expiration=_expiration(seconds)
+    )
+
+
+class TestUserTokenCache:
+    @pytest.mark.asyncio
+    async def test_returns_cached_token(self):
+        cache = UserTokenCache()
+        await cache.set("user", "connection", "msteams", _token())
+
+        cached = await cache.get("user", "connection", "msteams")
+
+        assert cached.token == "user-token"
+
+    @pytest.mark.asyncio
+    async def test_keys_by_user_connection_channel_and_app(self):
+        cache = UserTokenCache()
+        await cache.set("user", "connection", "msteams", _token(), app_id="app")
+
+        assert await cache.get("user", "connection", "msteams", app_id="app")
+        assert await cache.get("other", "connection", "msteams", app_id="app") is None
+        assert await cache.get("user", "other", "msteams", app_id="app") is None
+        assert await cache.get("user", "connection", "webchat", app_id="app") is None
+        assert await cache.get("user", "connection", "msteams", app_id="other") is None
+
+    @pytest.mark.asyncio
+    async def test_sub_channels_share_the_base_channel(self):
+        cache = UserTokenCache()
+        await cache.set("user", "connection", "msteams:COPILOT", _token())
+
+        assert await cache.get("user", "connection", "msteams")
+
+    @pytest.mark.asyncio
+    async def test_token_near_expiry_is_not_served(self):
+        cache = UserTokenCache(expiry_buffer=300)
+        await cache.set("user", "connection", "msteams", _token(seconds=600))
+        await cache.set("user", "near", "msteams", _token(seconds=60))
+
+        assert await cache.get("user", "connection", "msteams")
+        assert await cache.get("user", "near", "msteams") is None
+
+    @pytest.mark.asyncio
+    async def test_expiry_falls_back_to_jwt_exp(self):
+        cache = UserTokenCache()
+        token = jwt.encode({"exp": int(time.time()) + 3600}, "x" * 32, "HS256")
+        await cache.set("user", "connection", "msteams", TokenResponse(token=token))
+
+        assert (await cache.get("user", "connection", "msteams")).token == token
+
+    @pytest.mark.asyncio
+    async def test_token_without_expiry_is_not_cached(self):
+        cache = UserTokenCache()
+        await cache.set("user", "connection", "msteams", TokenResponse(token="opaque"))
+
+        assert await cache.get("user", "connection", "msteams") is None
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_one_connection(self):
+        cache = UserTokenCache()
+        await cache.set("user", "a", "msteams", _token("a"))
+        await cache.set("user", "b", "msteams", _token("b"))
+
+        await cache.delete("user", "a", "msteams")
+
+        assert await cache.get("user", "a", "msteams") is None
+        assert (await cache.get("user", "b", "msteams")).token == "b"
+
+    @pytest.mark.asyncio
+    async def test_delete_without_connection_removes_every_connection(self):
+        cache = UserTokenCache()
+        await cache.set("user", "a", "msteams", _token("a"))
+        await cache.set("user", "b", "msteams", _token("b"))
+
+        await cache.delete("user", None, "msteams")
+
+        assert await cache.get("user", "a", "msteams") is None
+        assert await cache.get("user", "b", "msteams") is None
+
+    @pytest.mark.asyncio
+    async def test_shared_storage_is_used_across_caches(self):
+        storage = MemoryStorage()
+        await UserTokenCache(storage).set("user", "connection", "msteams", _token())
+
+        cached = await UserTokenCache(storage).get("user", "connection", "msteams")
+
+        assert cached.token == "user-token"
+
+    @pytest.mark.asyncio
+    async def test_storage_read_failure_is_a_miss(self):
+        class FailingStorage(MemoryStorage):
+            async def read(self, keys, *, target_cls, **kwargs):
+                raise ConnectionError("storage unavailable")
+
+        cache = UserTokenCache(FailingStorage())
+        await cache.set("user", "connection", "msteams", _token())
+
+        assert await cache.get("user", "connection", "msteams") is None
+
+    def test_negative_expiry_buffer_is_rejected(self):
+        with pytest.raises(ValueError):
+            UserTokenCache(expiry_buffer=-1)
+
+
+class FakeTokenService:
+    """A local token service counting the requests it receives."""
+
+    def __init__(self):
+        self.requests: list[str] = []
+        self.expiration = _expiration(3600)
+
+    async def handler(self, request):
+        path = request.path.lower()
+        self.requests.append(path.rsplit("/", 1)[-1])
+        token = {
+            "token": "user-token",
+            "connectionName": "connection",
+            "expiration": self.expiration,
+        }
+        if path.endswith("/gettokenorsigninresource"):
+            return web.json_response({"tokenResponse": token})
+        if path.endswith("/gettoken") or path.endswith("/exchange"):
+            return web.json_response(token)
+        if path.endswith("/signout"):
+            return web.Response(status=204)
+        raise AssertionError(f"Unexpected token operation: {request.path}")
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self.handler)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.server.close()
+
+    def client(self, cache: UserTokenCache) -> UserTokenClient:
+        return UserTokenClient(
+            str(self.server.make_url("/")),
+            token="",
+            app_id="app-id",
+            token_cache=cache,
+        )
+
+
+def _activity() -> Activity:
+    return Activity(
+        type="message",
+        channel_id="msteams",
+        from_property=ChannelAccount(id="user-1"),
+        recipient=ChannelAccount(id="agent"),
+        conversation=ConversationAccount(id="conversation"),
+        service_url="https://service.example.com",
+    )
+
+
+class TestUserTokenClientCache:
+    @pytest.mark.asyncio
+    async def test_get_user_token_is_served_from_cache(self):
+        cache = UserTokenCache()
+        async with FakeTokenService() as service:
+            for _ in range(3):
+                client = service.client(cache)
+                try:
+                    token = await client.get_user_token(
+                        "user-1", "connection", "msteams"
+                    )
+                finally:
+                    await client.close()
+
+        assert token.token == "user-token"
+        assert service.requests == ["gettoken"]
+
+    @pytest.mark.asyncio
+    async def test_magic_code_bypasses_cache(self):
+        cache = UserTokenCache()
+        await cache.set("user-1", "connection", "msteams", _token(), app_id="app-id")
+        async with FakeTokenService() as service:
+            client = service.client(cache)
+            try:
+                await client.get_user_token(
+                    "user-1", "connection", "msteams", magic_code="123456"
+                )
+            finally:
+                await client.close()
+
+        assert service.requests == ["gettoken"]
+
+    @pytest.mark.asyncio
+    async def test_token_or_sign_in_resource_is_served_from_cache(self):
+        cache = UserTokenCache()
+        async with FakeTokenService() as service:
+            client = service.client(cache)
+            try:
+                first = await client.get_token_or_sign_in_resource(
+                    "connection", _activity()
+                )
+                second = await client.get_token_or_sign_in_resource(
+                    "connection", _activity()
+                )
+                token = await client.get_user_token("user-1", "connection", "msteams")
+            finally:
+                await client.close()
+
+        assert first.token_response.token == second.token_response.token
+        assert token.token == "user-token"
+        assert service.requests == ["gettokenorsigninresource"]
+
+    @pytest.mark.asyncio
+    async def test_exchanged_token_is_cached(self):
+        cache = UserTokenCache()
+        async with FakeTokenService() as service:
+            client = service.client(cache)
+            try:
+                await client.exchange_token(
+                    "user-1",
+                    "connection",
+                    "msteams",
+                    TokenExchangeRequest(token="sso-token"),
+                )
+                await client.get_user_token("user-1", "connection", "msteams")
+            finally:
+                await client.close()
+
+        assert service.requests == ["exchange"]
+
+    @pytest.mark.asyncio
+    async def test_sign_out_invalidates_cached_token(self):
+        cache = UserTokenCache()
+        async with FakeTokenService() as service:
+            client = service.client(cache)
+            try:
+                await client.get_user_token("user-1", "connection", "msteams")
+                await client.sign_out_user("user-1", "connection", "msteams")
+                await client.get_user_token("user-1", "connection", "msteams")
+            finally:
+                await client.close()
+
+        assert service.requests == ["gettoken", "signout", "gettoken"]
+
+    @pytest.mark.asyncio
+    async def test_expiring_token_is_fetched_again(self):
+        cache = UserTokenCache(expiry_buffer=300)
+        async with FakeTokenService() as service:
+            service.expiration = _expiration(60)
+            client = service.client(cache)
+            try:
+                await client.get_user_token("user-1", "connection", "msteams")
+                await client.get_user_token("user-1", "connection", "msteams")
+            finally:
+                await client.close()
+
+        assert service.requests == ["gettoken", "gettoken"]
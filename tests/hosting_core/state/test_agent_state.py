@@ -16,7 +16,12 @@ from microsoft_agents.hosting.core.state.agent_state import (
 from microsoft_agents.hosting.core.state.user_state import UserState
 from microsoft_agents.hosting.core.app.state.conversation_state import ConversationState
 from microsoft_agents.hosting.core.turn_context import TurnContext
-from microsoft_agents.hosting.core.storage import Storage, StoreItem, MemoryStorage
+from microsoft_agents.hosting.core.storage import (
+    ETagConflictError,
+    MemoryStorage,
+    Storage,
+    StoreItem,
+)
 from microsoft_agents.activity import (
     Activity,
     ActivityTypes,
@@ -491,3 +496,202 @@ class TestAgentState:
             elif not isinstance(invalid_name, str):
                 with pytest.raises((TypeError, ValueError)):
                     self.user_state.create_property(invalid_name)
+
+
+class TestAgentStateChangeTracking:
+    """Tests for AgentState with track_changes enabled."""
+
+    def setup_method(self):
+        self.storage = MemoryStorage()
+        self.user_state = UserState(self.storage, track_changes=True)
+        self.adapter = MockTestingAdapter()
+        self.activity = Activity(
+            type=ActivityTypes.message,
+            channel_id="test-channel",
+            conversation=ConversationAccount(id="test-conversation"),
+            from_property=ChannelAccount(id="test-user"),
+            text="test message",
+        )
+        self.context = TurnContext(self.adapter, self.activity)
+
+    @pytest.mark.asyncio
+    async def test_load_does_not_hash(self, mocker):
+        await self.storage.write(
+            {"test-channel/users/test-user": CachedAgentState({"a": 1})}
+        )
+        compute_hash = mocker.spy(CachedAgentState, "compute_hash")
+
+        await self.user_state.load(self.context)
+        cached_state = self.user_state.get_cached_state()
+
+        assert cached_state.tracks_changes
+        assert cached_state.state == {"a": 1}
+        assert not cached_state.is_changed
+        compute_hash.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_without_changes_skips_write(self):
+        await self.user_state.load(self.context)
+        storage_mock = MagicMock(spec=Storage)
+        storage_mock.write = AsyncMock()
+        self.user_state._storage = storage_mock
+
+        await self.user_state.save(self.context)
+        storage_mock.write.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_set_records_changed_property(self):
+        await self.user_state.load(self.context)
+        accessor = self.user_state.create_property("test_property")
+        await accessor.set(self.context, _MockTestDataItem("changed_value"))
+
+        cached_state = self.user_state.get_cached_state()
+        assert cached_state.is_changed
+        assert cached_state.changed_properties == {"test_property"}
+
+        await self.user_state.save(self.context)
+        assert not cached_state.is_changed
+        assert cached_state.changed_properties == frozenset()
+
+        fresh_context = TurnContext(self.adapter, self.activity)
+        await self.user_state.load(fresh_context)
+        value = await self.user_state.create_property("test_property").get(
+            fresh_context, target_cls=_MockTestDataItem
+        )
+        assert value.value == "changed_value"
+
+    @pytest.mark.asyncio
+    async def test_direct_dict_writes_are_recorded(self):
+        await self.user_state.load(self.context)
+        state = self.user_state.get()
+
+        state["a"] = 1
+        state.update(b=2)
+        state.setdefault("c", 3)
+        state.pop("missing", None)
+
+        assert self.user_state.get_cached_state().changed_properties == {
+            "a",
+            "b",
+            "c",
+        }
+
+    @pytest.mark.asyncio
+    async def test_delete_records_changed_property(self):
+        await self.storage.write(
+            {"test-channel/users/test-user": CachedAgentState({"a": 1})}
+        )
+        await self.user_state.load(self.context)
+
+        await self.user_state.create_property("a").delete(self.context)
+
+        assert self.user_state.get_cached_state().changed_properties == {"a"}
+
+    @pytest.mark.asyncio
+    async def test_clear_forces_write(self):
+        await self.user_state.load(self.context)
+        self.user_state.clear()
+
+        cached_state = self.user_state.get_cached_state()
+        assert cached_state.is_changed
+        assert cached_state.changed_properties is None
+
+    @pytest.mark.asyncio
+    async def test_save_writes_delta_for_partial_change(self, mocker):
+        await self.storage.write(
+            {"test-channel/users/test-user": CachedAgentState({"a": 1, "b": 2, "c": 3})}
+        )
+        await self.user_state.load(self.context)
+        write = mocker.spy(self.storage, "write")
+        write_delta = mocker.spy(self.storage, "write_delta")
+
+        state = self.user_state.get()
+        state["a"] = 10
+        del state["c"]
+        await self.user_state.save(self.context)
+
+        write.assert_not_called()
+        write_delta.assert_awaited_once_with(
+            "test-channel/users/test-user",
+            {"a": 10},
+            ["c"],
+            source=self.user_state.get_cached_state(),
+        )
+        assert self.storage._memory["test-channel/users/test-user"] == {
+            "a": 10,
+            "b": 2,
+        }
+        assert not self.user_state.get_cached_state().is_changed
+
+    @pytest.mark.asyncio
+    async def test_save_falls_back_to_full_write(self):
+        await self.storage.write(
+            {"test-channel/users/test-user": CachedAgentState({"a": 1, "b": 2})}
+        )
+        await self.user_state.load(self.context)
+        storage_mock = MagicMock(spec=Storage)
+        storage_mock.write = AsyncMock()
+        storage_mock.write_delta = AsyncMock(return_value=False)
+        self.user_state._storage = storage_mock
+
+        self.user_state.get()["a"] = 10
+        await self.user_state.save(self.context)
+
+        storage_mock.write_delta.assert_awaited_once()
+        storage_mock.write.assert_awaited_once()
+        assert not self.user_state.get_cached_state().is_changed
+
+
+class TestAgentStateConcurrency:
+    """Tests for AgentState saves against a storage with ETags."""
+
+    def setup_method(self):
+        self.storage = MemoryStorage()
+        self.activity = Activity(
+            type=ActivityTypes.message,
+            channel_id="test-channel",
+            conversation=ConversationAccount(id="test-conversation"),
+            from_property=ChannelAccount(id="test-user"),
+            text="test message",
+        )
+
+    def create_context(self):
+        return TurnContext(MockTestingAdapter(), self.activity)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_save_raises_conflict(self):
+        await self.storage.write(
+            {"test-channel/users/test-user": CachedAgentState({"a": 1})}
+        )
+        first = UserState(self.storage, optimistic_concurrency=True)
+        second = UserState(self.storage, optimistic_concurrency=True)
+        first_context, second_context = self.create_context(), self.create_context()
+        await first.load(first_context)
+        await second.load(second_context)
+
+        first.get()["a"] = 2
+        await first.save(first_context)
+        first.get()["a"] = 3
+        await first.save(first_context)
+
+        second.get()["a"] = 4
+        with pytest.raises(ETagConflictError):
+            await second.save(second_context)
+        assert self.storage._memory["test-channel/users/test-user"] == {"a": 3}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_save_last_write_wins_by_default(self):
+        await self.storage.write(
+            {"test-channel/users/test-user": CachedAgentState({"a": 1})}
+        )
+        first, second = UserState(self.storage), UserState(self.storage)
+        first_context, second_context = self.create_context(), self.create_context()
+        await first.load(first_context)
+        await second.load(second_context)
+
+        first.get()["a"] = 2
+        await first.save(first_context)
+
+        second.get()["a"] = 3
+        await second.save(second_context)
+        assert self.storage._memory["test-channel/users/test-user"] == {"a": 3}
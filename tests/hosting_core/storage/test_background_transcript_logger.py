@@ -0,0 +1,249 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+
+import pytest
+
+from microsoft_agents.activity import Activity, ConversationAccount
+from microsoft_agents.hosting.core.authorization.claims_identity import ClaimsIdentity
+from microsoft_agents.hosting.core.storage import (
+    BackgroundTranscriptLogger,
+    TranscriptLogger,
+    TranscriptLoggerMiddleware,
+    TranscriptOverflowPolicy,
+)
+from microsoft_agents.hosting.core.storage.transcript.transcript_memory_store import (
+    TranscriptMemoryStore,
+)
+
+from tests._common.testing_objects.adapters.mock_testing_adapter import (
+    MockTestingAdapter,
+)
+
+
+class RecordingTranscriptLogger(TranscriptLogger):
+    """Records the batches it is asked to write, optionally waiting to be released."""
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+        self.release: asyncio.Event | None = None
+        self.error: Exception | None = None
+
+    async def log_activity(self, activity: Activity) -> None:
+        await self.log_activities([activity])
+
+    async def log_activities(self, activities: list[Activity]) -> None:
+        if self.release is not None:
+            await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        self.batches.append([activity.text for activity in activities])
+
+
+def _activities(*texts: str) -> list[Activity]:
+    return [Activity(type="message", text=text) for text in texts]
+
+
+class TestBackgroundTranscriptLogger:
+    @pytest.mark.asyncio
+    async def test_writes_queued_activities_in_batches(self):
+        inner = RecordingTranscriptLogger()
+        background = BackgroundTranscriptLogger(inner, batch_size=2)
+
+        await background.log_activities(_activities("a", "b", "c"))
+        await background.flush()
+
+        assert inner.batches == [["a", "b"], ["c"]]
+        await background.close()
+
+    @pytest.mark.asyncio
+    async def test_logging_does_not_wait_for_the_write(self):
+        inner = RecordingTranscriptLogger()
+        inner.release = asyncio.Event()
+        background = BackgroundTranscriptLogger(inner)
+
+        await asyncio.wait_for(background.log_activities(_activities("a")), 1)
+        assert inner.batches == []
+
+        inner.release.set()
+        await background.flush()
+        assert inner.batches == [["a"]]
+        await background.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_waits_up_to_flush_interval(self):
+        inner = RecordingTranscriptLogger()
+        background = BackgroundTranscriptLogger(inner, flush_interval=0.05)
+
+        await background.log_activity(_activities("a")[0])
+        await asyncio.sleep(0)
+        await background.log_activity(_activities("b")[0])
+        await asyncio.sleep(0.1)
+
+        assert inner.batches == [["a", "b"]]
+        await background.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_does_not_wait_for_flush_interval(self):
+        inner = RecordingTranscriptLogger()
+        background = BackgroundTranscriptLogger(inner, flush_interval=60)
+
+        await background.log_activity(_activities("a")[0])
+        await asyncio.wait_for(background.flush(), 1)
+
+        assert inner.batches == [["a"]]
+        await background.close()
+
+    @pytest.mark.asyncio
+    async def test_drop_newest_drops_activities_when_full(self):
+        inner = RecordingTranscriptLogger()
+        inner.release = asyncio.Event()
+        background = BackgroundTranscriptLogger(
+            inner,
+            batch_size=1,
+            max_queue_size=2,
+            overflow_policy=TranscriptOverflowPolicy.DROP_NEWEST,
+        )
+
+        await background.log_activity(_activities("a")[0])
+        await asyncio.sleep(0)  # the worker takes "a" and waits on the write
+        await background.log_activities(_activities("b", "c", "d"))
+        inner.release.set()
+        await background.flush()
+
+        assert inner.batches == [["a"], ["b"], ["c"]]
+        assert background.dropped == 1
+        await background.close()
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_keeps_the_newest_activities(self):
+        inner = RecordingTranscriptLogger()
+        inner.release = asyncio.Event()
+        background = BackgroundTranscriptLogger(
+            inner,
+            batch_size=1,
+            max_queue_size=2,
+            overflow_policy=TranscriptOverflowPolicy.DROP_OLDEST,
+        )
+
+        await background.log_activity(_activities("a")[0])
+        await asyncio.sleep(0)
+        await background.log_activities(_activities("b", "c", "d"))
+        inner.release.set()
+        await background.flush()
+
+        assert inner.batches == [["a"], ["c"], ["d"]]
+        assert background.dropped == 1
+        await background.close()
+
+    @pytest.mark.asyncio
+    async def test_block_waits_for_room_in_the_queue(self):
+        inner = RecordingTranscriptLogger()
+        inner.release = asyncio.Event()
+        background = BackgroundTranscriptLogger(inner, batch_size=1, max_queue_size=1)
+
+        await background.log_activity(_activities("a")[0])
+        await asyncio.sleep(0)
+        await background.log_activity(_activities("b")[0])
+        blocked = asyncio.create_task(background.log_activity(_activities("c")[0]))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        inner.release.set()
+        await blocked
+        await background.flush()
+
+        assert inner.batches == [["a"], ["b"], ["c"]]
+        assert background.dropped == 0
+        await background.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_counted_and_later_writes_continue(self):
+        inner = RecordingTranscriptLogger()
+        inner.error = RuntimeError("store unavailable")
+        background = BackgroundTranscriptLogger(inner)
+
+        await background.log_activities(_activities("a", "b"))
+        await background.flush()
+        inner.error = None
+        await background.log_activities(_activities("c"))
+        await background.flush()
+
+        assert background.failed == 2
+        assert inner.batches == [["c"]]
+        await background.close()
+
+    @pytest.mark.asyncio
+    async def test_close_writes_queued_activities(self):
+        inner = RecordingTranscriptLogger()
+        background = BackgroundTranscriptLogger(inner, flush_interval=60)
+
+        await background.log_activities(_activities("a", "b"))
+        await background.close()
+
+        assert inner.batches == [["a", "b"]]
+
+    def test_invalid_options_are_rejected(self):
+        inner = RecordingTranscriptLogger()
+        with pytest.raises(ValueError):
+            BackgroundTranscriptLogger(inner, batch_size=0)
+        with pytest.raises(ValueError):
+            BackgroundTranscriptLogger(inner, max_queue_size=0)
+        with pytest.raises(ValueError):
+            BackgroundTranscriptLogger(inner, flush_interval=-1)
+
+
+class TestTranscriptLoggerMiddlewareBatching:
+    @pytest.mark.asyncio
+    async def test_turn_activities_are_logged_in_one_batch(self):
+        inner = RecordingTranscriptLogger()
+        adapter = MockTestingAdapter("Channel1")
+        adapter.use(TranscriptLoggerMiddleware(inner))
+
+        async def callback(tc):
+            await tc.send_activity("first reply")
+            await tc.send_activity("second reply")
+
+        await adapter.process_activity(
+            ClaimsIdentity({}, True), adapter.make_activity("hello"), callback
+        )
+
+        assert inner.batches == [["hello", "first reply", "second reply"]]
+
+    @pytest.mark.asyncio
+    async def test_turn_does_not_wait_for_background_persistence(self):
+        inner = RecordingTranscriptLogger()
+        inner.release = asyncio.Event()
+        background = BackgroundTranscriptLogger(inner)
+        adapter = MockTestingAdapter("Channel1")
+        adapter.use(TranscriptLoggerMiddleware(background))
+
+        async def callback(tc):
+            await tc.send_activity("reply")
+
+        await asyncio.wait_for(
+            adapter.process_activity(
+                ClaimsIdentity({}, True), adapter.make_activity("hello"), callback
+            ),
+            1,
+        )
+        assert inner.batches == []
+
+        inner.release.set()
+        await background.flush()
+        assert inner.batches == [["hello", "reply"]]
+        await background.close()
+
+    @pytest.mark.asyncio
+    async def test_memory_store_logs_batches(self):
+        store = TranscriptMemoryStore()
+        activities = _activities("a", "b")
+        for activity in activities:
+            activity.channel_id = "Channel1"
+            activity.conversation = ConversationAccount(id="conv")
+
+        await store.log_activities(activities)
+        result = await store.get_transcript_activities("Channel1", "conv")
+
+        assert [activity.text for activity in result.items] == ["a", "b"]
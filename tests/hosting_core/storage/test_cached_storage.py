@@ -0,0 +1,260 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from microsoft_agents.hosting.core.storage import (
+    CachedStorage,
+    ETagConflictError,
+    MemoryStorage,
+)
+from tests._common.storage.utils import CRUDStorageTests, MockStoreItem
+
+
+class TestCachedStorage(CRUDStorageTests):
+
+    @asynccontextmanager
+    async def storage(self, initial_data=None):
+        data = {
+            key: value.store_item_to_json()
+            for key, value in (initial_data or {}).items()
+        }
+        yield CachedStorage(MemoryStorage(data))
+
+
+class TestCachedStorageCaching:
+
+    def setup_method(self):
+        self.backing = MemoryStorage({"a": {"id": "a"}, "b": {"id": "b"}})
+
+    @pytest.mark.asyncio
+    async def test_read_hits_cache(self, mocker):
+        storage = CachedStorage(self.backing)
+        read = mocker.spy(self.backing, "read")
+
+        await storage.read(["a", "missing"], target_cls=MockStoreItem)
+        result = await storage.read(["a", "missing"], target_cls=MockStoreItem)
+
+        assert result == {"a": MockStoreItem({"id": "a"})}
+        read.assert_awaited_once()
+        assert storage.hits == 2
+        assert storage.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_read_returns_copies(self):
+        storage = CachedStorage(self.backing)
+
+        item = (await storage.read(["a"], target_cls=MockStoreItem))["a"]
+        item.data["id"] = "changed"
+
+        result = await storage.read(["a"], target_cls=MockStoreItem)
+        assert result["a"] == MockStoreItem({"id": "a"})
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self, mocker):
+        now = mocker.patch(
+            "microsoft_agents.hosting.core.storage.cached_storage.time.monotonic",
+            return_value=100.0,
+        )
+        storage = CachedStorage(self.backing, ttl=10)
+        await storage.read(["a"], target_cls=MockStoreItem)
+
+        now.return_value = 111.0
+        await storage.read(["a"], target_cls=MockStoreItem)
+
+        assert storage.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self):
+        storage = CachedStorage(self.backing, max_items=2)
+        await storage.read(["a"], target_cls=MockStoreItem)
+        await storage.read(["b"], target_cls=MockStoreItem)
+        await storage.read(["a"], target_cls=MockStoreItem)
+        await storage.read(["c"], target_cls=MockStoreItem)
+
+        await storage.read(["a"], target_cls=MockStoreItem)
+        assert storage.misses == 3
+        await storage.read(["b"], target_cls=MockStoreItem)
+        assert storage.misses == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_read(self, mocker):
+        storage = CachedStorage(self.backing)
+        read = mocker.spy(self.backing, "read")
+
+        results = await asyncio.gather(
+            *[storage.read(["a"], target_cls=MockStoreItem) for _ in range(5)]
+        )
+
+        assert all(result == {"a": MockStoreItem({"id": "a"})} for result in results)
+        read.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_read_is_shared_and_not_cached(self, mocker):
+        storage = CachedStorage(self.backing)
+        mocker.patch.object(self.backing, "read", side_effect=RuntimeError("down"))
+
+        results = await asyncio.gather(
+            *[storage.read(["a"], target_cls=MockStoreItem) for _ in range(3)],
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        mocker.stopall()
+        assert await storage.read(["a"], target_cls=MockStoreItem) == {
+            "a": MockStoreItem({"id": "a"})
+        }
+
+    @pytest.mark.asyncio
+    async def test_write_through_updates_cache(self, mocker):
+        storage = CachedStorage(self.backing)
+        item = (await storage.read(["a"], target_cls=MockStoreItem))["a"]
+        item.data["id"] = "new"
+        await storage.write({"a": item})
+        read = mocker.spy(self.backing, "read")
+
+        result = await storage.read(["a"], target_cls=MockStoreItem)
+
+        assert result == {"a": MockStoreItem({"id": "new"})}
+        assert result["a"].e_tag == item.e_tag
+        assert self.backing._memory["a"] == {"id": "new"}
+        read.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unconditional_write_reads_back_e_tag(self):
+        storage = CachedStorage(self.backing)
+        await storage.write({"c": MockStoreItem({"id": "c"})})
+
+        cached = (await storage.read(["c"], target_cls=MockStoreItem))["c"]
+        stored = (await self.backing.read(["c"], target_cls=MockStoreItem))["c"]
+
+        assert cached == MockStoreItem({"id": "c"})
+        assert cached.e_tag is not None
+        assert cached.e_tag == stored.e_tag
+
+    @pytest.mark.asyncio
+    async def test_conflict_invalidates_cached_entry(self):
+        storage = CachedStorage(self.backing)
+        item = (await storage.read(["a"], target_cls=MockStoreItem))["a"]
+        await self.backing.write({"a": MockStoreItem({"id": "other"})})
+
+        with pytest.raises(ETagConflictError):
+            await storage.write({"a": item})
+
+        result = await storage.read(["a"], target_cls=MockStoreItem)
+        assert result == {"a": MockStoreItem({"id": "other"})}
+
+    @pytest.mark.asyncio
+    async def test_delete_caches_absence(self, mocker):
+        storage = CachedStorage(self.backing)
+        await storage.delete(["a"])
+        read = mocker.spy(self.backing, "read")
+
+        assert await storage.read(["a"], target_cls=MockStoreItem) == {}
+        assert "a" not in self.backing._memory
+        read.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_write_behind_batches_writes(self, mocker):
+        storage = CachedStorage(self.backing, write_behind=True, flush_interval=60)
+        write = mocker.spy(self.backing, "write")
+
+        await storage.write({"a": MockStoreItem({"id": "1"})})
+        await storage.write({"a": MockStoreItem({"id": "2"})})
+        await storage.write({"c": MockStoreItem({"id": "3"})})
+
+        assert await storage.read(["a"], target_cls=MockStoreItem) == {
+            "a": MockStoreItem({"id": "2"})
+        }
+        write.assert_not_called()
+
+        await storage.flush()
+
+        write.assert_awaited_once()
+        assert self.backing._memory["a"] == {"id": "2"}
+        assert self.backing._memory["c"] == {"id": "3"}
+
+    @pytest.mark.asyncio
+    async def test_write_behind_flushes_in_background(self):
+        storage = CachedStorage(self.backing, write_behind=True, flush_interval=0)
+
+        await storage.write({"a": MockStoreItem({"id": "1"})})
+        await asyncio.sleep(0.01)
+
+        assert self.backing._memory["a"] == {"id": "1"}
+
+    @pytest.mark.asyncio
+    async def test_write_behind_carries_e_tag_to_write_made_during_flush(self):
+        storage = CachedStorage(self.backing, write_behind=True, flush_interval=60)
+        release = asyncio.Event()
+        write = self.backing.write
+
+        async def slow_write(changes):
+            await release.wait()
+            await write(changes)
+
+        self.backing.write = slow_write
+        item = (await storage.read(["a"], target_cls=MockStoreItem))["a"]
+        item.data["v"] = 1
+        await storage.write({"a": item})
+        flushing = asyncio.create_task(storage.flush())
+        await asyncio.sleep(0)
+
+        item.data["v"] = 2
+        await storage.write({"a": item})
+        release.set()
+        await flushing
+        await storage.flush()
+
+        assert self.backing._memory["a"] == {"id": "a", "v": 2}
+        result = await storage.read(["a"], target_cls=MockStoreItem)
+        assert result == {"a": MockStoreItem({"id": "a", "v": 2})}
+        assert result["a"].e_tag == item.e_tag
+
+    @pytest.mark.asyncio
+    async def test_write_behind_retries_failed_flush(self, mocker):
+        storage = CachedStorage(self.backing, write_behind=True, flush_interval=60)
+        write = mocker.patch.object(
+            self.backing,
+            "write",
+            side_effect=[RuntimeError("unavailable"), None],
+        )
+
+        await storage.write({"c": MockStoreItem({"id": "c"})})
+        with pytest.raises(RuntimeError):
+            await storage.flush()
+        await storage.flush()
+
+        assert write.await_count == 2
+        assert write.await_args.args[0]["c"].data == {"id": "c"}
+
+    @pytest.mark.asyncio
+    async def test_write_behind_reports_conflict(self):
+        storage = CachedStorage(self.backing, write_behind=True, flush_interval=60)
+        item = (await storage.read(["a"], target_cls=MockStoreItem))["a"]
+        await self.backing.write({"a": MockStoreItem({"id": "other"})})
+
+        await storage.write({"a": item})
+        with pytest.raises(ETagConflictError):
+            await storage.flush()
+        with pytest.raises(ETagConflictError):
+            await storage.write({"a": item})
+
+        result = await storage.read(["a"], target_cls=MockStoreItem)
+        assert result == {"a": MockStoreItem({"id": "other"})}
+        await storage.write({"a": result["a"]})
+        await storage.flush()
+        assert self.backing._memory["a"] == {"id": "other"}
+
+    @pytest.mark.asyncio
+    async def test_write_delta_updates_cached_item(self, mocker):
+        storage = CachedStorage(self.backing)
+        item = (await storage.read(["a"], target_cls=MockStoreItem))["a"]
+
+        assert await storage.write_delta("a", {"value": 1}, source=item)
+
+        read = mocker.spy(self.backing, "read")
+        result = await storage.read(["a"], target_cls=MockStoreItem)
+        assert result == {"a": MockStoreItem({"id": "a", "value": 1})}
+        assert result["a"].e_tag == item.e_tag
+        read.assert_not_called()
@@ -67,6 +67,25 @@ async def test_log_activity_appends_multiple_lines(temp_logger: FileTranscriptSt
     assert texts == ["first", "second"]
 
 
+@pytest.mark.asyncio
+async def test_log_activities_writes_each_conversation_in_order(
+    temp_logger: FileTranscriptStore,
+):
+    await temp_logger.log_activities(
+        [
+            make_activity(text="first"),
+            make_activity(conv="conv2", text="other"),
+            make_activity(text="second"),
+        ]
+    )
+
+    root = Path(temp_logger._root) / "testChannel"
+    lines = (root / "conv1.transcript").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(l)["text"] for l in lines] == ["first", "second"]
+    lines = (root / "conv2.transcript").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(l)["text"] for l in lines] == ["other"]
+
+
 # ----------------------------
 # list_transcripts
 # ----------------------------
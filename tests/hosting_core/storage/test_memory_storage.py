@@ -1,7 +1,10 @@
 from contextlib import asynccontextmanager
 
+import pytest
+
+from microsoft_agents.hosting.core.storage import ETagConflictError
 from microsoft_agents.hosting.core.storage.memory_storage import MemoryStorage
-from tests._common.storage.utils import CRUDStorageTests
+from tests._common.storage.utils import CRUDStorageTests, MockStoreItem
 
 
 class TestMemoryStorage(CRUDStorageTests):
@@ -13,3 +16,95 @@ class TestMemoryStorage(CRUDStorageTests):
             for key, value in (initial_data or {}).items()
         }
         yield MemoryStorage(data)
+
+
+class TestMemoryStorageWriteDelta:
+
+    @pytest.mark.asyncio
+    async def test_write_delta_merges_properties(self):
+        storage = MemoryStorage({"key": {"a": 1, "b": 2, "c": 3}})
+
+        assert await storage.write_delta("key", {"a": 10, "d": 4}, ["c"])
+        assert storage._memory["key"] == {"a": 10, "b": 2, "d": 4}
+
+    @pytest.mark.asyncio
+    async def test_write_delta_missing_key(self):
+        storage = MemoryStorage()
+
+        assert not await storage.write_delta("key", {"a": 1})
+        assert "key" not in storage._memory
+
+    @pytest.mark.asyncio
+    async def test_write_delta_empty_key(self):
+        with pytest.raises(ValueError):
+            await MemoryStorage().write_delta("", {"a": 1})
+
+
+class TestMemoryStorageETags:
+
+    @pytest.mark.asyncio
+    async def test_read_sets_e_tag(self):
+        storage = MemoryStorage({"key": {"id": "1"}})
+
+        item = (await storage.read(["key"], target_cls=MockStoreItem))["key"]
+
+        assert item.e_tag is not None
+        assert (await storage.read(["key"], target_cls=MockStoreItem))[
+            "key"
+        ].e_tag == item.e_tag
+
+    @pytest.mark.asyncio
+    async def test_conditional_write_refreshes_e_tag(self):
+        storage = MemoryStorage({"key": {"id": "1"}})
+        item = (await storage.read(["key"], target_cls=MockStoreItem))["key"]
+        e_tag = item.e_tag
+
+        await storage.write({"key": item})
+        assert item.e_tag != e_tag
+
+        await storage.write({"key": item})
+        assert storage._memory["key"] == {"id": "1"}
+
+    @pytest.mark.asyncio
+    async def test_stale_e_tag_raises_conflict(self):
+        storage = MemoryStorage({"key": {"id": "1"}, "other": {"id": "2"}})
+        first = (await storage.read(["key"], target_cls=MockStoreItem))["key"]
+        second = (await storage.read(["key"], target_cls=MockStoreItem))["key"]
+        first.data = {"id": "3"}
+        await storage.write({"key": first})
+
+        with pytest.raises(ETagConflictError) as exc_info:
+            await storage.write({"other": MockStoreItem({"id": "4"}), "key": second})
+
+        assert exc_info.value.key == "key"
+        assert storage._memory == {"key": {"id": "3"}, "other": {"id": "2"}}
+
+    @pytest.mark.asyncio
+    async def test_wildcard_e_tag_writes_unconditionally(self):
+        storage = MemoryStorage({"key": {"id": "1"}})
+        item = MockStoreItem({"id": "2"})
+        item.e_tag = "*"
+
+        await storage.write({"key": item})
+
+        assert storage._memory["key"] == {"id": "2"}
+        assert item.e_tag == "*"
+
+    @pytest.mark.asyncio
+    async def test_write_after_delete_raises_conflict(self):
+        storage = MemoryStorage({"key": {"id": "1"}})
+        item = (await storage.read(["key"], target_cls=MockStoreItem))["key"]
+        await storage.delete(["key"])
+
+        with pytest.raises(ETagConflictError):
+            await storage.write({"key": item})
+
+    @pytest.mark.asyncio
+    async def test_write_delta_checks_source_e_tag(self):
+        storage = MemoryStorage({"key": {"a": 1, "b": 2}})
+        item = (await storage.read(["key"], target_cls=MockStoreItem))["key"]
+        await storage.write({"key": MockStoreItem({"a": 3, "b": 2})})
+
+        with pytest.raises(ETagConflictError):
+            await storage.write_delta("key", {"a": 10}, source=item)
+        assert storage._memory["key"] == {"a": 3, "b": 2}
@@ -0,0 +1,109 @@
+from contextlib import asynccontextmanager
+
+import pytest
+
+from microsoft_agents.hosting.core.app import (
+    AgentApplication,
+    ApplicationOptions,
+    TurnState,
+)
+from microsoft_agents.hosting.core.app.oauth import Authorization
+from microsoft_agents.hosting.core.state.agent_state import CachedAgentState
+from microsoft_agents.hosting.core.storage import (
+    ETagConflictError,
+    ObjectMemoryStorage,
+)
+from tests._common.storage.utils import CRUDStorageTests, MockStoreItem
+from tests._common.testing_objects import TestingConnectionManager as _ConnectionManager
+
+
+class TestObjectMemoryStorage(CRUDStorageTests):
+
+    @asynccontextmanager
+    async def storage(self, initial_data=None):
+        yield ObjectMemoryStorage(initial_data)
+
+
+class TestObjectMemoryStorageCopies:
+
+    @pytest.mark.asyncio
+    async def test_read_skips_deserialization(self, mocker):
+        storage = ObjectMemoryStorage({"a": MockStoreItem({"id": "a"})})
+        from_json = mocker.spy(MockStoreItem, "from_json_to_store_item")
+
+        result = await storage.read(["a"], target_cls=MockStoreItem)
+
+        assert result == {"a": MockStoreItem({"id": "a"})}
+        from_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_written_and_read_items_are_copies(self):
+        item = MockStoreItem({"id": "a"})
+        storage = ObjectMemoryStorage()
+        await storage.write({"a": item})
+        item.data["id"] = "changed"
+
+        read = (await storage.read(["a"], target_cls=MockStoreItem))["a"]
+        read.data["id"] = "changed again"
+
+        result = await storage.read(["a"], target_cls=MockStoreItem)
+        assert result == {"a": MockStoreItem({"id": "a"})}
+
+    @pytest.mark.asyncio
+    async def test_saved_agent_state_reads_back_unchanged(self):
+        storage = ObjectMemoryStorage()
+        for track_changes in (False, True):
+            cached_state = CachedAgentState(track_changes=track_changes)
+            cached_state.state["a"] = 1
+            await storage.write({"key": cached_state})
+            cached_state.mark_saved()
+
+            result = (await storage.read(["key"], target_cls=CachedAgentState))["key"]
+
+            assert result.state == {"a": 1}
+            assert not result.is_changed
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_item_is_evicted(self):
+        storage = ObjectMemoryStorage(
+            {"a": MockStoreItem({"id": "a"}), "b": MockStoreItem({"id": "b"})},
+            max_items=2,
+        )
+        await storage.read(["a"], target_cls=MockStoreItem)
+
+        await storage.write({"c": MockStoreItem({"id": "c"})})
+
+        result = await storage.read(["a", "b", "c"], target_cls=MockStoreItem)
+        assert set(result) == {"a", "c"}
+        assert storage.count == 2
+
+    def test_empty_storage_is_accepted_by_agent_application(self):
+        storage = ObjectMemoryStorage()
+
+        app = AgentApplication[TurnState](
+            options=ApplicationOptions(storage=storage),
+            authorization=Authorization(
+                storage=storage, connection_manager=_ConnectionManager()
+            ),
+        )
+
+        assert app.options.storage is storage
+        assert storage.count == 0
+
+    def test_invalid_max_items(self):
+        with pytest.raises(ValueError):
+            ObjectMemoryStorage(max_items=0)
+
+    @pytest.mark.asyncio
+    async def test_conditional_write_conflict(self):
+        storage = ObjectMemoryStorage({"a": MockStoreItem({"id": "a"})})
+        first = (await storage.read(["a"], target_cls=MockStoreItem))["a"]
+        second = (await storage.read(["a"], target_cls=MockStoreItem))["a"]
+
+        await storage.write({"a": first})
+
+        with pytest.raises(ETagConflictError):
+            await storage.write({"a": second})
+        assert (await storage.read(["a"], target_cls=MockStoreItem))["a"].e_tag == (
+            first.e_tag
+        )
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from microsoft_agents.activity import (
@@ -5,6 +7,7 @@ from microsoft_agents.activity import (
     ConversationResourceResponse,
     ConversationParameters,
     DeliveryModes,
+    ResourceResponse,
 )
 from microsoft_agents.hosting.core import (
     ChannelServiceAdapter,
@@ -283,3 +286,121 @@ class TestChannelServiceAdapter:
             "audience",
             use_anonymous=True,
         )
+
+    @staticmethod
+    def _pipelined_context(mocker, adapter, conversations):
+        connector_client = mocker.Mock(spec=TeamsConnectorClient)
+        connector_client.conversations = conversations
+        context = TurnContext(
+            adapter,
+            Activity(type="message", conversation={"id": "conversation123"}),
+        )
+        context.services.set(ConnectorClientBase, connector_client)
+        return context
+
+    @staticmethod
+    def _messages(*conversation_ids):
+        return [
+            Activity(
+                type="message",
+                text=f"{conversation_id}{index}",
+                conversation={"id": conversation_id},
+            )
+            for index, conversation_id in enumerate(conversation_ids)
+        ]
+
+    def test_max_in_flight_sends_must_be_positive(self, factory):
+        with pytest.raises(ValueError):
+            MyChannelServiceAdapter(factory, max_in_flight_sends=0)
+
+    @pytest.mark.asyncio
+    async def test_send_activities_pipelined_keeps_conversation_order(
+        self, mocker, factory
+    ):
+        adapter = MyChannelServiceAdapter(factory, max_in_flight_sends=2)
+        activities = self._messages("a", "a", "b", "a", "b", "b")
+        delays = dict(zip((a.text for a in activities), (5, 1, 4, 1, 3, 1)))
+        completed = []
+        in_flight = []
+        max_in_flight = 0
+
+        async def send_to_conversation(conversation_id, activity):
+            nonlocal max_in_flight
+            assert conversation_id not in in_flight
+            in_flight.append(conversation_id)
+            max_in_flight = max(max_in_flight, len(in_flight))
+            # later requests finish faster than earlier ones if they are allowed to overlap
+            await asyncio.sleep(0.01 * delays[activity.text])
+            in_flight.remove(conversation_id)
+            completed.append(activity.text)
+            return ResourceResponse(id=f"id-{activity.text}")
+
+        conversations = mocker.Mock(spec=ConversationsBase)
+        conversations.send_to_conversation = send_to_conversation
+        context = self._pipelined_context(mocker, adapter, conversations)
+
+        responses = await adapter.send_activities(context, activities)
+
+        assert [text for text in completed if text.startswith("a")] == [
+            "a0",
+            "a1",
+            "a3",
+        ]
+        assert [text for text in completed if text.startswith("b")] == [
+            "b2",
+            "b4",
+            "b5",
+        ]
+        assert max_in_flight == 2
+        assert [response.id for response in responses] == [
+            f"id-{activity.text}" for activity in activities
+        ]
+
+    @pytest.mark.asyncio
+    async def test_send_activities_pipelined_stops_on_failure(self, mocker, factory):
+        adapter = MyChannelServiceAdapter(factory, max_in_flight_sends=2)
+        started = []
+
+        async def send_to_conversation(conversation_id, activity):
+            started.append(activity.text)
+            await asyncio.sleep(0)
+            if activity.text == "a0":
+                raise RuntimeError("send failed")
+            await asyncio.sleep(0.01)
+            return ResourceResponse(id=f"id-{activity.text}")
+
+        conversations = mocker.Mock(spec=ConversationsBase)
+        conversations.send_to_conversation = send_to_conversation
+        context = self._pipelined_context(mocker, adapter, conversations)
+
+        with pytest.raises(RuntimeError, match="send failed"):
+            await adapter.send_activities(
+                context, self._messages("a", "b", "a", "b", "c")
+            )
+
+        assert started == ["a0", "b1"]
+
+    @pytest.mark.asyncio
+    async def test_send_activities_pipelined_handles_invoke_response(
+        self, mocker, factory
+    ):
+        adapter = MyChannelServiceAdapter(factory, max_in_flight_sends=4)
+        conversations = mocker.Mock(spec=ConversationsBase)
+        conversations.reply_to_activity = mocker.AsyncMock(
+            return_value=ResourceResponse(id="reply")
+        )
+        context = self._pipelined_context(mocker, adapter, conversations)
+        invoke_response = Activity(type="invokeResponse", value={"status": 200})
+        reply = Activity(
+            type="message",
+            reply_to_id="activity123",
+            conversation={"id": "conversation123"},
+        )
+
+        responses = await adapter.send_activities(context, [invoke_response, reply])
+
+        assert context.turn_state[adapter.INVOKE_RESPONSE_KEY] is invoke_response
+        assert [response.id for response in responses] == [None, "reply"]
+        conversations.reply_to_activity.assert_awaited_once_with(
+            "conversation123", "activity123", reply
+        )
@@ -0,0 +1,112 @@
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from pydantic import ValidationError
+
+from microsoft_agents.activity import Activity, LazyActivity
+from microsoft_agents.hosting.core import HttpAdapterBase
+
+ACTIVITY_BODY = {
+    "type": "message",
+    "id": "act-1",
+    "channelId": "msteams",
+    "text": "hello",
+    "conversation": {"id": "conv-1"},
+    "from": {"id": "user-1"},
+    "recipient": {"id": "bot-1"},
+}
+
+
+class _ConcreteAdapter(HttpAdapterBase):
+    pass
+
+
+class _RawRequest:
+    method = "POST"
+    headers = {"Content-Type": "application/json"}
+
+    def __init__(self, raw: bytes):
+        self._raw = raw
+        self.json = AsyncMock(side_effect=AssertionError("json() should not be used"))
+
+    async def read(self) -> bytes:
+        return self._raw
+
+    def get_claims_identity(self):
+        return None
+
+    def get_path_param(self, name: str) -> str:
+        return ""
+
+
+class TestHttpAdapterBase:
+    @pytest.fixture
+    def adapter(self):
+        factory = MagicMock()
+        adapter = _ConcreteAdapter(channel_service_client_factory=factory)
+        adapter.process_activity = AsyncMock(return_value=None)
+        return adapter
+
+    @pytest.fixture
+    def agent(self):
+        agent = MagicMock()
+        agent.on_turn = AsyncMock()
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_process_request_validates_raw_body(self, adapter, agent):
+        request = _RawRequest(json.dumps(ACTIVITY_BODY).encode())
+
+        response = await adapter.process_request(request, agent)
+
+        assert response.status_code == 202
+        activity = adapter.process_activity.await_args.args[1]
+        assert isinstance(activity, Activity)
+        assert activity.text == "hello"
+        assert activity.from_property.id == "user-1"
+        request.json.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_process_request_invalid_raw_json_is_bad_request(
+        self, adapter, agent
+    ):
+        response = await adapter.process_request(_RawRequest(b"{not json"), agent)
+
+        assert response.status_code == 400
+        adapter.process_activity.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_process_request_invalid_activity_raises(self, adapter, agent):
+        request = _RawRequest(json.dumps({"text": "no type"}).encode())
+
+        with pytest.raises(ValidationError):
+            await adapter.process_request(request, agent)
+
+    @pytest.mark.asyncio
+    async def test_process_request_falls_back_to_json(self, adapter, agent):
+        request = AsyncMock()
+        request.method = "POST"
+        request.json = AsyncMock(return_value=ACTIVITY_BODY)
+        request.get_claims_identity = MagicMock(return_value=None)
+
+        response = await adapter.process_request(request, agent)
+
+        assert response.status_code == 202
+        request.json.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_process_request_lazy_activity_validation(self, agent):
+        factory = MagicMock()
+        adapter = _ConcreteAdapter(
+            channel_service_client_factory=factory, lazy_activity_validation=True
+        )
+        adapter.process_activity = AsyncMock(return_value=None)
+        request = _RawRequest(json.dumps(ACTIVITY_BODY).encode())
+
+        await adapter.process_request(request, agent)
+
+        activity = adapter.process_activity.await_args.args[1]
+        assert isinstance(activity, LazyActivity)
+        assert activity.text == "hello"
@@ -0,0 +1,106 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import pytest
+
+from microsoft_agents.hosting.core import json_codec
+from microsoft_agents.hosting.core.json_codec import (
+    JsonCodec,
+    MsgspecJsonCodec,
+    OrjsonJsonCodec,
+    StdlibJsonCodec,
+    get_json_codec,
+    set_json_codec,
+)
+
+
+def _installed_codecs():
+    codecs = [StdlibJsonCodec()]
+    for codec_type in (OrjsonJsonCodec, MsgspecJsonCodec):
+        try:
+            codecs.append(codec_type())
+        except ImportError:
+            pass
+    return codecs
+
+
+@pytest.fixture(autouse=True)
+def reset_codec():
+    yield
+    set_json_codec(None)
+
+
+@pytest.mark.parametrize("codec", _installed_codecs(), ids=lambda codec: codec.name)
+class TestJsonCodecs:
+    def test_round_trip(self, codec):
+        value = {"text": "héllo", "items": [1, 2.5, True, None], "nested": {"a": "b"}}
+
+        encoded = codec.dumps(value)
+
+        assert isinstance(encoded, bytes)
+        assert codec.loads(encoded) == value
+
+    def test_round_trip_int_keys(self, codec):
+        encoded = codec.dumps({1: "a", "nested": {2: "b"}})
+
+        assert codec.loads(encoded) == {"1": "a", "nested": {"2": "b"}}
+
+    @pytest.mark.parametrize(
+        "data",
+        [b'{"a": 1}', '{"a": 1}', bytearray(b'{"a": 1}'), memoryview(b'{"a": 1}')],
+    )
+    def test_loads_accepts_bytes_and_text(self, codec, data):
+        assert codec.loads(data) == {"a": 1}
+
+    def test_loads_invalid_json_raises_value_error(self, codec):
+        with pytest.raises(ValueError):
+            codec.loads(b"{not json")
+
+    def test_dumps_unsupported_value_raises_type_error(self, codec):
+        with pytest.raises(TypeError):
+            codec.dumps({"value": object()})
+
+    def test_is_json_codec(self, codec):
+        assert isinstance(codec, JsonCodec)
+
+
+class TestJsonCodecSelection:
+    def test_default_prefers_installed_fast_codec(self, mocker):
+        mocker.patch.object(json_codec, "_codec", None)
+        names = [codec.name for codec in _installed_codecs()]
+        expected = next(
+            (name for name in ("orjson", "msgspec") if name in names), "json"
+        )
+
+        assert get_json_codec().name == expected
+
+    def test_default_falls_back_to_stdlib(self, mocker):
+        mocker.patch.object(json_codec, "_codec", None)
+        mocker.patch.object(OrjsonJsonCodec, "__init__", side_effect=ImportError)
+        mocker.patch.object(MsgspecJsonCodec, "__init__", side_effect=ImportError)
+
+        assert isinstance(get_json_codec(), StdlibJsonCodec)
+
+    def test_set_codec_instance(self):
+        codec = StdlibJsonCodec()
+
+        set_json_codec(codec)
+
+        assert get_json_codec() is codec
+
+    def test_set_codec_by_name(self):
+        set_json_codec("json")
+
+        assert isinstance(get_json_codec(), StdlibJsonCodec)
+
+    def test_set_unknown_codec_name_raises(self):
+        with pytest.raises(ValueError):
+            set_json_codec("yaml")
+
+    def test_set_none_restores_default(self):
+        codec = StdlibJsonCodec()
+        set_json_codec(codec)
+
+        set_json_codec(None)
+
+        assert get_json_codec() is not codec
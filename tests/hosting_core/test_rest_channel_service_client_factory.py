@@ -15,6 +15,7 @@ from microsoft_agents.hosting.core.authorization import (
     AccessTokenProviderBase,
     AgentAuthConfiguration,
 )
+from microsoft_agents.hosting.core.connector.client import ClientSessionPool
 from microsoft_agents.hosting.core.connector.teams import TeamsConnectorClient
 
 from tests._common.data import DEFAULT_TEST_VALUES
@@ -269,6 +270,41 @@ class TestRestChannelServiceClientFactory:
             TeamsConnectorClient, endpoint=DEFAULTS.service_url, token=DEFAULTS.token
         )
 
+    @pytest.mark.asyncio
+    async def test_create_connector_client_with_session_pool(self, mocker, activity):
+        mock_connector_client = mocker.Mock(spec=TeamsConnectorClient)
+        mocker.patch.object(
+            TeamsConnectorClient,
+            "__new__",
+            side_effect=lambda cls, *args, **kwargs: mock_connector_client,
+        )
+        token_provider = mocker.Mock(spec=AccessTokenProviderBase)
+        token_provider.get_access_token = mocker.AsyncMock(return_value=DEFAULTS.token)
+        connection_manager = mocker.Mock(spec=Connections)
+        connection_manager.get_token_provider = mocker.Mock(return_value=token_provider)
+        session_pool = ClientSessionPool()
+
+        factory = RestChannelServiceClientFactory(
+            connection_manager, session_pool=session_pool
+        )
+        context = mocker.Mock(spec=TurnContext)
+        context.activity = activity
+
+        await factory.create_connector_client(
+            context,
+            mocker.Mock(spec=ClaimsIdentity),
+            DEFAULTS.service_url,
+            "https://service.audience/",
+            ["scope"],
+        )
+
+        TeamsConnectorClient.__new__.assert_called_once_with(
+            TeamsConnectorClient,
+            endpoint=DEFAULTS.service_url,
+            token=DEFAULTS.token,
+            session_pool=session_pool,
+        )
+
     @pytest.mark.parametrize("alt_blueprint", [True, False])
     @pytest.mark.asyncio
     async def test_create_connector_client_agentic_identity(
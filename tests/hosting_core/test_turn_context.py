@@ -5,6 +5,7 @@ from typing import Callable, List
 from microsoft_agents.activity import (
     Activity,
     ActivityTypes,
+    Attachment,
     ChannelAccount,
     ConversationAccount,
     Entity,
@@ -544,3 +545,78 @@ class TestTurnContext:
             "name-text", "value-text", "valueType-text", "label-text"
         )
         assert called
+
+    @pytest.mark.asyncio
+    async def test_buffered_messages_are_sent_as_one_batch(self):
+        adapter = _RecordingAdapter()
+        context = TurnContext(adapter, ACTIVITY)
+        emitted = []
+
+        async def on_send(ctx, activities, next_handler):
+            emitted.append([activity.text for activity in activities])
+            return await next_handler()
+
+        context.on_send_activities(on_send)
+        context.enable_buffering()
+
+        first = await context.send_activity("one")
+        await context.send_activity("two")
+
+        assert first.id is None
+        assert context.responded is True
+        assert adapter.sent_batches == []
+
+        responses = await context.flush_buffered_activities()
+
+        assert emitted == [["one", "two"]]
+        assert [activity.text for activity in adapter.sent_batches[0]] == [
+            "one",
+            "two",
+        ]
+        assert [response.id for response in responses] == ["sent-0", "sent-1"]
+        assert await context.flush_buffered_activities() == []
+
+    @pytest.mark.asyncio
+    async def test_buffered_messages_are_flushed_before_other_activities(self):
+        adapter = _RecordingAdapter()
+        context = TurnContext(adapter, ACTIVITY)
+        context.enable_buffering()
+
+        await context.send_activity("one")
+        await context.send_trace_activity("trace")
+
+        assert [
+            [activity.type for activity in batch] for batch in adapter.sent_batches
+        ] == [[ActivityTypes.message], [ActivityTypes.trace]]
+
+    @pytest.mark.asyncio
+    async def test_buffering_coalesces_text_messages(self):
+        adapter = _RecordingAdapter()
+        context = TurnContext(adapter, ACTIVITY)
+        context.enable_buffering(coalesce_text=True)
+        card = MessageFactory.attachment(
+            Attachment(content_type="application/vnd.microsoft.card.hero", content={})
+        )
+
+        await context.send_activity("one")
+        await context.send_activity("two")
+        await context.send_activity(card)
+        await context.send_activity("three")
+        await context.flush_buffered_activities()
+
+        assert len(adapter.sent_batches) == 1
+        texts = [activity.text for activity in adapter.sent_batches[0]]
+        assert texts == ["one\n\ntwo", None, "three"]
+
+    @pytest.mark.asyncio
+    async def test_buffer_is_shared_with_copied_context(self):
+        adapter = _RecordingAdapter()
+        context = TurnContext(adapter, ACTIVITY)
+        inner_context = TurnContext(context)
+        inner_context.enable_buffering()
+
+        await inner_context.send_activity("one")
+
+        assert context.buffering is True
+        await context.flush_buffered_activities()
+        assert [activity.text for activity in adapter.sent_batches[0]] == ["one"]
@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import importlib
 import inspect
 from unittest.mock import AsyncMock, patch
 from types import SimpleNamespace
@@ -16,6 +17,11 @@ from microsoft_agents.hosting.core.http import HttpResponse
 from microsoft_agents.hosting.fastapi.jwt_authorization_middleware import (
     JwtAuthorizationMiddleware,
     jwt_authorization_decorator,
+    jwt_authorization_warm_up,
+)
+
+_jwt_middleware_module = importlib.import_module(
+    "microsoft_agents.hosting.fastapi.jwt_authorization_middleware"
 )
 
 
@@ -203,3 +209,27 @@ def test_fastapi_decorator_does_not_change_original_route_signature():
     jwt_authorization_decorator(route)
 
     assert inspect.signature(route) == original_signature
+
+
+@pytest.mark.asyncio
+async def test_fastapi_warm_up_prefetches_configured_keys():
+    auth_config = AgentAuthConfiguration()
+    app = SimpleNamespace(state=SimpleNamespace(agent_configuration=auth_config))
+
+    with patch.object(
+        _jwt_middleware_module.JwtTokenValidator, "warm_up", autospec=True
+    ) as warm_up:
+        await jwt_authorization_warm_up(app)
+
+    warm_up.assert_awaited_once()
+    assert warm_up.await_args.args[0].configuration is auth_config
+
+
+@pytest.mark.asyncio
+async def test_fastapi_warm_up_skips_without_configuration():
+    with patch.object(
+        _jwt_middleware_module.JwtTokenValidator, "warm_up", autospec=True
+    ) as warm_up:
+        await jwt_authorization_warm_up(SimpleNamespace(state=SimpleNamespace()))
+
+    warm_up.assert_not_awaited()
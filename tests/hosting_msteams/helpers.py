@@ -36,7 +36,13 @@ def _make_app() -> Any:
     app._routes = []
 
     def _add_route(
-        selector, handler, is_invoke=False, rank=RouteRank.DEFAULT, auth_handlers=None
+        selector,
+        handler,
+        is_invoke=False,
+        rank=RouteRank.DEFAULT,
+        auth_handlers=None,
+        activity_types=None,
+        activity_name=None,
     ):
         app._routes.append(
             dict(
@@ -45,6 +51,8 @@ def _make_app() -> Any:
                 is_invoke=is_invoke,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=activity_types,
+                activity_name=activity_name,
             )
         )
 
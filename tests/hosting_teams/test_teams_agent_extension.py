@@ -47,7 +47,13 @@ def _make_app() -> AgentApplication:
     app._routes = []
 
     def _add_route(
-        selector, handler, is_invoke=False, rank=RouteRank.DEFAULT, auth_handlers=None
+        selector,
+        handler,
+        is_invoke=False,
+        rank=RouteRank.DEFAULT,
+        auth_handlers=None,
+        activity_types=None,
+        activity_name=None,
     ):
         app._routes.append(
             dict(
@@ -56,6 +62,8 @@ def _make_app() -> AgentApplication:
                 is_invoke=is_invoke,
                 rank=rank,
                 auth_handlers=auth_handlers,
+                activity_types=activity_types,
+                activity_name=activity_name,
             )
         )
 
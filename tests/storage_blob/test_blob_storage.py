@@ -8,6 +8,7 @@ import pytest
 import pytest_asyncio
 from dotenv import load_dotenv
 
+from microsoft_agents.hosting.core.storage import ETagConflictError
 from microsoft_agents.storage.blob import BlobStorage, BlobStorageConfig
 from azure.storage.blob.aio import BlobServiceClient, ContainerClient
 from azure.core.exceptions import ResourceNotFoundError
@@ -120,6 +121,19 @@ class TestBlobStorage(QuickCRUDStorageTests):
                 "key": MockStoreItem({"id": "item", "value": "data"})
             }
 
+    @pytest.mark.asyncio
+    async def test_conditional_write(self):
+        async with self.storage() as blob_storage:
+            await blob_storage.write({"key": MockStoreItem({"id": "item"})})
+            first = (await blob_storage.read(["key"], target_cls=MockStoreItem))["key"]
+            second = (await blob_storage.read(["key"], target_cls=MockStoreItem))["key"]
+            assert first.e_tag
+
+            await blob_storage.write({"key": first})
+            assert first.e_tag != second.e_tag
+            with pytest.raises(ETagConflictError):
+                await blob_storage.write({"key": second})
+
     @pytest.mark.asyncio
     async def test_external_change_is_visible(self):
         async with blob_storage_instance() as (blob_storage, container_client):
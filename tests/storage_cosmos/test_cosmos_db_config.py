@@ -174,6 +174,18 @@ class TestCosmosDBStorageConfig:
         with pytest.raises(ValueError):
             CosmosDBStorageConfig.validate_cosmos_db_config(config)
 
+    def test_validation_invalid_max_concurrency(self):
+        """Test validation with a max_concurrency below 1"""
+        config = CosmosDBStorageConfig(
+            cosmos_db_endpoint="https://test.documents.azure.com:443/",
+            auth_key="test_key",
+            database_id="test_db",
+            container_id="test_container",
+            max_concurrency=-1,
+        )
+        with pytest.raises(ValueError):
+            CosmosDBStorageConfig.validate_cosmos_db_config(config)
+
     def test_validation_suffix_with_compatibility_mode(self):
         """Test validation fails when using suffix with compatibility mode"""
         config = CosmosDBStorageConfig(
@@ -3,7 +3,9 @@
 
 import os
 import gc
+import asyncio
 from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -11,9 +13,15 @@ from dotenv import load_dotenv
 
 from azure.cosmos import documents
 from azure.cosmos.aio import CosmosClient
-from azure.cosmos.exceptions import CosmosResourceNotFoundError
+from azure.core import MatchConditions
+from azure.cosmos.exceptions import (
+    CosmosAccessConditionFailedError,
+    CosmosResourceNotFoundError,
+)
+from azure.cosmos.partition_key import NonePartitionKeyValue
 from azure.identity.aio import DefaultAzureCredential
 
+from microsoft_agents.hosting.core.storage import ETagConflictError
 from microsoft_agents.storage.cosmos import CosmosDBStorage, CosmosDBStorageConfig
 from microsoft_agents.storage.cosmos.key_ops import sanitize_key
 
@@ -248,6 +256,37 @@ class TestCosmosDBStorage(QuickCRUDStorageTests):
                 "key2"
             ] == MockStoreItem({"id": "key2", "value": "new_val"})
 
+    @pytest.mark.asyncio
+    async def test_conditional_write(self):
+        async with self.storage() as cosmos_db_storage:
+            await cosmos_db_storage.write({"key": MockStoreItem({"id": "item"})})
+            first = (await cosmos_db_storage.read(["key"], target_cls=MockStoreItem))[
+                "key"
+            ]
+            second = (await cosmos_db_storage.read(["key"], target_cls=MockStoreItem))[
+                "key"
+            ]
+            assert first.e_tag
+
+            await cosmos_db_storage.write({"key": first})
+            assert first.e_tag != second.e_tag
+            with pytest.raises(ETagConflictError):
+                await cosmos_db_storage.write({"key": second})
+
+    @pytest.mark.asyncio
+    async def test_write_delta(self):
+        async with self.storage() as cosmos_db_storage:
+            assert not await cosmos_db_storage.write_delta("key", {"data": "value"})
+            await cosmos_db_storage.write(
+                {"key": MockStoreItem({"id": "123", "data": "value", "extra": 1})}
+            )
+            assert await cosmos_db_storage.write_delta(
+                "key", {"data": "new_value"}, ["extra"]
+            )
+            assert (
+                await cosmos_db_storage.read(["key"], target_cls=MockStoreItem)
+            ) == {"key": MockStoreItem({"id": "123", "data": "new_value"})}
+
     @pytest.mark.asyncio
     async def test_cosmos_db_from_azure_cred(self):
         load_dotenv()
@@ -341,3 +380,127 @@ class TestCosmosDBStorageInit:
                 await storage.initialize()
             await storage._close()
             await cosmos_client.close()
+
+
+class TestCosmosDBStorageBulk:
+
+    def create_storage(self, compat_mode=False, **kwargs):
+        storage = CosmosDBStorage(
+            CosmosDBStorageConfig(
+                cosmos_db_endpoint="https://localhost:8081",
+                auth_key="a2V5",
+                database_id="test-db",
+                container_id="bot-storage",
+                **kwargs,
+            )
+        )
+        storage._container = MagicMock()
+        storage._container.read_items = AsyncMock(return_value=[])
+        storage._container.upsert_item = AsyncMock()
+        storage._container.execute_item_batch = AsyncMock()
+        storage._compatability_mode_partition_key = compat_mode
+        return storage
+
+    @pytest.mark.asyncio
+    async def test_read_uses_single_request(self):
+        storage = self.create_storage()
+        storage._container.read_items.return_value = [
+            {"id": "a", "realId": "a", "document": {"id": "1", "value": "x"}},
+            {"id": "b", "realId": "b"},
+        ]
+
+        result = await storage.read(["a", "b", "c", "a"], target_cls=MockStoreItem)
+
+        assert result == {"a": MockStoreItem({"id": "1", "value": "x"})}
+        storage._container.read_items.assert_awaited_once_with(
+            items=[("a", "a"), ("b", "b"), ("c", "c")], max_concurrency=10
+        )
+
+    @pytest.mark.asyncio
+    async def test_read_empty_key(self):
+        storage = self.create_storage()
+        with pytest.raises(ValueError):
+            await storage.read(["a", ""], target_cls=MockStoreItem)
+        storage._container.read_items.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_write_upserts_distinct_partitions(self):
+        storage = self.create_storage()
+
+        await storage.write({"a": MockStoreItem({"id": "1"}), "b": MockStoreItem()})
+
+        assert storage._container.upsert_item.await_count == 2
+        storage._container.execute_item_batch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_write_batches_shared_partition(self):
+        storage = self.create_storage(compat_mode=True)
+        changes = {f"key{i}": MockStoreItem({"id": str(i)}) for i in range(150)}
+
+        await storage.write(changes)
+
+        storage._container.upsert_item.assert_not_called()
+        calls = storage._container.execute_item_batch.await_args_list
+        assert [len(call.kwargs["batch_operations"]) for call in calls] == [100, 50]
+        assert calls[0].kwargs["partition_key"] is NonePartitionKeyValue
+        assert calls[0].kwargs["batch_operations"][0] == (
+            "upsert",
+            ({"id": "key0", "realId": "key0", "document": {"id": "0"}},),
+        )
+
+    @pytest.mark.asyncio
+    async def test_write_caps_in_flight_requests(self):
+        storage = self.create_storage(max_concurrency=2)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def upsert_item(body):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        storage._container.upsert_item = upsert_item
+
+        await storage.write({f"key{i}": MockStoreItem() for i in range(10)})
+
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_read_sets_e_tag(self):
+        storage = self.create_storage()
+        storage._container.read_items.return_value = [
+            {"id": "a", "realId": "a", "document": {"id": "1"}, "_etag": "etag-a"},
+        ]
+
+        result = await storage.read(["a"], target_cls=MockStoreItem)
+
+        assert result["a"].e_tag == "etag-a"
+
+    @pytest.mark.asyncio
+    async def test_conditional_write_is_not_batched(self):
+        storage = self.create_storage(compat_mode=True)
+        storage._container.upsert_item.return_value = {"_etag": "etag-2"}
+        item = MockStoreItem({"id": "1"})
+        item.e_tag = "etag-1"
+
+        await storage.write({"a": item, "b": MockStoreItem(), "c": MockStoreItem()})
+
+        storage._container.upsert_item.assert_awaited_once_with(
+            body={"id": "a", "realId": "a", "document": {"id": "1"}},
+            etag="etag-1",
+            match_condition=MatchConditions.IfNotModified,
+        )
+        storage._container.execute_item_batch.assert_awaited_once()
+        assert item.e_tag == "etag-2"
+
+    @pytest.mark.asyncio
+    async def test_conditional_write_conflict(self):
+        storage = self.create_storage()
+        storage._container.upsert_item.side_effect = CosmosAccessConditionFailedError()
+        item = MockStoreItem({"id": "1"})
+        item.e_tag = "etag-1"
+
+        with pytest.raises(ETagConflictError):
+            await storage.write({"a": item})